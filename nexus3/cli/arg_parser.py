@@ -185,6 +185,11 @@ def parse_args() -> argparse.Namespace:
         default=300.0,
         help="Request timeout in seconds (default: 300)",
     )
+    send_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print the response as it is generated instead of JSON at the end",
+    )
     add_port_arg(send_parser)
     add_api_key_arg(send_parser)
 
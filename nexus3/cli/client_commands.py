@@ -11,7 +11,7 @@ All commands are accessed via the `nexus3 rpc` subcommand group:
     nexus3 rpc list             # List agents
     nexus3 rpc create ID        # Create agent
     nexus3 rpc destroy ID       # Remove agent from pool
-    nexus3 rpc send AGENT MSG   # Send message to agent
+    nexus3 rpc send AGENT MSG   # Send message to agent (--stream for live output)
     nexus3 rpc cancel AGENT ID  # Cancel request
     nexus3 rpc status AGENT     # Get agent status
     nexus3 rpc shutdown         # Stop server
@@ -103,6 +103,7 @@ async def cmd_send(
     port: int = DEFAULT_PORT,
     api_key: str | None = None,
     timeout: float = 300.0,
+    stream: bool = False,
 ) -> int:
     """Send a message to a Nexus agent.
 
@@ -112,7 +113,10 @@ async def cmd_send(
         port: Server port (default 8765).
         api_key: Optional API key. If not provided, auto-discovers from
                  environment or key files.
-        timeout: Request timeout in seconds (default 300).
+        timeout: Request timeout in seconds (default 300). When streaming,
+                 the longest allowed gap between frames.
+        stream: Print the response as it is generated (text to stdout, tool
+                progress to stderr) instead of one JSON object at the end.
 
     Returns:
         Exit code: 0 on success, 1 on error.
@@ -131,6 +135,8 @@ async def cmd_send(
 
     try:
         async with NexusClient(url, api_key=key, timeout=timeout) as client:
+            if stream:
+                return await _stream_send(client, content, request_id)
             send_result = await client.send(content, request_id=request_id)
             _print_json(send_result)
             return 0
@@ -147,6 +153,27 @@ async def cmd_send(
         return 1
 
 
+async def _stream_send(client: NexusClient, content: str, request_id: str) -> int:
+    """Consume a streamed send, printing text and tool progress as it arrives."""
+    out = SafeSink(Console(markup=False, highlight=False), stream=sys.stdout)
+    async for frame in client.send_stream(content, request_id=request_id):
+        if frame.event == "content":
+            out.write_untrusted(str(frame.data.get("text", "")))
+        elif frame.event == "tool_started":
+            _print_info(f"[tool] {frame.data.get('name')} started")
+        elif frame.event == "tool_completed":
+            status = "ok" if frame.data.get("success") else "failed"
+            _print_info(f"[tool] {frame.data.get('name')} {status}")
+        elif frame.event == "result":
+            out.write_trusted("\n")
+            if frame.data.get("cancelled"):
+                _print_info("Request cancelled")
+                return 1
+            if frame.data.get("halted_at_iteration_limit"):
+                _print_info("Halted at tool iteration limit")
+    return 0
+
+
 async def cmd_cancel(
     agent_id: str,
     request_id: str,
@@ -136,7 +136,7 @@ from nexus3.rpc.pool import Agent, AgentConfig, generate_temp_id
 from nexus3.session import LogStream, Session, SessionManager
 from nexus3.session.persistence import (
     SavedSession,
-    deserialize_messages,
+    deserialize_messages_with_tokens,
     serialize_clipboard_entries,
     serialize_session,
 )
@@ -615,6 +615,8 @@ async def run_repl(
             disabled_tools=disabled_tools,
             model_alias=get_model_alias(main_agent),
             clipboard_agent_entries=get_clipboard_entries(main_agent),
+            message_token_counts=main_agent.context.message_token_counts(),
+            token_counter=main_agent.context.token_counter_id,
         )
         session_manager.save_last_session(startup_saved, agent_name)
     except Exception as e:
@@ -672,6 +674,8 @@ async def run_repl(
                     disabled_tools=disabled_tools,
                     model_alias=get_model_alias(agent),
                     clipboard_agent_entries=get_clipboard_entries(agent),
+                    message_token_counts=agent.context.message_token_counts(),
+                    token_counter=agent.context.token_counter_id,
                 )
                 session_manager.save_last_session(saved, agent_id)
         except Exception as e:
@@ -689,6 +693,8 @@ async def run_repl(
             idle_timeout=1800.0,
             started_event=started_event,
             activity_tracker=server_activity,
+            keep_alive_timeout=config.server.keep_alive_timeout,
+            max_requests_per_connection=config.server.max_requests_per_connection,
         ),
         name="http_server",
     )
@@ -1604,9 +1610,16 @@ async def run_repl(
                                     if new_agent:
                                         # Wire up confirmation callback
                                         new_agent.session.on_confirm = confirm_with_pause
-                                        restored_msgs = deserialize_messages(saved.messages)
-                                        for msg in restored_msgs:
-                                            new_agent.context._messages.append(msg)
+                                        restored_msgs, restored_tokens = (
+                                            deserialize_messages_with_tokens(saved.messages)
+                                        )
+                                        same_counter = saved.token_counter == (
+                                            new_agent.context.token_counter_id
+                                        )
+                                        new_agent.context.restore_messages(
+                                            restored_msgs,
+                                            restored_tokens if same_counter else None,
+                                        )
                                         console.print(
                                             _format_restored_session_line(
                                                 safe_sink,
@@ -1873,6 +1886,8 @@ async def run_repl(
                         disabled_tools=disabled_tools,
                         model_alias=get_model_alias(save_agent),
                         clipboard_agent_entries=get_clipboard_entries(save_agent),
+                        message_token_counts=save_agent.context.message_token_counts(),
+                        token_counter=save_agent.context.token_counter_id,
                     )
                     session_manager.save_last_session(saved, current_agent_id)
             except Exception as e:
@@ -1994,7 +2009,14 @@ def main() -> None:
                 exit_code = asyncio.run(cmd_destroy(args.agent_id, args.port, args.api_key))
             elif rpc_cmd == "send":
                 exit_code = asyncio.run(
-                    cmd_send(args.agent_id, args.content, args.port, args.api_key, args.timeout)
+                    cmd_send(
+                        args.agent_id,
+                        args.content,
+                        args.port,
+                        args.api_key,
+                        args.timeout,
+                        args.stream,
+                    )
                 )
             elif rpc_cmd == "cancel":
                 exit_code = asyncio.run(
@@ -29,6 +29,8 @@ from nexus3.cli.editor_preview import open_in_editor
 from nexus3.cli.whisper import WhisperMode
 from nexus3.commands.protocol import CommandContext, CommandOutput, CommandResult
 from nexus3.config.schema import MCPServerConfig
+from nexus3.context.calibration import get_token_calibration
+from nexus3.context.token_counter import describe_token_counter, get_token_counter_for_model
 from nexus3.core.authorization_kernel import (
     AdapterAuthorizationKernel,
     AuthorizationAction,
@@ -415,7 +417,7 @@ Arguments:
 
 Flags:
   --tools     Include full list of available tools
-  --tokens    Include detailed token breakdown
+  --tokens    Include detailed token breakdown and per-tool definition costs
   -a, --all   Include both tools and tokens
 
 Examples:
@@ -1794,9 +1796,15 @@ async def cmd_model(
     # Update model in agent services
     agent.services.set_model(new_model)
 
-    # Update context manager's max_tokens
+    # Update context manager's max_tokens and tokenizer
     if hasattr(agent.context, "config"):
         agent.context.config.max_tokens = new_model.context_window
+    if hasattr(agent.context, "set_token_counter"):
+        new_counter = get_token_counter_for_model(new_model)
+        agent.context.set_token_counter(new_counter)
+        agent.context.set_token_calibration(
+            get_token_calibration(new_model, describe_token_counter(new_counter))
+        )
 
     # Update session's provider to use the new model
     # The provider is cached by provider_name:model_id, so this gets or creates
@@ -2075,16 +2083,10 @@ async def cmd_mcp(
         if not srv_cfg.enabled:
             return CommandOutput.error(f"MCP server '{name}' is disabled in config")
 
-        # Check if already connected (by anyone)
-        existing = registry.get(name)
-        if existing is not None:
-            if existing.is_visible_to(current_agent_id):
-                return CommandOutput.error(f"Already connected to '{name}'")
-            else:
-                return CommandOutput.error(
-                    f"Server '{name}' is connected by another agent "
-                    f"(owner: {existing.owner_agent_id})"
-                )
+        # Check if already connected (own connection, or shared by another agent).
+        # Another agent's private connection does not block this agent's own.
+        if registry.get(name, agent_id=current_agent_id) is not None:
+            return CommandOutput.error(f"Already connected to '{name}'")
 
         # Check if YOLO (skip all prompts)
         is_yolo = (
@@ -2116,7 +2118,7 @@ async def cmd_mcp(
 
             if not proceed:
                 # User denied - disconnect and return
-                await registry.disconnect(name)
+                await registry.disconnect(name, current_agent_id)
                 return CommandOutput.error(f"Connection to '{name}' denied by user")
 
             # Determine sharing from flags or prompt
@@ -2165,7 +2167,7 @@ async def cmd_mcp(
         name = parts[1]
 
         # Check if connected and visible/owned by this agent
-        server = registry.get(name)
+        server = registry.get(name, agent_id=current_agent_id)
         if server is None:
             return CommandOutput.error(f"Not connected to '{name}'")
 
@@ -2178,7 +2180,7 @@ async def cmd_mcp(
         # Remember if it was shared before disconnecting
         was_shared = server.shared
 
-        await registry.disconnect(name)
+        await registry.disconnect(name, current_agent_id)
 
         # Reset MCP allowances for this server (for current agent)
         if perms:
@@ -2256,7 +2258,7 @@ async def cmd_mcp(
             return CommandOutput.error(f"Not connected to '{server_name}'")
 
         try:
-            tool_count = await registry.retry_tools(server_name)
+            tool_count = await registry.retry_tools(server_name, current_agent_id)
             if tool_count > 0:
                 # Refresh tool definitions for this agent
                 if agent:
@@ -199,6 +199,8 @@ async def run_serve(
             session_manager=session_manager,
             idle_timeout=None,  # No auto-shutdown in headless dev mode
             started_event=started_event,
+            keep_alive_timeout=config.server.keep_alive_timeout,
+            max_requests_per_connection=config.server.max_requests_per_connection,
         )
     )
 
@@ -1,21 +1,47 @@
 """Async HTTP client for communicating with Nexus JSON-RPC servers."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import Any, cast
 from urllib.parse import urlparse
 
 import httpx
 
-from nexus3.core.constants import get_default_server_port
+from nexus3.core.constants import (
+    get_default_keep_alive_timeout,
+    get_default_server_port,
+)
 from nexus3.core.errors import NexusError
 from nexus3.core.url_validator import UrlSecurityError, validate_url
+from nexus3.provider.base import iter_sse_events
 from nexus3.rpc.auth import discover_rpc_token
-from nexus3.rpc.protocol import ParseError, parse_response, serialize_request
+from nexus3.rpc.protocol import (
+    ParseError,
+    parse_batch_response,
+    parse_response,
+    serialize_request,
+)
 from nexus3.rpc.types import Request, Response
 
 logger = logging.getLogger(__name__)
 
 
+
+def keepalive_expiry_for(server_timeout: float | None) -> float:
+    """Return the pooled-connection expiry for a server keep-alive timeout.
+
+    The result is always below server_timeout (config.server.keep_alive_timeout),
+    so an idle connection is dropped by the client before the server closes it
+    and a request never races the close. With keep-alive disabled on the
+    server (None), connections are not reused.
+    """
+    if server_timeout is None:
+        return 0.0
+    return max(server_timeout - 1.0, server_timeout / 2)
+
+
 def _get_default_port() -> int:
     """Get default port from canonical config resolver."""
     return get_default_server_port()
@@ -25,6 +51,20 @@ class ClientError(NexusError):
     """Exception for client-side errors (connection, timeout, protocol)."""
 
 
+@dataclass(frozen=True)
+class StreamEvent:
+    """One frame of a streamed ``send``.
+
+    Attributes:
+        event: ``content``, ``tool_started``, ``tool_completed`` or ``result``.
+        data: Frame payload. For ``content`` it has ``text``; for ``result``
+            it is the same dict a non-streamed send() returns.
+    """
+
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
 class NexusClient:
     """Async HTTP client for Nexus JSON-RPC servers.
 
@@ -46,6 +86,7 @@ class NexusClient:
         skip_url_validation: bool = False,
         requester_id: str | None = None,
         capability_token: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the client.
 
@@ -62,6 +103,10 @@ class NexusClient:
             capability_token: Optional capability token to forward via
                      `X-Nexus-Capability` header for explicit capability-scoped
                      calls.
+            http_client: Optional caller-owned httpx.AsyncClient. Pass the same
+                     one to many NexusClient instances (e.g. one per agent) to
+                     share its keep-alive connection pool; it is not closed on
+                     exit. Without it, each context owns a pooled client.
 
         Raises:
             ValueError: If URL fails security validation (and skip_url_validation=False).
@@ -81,6 +126,7 @@ class NexusClient:
         self._api_key = api_key
         self._requester_id = requester_id
         self._capability_token = capability_token
+        self._shared_client = http_client
         self._client: httpx.AsyncClient | None = None
         self._request_id = 0
         logger.debug("NexusClient initialized: url=%s, timeout=%s", url, timeout)
@@ -157,15 +203,41 @@ class NexusClient:
             capability_token=capability_token,
         )
 
+    @staticmethod
+    def create_http_client(
+        timeout: float = 60.0,
+        server_keep_alive_timeout: float | None = None,
+    ) -> httpx.AsyncClient:
+        """Create an httpx client tuned for the Nexus RPC server's keep-alive.
+
+        Use this to build a client shared by several NexusClient instances.
+        The caller closes it.
+
+        Args:
+            timeout: Request timeout in seconds.
+            server_keep_alive_timeout: The server's keep-alive timeout. Defaults
+                to config.server.keep_alive_timeout.
+        """
+        if server_keep_alive_timeout is None:
+            server_keep_alive_timeout = get_default_keep_alive_timeout()
+        return httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(keepalive_expiry=keepalive_expiry_for(server_keep_alive_timeout)),
+        )
+
     async def __aenter__(self) -> "NexusClient":
-        """Enter async context, create httpx client."""
-        self._client = httpx.AsyncClient(timeout=self._timeout)
+        """Enter async context, create (or adopt the shared) httpx client."""
+        if self._shared_client is not None:
+            self._client = self._shared_client
+        else:
+            self._client = self.create_http_client(self._timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit async context, close httpx client."""
+        """Exit async context, close the httpx client if this instance owns it."""
         if self._client:
-            await self._client.aclose()
+            if self._client is not self._shared_client:
+                await self._client.aclose()
             self._client = None
 
     def _next_id(self) -> int:
@@ -173,6 +245,17 @@ class NexusClient:
         self._request_id += 1
         return self._request_id
 
+    def _headers(self) -> dict[str, str]:
+        """Build request headers with optional auth and identity."""
+        headers: dict[str, str] = {"Content-Type": "application/json"}
+        if self._api_key:
+            headers["Authorization"] = f"Bearer {self._api_key}"
+        if self._requester_id is not None:
+            headers["X-Nexus-Agent"] = self._requester_id
+        if self._capability_token is not None:
+            headers["X-Nexus-Capability"] = self._capability_token
+        return headers
+
     async def _call(self, method: str, params: dict[str, Any] | None = None) -> Response:
         """Make a JSON-RPC call and return the response.
 
@@ -196,21 +279,13 @@ class NexusClient:
             id=self._next_id(),
         )
 
-        # Build headers with optional auth
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self._api_key:
-            headers["Authorization"] = f"Bearer {self._api_key}"
-        if self._requester_id is not None:
-            headers["X-Nexus-Agent"] = self._requester_id
-        if self._capability_token is not None:
-            headers["X-Nexus-Capability"] = self._capability_token
-
         logger.debug("RPC call: method=%s, id=%s", method, request.id)
         try:
             response = await self._client.post(
                 self._url,
                 content=serialize_request(request),
-                headers=headers,
+                headers=self._headers(),
+                timeout=self._timeout,
             )
             return parse_response(response.text)
         except httpx.ConnectError as e:
@@ -224,6 +299,61 @@ class NexusClient:
             logger.warning("Invalid server response for method=%s: %s", method, e)
             raise ClientError(f"Invalid server response: {e}") from e
 
+    async def call_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any] | None]],
+    ) -> list[Response]:
+        """Make several calls to this endpoint in one JSON-RPC batch.
+
+        The server runs them concurrently. Errors of individual calls are
+        returned in their Response rather than raised; pass each to the
+        caller's own checks.
+
+        Args:
+            calls: (method, params) pairs.
+
+        Returns:
+            One Response per call, in call order.
+
+        Raises:
+            ClientError: On connection error, timeout, protocol error, or if
+                the server rejects the batch as a whole.
+        """
+        if self._client is None:
+            raise ClientError("Client not initialized. Use 'async with' context manager.")
+        if not calls:
+            return []
+
+        requests = [
+            Request(jsonrpc="2.0", method=method, params=params, id=self._next_id())
+            for method, params in calls
+        ]
+        body = "[" + ",".join(serialize_request(r) for r in requests) + "]"
+
+        logger.debug("RPC batch: %d calls", len(requests))
+        try:
+            response = await self._client.post(
+                self._url,
+                content=body,
+                headers=self._headers(),
+                timeout=self._timeout,
+            )
+            by_id = {r.id: r for r in parse_batch_response(response.text)}
+        except httpx.ConnectError as e:
+            logger.warning("Connection failed to %s: %s", self._url, e)
+            raise ClientError(f"Connection failed: {e}") from e
+        except httpx.TimeoutException as e:
+            logger.warning("Batch timed out: timeout=%s", self._timeout)
+            raise ClientError(f"Request timed out: {e}") from e
+        except ParseError as e:
+            logger.warning("Invalid batch response: %s", e)
+            raise ClientError(f"Invalid server response: {e}") from e
+
+        missing = [r.id for r in requests if r.id not in by_id]
+        if missing:
+            raise ClientError(f"Batch response missing ids: {missing}")
+        return [by_id[r.id] for r in requests]
+
     def _check(self, response: Response) -> Any:
         """Extract result from response or raise ClientError on error.
 
@@ -271,6 +401,83 @@ class NexusClient:
         response = await self._call("send", params)
         return cast(dict[str, Any], self._check(response))
 
+    async def send_stream(
+        self,
+        content: str,
+        request_id: str | int | None = None,
+        source: str | None = None,
+        source_agent_id: str | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Send a message and yield response frames as the agent produces them.
+
+        Frames are read as they are consumed, so a slow consumer slows the
+        server-side turn rather than buffering it. The timeout applies to the
+        gap between frames, not to the whole turn. The last frame is always
+        ``result``. A server that answers with a plain JSON-RPC response
+        (e.g. an authentication error) yields just the ``result`` frame.
+
+        Args:
+            content: The message content.
+            request_id: Optional request ID for tracking/cancellation.
+            source: Source of the message (e.g., "nexus_send", "repl").
+            source_agent_id: Agent ID of the sender (for agent-to-agent messages).
+
+        Yields:
+            StreamEvent frames.
+
+        Raises:
+            ClientError: On connection error, timeout, protocol error, or an
+                error response.
+        """
+        if self._client is None:
+            raise ClientError("Client not initialized. Use 'async with' context manager.")
+
+        params: dict[str, Any] = {"content": content, "stream": True}
+        if request_id is not None:
+            params["request_id"] = request_id
+        if source is not None:
+            params["source"] = source
+        if source_agent_id is not None:
+            params["source_agent_id"] = source_agent_id
+        request = Request(jsonrpc="2.0", method="send", params=params, id=self._next_id())
+
+        logger.debug("RPC stream: method=send, id=%s", request.id)
+        try:
+            async with self._client.stream(
+                "POST",
+                self._url,
+                content=serialize_request(request),
+                headers=self._headers(),
+                timeout=self._timeout,
+            ) as response:
+                if not response.headers.get("content-type", "").startswith(
+                    "text/event-stream"
+                ):
+                    body = (await response.aread()).decode("utf-8", errors="replace")
+                    result = self._check(parse_response(body))
+                    yield StreamEvent("result", cast(dict[str, Any], result))
+                    return
+
+                async for sse in iter_sse_events(response):
+                    if sse.event == "result":
+                        result = self._check(parse_response(sse.data))
+                        yield StreamEvent("result", cast(dict[str, Any], result))
+                        return
+                    yield StreamEvent(sse.event or "message", json.loads(sse.data))
+        except httpx.ConnectError as e:
+            logger.warning("Connection failed to %s: %s", self._url, e)
+            raise ClientError(f"Connection failed: {e}") from e
+        except httpx.TimeoutException as e:
+            logger.warning("Stream timed out: timeout=%s", self._timeout)
+            raise ClientError(f"Request timed out: {e}") from e
+        except httpx.RemoteProtocolError as e:
+            logger.warning("Stream closed by server: %s", e)
+            raise ClientError(f"Stream closed by server: {e}") from e
+        except (ParseError, json.JSONDecodeError) as e:
+            logger.warning("Invalid streamed response: %s", e)
+            raise ClientError(f"Invalid server response: {e}") from e
+        raise ClientError("Stream ended without a result")
+
     async def cancel(self, request_id: str | int | None = None) -> dict[str, Any]:
         """Cancel the current operation.
 
@@ -284,13 +491,18 @@ class NexusClient:
         response = await self._call("cancel", params)
         return cast(dict[str, Any], self._check(response))
 
-    async def get_tokens(self) -> dict[str, Any]:
+    async def get_tokens(self, per_tool: bool = False) -> dict[str, Any]:
         """Get current token usage.
 
+        Args:
+            per_tool: If True, include a 'tools_breakdown' map of tool name
+                to token count.
+
         Returns:
             Token usage breakdown dict.
         """
-        response = await self._call("get_tokens")
+        params = {"per_tool": True} if per_tool else None
+        response = await self._call("get_tokens", params)
         return cast(dict[str, Any], self._check(response))
 
     async def get_context(self) -> dict[str, Any]:
@@ -9,6 +9,7 @@ from nexus3.clipboard.types import (
     ClipboardEntry,
     ClipboardPermissions,
     ClipboardScope,
+    ClipboardSearchHit,
     ClipboardTag,
     InsertionMode,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "ClipboardEntry",
     "ClipboardPermissions",
     "ClipboardScope",
+    "ClipboardSearchHit",
     "ClipboardTag",
     "InsertionMode",
     "CLIPBOARD_PRESETS",
@@ -27,7 +27,7 @@ def format_clipboard_context(
     Returns:
         Formatted markdown string, or None if no entries
     """
-    all_entries = manager.list_entries()
+    all_entries = manager.list_entries(include_content=False)
     if not all_entries:
         return None
 
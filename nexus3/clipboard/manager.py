@@ -1,6 +1,7 @@
 """ClipboardManager - coordinates storage, permissions, and scope resolution."""
 from __future__ import annotations
 
+import dataclasses
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,6 +14,7 @@ from nexus3.clipboard.types import (
     ClipboardEntry,
     ClipboardPermissions,
     ClipboardScope,
+    ClipboardSearchHit,
 )
 
 if TYPE_CHECKING:
@@ -46,11 +48,29 @@ class ClipboardManager:
 
         # Agent scope: in-memory only
         self._agent_clipboard: dict[str, ClipboardEntry] = {}
+        self._agent_writes = 0
 
         # Lazy-loaded persistent storage
         self._project_storage: ClipboardStorage | None = None
         self._system_storage: ClipboardStorage | None = None
 
+    @property
+    def version(self) -> tuple[int, ...]:
+        """Opaque value that changes whenever readable entries may have changed.
+
+        Covers writes through this manager and, for the persistent scopes,
+        commits by other agents or processes sharing the database. Callers
+        that cache derived views (e.g. the injected clipboard table) compare
+        it instead of re-listing entries. Expiry is time-based and is not
+        reflected here.
+        """
+        parts = [self._agent_writes]
+        if self._permissions.can_read(ClipboardScope.PROJECT):
+            parts.extend(self._get_project_storage().version)
+        if self._permissions.can_read(ClipboardScope.SYSTEM):
+            parts.extend(self._get_system_storage().version)
+        return tuple(parts)
+
     def _get_project_storage(self) -> ClipboardStorage:
         """Get or create project-scope storage."""
         if self._project_storage is None:
@@ -145,6 +165,7 @@ class ClipboardManager:
                     "Use clipboard_update to modify or choose a different key."
                 )
             self._agent_clipboard[key] = entry
+            self._agent_writes += 1
         elif scope == ClipboardScope.PROJECT:
             try:
                 self._get_project_storage().create(entry)
@@ -257,6 +278,7 @@ class ClipboardManager:
                 del self._agent_clipboard[key]
                 self._agent_clipboard[new_key] = entry
 
+            self._agent_writes += 1
             return entry, warning
 
         elif scope == ClipboardScope.PROJECT:
@@ -294,6 +316,7 @@ class ClipboardManager:
         if scope == ClipboardScope.AGENT:
             if key in self._agent_clipboard:
                 del self._agent_clipboard[key]
+                self._agent_writes += 1
                 return True
             return False
         elif scope == ClipboardScope.PROJECT:
@@ -309,6 +332,7 @@ class ClipboardManager:
         if scope == ClipboardScope.AGENT:
             count = len(self._agent_clipboard)
             self._agent_clipboard.clear()
+            self._agent_writes += 1
             return count
         elif scope == ClipboardScope.PROJECT:
             return self._get_project_storage().clear()
@@ -323,6 +347,7 @@ class ClipboardManager:
         tags: list[str] | None = None,
         any_tags: list[str] | None = None,
         include_expired: bool = True,
+        include_content: bool = True,
     ) -> list[ClipboardEntry]:
         """List entries, optionally filtered by scope and tags.
 
@@ -331,6 +356,8 @@ class ClipboardManager:
             tags: Filter to entries having ALL of these tags (AND logic)
             any_tags: Filter to entries having ANY of these tags (OR logic)
             include_expired: If False, exclude expired entries
+            include_content: If False, return metadata-only entries (content
+                is ""), which avoids reading content from the databases
 
         Returns entries sorted by modified_at descending.
         Only includes entries from scopes the agent can read.
@@ -348,11 +375,16 @@ class ClipboardManager:
                 continue
 
             if s == ClipboardScope.AGENT:
-                entries.extend(self._agent_clipboard.values())
+                if include_content:
+                    entries.extend(self._agent_clipboard.values())
+                else:
+                    entries.extend(_without_content(e) for e in self._agent_clipboard.values())
             elif s == ClipboardScope.PROJECT:
-                entries.extend(self._get_project_storage().list_all())
+                storage = self._get_project_storage()
+                entries.extend(storage.list_all() if include_content else storage.list_metadata())
             elif s == ClipboardScope.SYSTEM:
-                entries.extend(self._get_system_storage().list_all())
+                storage = self._get_system_storage()
+                entries.extend(storage.list_all() if include_content else storage.list_metadata())
 
         # Filter by tags (AND logic)
         if tags:
@@ -464,9 +496,12 @@ class ClipboardManager:
         search_keys: bool = True,
         search_descriptions: bool = True,
         tags: list[str] | None = None,
+        include_content: bool = True,
     ) -> list[ClipboardEntry]:
         """Search clipboard entries.
 
+        Same ranking as search_hits(), without snippets or scores.
+
         Args:
             query: Search string (case-insensitive substring match)
             scope: Specific scope to search, or None for all accessible
@@ -474,37 +509,134 @@ class ClipboardManager:
             search_keys: Search in keys
             search_descriptions: Search in descriptions
             tags: Filter by tags (entries must have ALL specified tags)
+            include_content: If False, return metadata-only entries (content
+                is ""), which avoids reading content of the matches
 
         Returns:
-            Matching entries, sorted by relevance (key match > desc > content)
+            Matching entries, best first (key match > desc > content)
         """
-        entries = self.list_entries(scope)  # Already filters by permission
-        query_lower = query.lower()
-        results = []
+        hits = self.search_hits(
+            query,
+            scope=scope,
+            search_content=search_content,
+            search_keys=search_keys,
+            search_descriptions=search_descriptions,
+            tags=tags,
+        )
+        if not include_content:
+            return [hit.entry for hit in hits]
+        entries = []
+        for hit in hits:
+            entry = self._get_from_scope(hit.entry.key, hit.entry.scope)
+            if entry is not None:
+                entries.append(entry)
+        return entries
 
-        for entry in entries:
-            # Filter by tags first (if specified)
-            if tags:
-                if not all(t in entry.tags for t in tags):
-                    continue
+    def search_hits(
+        self,
+        query: str,
+        scope: ClipboardScope | None = None,
+        search_content: bool = True,
+        search_keys: bool = True,
+        search_descriptions: bool = True,
+        tags: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[ClipboardSearchHit]:
+        """Search clipboard entries, ranked, with a snippet per hit.
+
+        Persistent scopes are searched through their FTS5 index, so entry
+        content is never loaded. Hits are ordered key match > description
+        match > content match, then by bm25 score.
+
+        Args:
+            query: Search string (case-insensitive substring match)
+            scope: Specific scope to search, or None for all accessible
+            search_content: Search in content
+            search_keys: Search in keys
+            search_descriptions: Search in descriptions
+            tags: Filter by tags (entries must have ALL specified tags)
+            limit: Maximum hits to return (None for all)
+
+        Returns:
+            Hits with metadata-only entries (content is "")
+        """
+        hits: list[ClipboardSearchHit] = []
+        scopes = (
+            [scope]
+            if scope
+            else [ClipboardScope.AGENT, ClipboardScope.PROJECT, ClipboardScope.SYSTEM]
+        )
+        for s in scopes:
+            if not self._permissions.can_read(s):
+                continue
+            if s == ClipboardScope.AGENT:
+                hits.extend(
+                    self._search_agent_scope(
+                        query, search_content, search_keys, search_descriptions
+                    )
+                )
+            else:
+                storage = (
+                    self._get_project_storage()
+                    if s == ClipboardScope.PROJECT
+                    else self._get_system_storage()
+                )
+                hits.extend(
+                    storage.search(
+                        query,
+                        search_keys=search_keys,
+                        search_descriptions=search_descriptions,
+                        search_content=search_content,
+                    )
+                )
+
+        if tags:
+            hits = [h for h in hits if all(t in h.entry.tags for t in tags)]
+
+        query_lower = query.lower()
 
-            # Search in specified fields
-            matches = False
+        def tier(hit: ClipboardSearchHit) -> int:
+            entry = hit.entry
             if search_keys and query_lower in entry.key.lower():
-                matches = True
-            elif (
+                return 0
+            if (
                 search_descriptions
                 and entry.short_description
                 and query_lower in entry.short_description.lower()
             ):
-                matches = True
-            elif search_content and query_lower in entry.content.lower():
-                matches = True
+                return 1
+            return 2
 
-            if matches:
-                results.append(entry)
+        hits.sort(key=lambda hit: (tier(hit), hit.score))
+        return hits[:limit] if limit is not None else hits
 
-        return results
+    def _search_agent_scope(
+        self,
+        query: str,
+        search_content: bool,
+        search_keys: bool,
+        search_descriptions: bool,
+    ) -> list[ClipboardSearchHit]:
+        """Substring search over the in-memory agent clipboard."""
+        query_lower = query.lower()
+        hits: list[ClipboardSearchHit] = []
+        for entry in self._agent_clipboard.values():
+            fields = [
+                (search_keys, entry.key),
+                (search_descriptions, entry.short_description or ""),
+                (search_content, entry.content),
+            ]
+            for enabled, text in fields:
+                if enabled and query_lower in text.lower():
+                    hits.append(
+                        ClipboardSearchHit(
+                            entry=_without_content(entry),
+                            snippet=_snippet(text, query_lower),
+                            score=0.0,
+                        )
+                    )
+                    break
+        return hits
 
     # --- Tag Management ---
 
@@ -531,6 +663,8 @@ class ClipboardManager:
                 else self._get_system_storage()
             )
             storage.set_tags(key, new_tags)
+        else:
+            self._agent_writes += 1
 
         return entry
 
@@ -556,12 +690,14 @@ class ClipboardManager:
                 else self._get_system_storage()
             )
             storage.set_tags(key, entry.tags)
+        else:
+            self._agent_writes += 1
 
         return entry
 
     def list_tags(self, scope: ClipboardScope | None = None) -> list[str]:
         """List all tags in use across accessible scopes."""
-        entries = self.list_entries(scope)
+        entries = self.list_entries(scope, include_content=False)
         all_tags: set[str] = set()
         for entry in entries:
             all_tags.update(entry.tags)
@@ -576,3 +712,25 @@ class ClipboardManager:
     def restore_agent_entries(self, entries: dict[str, ClipboardEntry]) -> None:
         """Restore agent-scope entries from session persistence."""
         self._agent_clipboard = dict(entries)
+        self._agent_writes += 1
+
+
+def _without_content(entry: ClipboardEntry) -> ClipboardEntry:
+    """Metadata-only copy of an entry, matching ClipboardStorage.list_metadata()."""
+    return dataclasses.replace(entry, content="", tags=list(entry.tags))
+
+
+def _snippet(text: str, query_lower: str, context: int = 40) -> str:
+    """Text around the first match of query_lower, match wrapped in [...]."""
+    start = text.lower().find(query_lower)
+    if start < 0 or len(text.lower()) != len(text):
+        return " ".join(text[: 2 * context].split())
+    end = start + len(query_lower)
+    before = text[max(0, start - context) : start]
+    after = text[end : end + context]
+    snippet = f"{before}[{text[start:end]}]{after}"
+    if start > context:
+        snippet = "..." + snippet
+    if end + context < len(text):
+        snippet += "..."
+    return " ".join(snippet.split())
@@ -1,18 +1,21 @@
 """SQLite storage for clipboard entries."""
 from __future__ import annotations
 
+import logging
 import os
 import sqlite3
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from nexus3.clipboard.types import ClipboardEntry, ClipboardScope
+from nexus3.clipboard.types import ClipboardEntry, ClipboardScope, ClipboardSearchHit
 from nexus3.core.secure_io import SECURE_FILE_MODE, secure_mkdir
 
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
 SCHEMA_VERSION = 1
 
 SCHEMA_SQL = """
@@ -63,6 +66,57 @@ CREATE TABLE IF NOT EXISTS metadata (
 );
 """
 
+# Full-text index over key, description and content. External-content table:
+# the text lives only in `clipboard`; triggers keep the index in step with it.
+# The trigram tokenizer gives case-insensitive substring matching, the same
+# semantics as the plain scan it replaces.
+FTS_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_fts USING fts5(
+    key, short_description, content,
+    content='clipboard', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS clipboard_fts_insert AFTER INSERT ON clipboard BEGIN
+    INSERT INTO clipboard_fts(rowid, key, short_description, content)
+    VALUES (new.id, new.key, new.short_description, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS clipboard_fts_delete AFTER DELETE ON clipboard BEGIN
+    INSERT INTO clipboard_fts(clipboard_fts, rowid, key, short_description, content)
+    VALUES ('delete', old.id, old.key, old.short_description, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS clipboard_fts_update
+AFTER UPDATE OF key, short_description, content ON clipboard BEGIN
+    INSERT INTO clipboard_fts(clipboard_fts, rowid, key, short_description, content)
+    VALUES ('delete', old.id, old.key, old.short_description, old.content);
+    INSERT INTO clipboard_fts(rowid, key, short_description, content)
+    VALUES (new.id, new.key, new.short_description, new.content);
+END;
+"""
+
+# Every column except content, plus the entry's tags in one string, so listings
+# neither read content pages nor issue a tag query per row.
+_TAG_SEPARATOR = "\x1f"
+_METADATA_SELECT = """
+SELECT c.key, c.short_description, c.source_path, c.source_lines,
+       c.line_count, c.byte_count, c.created_at, c.modified_at,
+       c.created_by_agent, c.modified_by_agent, c.expires_at, c.ttl_seconds,
+       (SELECT group_concat(t.name, char(31)) FROM clipboard_tags ct
+        JOIN tags t ON t.id = ct.tag_id WHERE ct.clipboard_id = c.id) AS tag_names
+"""
+
+# Column weights for bm25(): key matches outrank description, then content.
+_FTS_COLUMNS = ("key", "short_description", "content")
+_FTS_WEIGHTS = "10.0, 5.0, 1.0"
+
+# Trigram index cannot match queries shorter than this.
+_FTS_MIN_QUERY_CHARS = 3
+
+SNIPPET_TOKENS = 64
+"""Snippet length for FTS hits, in tokens (about one character each with the
+trigram tokenizer; 64 is the FTS5 maximum)."""
+
 
 class ClipboardStorage:
     """SQLite storage for a single clipboard scope (project or system)."""
@@ -77,6 +131,7 @@ class ClipboardStorage:
         self._db_path = db_path
         self._scope = scope
         self._conn: sqlite3.Connection | None = None
+        self._writes = 0
         self._ensure_db()
 
     def _ensure_db(self) -> None:
@@ -101,6 +156,7 @@ class ClipboardStorage:
         # WAL is fine here; session storage does not use WAL, but clipboard can.
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.executescript(SCHEMA_SQL)
+        self._fts_enabled = self._ensure_fts()
 
         # Check/set schema version
         cur = self._conn.execute(
@@ -114,6 +170,51 @@ class ClipboardStorage:
             )
             self._conn.commit()
 
+    def _ensure_fts(self) -> bool:
+        """Create the full-text index if SQLite supports it.
+
+        A database created before the index existed is indexed on first open.
+
+        Returns:
+            True if clipboard_fts is available, False to fall back to scans.
+        """
+        assert self._conn is not None
+        existed = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'clipboard_fts'"
+        ).fetchone()
+        try:
+            self._conn.executescript(FTS_SCHEMA_SQL)
+        except sqlite3.OperationalError as e:
+            logger.debug("Clipboard full-text search unavailable: %s", e)
+            return False
+        if not existed:
+            self._conn.execute("INSERT INTO clipboard_fts(clipboard_fts) VALUES ('rebuild')")
+            self._conn.commit()
+        return True
+
+    @property
+    def fts_enabled(self) -> bool:
+        """Whether search() is backed by the FTS5 index."""
+        return self._fts_enabled
+
+    def _commit(self) -> None:
+        """Commit a write made through this connection and bump the version."""
+        assert self._conn is not None
+        self._conn.commit()
+        self._writes += 1
+
+    @property
+    def version(self) -> tuple[int, int]:
+        """Opaque value that changes whenever the stored entries may have changed.
+
+        Combines a counter of writes made through this connection with SQLite's
+        ``PRAGMA data_version``, which changes when another connection (another
+        agent or process sharing the database) commits.
+        """
+        assert self._conn is not None
+        data_version: int = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._writes, data_version)
+
     def _row_to_entry(self, row: sqlite3.Row) -> ClipboardEntry:
         """Convert database row to ClipboardEntry."""
         key = row["key"]
@@ -135,6 +236,27 @@ class ClipboardStorage:
             tags=self.get_tags(key),
         )
 
+    def _metadata_row_to_entry(self, row: sqlite3.Row) -> ClipboardEntry:
+        """Convert a _METADATA_SELECT row to an entry with empty content."""
+        tag_names = row["tag_names"]
+        return ClipboardEntry(
+            key=row["key"],
+            scope=self._scope,
+            content="",
+            line_count=row["line_count"],
+            byte_count=row["byte_count"],
+            short_description=row["short_description"],
+            source_path=row["source_path"],
+            source_lines=row["source_lines"],
+            created_at=row["created_at"],
+            modified_at=row["modified_at"],
+            created_by_agent=row["created_by_agent"],
+            modified_by_agent=row["modified_by_agent"],
+            expires_at=row["expires_at"],
+            ttl_seconds=row["ttl_seconds"],
+            tags=sorted(tag_names.split(_TAG_SEPARATOR)) if tag_names else [],
+        )
+
     def get(self, key: str) -> ClipboardEntry | None:
         """Get entry by key, or None if not found."""
         assert self._conn is not None
@@ -176,7 +298,7 @@ class ClipboardStorage:
                 entry.ttl_seconds,
             ),
         )
-        self._conn.commit()
+        self._commit()
 
         # Set tags if provided
         if entry.tags:
@@ -247,7 +369,7 @@ class ClipboardStorage:
         self._conn.execute(
             f"UPDATE clipboard SET {', '.join(updates)} WHERE key = ?", params
         )
-        self._conn.commit()
+        self._commit()
 
         result = self.get(new_key if new_key else key)
         assert result is not None  # We just updated it
@@ -257,14 +379,14 @@ class ClipboardStorage:
         """Delete entry by key. Returns True if deleted, False if not found."""
         assert self._conn is not None
         cur = self._conn.execute("DELETE FROM clipboard WHERE key = ?", (key,))
-        self._conn.commit()
+        self._commit()
         return cur.rowcount > 0
 
     def clear(self) -> int:
         """Delete all entries. Returns count of deleted entries."""
         assert self._conn is not None
         cur = self._conn.execute("DELETE FROM clipboard")
-        self._conn.commit()
+        self._commit()
         return cur.rowcount
 
     def list_all(self) -> list[ClipboardEntry]:
@@ -275,6 +397,75 @@ class ClipboardStorage:
         )
         return [self._row_to_entry(row) for row in cur.fetchall()]
 
+    def list_metadata(self) -> list[ClipboardEntry]:
+        """List all entries without their content, ordered by modified_at descending.
+
+        Entries carry every field except ``content``, which is ``""``; use
+        get() to load it. Meant for listings and context injection, which
+        only show keys, sizes and descriptions.
+        """
+        assert self._conn is not None
+        cur = self._conn.execute(
+            _METADATA_SELECT + " FROM clipboard c ORDER BY c.modified_at DESC"
+        )
+        return [self._metadata_row_to_entry(row) for row in cur.fetchall()]
+
+    def search(
+        self,
+        query: str,
+        *,
+        search_keys: bool = True,
+        search_descriptions: bool = True,
+        search_content: bool = True,
+    ) -> list[ClipboardSearchHit]:
+        """Case-insensitive substring search, best matches first.
+
+        Uses the FTS5 index (ranked by bm25, key > description > content, with
+        a snippet around the match). Queries shorter than three characters,
+        or databases without FTS5, fall back to a LIKE scan ordered by
+        modified_at with no snippet. Content is never loaded into Python.
+
+        Returns:
+            Hits with metadata-only entries (``content == ""``).
+        """
+        assert self._conn is not None
+        flags = (search_keys, search_descriptions, search_content)
+        columns = [name for name, enabled in zip(_FTS_COLUMNS, flags, strict=True) if enabled]
+        if not columns or not query:
+            return []
+
+        if self._fts_enabled and len(query) >= _FTS_MIN_QUERY_CHARS:
+            phrase = '"' + query.replace('"', '""') + '"'
+            cur = self._conn.execute(
+                _METADATA_SELECT
+                + f""", snippet(clipboard_fts, -1, '[', ']', '...', {SNIPPET_TOKENS})
+                         AS snippet,
+                       bm25(clipboard_fts, {_FTS_WEIGHTS}) AS score
+                FROM clipboard_fts JOIN clipboard c ON c.id = clipboard_fts.rowid
+                WHERE clipboard_fts MATCH ?
+                ORDER BY score""",
+                ("{" + " ".join(columns) + "} : " + phrase,),
+            )
+            return [
+                ClipboardSearchHit(
+                    entry=self._metadata_row_to_entry(row),
+                    snippet=" ".join(row["snippet"].split()) or None,
+                    score=row["score"],
+                )
+                for row in cur.fetchall()
+            ]
+
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where = " OR ".join(f"c.{name} LIKE ? ESCAPE '\\'" for name in columns)
+        cur = self._conn.execute(
+            _METADATA_SELECT + f" FROM clipboard c WHERE {where} ORDER BY c.modified_at DESC",
+            [pattern] * len(columns),
+        )
+        return [
+            ClipboardSearchHit(entry=self._metadata_row_to_entry(row), snippet=None, score=0.0)
+            for row in cur.fetchall()
+        ]
+
     def count_expired(self, now: float) -> int:
         """Count entries where expires_at <= now. Does NOT delete them.
 
@@ -331,7 +522,7 @@ class ClipboardStorage:
                 (clipboard_id, tag_id),
             )
 
-        self._conn.commit()
+        self._commit()
 
     def get_tags(self, key: str) -> list[str]:
         """Get tags for an entry."""
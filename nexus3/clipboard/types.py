@@ -108,6 +108,15 @@ class ClipboardEntry:
         return time.time() >= self.expires_at
 
 
+@dataclass
+class ClipboardSearchHit:
+    """A ranked clipboard search result."""
+
+    entry: ClipboardEntry  # Metadata only: content is "" (use get() to load it)
+    snippet: str | None  # Text around the match, match wrapped in [...]
+    score: float  # Lower is better (bm25); 0.0 where no score is available
+
+
 @dataclass
 class ClipboardPermissions:
     """Clipboard scope access permissions."""
@@ -35,6 +35,9 @@ from nexus3.session.session_manager import SessionManagerError, SessionNotFoundE
 if TYPE_CHECKING:
     pass
 
+# Number of tool definitions listed in `/status --tokens`.
+_STATUS_TOP_TOOL_TOKENS = 15
+
 
 async def cmd_list(ctx: CommandContext) -> CommandOutput:
     """List all agents in the pool.
@@ -260,7 +263,8 @@ async def cmd_status(
         ctx: Command context with pool and session_manager.
         agent_id: Agent to get status for. Uses current agent if None.
         show_tools: If True, include full list of available tools.
-        show_tokens: If True, include detailed token breakdown.
+        show_tokens: If True, include detailed token breakdown, including
+            per-tool definition costs.
 
     Returns:
         CommandOutput with status info in data field.
@@ -377,6 +381,11 @@ async def cmd_status(
                 "model": comp_cfg.model,
             }
 
+    # Per-tool definition costs (memoised by the context manager)
+    tool_tokens: dict[str, int] | None = None
+    if show_tokens:
+        tool_tokens = agent.context.get_tool_token_breakdown()
+
     # Get tool list if requested
     tool_list: list[str] | None = None
     if show_tools and hasattr(agent, "registry"):
@@ -393,6 +402,7 @@ async def cmd_status(
             tokens if show_tokens
             else {"total": total, "available": available, "remaining": remaining}
         ),
+        "tool_tokens": tool_tokens,
         "model": model_info,
         "permission_level": perm_level,
         "preset": preset_name,
@@ -466,6 +476,11 @@ async def cmd_status(
         lines.append(f"    Tools: {tokens.get('tools', 0):,}")
         lines.append(f"    Messages: {tokens.get('messages', 0):,}")
         lines.append(f"    Available: {tokens.get('available', 0):,}")
+        if tool_tokens:
+            shown = list(tool_tokens.items())[:_STATUS_TOP_TOOL_TOKENS]
+            lines.append(f"  Largest tool definitions ({len(shown)} of {len(tool_tokens)}):")
+            for name, count in shown:
+                lines.append(f"    {name}: {count:,}")
 
     # Tool list (if requested)
     if tool_list:
@@ -623,6 +638,8 @@ async def cmd_save(
         disabled_tools=disabled_tools,
         model_alias=model_alias,
         clipboard_agent_entries=clipboard_entries,
+        message_token_counts=agent.context.message_token_counts(),
+        token_counter=agent.context.token_counter_id,
     )
 
     try:
@@ -670,8 +687,7 @@ async def cmd_clone(
             new_agent = await ctx.pool.create(agent_id=dest)
 
             # Copy context (messages and system prompt)
-            for msg in src_agent.context.messages:
-                new_agent.context._messages.append(msg)
+            new_agent.context.restore_messages(src_agent.context.messages)
             new_agent.context.set_system_prompt(src_agent.context.system_prompt or "")
 
             return CommandOutput.success(
@@ -736,8 +752,7 @@ async def cmd_rename(
             new_agent = await ctx.pool.create(agent_id=new)
 
             # Copy state
-            for msg in old_agent.context.messages:
-                new_agent.context._messages.append(msg)
+            new_agent.context.restore_messages(old_agent.context.messages)
             new_agent.context.set_system_prompt(old_agent.context.system_prompt or "")
 
             # Destroy old
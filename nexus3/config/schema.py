@@ -61,6 +61,50 @@ class AuthMethod(StrEnum):
     NONE = "none"  # No auth (local Ollama)
 
 
+class TokenizerConfig(BaseModel):
+    """Tokenizer used to count tokens for a model.
+
+    Types:
+        - simple: ~4 characters per token heuristic (no dependencies)
+        - tiktoken: tiktoken encoding by name (requires ``tiktoken``)
+        - huggingface: local ``tokenizer.json`` file (requires ``tokenizers``)
+
+    Example in config.json:
+        "models": {
+            "qwen": {
+                "id": "qwen/qwen3-coder",
+                "tokenizer": {"type": "huggingface", "path": "~/models/qwen3/tokenizer.json"}
+            }
+        }
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: Literal["simple", "tiktoken", "huggingface"] = "tiktoken"
+    """Tokenizer backend."""
+
+    encoding: str = "cl100k_base"
+    """tiktoken encoding name (tiktoken only)."""
+
+    path: str | None = None
+    """Path to a HuggingFace tokenizer.json file (huggingface only)."""
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, v: str | None) -> str | None:
+        """Expand ~ and make the tokenizer path absolute."""
+        if v is None:
+            return None
+        return os.path.abspath(os.path.expanduser(v))
+
+    @model_validator(mode="after")
+    def validate_path(self) -> "TokenizerConfig":
+        """Require a path for huggingface tokenizers."""
+        if self.type == "huggingface" and not self.path:
+            raise ValueError("TokenizerConfig: 'huggingface' tokenizer requires 'path'")
+        return self
+
+
 class ModelConfig(BaseModel):
     """Configuration for a model under a provider.
 
@@ -91,6 +135,10 @@ class ModelConfig(BaseModel):
     guidance: str | None = None
     """Brief usage guidance for this model (e.g., 'Fast, cheap. Good for research.')."""
 
+    tokenizer: TokenizerConfig | None = None
+    """Tokenizer for token counting. Falls back to the provider's tokenizer, then
+    to tiktoken cl100k_base (or the character heuristic if tiktoken is missing)."""
+
 
 class ProviderConfig(BaseModel):
     """Configuration for an LLM provider with its models.
@@ -156,6 +204,9 @@ class ProviderConfig(BaseModel):
     models: dict[str, ModelConfig] = {}
     """Model aliases available through this provider."""
 
+    tokenizer: TokenizerConfig | None = None
+    """Default tokenizer for this provider's models (a model's own setting wins)."""
+
     @field_validator("ssl_ca_cert", mode="before")
     @classmethod
     def normalize_ssl_ca_cert(cls, v: str | None) -> str | None:
@@ -300,6 +351,45 @@ class CompactionConfig(BaseModel):
     )
     """Whether to redact secrets before summarization."""
 
+    chunk_budget_ratio: float | None = Field(default=None, gt=0.0, le=1.0)
+    """Ratio of the compaction model's context window one summarization
+    request may fill. Larger histories are summarized in chunks and merged.
+    None = what the summary reservation leaves, 1 - summary_budget_ratio, so
+    only prompts that cannot fit alongside the summary are chunked."""
+
+    max_parallel_summaries: int = Field(default=4, ge=1, le=32)
+    """Maximum chunk summaries requested concurrently."""
+
+    strategy: Literal["full", "incremental"] = "full"
+    """How older history is summarized. "full" re-summarizes everything,
+    including the previous summary. "incremental" keeps the previous summary
+    as a fixed prefix, folds in only messages added since, and condenses the
+    result when it exceeds summary_budget_ratio."""
+
+    precompact_threshold: float | None = Field(default=None, gt=0.0, lt=1.0)
+    """Start summarizing older history in the background once context exceeds
+    this ratio of available budget, so compaction at trigger_threshold can
+    reuse the result. None = disabled. Must be below trigger_threshold."""
+
+    @property
+    def request_budget_ratio(self) -> float:
+        """Effective chunk_budget_ratio (see its docstring for None)."""
+        if self.chunk_budget_ratio is not None:
+            return self.chunk_budget_ratio
+        return 1.0 - self.summary_budget_ratio
+
+    @model_validator(mode="after")
+    def validate_precompact_threshold(self) -> "CompactionConfig":
+        """Ensure background pre-compaction starts before the hard threshold."""
+        if (
+            self.precompact_threshold is not None
+            and self.precompact_threshold >= self.trigger_threshold
+        ):
+            raise ValueError(
+                "CompactionConfig: 'precompact_threshold' must be below 'trigger_threshold'"
+            )
+        return self
+
 
 class ClipboardConfig(BaseModel):
     """Configuration for clipboard system."""
@@ -392,6 +482,50 @@ class ContextConfig(BaseModel):
         return v
 
 
+class SessionStorageConfig(BaseModel):
+    """Write behaviour of per-session logs (session.db and the log files).
+
+    Durability modes for session.db:
+        - full: commit every write synchronously (rollback journal). A write
+          is on disk before the call returns, but each one costs an fsync on
+          the event loop.
+        - batched: WAL journal with synchronous=NORMAL and a background writer
+          thread that groups writes into one transaction per flush interval.
+          Writes never block the event loop; a crash can lose roughly the last
+          flush interval of log rows.
+
+    With buffered_logs (default), context.md, verbose.md and raw.jsonl are
+    written through one open descriptor per file by a worker thread instead
+    of an open/write/close per entry on the event loop.
+
+    Example in config.json:
+        "session_storage": {
+            "durability": "batched",
+            "flush_interval_ms": 50
+        }
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    durability: Literal["full", "batched"] = "full"
+    """Durability mode: 'full' (commit per write) or 'batched' (WAL + writer thread)."""
+
+    flush_interval_ms: int = Field(default=50, ge=1, le=5000)
+    """Batched mode: maximum time a queued write waits before its commit."""
+
+    max_batch: int = Field(default=512, ge=1, le=100000)
+    """Batched mode: maximum writes grouped into one transaction."""
+
+    buffered_logs: bool = True
+    """Write markdown/raw log files through a buffered writer thread."""
+
+    log_flush_interval_ms: int = Field(default=100, ge=1, le=10000)
+    """Buffered logs: maximum time an entry waits before it is written."""
+
+    log_buffer_max_bytes: int = Field(default=8 * 1024 * 1024, ge=64 * 1024)
+    """Buffered logs: cap on unwritten bytes; entries beyond it are dropped and counted."""
+
+
 class ServerConfig(BaseModel):
     """Configuration for the NEXUS3 HTTP server.
 
@@ -416,6 +550,12 @@ class ServerConfig(BaseModel):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     """Logging level for server operations."""
 
+    keep_alive_timeout: float | None = Field(default=5.0, gt=0, le=300)
+    """Seconds an idle keep-alive connection is held open (None disables keep-alive)."""
+
+    max_requests_per_connection: int = Field(default=100, ge=1, le=100000)
+    """Requests served on one keep-alive connection before the server closes it."""
+
 
 class SearchConfig(BaseModel):
     """Configuration for optional external search acceleration."""
@@ -428,6 +568,16 @@ class SearchConfig(BaseModel):
     require_ripgrep: bool = False
     """Fail closed for directory search_text when ripgrep cannot be used."""
 
+    content_index: bool = False
+    """Keep a trigram index in <cwd>/.nexus3/search_index.db that lets
+    search_text's Python fallback (used by sandboxed agents) skip files that
+    cannot match. Updated incrementally from file mtime/size."""
+
+    symbol_index: bool = False
+    """Persist outline's parse cache and project symbol index in
+    <cwd>/.nexus3/symbol_index.db and refresh it in the background. Without
+    it the cache and index live in memory for the process."""
+
     @field_validator("ripgrep_path", mode="before")
     @classmethod
     def normalize_ripgrep_path(cls, v: str | None) -> str | None:
@@ -606,6 +756,20 @@ class MCPServerConfig(BaseModel):
     fail_if_no_tools: bool = False
     """If True, fail connection when tool listing fails after transport connect."""
 
+    max_concurrent_requests: int = Field(default=8, ge=1)
+    """Maximum requests in flight to this server at once. Responses are routed
+    by JSON-RPC id, so independent tool calls overlap instead of queueing.
+    Set to 1 for servers that cannot handle concurrent requests."""
+
+    pooled: bool = False
+    """Share one server process among every connection with the same command,
+    env and cwd (stdio only). The tool list is cached and refreshed when the
+    server sends notifications/tools/list_changed."""
+
+    pool_idle_timeout: float = Field(default=300.0, ge=0)
+    """Seconds a pooled process stays up after its last connection is closed,
+    so a reconnect reuses it. 0 shuts it down immediately."""
+
     def get_command_list(self) -> list[str]:
         """Return command as list, merging command + args if needed.
 
@@ -648,6 +812,7 @@ class ResolvedModel:
         alias: str,
         provider_name: str,
         guidance: str | None = None,
+        tokenizer: TokenizerConfig | None = None,
     ) -> None:
         self.model_id = model_id
         self.context_window = context_window
@@ -655,6 +820,7 @@ class ResolvedModel:
         self.alias = alias
         self.provider_name = provider_name
         self.guidance = guidance
+        self.tokenizer = tokenizer
 
 
 class Config(BaseModel):
@@ -735,6 +901,7 @@ class Config(BaseModel):
     context: ContextConfig = ContextConfig()
     mcp_servers: list[MCPServerConfig] = []
     server: ServerConfig = ServerConfig()
+    session_storage: SessionStorageConfig = SessionStorageConfig()
     gitlab: GitLabConfig = GitLabConfig()
 
     @model_validator(mode="after")
@@ -845,6 +1012,10 @@ class Config(BaseModel):
                         alias=model_alias,
                         provider_name=provider_name,
                         guidance=model_config.guidance,
+                        tokenizer=(
+                            model_config.tokenizer
+                            or self.providers[provider_name].tokenizer
+                        ),
                     )
 
         # Search for alias across all providers
@@ -856,6 +1027,7 @@ class Config(BaseModel):
             alias=alias,
             provider_name=provider_name,
             guidance=model_config.guidance,
+            tokenizer=model_config.tokenizer or self.providers[provider_name].tokenizer,
         )
 
     def list_models(self) -> list[str]:
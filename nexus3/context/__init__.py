@@ -6,11 +6,16 @@ It also provides token counting functionality with pluggable backends and
 context management for conversation state and token budgets.
 """
 
+from nexus3.context.calibration import TokenCalibration, get_token_calibration
 from nexus3.context.compaction import (
     CompactionResult,
+    batch_summaries,
+    build_chunk_summarize_prompt,
+    build_merge_prompt,
     build_summarize_prompt,
     create_summary_message,
     select_messages_for_compaction,
+    split_for_summary,
 )
 from nexus3.context.compiler import (
     CompiledContextIR,
@@ -52,19 +57,29 @@ from nexus3.context.prompt_builder import (
     StructuredPrompt,
 )
 from nexus3.context.token_counter import (
+    CachedTokenCounter,
+    HuggingFaceTokenCounter,
     SimpleTokenCounter,
     TiktokenCounter,
+    TokenCountCache,
     TokenCounter,
+    describe_token_counter,
+    get_token_count_cache,
     get_token_counter,
+    get_token_counter_for_model,
 )
 from nexus3.core.utils import deep_merge
 
 __all__ = [
     # Compaction
     "CompactionResult",
+    "batch_summaries",
+    "build_chunk_summarize_prompt",
+    "build_merge_prompt",
     "build_summarize_prompt",
     "create_summary_message",
     "select_messages_for_compaction",
+    "split_for_summary",
     # Compiler
     "InvariantCode",
     "InvariantViolation",
@@ -91,11 +106,20 @@ __all__ = [
     "PromptSource",
     "deep_merge",
     "get_system_info",
+    # Calibration
+    "TokenCalibration",
+    "get_token_calibration",
     # Token counter
     "TokenCounter",
     "SimpleTokenCounter",
     "TiktokenCounter",
+    "HuggingFaceTokenCounter",
+    "CachedTokenCounter",
+    "TokenCountCache",
+    "describe_token_counter",
+    "get_token_count_cache",
     "get_token_counter",
+    "get_token_counter_for_model",
     # Context manager
     "ContextManager",
     "ContextConfig",
@@ -0,0 +1,108 @@
+"""Calibration of local token estimates against provider-reported usage.
+
+Local tokenizers rarely match the provider exactly: chat templates, tool schema
+rendering and model-specific vocabularies all shift the real prompt size. After
+each streamed request the session records the provider's ``prompt_tokens``
+against the local estimate for the same request; the running ratio is used as
+a correction factor for budget checks (truncation and compaction triggers).
+
+Calibrations are shared process-wide per (model, token counter) pair, so every
+agent on the same model benefits from the others' samples.
+"""
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nexus3.config.schema import ResolvedModel
+
+
+class TokenCalibration:
+    """Exponentially weighted ratio of reported to estimated prompt tokens."""
+
+    def __init__(
+        self,
+        smoothing: float = 0.3,
+        min_factor: float = 0.5,
+        max_factor: float = 2.0,
+        min_estimate: int = 256,
+    ) -> None:
+        """Initialize an uncalibrated (factor 1.0) calibration.
+
+        Args:
+            smoothing: Weight of each new sample in the moving average.
+            min_factor: Lower clamp for the correction factor.
+            max_factor: Upper clamp for the correction factor.
+            min_estimate: Samples with a smaller estimate are ignored; tiny
+                prompts are dominated by fixed per-request overhead.
+        """
+        self._smoothing = smoothing
+        self._min_factor = min_factor
+        self._max_factor = max_factor
+        self._min_estimate = min_estimate
+        self._factor = 1.0
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    @property
+    def factor(self) -> float:
+        """Current correction factor (reported / estimated)."""
+        return self._factor
+
+    @property
+    def samples(self) -> int:
+        """Number of samples recorded."""
+        return self._samples
+
+    def record(self, estimated: int, reported: int) -> None:
+        """Record one request's local estimate and reported prompt tokens.
+
+        Args:
+            estimated: Local estimate for the request as sent.
+            reported: Provider-reported prompt tokens for the same request.
+        """
+        if estimated < self._min_estimate or reported <= 0:
+            return
+        ratio = min(self._max_factor, max(self._min_factor, reported / estimated))
+        with self._lock:
+            if self._samples == 0:
+                self._factor = ratio
+            else:
+                self._factor += self._smoothing * (ratio - self._factor)
+            self._samples += 1
+
+    def apply(self, tokens: int) -> int:
+        """Scale a local estimate by the correction factor."""
+        return round(tokens * self._factor)
+
+
+_calibrations: dict[str, TokenCalibration] = {}
+_calibrations_lock = threading.Lock()
+
+
+def get_token_calibration(
+    model: "ResolvedModel | str | None",
+    counter_id: str,
+) -> TokenCalibration:
+    """Return the shared calibration for a model and token counter.
+
+    Args:
+        model: Resolved model, a model key string, or None for the default.
+        counter_id: Token counter identity (see describe_token_counter).
+
+    Returns:
+        The process-wide TokenCalibration for this pair.
+    """
+    if model is None:
+        model_key = "default"
+    elif isinstance(model, str):
+        model_key = model
+    else:
+        model_key = f"{model.provider_name}/{model.model_id}"
+    key = f"{model_key}|{counter_id}"
+    with _calibrations_lock:
+        calibration = _calibrations.get(key)
+        if calibration is None:
+            calibration = TokenCalibration()
+            _calibrations[key] = calibration
+    return calibration
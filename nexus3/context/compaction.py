@@ -1,7 +1,19 @@
-"""Context compaction via LLM summarization."""
+"""Context compaction via LLM summarization.
+
+Histories too large for one summarization request are compacted map-reduce
+style: split_for_summary() cuts them into chunks along context-graph group
+boundaries, each chunk is summarized on its own (build_chunk_summarize_prompt),
+and the partial summaries are merged (build_merge_prompt), in several rounds
+if batch_summaries() cannot fit them into one merge request.
+
+The incremental strategy keeps the previous summary as a fixed prefix: only
+messages added since the last compaction are summarized and folded into it
+(build_incremental_summarize_prompt), and a rolling summary that outgrows its
+budget is condensed (build_condense_prompt).
+"""
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from nexus3.context.graph import build_context_graph
@@ -9,6 +21,9 @@ from nexus3.context.token_counter import TokenCounter
 from nexus3.core.redaction import redact_dict, redact_secrets
 from nexus3.core.types import Message, Role
 
+# Opening of every summary message, followed by the generation timestamp
+SUMMARY_HEADER = "[CONTEXT SUMMARY - Generated: "
+
 
 def get_summary_prefix() -> str:
     """Generate summary prefix with current timestamp.
@@ -18,7 +33,7 @@ def get_summary_prefix() -> str:
     """
     now = datetime.now()
     timestamp = now.strftime("%Y-%m-%d %H:%M")
-    return f"""[CONTEXT SUMMARY - Generated: {timestamp}]
+    return f"""{SUMMARY_HEADER}{timestamp}]
 The following is a summary of our previous conversation. It was automatically
 generated when the context window needed compaction. Treat this as established
 context - you don't need to re-confirm decisions already made.
@@ -42,6 +57,72 @@ CONVERSATION:
 
 SUMMARY:"""
 
+CHUNK_SUMMARIZE_PROMPT = """Summarize part {part} of {total} of a longer conversation.
+The parts are summarized separately and merged afterwards, so summarize only
+what happens in this part.
+
+Preserve:
+- Key decisions made and their rationale
+- Files created/modified and why
+- Task state at the end of this part
+- Important constraints or requirements mentioned
+- Any errors encountered and how they were resolved
+
+Be concise but complete.
+
+CONVERSATION PART:
+{conversation}
+
+SUMMARY:"""
+
+MERGE_SUMMARIES_PROMPT = """Merge these summaries of consecutive parts of one conversation
+into a single summary for context continuity. Later parts supersede earlier
+ones where they disagree.
+
+Preserve:
+- Key decisions made and their rationale
+- Files created/modified and why
+- Current task state and next steps
+- Important constraints or requirements mentioned
+- Any errors encountered and how they were resolved
+
+Be concise but complete. This summary replaces the full conversation history.
+
+SUMMARIES:
+{summaries}
+
+MERGED SUMMARY:"""
+
+INCREMENTAL_SUMMARIZE_PROMPT = """Update a running conversation summary with what happened since.
+
+Fold the new conversation into the existing summary. Keep everything from the
+existing summary that still matters, drop what the new conversation has made
+obsolete, and record the current task state and next steps.
+{length_hint}
+EXISTING SUMMARY:
+{previous_summary}
+
+NEW CONVERSATION:
+{conversation}
+
+UPDATED SUMMARY:"""
+
+CONDENSE_SUMMARY_PROMPT = """Condense this conversation summary to about {max_tokens} tokens.
+
+Keep decisions and their rationale, modified files, constraints, unresolved
+errors, and the current task state and next steps. Drop resolved detail first.
+
+SUMMARY:
+{summary}
+
+CONDENSED SUMMARY:"""
+
+# Metadata key marking a message created by create_summary_message()
+SUMMARY_META_KEY = "compaction_summary"
+
+# Marker left in place of message content cut to fit one chunk
+_CLIPPED_MARKER = "\n\n[... {omitted} characters omitted for summarization ...]\n\n"
+
 
 @dataclass
 class CompactionResult:
@@ -109,10 +190,39 @@ def create_summary_message(summary_text: str) -> Message:
     """
     return Message(
         role=Role.USER,
-        content=f"{get_summary_prefix()}{summary_text}"
+        content=f"{get_summary_prefix()}{summary_text}",
+        meta={SUMMARY_META_KEY: True},
     )
 
 
+def is_summary_message(msg: Message) -> bool:
+    """Check whether a message is a compaction summary.
+
+    Args:
+        msg: Message to check
+
+    Returns:
+        True for messages created by create_summary_message(), including ones
+        restored from sessions saved before the metadata marker existed.
+    """
+    if msg.role != Role.USER:
+        return False
+    return bool(msg.meta.get(SUMMARY_META_KEY)) or msg.content.startswith(SUMMARY_HEADER)
+
+
+def get_summary_text(msg: Message) -> str:
+    """Return the summary text of a summary message, without its prefix.
+
+    Args:
+        msg: Message created by create_summary_message()
+
+    Returns:
+        The text that was passed to create_summary_message()
+    """
+    _, separator, text = msg.content.partition("\n---\n")
+    return text if separator else msg.content
+
+
 def build_summarize_prompt(messages: list[Message]) -> str:
     """Build the prompt for the summarization LLM call.
 
@@ -126,6 +236,185 @@ def build_summarize_prompt(messages: list[Message]) -> str:
     return SUMMARIZE_PROMPT.format(conversation=conversation)
 
 
+def build_incremental_summarize_prompt(
+    previous_summary: str,
+    messages: list[Message],
+    max_tokens: int | None = None,
+) -> str:
+    """Build the prompt folding new messages into an existing summary.
+
+    Args:
+        previous_summary: Summary text from the previous compaction
+        messages: Messages added since the previous compaction
+        max_tokens: Optional size bound for the updated summary
+
+    Returns:
+        Complete prompt for the incremental summarization
+    """
+    length_hint = ""
+    if max_tokens is not None:
+        length_hint = f"Keep the updated summary under about {max_tokens} tokens.\n"
+    return INCREMENTAL_SUMMARIZE_PROMPT.format(
+        length_hint=length_hint,
+        previous_summary=previous_summary,
+        conversation=format_messages_for_summary(messages),
+    )
+
+
+def build_condense_prompt(summary: str, max_tokens: int) -> str:
+    """Build the prompt shrinking a summary that exceeds its budget.
+
+    Args:
+        summary: Summary text to condense
+        max_tokens: Target size of the condensed summary
+
+    Returns:
+        Complete prompt for condensing the summary
+    """
+    return CONDENSE_SUMMARY_PROMPT.format(max_tokens=max_tokens, summary=summary)
+
+
+def build_chunk_summarize_prompt(messages: list[Message], part: int, total: int) -> str:
+    """Build the prompt summarizing one chunk of a split history.
+
+    Args:
+        messages: Messages in the chunk
+        part: 1-indexed position of the chunk
+        total: Number of chunks
+
+    Returns:
+        Complete prompt for summarizing the chunk
+    """
+    conversation = format_messages_for_summary(messages)
+    return CHUNK_SUMMARIZE_PROMPT.format(part=part, total=total, conversation=conversation)
+
+
+def build_merge_prompt(summaries: list[str]) -> str:
+    """Build the prompt merging partial summaries, oldest first.
+
+    Args:
+        summaries: Summaries of consecutive parts of the history
+
+    Returns:
+        Complete prompt for merging the summaries
+    """
+    parts = [f"PART {i}:\n{summary}" for i, summary in enumerate(summaries, 1)]
+    return MERGE_SUMMARIES_PROMPT.format(summaries="\n\n".join(parts))
+
+
+def _clip_group(
+    group: list[Message],
+    token_counter: TokenCounter,
+    max_tokens: int,
+) -> list[Message]:
+    """Shorten message contents of a group that alone exceeds max_tokens.
+
+    The start and end of each long content are kept; the middle is replaced
+    by a marker. Tool calls and ids are left intact.
+    """
+    group_tokens = token_counter.count(format_messages_for_summary(group))
+    if group_tokens <= max_tokens:
+        return group
+
+    ratio = max_tokens / group_tokens
+    clipped: list[Message] = []
+    for msg in group:
+        keep = int(len(msg.content) * ratio)
+        if keep >= len(msg.content):
+            clipped.append(msg)
+            continue
+        head = keep // 2
+        tail = keep - head
+        marker = _CLIPPED_MARKER.format(omitted=len(msg.content) - keep)
+        content = msg.content[:head] + marker + (msg.content[-tail:] if tail else "")
+        clipped.append(replace(msg, content=content))
+    return clipped
+
+
+def split_for_summary(
+    messages: list[Message],
+    token_counter: TokenCounter,
+    max_chunk_tokens: int,
+) -> list[list[Message]]:
+    """Split messages into chunks that each fit one summarization request.
+
+    Chunks are cut only between atomic message groups (compiler/graph-backed),
+    so a tool call batch and its results always land in the same chunk. A
+    group that is larger than max_chunk_tokens on its own becomes a single
+    chunk with its longest contents clipped in the middle.
+
+    Args:
+        messages: Messages to summarize
+        token_counter: Token counter implementation
+        max_chunk_tokens: Token budget of the formatted conversation per chunk
+
+    Returns:
+        Non-empty chunks in conversation order
+    """
+    if not messages:
+        return []
+
+    graph = build_context_graph(messages)
+    normalized_messages = list(graph.messages)
+
+    chunks: list[list[Message]] = []
+    current: list[Message] = []
+    current_tokens = 0
+    for group in graph.groups:
+        group_messages = [normalized_messages[i] for i in group.message_indices]
+        group_tokens = token_counter.count(format_messages_for_summary(group_messages))
+        if current and current_tokens + group_tokens > max_chunk_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        if group_tokens > max_chunk_tokens:
+            chunks.append(_clip_group(group_messages, token_counter, max_chunk_tokens))
+            continue
+        current.extend(group_messages)
+        current_tokens += group_tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def batch_summaries(
+    summaries: list[str],
+    token_counter: TokenCounter,
+    max_batch_tokens: int,
+) -> list[list[str]]:
+    """Group consecutive partial summaries into merge requests.
+
+    Every batch holds at least two summaries (when there are two left to
+    pair), even if that exceeds max_batch_tokens, so each merge round at
+    least halves the number of summaries.
+
+    Args:
+        summaries: Partial summaries in conversation order
+        token_counter: Token counter implementation
+        max_batch_tokens: Token budget of the summaries per merge request
+
+    Returns:
+        Batches in conversation order
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for summary in summaries:
+        tokens = token_counter.count(summary)
+        if len(current) >= 2 and current_tokens + tokens > max_batch_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(summary)
+        current_tokens += tokens
+
+    if current:
+        if len(current) == 1 and batches:
+            batches[-1].append(current[0])
+        else:
+            batches.append(current)
+    return batches
+
+
 def select_messages_for_compaction(
     messages: list[Message],
     token_counter: TokenCounter,
@@ -1,7 +1,22 @@
-"""Git repository context detection and formatting for NEXUS3 agents."""
+"""Git repository context detection and formatting for NEXUS3 agents.
 
+get_git_context() is the blocking form for setup paths. Turn-time refreshes
+go through GitContextRefresher, which runs git via asyncio subprocesses so a
+slow ``git status`` in a large repository never stalls the event loop, and
+coalesces concurrent refreshes of the same directory across agents.
+
+The stash count comes from the ``# stash`` header of ``git status
+--porcelain=v2 --show-stash``, which git only prints from 2.35 on; older
+versions fall back to counting ``git stash list``.
+"""
+
+import asyncio
+import contextlib
+import os
 import re
 import subprocess
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 # Hard cap on total git context length
@@ -13,6 +28,20 @@ _MAX_COMMIT_MSG_LENGTH = 72
 # Timeout for each git subprocess call (seconds)
 _GIT_TIMEOUT = 5
 
+# One call gives repo detection, branch, HEAD, file status and stash count
+_STATUS_ARGS = ["status", "--porcelain=v2", "--branch", "--show-stash"]
+_COMMIT_ARGS = ["log", "-1", "--format=%h %s"]
+_REMOTE_ARGS = ["remote", "get-url", "origin"]
+_WORKTREE_ARGS = ["worktree", "list", "--porcelain"]
+_STASH_LIST_ARGS = ["stash", "list"]
+_VERSION_ARGS = ["--version"]
+
+# First git version whose porcelain v2 status prints the "# stash" header
+_STASH_HEADER_MIN_VERSION = (2, 35)
+
+# Whether the installed git prints "# stash"; probed once per process
+_status_reports_stash: bool | None = None
+
 # Tools whose execution should trigger a git context refresh
 _GIT_REFRESH_TOOLS = frozenset({
     "git",           # Any git command could change state
@@ -68,6 +97,40 @@ def _run_git(args: list[str], cwd: str | Path) -> str | None:
         return None
 
 
+async def _run_git_async(args: list[str], cwd: str | Path) -> tuple[int, str] | None:
+    """Run a git command without blocking the event loop.
+
+    Returns:
+        (returncode, stripped stdout), or None if git could not be run or
+        timed out.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=str(cwd),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except (OSError, ValueError):
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), _GIT_TIMEOUT)
+    except TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        return None
+    except BaseException:
+        # Cancelled: do not leave the child running
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        raise
+    assert proc.returncode is not None
+    return proc.returncode, stdout.decode("utf-8", errors="replace").strip()
+
+
 def _sanitize_remote_url(url: str) -> str:
     """Strip credentials and .git suffix from remote URL.
 
@@ -94,7 +157,7 @@ def _sanitize_remote_url(url: str) -> str:
 
 
 def _parse_status_counts(porcelain_output: str) -> dict[str, int]:
-    """Parse `git status --porcelain` output into counts.
+    """Parse `git status --porcelain=v2` entries into counts.
 
     Returns dict with keys: staged, modified, untracked.
     """
@@ -103,12 +166,11 @@ def _parse_status_counts(porcelain_output: str) -> dict[str, int]:
     untracked = 0
 
     for line in porcelain_output.splitlines():
-        if len(line) < 2:
-            continue
-        x, y = line[0], line[1]
-        if x == "?" and y == "?":
+        kind = line[:1]
+        if kind == "?":
             untracked += 1
-        else:
+        elif kind in ("1", "2", "u") and len(line) >= 4:
+            x, y = line[2], line[3]
             if x in "AMDRC":
                 staged += 1
             if y in "MD":
@@ -117,88 +179,145 @@ def _parse_status_counts(porcelain_output: str) -> dict[str, int]:
     return {"staged": staged, "modified": modified, "untracked": untracked}
 
 
-def get_git_context(cwd: str | Path) -> str | None:
-    """Get formatted git repository context for the given directory.
+@dataclass(frozen=True)
+class _StatusSummary:
+    """Parsed ``git status --porcelain=v2 --branch --show-stash`` output."""
 
-    Runs several git commands to gather repository information and formats
-    it into a concise block suitable for system prompt injection.
+    head_oid: str
+    branch: str
+    counts: dict[str, int]
+    stashes: int | None  # None when status had no "# stash" header
 
-    Args:
-        cwd: Working directory to check for git repository.
 
-    Returns:
-        Formatted git context string. Returns "No git repository detected
-        in CWD." if not a repo. Returns None only if git is not installed
-        or commands fail unexpectedly. Output is hard-capped at 500 characters.
-    """
-    # Check if inside a git repo — distinguish "not a repo" from "git unavailable"
-    try:
-        check = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=_GIT_TIMEOUT,
-            encoding="utf-8",
-            errors="replace",
-        )
-        if check.stdout.strip() != "true":
-            # git ran but this is not a repo
-            return "No git repository detected in CWD."
-    except (OSError, subprocess.TimeoutExpired, ValueError):
-        # git not installed or other system error — omit silently
+def _parse_status(output: str) -> _StatusSummary:
+    head_oid = ""
+    branch = ""
+    stashes: int | None = None
+    for line in output.splitlines():
+        if not line.startswith("# "):
+            continue
+        key, _, value = line[2:].partition(" ")
+        if key == "branch.oid":
+            head_oid = value
+        elif key == "branch.head":
+            # Match `rev-parse --abbrev-ref HEAD` wording for detached HEAD
+            branch = "HEAD" if value == "(detached)" else value
+        elif key == "stash" and value.isdigit():
+            stashes = int(value)
+    return _StatusSummary(head_oid, branch, _parse_status_counts(output), stashes)
+
+
+def _supports_stash_header(version_output: str | None) -> bool:
+    """True if `git --version` output is at least _STASH_HEADER_MIN_VERSION."""
+    match = re.search(r"(\d+)\.(\d+)", version_output or "")
+    if match is None:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= _STASH_HEADER_MIN_VERSION
+
+
+def _count_stash_list(output: str | None) -> int:
+    return len(output.splitlines()) if output else 0
+
+
+def _stash_count(status: _StatusSummary, cwd: str | Path) -> int:
+    """Stash count, running `git stash list` if status could not report it."""
+    global _status_reports_stash
+    if status.stashes is not None:
+        return status.stashes
+    if _status_reports_stash is None:
+        _status_reports_stash = _supports_stash_header(_run_git(_VERSION_ARGS, cwd))
+    if _status_reports_stash:
+        return 0
+    return _count_stash_list(_run_git(_STASH_LIST_ARGS, cwd))
+
+
+async def _stash_count_async(status: _StatusSummary, cwd: str | Path) -> int:
+    """Non-blocking _stash_count()."""
+    global _status_reports_stash
+    if status.stashes is not None:
+        return status.stashes
+    if _status_reports_stash is None:
+        ran = await _run_git_async(_VERSION_ARGS, cwd)
+        _status_reports_stash = _supports_stash_header(ran[1] if ran is not None else None)
+    if _status_reports_stash:
+        return 0
+    ran = await _run_git_async(_STASH_LIST_ARGS, cwd)
+    return _count_stash_list(ran[1] if ran is not None and ran[0] == 0 else None)
+
+
+def _cache_key(cwd: str | Path) -> str:
+    """Normalized directory key shared by the blocking and async paths."""
+    return os.path.abspath(cwd)
+
+
+@dataclass(frozen=True)
+class _RepoFacts:
+    """Repository details that only change with HEAD (or rarely at all)."""
+
+    commit: str | None
+    remote: str | None
+    worktrees: str | None
+
+
+# Facts per (cwd, HEAD oid), so refreshes after file edits need only the
+# single status call. Bounded; oldest entries are evicted first.
+_FACTS_CACHE: OrderedDict[tuple[str, str], _RepoFacts] = OrderedDict()
+_FACTS_CACHE_SIZE = 64
+
+
+def _cached_facts(cwd: str, head_oid: str) -> _RepoFacts | None:
+    if head_oid in ("", "(initial)"):
         return None
+    facts = _FACTS_CACHE.get((cwd, head_oid))
+    if facts is not None:
+        _FACTS_CACHE.move_to_end((cwd, head_oid))
+    return facts
 
-    lines = ["Git repository detected in CWD."]
 
-    # Branch name
-    branch = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd)
-    if branch:
-        lines.append(f"  Branch: {branch}")
+def _store_facts(cwd: str, head_oid: str, facts: _RepoFacts) -> None:
+    if head_oid in ("", "(initial)"):
+        return
+    _FACTS_CACHE[(cwd, head_oid)] = facts
+    _FACTS_CACHE.move_to_end((cwd, head_oid))
+    while len(_FACTS_CACHE) > _FACTS_CACHE_SIZE:
+        _FACTS_CACHE.popitem(last=False)
+
+
+def _format_git_context(status: _StatusSummary, facts: _RepoFacts) -> str:
+    lines = ["Git repository detected in CWD."]
 
-    # Status counts + stash count
-    status_output = _run_git(["status", "--porcelain"], cwd)
-    stash_output = _run_git(["stash", "list"], cwd)
+    if status.branch:
+        lines.append(f"  Branch: {status.branch}")
 
+    counts = status.counts
     status_parts: list[str] = []
-    if status_output is not None:
-        counts = _parse_status_counts(status_output)
-        if counts["staged"]:
-            status_parts.append(f"{counts['staged']} staged")
-        if counts["modified"]:
-            status_parts.append(f"{counts['modified']} modified")
-        if counts["untracked"]:
-            status_parts.append(f"{counts['untracked']} untracked")
-
-    if stash_output:
-        stash_count = len(stash_output.splitlines())
-        if stash_count > 0:
-            status_parts.append(f"{stash_count} stash{'es' if stash_count != 1 else ''}")
-
-    if status_parts:
-        lines.append(f"  Status: {', '.join(status_parts)}")
-    elif status_output is not None:
-        lines.append("  Status: clean")
+    if counts["staged"]:
+        status_parts.append(f"{counts['staged']} staged")
+    if counts["modified"]:
+        status_parts.append(f"{counts['modified']} modified")
+    if counts["untracked"]:
+        status_parts.append(f"{counts['untracked']} untracked")
+    if status.stashes:
+        status_parts.append(f"{status.stashes} stash{'es' if status.stashes != 1 else ''}")
+    lines.append(f"  Status: {', '.join(status_parts)}" if status_parts else "  Status: clean")
 
     # Last commit
-    commit = _run_git(["log", "-1", "--format=%h %s"], cwd)
+    commit = facts.commit
     if commit:
         if len(commit) > _MAX_COMMIT_MSG_LENGTH:
             commit = commit[:_MAX_COMMIT_MSG_LENGTH - 3] + "..."
         lines.append(f"  Last commit: {commit}")
 
     # Remote URL
-    remote = _run_git(["remote", "get-url", "origin"], cwd)
-    if remote:
-        sanitized = _sanitize_remote_url(remote)
+    if facts.remote:
+        sanitized = _sanitize_remote_url(facts.remote)
         lines.append(f"  Remote: origin \u2192 {sanitized}")
 
     # Worktrees (only show if more than the main one)
-    worktree_output = _run_git(["worktree", "list", "--porcelain"], cwd)
-    if worktree_output:
+    if facts.worktrees:
         worktrees = [
             line.split(" ", 1)[1]
-            for line in worktree_output.splitlines()
+            for line in facts.worktrees.splitlines()
             if line.startswith("worktree ")
         ]
         if len(worktrees) > 1:
@@ -214,3 +333,174 @@ def get_git_context(cwd: str | Path) -> str | None:
         result = result[:_MAX_CONTEXT_LENGTH - 3] + "..."
 
     return result
+
+
+def get_git_context(cwd: str | Path) -> str | None:
+    """Get formatted git repository context for the given directory.
+
+    One ``git status --porcelain=v2 --branch --show-stash`` call detects the
+    repository and gives branch, HEAD, status counts and stash count; last
+    commit, origin remote and worktrees are then read fresh (and cached per
+    HEAD for get_git_context_async()). This blocks - on the event loop, use
+    get_git_context_async() or GitContextRefresher instead.
+
+    Args:
+        cwd: Working directory to check for git repository.
+
+    Returns:
+        Formatted git context string. Returns "No git repository detected
+        in CWD." if not a repo. Returns None only if git is not installed
+        or commands fail unexpectedly. Output is hard-capped at 500 characters.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *_STATUS_ARGS],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        # git not installed or other system error — omit silently
+        return None
+    if result.returncode != 0:
+        # git ran but this is not a repo
+        return "No git repository detected in CWD."
+
+    status = _parse_status(result.stdout)
+    status = replace(status, stashes=_stash_count(status, cwd))
+    facts = _RepoFacts(
+        commit=_run_git(_COMMIT_ARGS, cwd),
+        remote=_run_git(_REMOTE_ARGS, cwd),
+        worktrees=_run_git(_WORKTREE_ARGS, cwd),
+    )
+    _store_facts(_cache_key(cwd), status.head_oid, facts)
+    return _format_git_context(status, facts)
+
+
+async def get_git_context_async(cwd: str | Path) -> str | None:
+    """Non-blocking get_git_context().
+
+    While HEAD is unchanged this is a single git process: last commit,
+    remote and worktrees are reused from the per-HEAD cache. Remote or
+    worktree changes that do not move HEAD therefore show up on the next
+    commit or the next blocking get_git_context().
+
+    Args:
+        cwd: Working directory to check for git repository.
+
+    Returns:
+        Same as get_git_context().
+    """
+    ran = await _run_git_async(_STATUS_ARGS, cwd)
+    if ran is None:
+        return None
+    returncode, output = ran
+    if returncode != 0:
+        return "No git repository detected in CWD."
+
+    status = _parse_status(output)
+    status = replace(status, stashes=await _stash_count_async(status, cwd))
+    facts = _cached_facts(_cache_key(cwd), status.head_oid)
+    if facts is None:
+        results = await asyncio.gather(
+            _run_git_async(_COMMIT_ARGS, cwd),
+            _run_git_async(_REMOTE_ARGS, cwd),
+            _run_git_async(_WORKTREE_ARGS, cwd),
+        )
+        commit, remote, worktrees = (
+            r[1] if r is not None and r[0] == 0 and r[1] else None for r in results
+        )
+        facts = _RepoFacts(commit=commit, remote=remote, worktrees=worktrees)
+        _store_facts(_cache_key(cwd), status.head_oid, facts)
+    return _format_git_context(status, facts)
+
+
+@dataclass
+class _RefreshState:
+    """Per-directory bookkeeping for GitContextRefresher."""
+
+    value: str | None = None
+    requested: int = 0
+    completed: int = 0
+    driver: asyncio.Task[None] | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def _is_running(task: asyncio.Task[None] | None) -> bool:
+    return task is not None and not task.done()
+
+
+class GitContextRefresher:
+    """Debounced, shared asynchronous git context refreshes.
+
+    Refreshes are keyed by working directory, so every agent in the same cwd
+    shares one git process. A refresh requested while another is running is
+    satisfied by the next run, which starts after the current one and after
+    ``debounce`` seconds - so a burst of requests (many agents finishing
+    tool batches at once) costs at most two git runs, and every caller gets
+    a result that started after its request.
+    """
+
+    def __init__(self, debounce: float = 0.05) -> None:
+        """Create a refresher.
+
+        Args:
+            debounce: Seconds to wait before each run so concurrent
+                requests coalesce.
+        """
+        self._debounce = debounce
+        self._states: dict[str, _RefreshState] = {}
+
+    def cached(self, cwd: str | Path) -> str | None:
+        """Most recent result for cwd (None if never refreshed)."""
+        state = self._states.get(_cache_key(cwd))
+        return state.value if state is not None else None
+
+    async def refresh(self, cwd: str | Path) -> str | None:
+        """Return git context for cwd from a run that started after this call.
+
+        Args:
+            cwd: Working directory to check for git repository.
+
+        Returns:
+            Same as get_git_context().
+        """
+        key = _cache_key(cwd)
+        state = self._states.setdefault(key, _RefreshState())
+        state.requested += 1
+        wanted = state.requested
+        if not _is_running(state.driver):
+            # A driver from a closed event loop is abandoned; start afresh
+            state.done = asyncio.Event()
+            state.driver = asyncio.create_task(self._drive(key, state))
+        while state.completed < wanted:
+            done = state.done
+            await done.wait()
+            if state.completed < wanted and not _is_running(state.driver):
+                break  # Driver failed; return whatever is cached
+        return state.value
+
+    async def _drive(self, key: str, state: _RefreshState) -> None:
+        try:
+            while state.completed < state.requested:
+                if self._debounce > 0:
+                    await asyncio.sleep(self._debounce)
+                target = state.requested
+                state.value = await get_git_context_async(key)
+                state.completed = target
+                done, state.done = state.done, asyncio.Event()
+                done.set()
+        finally:
+            state.driver = None
+            state.done.set()
+
+
+_shared_refresher = GitContextRefresher()
+
+
+def get_git_refresher() -> GitContextRefresher:
+    """Process-wide GitContextRefresher shared by all agents."""
+    return _shared_refresher
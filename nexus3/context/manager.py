@@ -1,5 +1,6 @@
 """Context management for conversation state and token budgets."""
 
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,9 +9,14 @@ from typing import TYPE_CHECKING, Any
 
 from nexus3.clipboard import format_clipboard_context
 from nexus3.config.schema import ClipboardConfig
-from nexus3.context.git_context import get_git_context
+from nexus3.context.calibration import TokenCalibration
+from nexus3.context.git_context import get_git_context, get_git_refresher
 from nexus3.context.graph import build_context_graph
-from nexus3.context.token_counter import TokenCounter, get_token_counter
+from nexus3.context.token_counter import (
+    TokenCounter,
+    describe_token_counter,
+    get_token_counter,
+)
 from nexus3.core.types import Message, Role, ToolCall, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -177,6 +183,16 @@ if TYPE_CHECKING:
     from nexus3.session.logging import SessionLogger
 
 
+@dataclass
+class _DynamicContextCache:
+    """Memoised dynamic context block and the state it was built from."""
+
+    datetime_line: str
+    clipboard_version: tuple[int, ...] | None
+    text: str | None
+    tokens: int | None = None
+
+
 @dataclass
 class ContextConfig:
     """Configuration for context management."""
@@ -219,6 +235,7 @@ class ContextManager:
         agent_id: str | None = None,
         clipboard_manager: "ClipboardManager | None" = None,
         clipboard_config: ClipboardConfig | None = None,
+        calibration: TokenCalibration | None = None,
     ) -> None:
         """Initialize context manager.
 
@@ -229,6 +246,8 @@ class ContextManager:
             agent_id: Agent ID for clipboard scoping
             clipboard_manager: Optional clipboard manager for context injection
             clipboard_config: Clipboard configuration (uses defaults if None)
+            calibration: Shared estimate calibration for the model (private,
+                uncalibrated instance if None)
         """
         self.config = config or ContextConfig()
         self._counter = token_counter or get_token_counter()
@@ -236,6 +255,7 @@ class ContextManager:
         self._agent_id = agent_id
         self._clipboard_manager = clipboard_manager
         self._clipboard_config = clipboard_config or ClipboardConfig()
+        self._calibration = calibration or TokenCalibration()
 
         # Context state
         self._system_prompt: str = ""
@@ -243,6 +263,30 @@ class ContextManager:
         self._messages: list[Message] = []
         self._git_context: str | None = None
 
+        # Per-message token counts keyed by id(). The Message itself is kept in
+        # the entry so its id cannot be recycled while cached; messages are
+        # frozen, so a cached count never goes stale.
+        self._message_token_cache: dict[int, tuple[Message, int]] = {}
+        self._message_tokens_total = 0
+        self._tracked_messages: list[Message] = self._messages
+        self._tracked_len = 0
+
+        # Storage row IDs of logged messages keyed by id(), kept the same way
+        # as the token cache, so compaction can record what a summary covers.
+        self._message_log_ids: dict[int, tuple[Message, int]] = {}
+
+        # Memoised counts for the static parts of the context. Tool definitions
+        # only change via set_tool_definitions() and the prompt only via
+        # set_system_prompt()/apply_compaction(), which reset these to None.
+        self._system_prompt_tokens: int | None = None
+        self._tools_tokens: int | None = None
+        self._tool_token_breakdown: dict[str, int] | None = None
+
+        # Memoised build_dynamic_context() result. Rebuilt when the datetime
+        # line rolls over to a new minute or the clipboard version changes;
+        # git refreshes drop it.
+        self._dynamic_cache: _DynamicContextCache | None = None
+
     # === Setup ===
 
     def set_system_prompt(self, prompt: str) -> None:
@@ -252,6 +296,7 @@ class ContextManager:
             prompt: System prompt content (from NEXUS.md or similar)
         """
         self._system_prompt = prompt
+        self._system_prompt_tokens = None
         if self._logger:
             self._logger.log_system(prompt)
 
@@ -262,6 +307,19 @@ class ContextManager:
             cwd: Working directory to check for git repository.
         """
         self._git_context = get_git_context(cwd)
+        self._dynamic_cache = None
+
+    async def refresh_git_context_async(self, cwd: str | Path) -> None:
+        """Refresh cached git context without blocking the event loop.
+
+        Goes through the process-wide GitContextRefresher, so agents sharing
+        a working directory share (and debounce) the git calls.
+
+        Args:
+            cwd: Working directory to check for git repository.
+        """
+        self._git_context = await get_git_refresher().refresh(cwd)
+        self._dynamic_cache = None
 
     def add_session_start_message(
         self,
@@ -294,17 +352,22 @@ class ContextManager:
                 has_confirmation_ui=has_confirmation_ui,
             ),
         )
-        self._messages.append(start_msg)
+        tokens = self._append_message(start_msg)
         if self._logger:
-            self._logger.log_user(start_msg.content)
+            self._logger.log_user(start_msg.content, tokens=tokens)
 
     def set_tool_definitions(self, tools: list[dict[str, Any]]) -> None:
         """Set available tool definitions for context.
 
+        Token counts for the definitions are memoised until the next call, so
+        pass a new list rather than mutating the previous one in place.
+
         Args:
             tools: List of tool definitions in OpenAI function format
         """
         self._tool_definitions = tools
+        self._tools_tokens = None
+        self._tool_token_breakdown = None
 
     @property
     def system_prompt(self) -> str:
@@ -318,12 +381,44 @@ class ContextManager:
         static system prompt so the system prompt remains cacheable. This context
         is injected into the last user message by the provider.
 
+        The result is memoised until the minute changes, the clipboard
+        version changes, or git context is refreshed.
+
         Returns:
             XML-wrapped string with datetime, git status, clipboard, or None
             if there's nothing to inject.
         """
+        return self._get_dynamic_context().text
+
+    def _get_dynamic_context(self) -> _DynamicContextCache:
+        """Return the memoised dynamic context, rebuilding it if stale."""
+        datetime_line = get_current_datetime_str()
+        clipboard_version = (
+            self._clipboard_manager.version
+            if self._clipboard_manager is not None
+            and self._clipboard_config.inject_into_context
+            else None
+        )
+        cached = self._dynamic_cache
+        if (
+            cached is not None
+            and cached.datetime_line == datetime_line
+            and cached.clipboard_version == clipboard_version
+        ):
+            return cached
+
+        cached = _DynamicContextCache(
+            datetime_line=datetime_line,
+            clipboard_version=clipboard_version,
+            text=self._render_dynamic_context(datetime_line),
+        )
+        self._dynamic_cache = cached
+        return cached
+
+    def _render_dynamic_context(self, datetime_line: str) -> str | None:
+        """Build the dynamic context block from current state."""
         parts: list[str] = []
-        parts.append(get_current_datetime_str())
+        parts.append(datetime_line)
 
         if self._git_context:
             parts.append(self._git_context)
@@ -350,6 +445,43 @@ class ContextManager:
         """Get the token counter instance."""
         return self._counter
 
+    @property
+    def token_counter_id(self) -> str:
+        """Identifier of the token counter (see describe_token_counter)."""
+        return describe_token_counter(self._counter)
+
+    @property
+    def token_calibration(self) -> TokenCalibration:
+        """Correction between local estimates and provider-reported usage."""
+        return self._calibration
+
+    def set_token_calibration(self, calibration: TokenCalibration) -> None:
+        """Use a different calibration (e.g. after a model change).
+
+        Args:
+            calibration: Calibration for the new model and token counter.
+        """
+        self._calibration = calibration
+
+    def set_token_counter(self, counter: TokenCounter) -> None:
+        """Switch token counters (e.g. after a model change).
+
+        All cached counts came from the previous counter, so they are dropped
+        and the history is re-counted.
+
+        Args:
+            counter: New token counter.
+        """
+        if counter is self._counter:
+            return
+        self._counter = counter
+        self._system_prompt_tokens = None
+        self._tools_tokens = None
+        self._tool_token_breakdown = None
+        self._dynamic_cache = None
+        self._message_token_cache = {}
+        self._resync_message_tokens()
+
     @property
     def messages(self) -> list[Message]:
         """Get all messages (read-only copy)."""
@@ -365,9 +497,9 @@ class ContextManager:
             meta: Optional metadata dict (e.g., source attribution)
         """
         msg = Message(role=Role.USER, content=content, meta=meta or {})
-        self._messages.append(msg)
+        tokens = self._append_message(msg)
         if self._logger:
-            self._logger.log_user(content, meta=meta)
+            self._remember_log_id(msg, self._logger.log_user(content, meta=meta, tokens=tokens))
 
     def add_assistant_message(
         self,
@@ -389,9 +521,11 @@ class ContextManager:
             content=content,
             tool_calls=tuple(tool_calls) if tool_calls else (),
         )
-        self._messages.append(msg)
+        tokens = self._append_message(msg)
         if self._logger:
-            self._logger.log_assistant(content, tool_calls)
+            self._remember_log_id(
+                msg, self._logger.log_assistant(content, tool_calls, tokens=tokens)
+            )
 
     def add_tool_result(
         self,
@@ -422,9 +556,11 @@ class ContextManager:
             content=content,
             tool_call_id=tool_call_id,
         )
-        self._messages.append(msg)
+        tokens = self._append_message(msg)
         if self._logger:
-            self._logger.log_tool_result(tool_call_id, name, result)
+            self._remember_log_id(
+                msg, self._logger.log_tool_result(tool_call_id, name, result, tokens=tokens)
+            )
 
     def fix_orphaned_tool_calls(self) -> None:
         """Ensure all tool_use blocks have matching tool_result messages.
@@ -475,6 +611,7 @@ class ContextManager:
                     self._messages.insert(insert_pos, synthetic)
                     insert_pos += 1
 
+                self._resync_message_tokens()
                 logger.warning(
                     "Synthesized %d missing tool result(s) for orphaned "
                     "tool calls: %s",
@@ -529,6 +666,7 @@ class ContextManager:
             i += 1
 
         if removed:
+            self._resync_message_tokens()
             logger.warning(
                 "Pruned %d unpaired tool result message(s) from context",
                 removed,
@@ -580,9 +718,11 @@ class ContextManager:
             role=Role.ASSISTANT,
             content="Previous turn was cancelled after tool execution.",
         )
-        self._messages.append(synthetic)
+        tokens = self._append_message(synthetic)
         if self._logger:
-            self._logger.log_assistant(synthetic.content)
+            self._remember_log_id(
+                synthetic, self._logger.log_assistant(synthetic.content, tokens=tokens)
+            )
 
         logger.warning(
             "Appended synthetic assistant message after trailing tool results "
@@ -592,7 +732,7 @@ class ContextManager:
 
     def clear_messages(self) -> None:
         """Clear all messages (keeps system prompt and tools)."""
-        self._messages.clear()
+        self._set_messages([])
 
     def replace_messages(self, messages: list[Message]) -> None:
         """Replace in-memory conversation history without re-logging messages.
@@ -600,7 +740,36 @@ class ContextManager:
         This is used by preflight normalization paths that repair context state
         before appending the next user turn.
         """
-        self._messages = messages.copy()
+        self._set_messages(messages.copy())
+
+    def restore_messages(
+        self,
+        messages: list[Message],
+        token_counts: list[int | None] | None = None,
+    ) -> None:
+        """Append previously recorded messages without re-logging them.
+
+        Used when restoring a saved session or cloning another agent's history.
+
+        Args:
+            messages: Messages to append, in order.
+            token_counts: Optional token counts aligned with ``messages`` (for
+                example persisted with the session). Known counts seed the
+                per-message cache so restored history is not re-tokenized;
+                ``None`` entries are counted normally.
+        """
+        self._message_tokens()
+        if token_counts is not None and len(token_counts) == len(messages):
+            for msg, tokens in zip(messages, token_counts, strict=True):
+                if tokens is not None and tokens >= 0:
+                    self._message_token_cache[id(msg)] = (msg, tokens)
+        for msg in messages:
+            self._append_message(msg)
+
+    def message_token_counts(self) -> list[int]:
+        """Get cached token counts aligned with :attr:`messages`."""
+        self._message_tokens()
+        return [self._count_message(msg) for msg in self._messages]
 
     def apply_compaction(
         self,
@@ -612,6 +781,8 @@ class ContextManager:
 
         Replaces current messages with summary + preserved recent messages.
         Optionally updates system prompt (for picking up NEXUS.md changes).
+        When logging, the summary is stored and marked as covering every
+        logged message it replaces (including a previous summary).
 
         Args:
             summary_message: The summary as a Message (from compaction module)
@@ -621,11 +792,29 @@ class ContextManager:
         # Update system prompt if provided (picks up NEXUS.md changes)
         if new_system_prompt is not None:
             self._system_prompt = new_system_prompt
+            self._system_prompt_tokens = None
             if self._logger:
                 self._logger.log_system(new_system_prompt)
 
+        if self._logger:
+            kept = {id(msg) for msg in preserved_messages}
+            replaced_ids = [
+                entry[1]
+                for msg in self._messages
+                if id(msg) not in kept
+                and (entry := self._message_log_ids.get(id(msg))) is not None
+                and entry[0] is msg
+            ]
+            summary_id = self._logger.log_summary(
+                summary_message.content,
+                meta=summary_message.meta or None,
+                tokens=self._count_message(summary_message),
+            )
+            self._logger.mark_compacted(replaced_ids, summary_id)
+            self._remember_log_id(summary_message, summary_id)
+
         # Replace messages: summary + preserved
-        self._messages = [summary_message] + preserved_messages
+        self._set_messages([summary_message] + preserved_messages)
 
     # === Context Building ===
 
@@ -675,14 +864,13 @@ class ContextManager:
             - remaining: Available minus total (how much space is left)
         """
         # Static system prompt (cacheable)
-        system_tokens = self._counter.count(self._system_prompt) if self._system_prompt else 0
+        system_tokens = self._count_system_tokens()
 
         # Dynamic context (injected per-request into last user message)
-        dynamic = self.build_dynamic_context()
-        dynamic_tokens = self._counter.count(dynamic) if dynamic else 0
+        dynamic_tokens = self._count_dynamic_tokens()
 
         tools_tokens = self._count_tools_tokens()
-        message_tokens = self._counter.count_messages(self._messages)
+        message_tokens = self._message_tokens()
         total = system_tokens + dynamic_tokens + tools_tokens + message_tokens
         available = self.config.max_tokens - self.config.reserve_tokens
         remaining = max(0, available - total)
@@ -698,24 +886,211 @@ class ContextManager:
             "remaining": remaining,
         }
 
+    def get_tool_token_breakdown(self) -> dict[str, int]:
+        """Get per-tool token counts for the current tool definitions.
+
+        Each definition is counted on its own, so the values may not sum exactly
+        to the ``tools`` figure in get_token_usage() (which counts the whole
+        serialized list at once).
+
+        Returns:
+            Dict mapping tool name to token count, largest first.
+        """
+        if self._tool_token_breakdown is None:
+            counts: dict[str, int] = {}
+            for index, tool in enumerate(self._tool_definitions):
+                function = tool.get("function")
+                name = function.get("name") if isinstance(function, dict) else None
+                key = name if isinstance(name, str) and name else f"<tool {index}>"
+                counts[key] = counts.get(key, 0) + self._counter.count(json.dumps(tool))
+            self._tool_token_breakdown = dict(
+                sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            )
+        return dict(self._tool_token_breakdown)
+
+    def _uncalibrated_available(self) -> int:
+        """Available budget expressed in uncalibrated local-estimate tokens."""
+        available = self.config.max_tokens - self.config.reserve_tokens
+        return int(available / self._calibration.factor)
+
+    def _count_system_tokens(self) -> int:
+        """Count tokens used by the static system prompt (memoised)."""
+        if self._system_prompt_tokens is None:
+            self._system_prompt_tokens = (
+                self._counter.count(self._system_prompt) if self._system_prompt else 0
+            )
+        return self._system_prompt_tokens
+
+    def _count_dynamic_tokens(self) -> int:
+        """Count tokens used by the dynamic context (memoised with it)."""
+        cached = self._get_dynamic_context()
+        if cached.tokens is None:
+            cached.tokens = self._counter.count(cached.text) if cached.text else 0
+        return cached.tokens
+
     def _count_tools_tokens(self) -> int:
-        """Count tokens used by tool definitions."""
-        if not self._tool_definitions:
-            return 0
+        """Count tokens used by tool definitions (memoised)."""
+        if self._tools_tokens is None:
+            self._tools_tokens = (
+                self._counter.count(json.dumps(self._tool_definitions))
+                if self._tool_definitions
+                else 0
+            )
+        return self._tools_tokens
+
+    def _count_message(self, msg: Message) -> int:
+        """Count tokens for one message, using the per-message cache."""
+        entry = self._message_token_cache.get(id(msg))
+        if entry is not None and entry[0] is msg:
+            return entry[1]
+        tokens = self._counter.count_messages([msg])
+        self._message_token_cache[id(msg)] = (msg, tokens)
+        return tokens
+
+    def _append_message(self, msg: Message) -> int:
+        """Append a message, updating the running token total.
 
-        import json
+        Returns:
+            Token count for the appended message.
+        """
+        self._message_tokens()
+        tokens = self._count_message(msg)
+        self._messages.append(msg)
+        self._message_tokens_total += tokens
+        self._tracked_len += 1
+        return tokens
+
+    def _set_messages(self, messages: list[Message]) -> None:
+        """Replace the message list and re-derive the running token total."""
+        self._messages = messages
+        self._resync_message_tokens()
+        self._message_log_ids = {
+            id(msg): entry
+            for msg in messages
+            if (entry := self._message_log_ids.get(id(msg))) is not None and entry[0] is msg
+        }
 
-        tools_str = json.dumps(self._tool_definitions)
-        return self._counter.count(tools_str)
+    def _remember_log_id(self, msg: Message, log_id: int) -> None:
+        """Record the storage row ID a message was logged under."""
+        self._message_log_ids[id(msg)] = (msg, log_id)
+
+    def _resync_message_tokens(self) -> None:
+        """Rebuild the running total from cached counts, evicting stale entries.
+
+        Only messages not seen before are tokenized; everything else is a dict
+        lookup.
+        """
+        cache: dict[int, tuple[Message, int]] = {}
+        total = 0
+        for msg in self._messages:
+            tokens = self._count_message(msg)
+            cache[id(msg)] = (msg, tokens)
+            total += tokens
+        self._message_token_cache = cache
+        self._message_tokens_total = total
+        self._tracked_messages = self._messages
+        self._tracked_len = len(self._messages)
+
+    def _message_tokens(self) -> int:
+        """Get total message tokens in O(1) from the running total.
+
+        Falls back to a resync if the list was mutated behind the manager's back
+        (replaced, or its length changed).
+        """
+        if (
+            self._tracked_messages is not self._messages
+            or self._tracked_len != len(self._messages)
+        ):
+            self._resync_message_tokens()
+        return self._message_tokens_total
+
+    def calibrated_total(self, usage: dict[str, int] | None = None) -> int:
+        """Estimated total tokens scaled by the provider calibration factor.
+
+        Args:
+            usage: Result of get_token_usage() to reuse (computed if None).
+
+        Returns:
+            ``usage["total"]`` corrected towards what the provider would report.
+        """
+        if usage is None:
+            usage = self.get_token_usage()
+        return self._calibration.apply(usage["total"])
+
+    def estimate_request_tokens(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None,
+        dynamic_context: str | None,
+    ) -> int:
+        """Estimate prompt tokens for a request built from this context.
+
+        Counted the same way as get_token_usage() so the ratio to the
+        provider's figure can be applied to that total.
+
+        Args:
+            messages: Messages as sent (from build_messages()).
+            tools: Tool definitions as sent.
+            dynamic_context: Dynamic context as sent.
+
+        Returns:
+            Local token estimate for the request.
+        """
+        total = 0
+        for msg in messages:
+            if msg.role == Role.SYSTEM and msg.content == self._system_prompt:
+                total += self._count_system_tokens()
+            else:
+                entry = self._message_token_cache.get(id(msg))
+                if entry is not None and entry[0] is msg:
+                    total += entry[1]
+                else:
+                    total += self._counter.count_messages([msg])
+        if tools:
+            if tools is self._tool_definitions:
+                total += self._count_tools_tokens()
+            else:
+                total += self._counter.count(json.dumps(tools))
+        if dynamic_context:
+            cached = self._dynamic_cache
+            if (
+                cached is not None
+                and cached.tokens is not None
+                and cached.text == dynamic_context
+            ):
+                total += cached.tokens
+            else:
+                total += self._counter.count(dynamic_context)
+        return total
+
+    def record_provider_usage(
+        self,
+        prompt_tokens: int,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None,
+        dynamic_context: str | None,
+    ) -> None:
+        """Feed provider-reported prompt tokens into the calibration.
+
+        Args:
+            prompt_tokens: Prompt tokens reported by the provider.
+            messages: Messages sent in that request.
+            tools: Tool definitions sent in that request.
+            dynamic_context: Dynamic context sent in that request.
+        """
+        estimated = self.estimate_request_tokens(messages, tools, dynamic_context)
+        self._calibration.record(estimated, prompt_tokens)
 
     def is_over_budget(self) -> bool:
         """Check if context exceeds available token budget.
 
+        The estimate is corrected by the provider calibration factor.
+
         Returns:
-            True if total tokens > (max_tokens - reserve_tokens)
+            True if calibrated total tokens > (max_tokens - reserve_tokens)
         """
         usage = self.get_token_usage()
-        return usage["total"] > usage["available"]
+        return self.calibrated_total(usage) > usage["available"]
 
     # === Truncation ===
 
@@ -737,7 +1112,7 @@ class ContextManager:
             truncated = self._truncate_oldest_first()
 
         # Sync _messages with what we're sending - don't keep orphaned messages
-        self._messages = truncated
+        self._set_messages(truncated)
 
         return truncated
 
@@ -757,7 +1132,7 @@ class ContextManager:
 
         # Persist normalization so truncation operates on repaired context.
         if normalized_messages != self._messages:
-            self._messages = normalized_messages.copy()
+            self._set_messages(normalized_messages.copy())
 
         groups: list[list[Message]] = []
         for group in graph.groups:
@@ -769,11 +1144,7 @@ class ContextManager:
 
     def _count_group_tokens(self, group: list[Message]) -> int:
         """Count tokens for a message group."""
-        total = 0
-        for msg in group:
-            # Use count_messages for accurate token counting including tool_calls
-            total += self._counter.count_messages([msg])
-        return total
+        return sum(self._count_message(msg) for msg in group)
 
     def _flatten_groups(self, groups: list[list[Message]]) -> list[Message]:
         """Flatten list of groups into single message list."""
@@ -787,10 +1158,10 @@ class ContextManager:
 
         Preserves tool call/result pairs as atomic units.
         """
-        available = self.config.max_tokens - self.config.reserve_tokens
-        system_tokens = self._counter.count(self._system_prompt) if self._system_prompt else 0
-        dynamic = self.build_dynamic_context()
-        dynamic_tokens = self._counter.count(dynamic) if dynamic else 0
+        # Budget in local-estimate units (the calibration factor scales estimates)
+        available = self._uncalibrated_available()
+        system_tokens = self._count_system_tokens()
+        dynamic_tokens = self._count_dynamic_tokens()
         tools_tokens = self._count_tools_tokens()
         budget_for_messages = available - system_tokens - dynamic_tokens - tools_tokens
 
@@ -829,10 +1200,10 @@ class ContextManager:
         if len(groups) <= 2:
             return self._messages.copy()
 
-        available = self.config.max_tokens - self.config.reserve_tokens
-        system_tokens = self._counter.count(self._system_prompt) if self._system_prompt else 0
-        dynamic = self.build_dynamic_context()
-        dynamic_tokens = self._counter.count(dynamic) if dynamic else 0
+        # Budget in local-estimate units (the calibration factor scales estimates)
+        available = self._uncalibrated_available()
+        system_tokens = self._count_system_tokens()
+        dynamic_tokens = self._count_dynamic_tokens()
         tools_tokens = self._count_tools_tokens()
         budget_for_messages = available - system_tokens - dynamic_tokens - tools_tokens
 
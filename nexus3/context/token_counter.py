@@ -1,11 +1,20 @@
 """Token counting with pluggable backends."""
 
+import hashlib
 import json
+import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Protocol
 
+from nexus3.config.schema import TokenizerConfig
+
 if TYPE_CHECKING:
+    from nexus3.config.schema import ResolvedModel
     from nexus3.core.types import Message
 
+logger = logging.getLogger(__name__)
+
 
 class TokenCounter(Protocol):
     """Protocol for token counting implementations."""
@@ -96,6 +105,7 @@ class TiktokenCounter:
             ) from e
 
         self._encoder = tiktoken.get_encoding(encoding_name)
+        self.identity = f"tiktoken:{encoding_name}"
 
     def count(self, text: str) -> int:
         """Count tokens using tiktoken.
@@ -132,12 +142,265 @@ class TiktokenCounter:
         return total
 
 
-def get_token_counter(use_tiktoken: bool = True) -> TokenCounter:
+class HuggingFaceTokenCounter:
+    """Token counting with a local HuggingFace ``tokenizer.json`` file.
+
+    Requires tokenizers package: pip install tokenizers
+    The file is loaded from disk only; nothing is downloaded.
+    """
+
+    OVERHEAD_PER_MESSAGE = 4
+
+    def __init__(self, path: str) -> None:
+        """Load a tokenizer from a ``tokenizer.json`` file.
+
+        Args:
+            path: Path to the tokenizer.json file.
+
+        Raises:
+            ImportError: If tokenizers is not installed.
+            OSError: If the file cannot be read.
+        """
+        try:
+            from tokenizers import Tokenizer  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "tokenizers is not installed. "
+                "Install it with: pip install tokenizers"
+            ) from e
+
+        with open(path, "rb") as f:
+            data = f.read()
+        self._tokenizer = Tokenizer.from_str(data.decode("utf-8"))
+        # Identify by content so the same tokenizer at another path matches.
+        self.identity = f"hf:{hashlib.sha256(data).hexdigest()[:16]}"
+
+    def count(self, text: str) -> int:
+        """Count tokens using the loaded tokenizer.
+
+        Args:
+            text: Text string to count tokens for.
+
+        Returns:
+            Accurate token count.
+        """
+        if not text:
+            return 0
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count_messages(self, messages: list["Message"]) -> int:
+        """Count tokens in messages with accurate encoding.
+
+        Args:
+            messages: List of Message objects to count.
+
+        Returns:
+            Total token count for all messages.
+        """
+        total = 0
+        for msg in messages:
+            total += self.count(msg.content) + self.OVERHEAD_PER_MESSAGE
+
+            if msg.tool_calls:
+                for tc in msg.tool_calls:
+                    total += self.count(tc.name)
+                    args_str = json.dumps(tc.arguments)
+                    total += self.count(args_str)
+
+        return total
+
+
+class TokenCountCache:
+    """Thread-safe bounded LRU of token counts keyed by content hash.
+
+    Keys combine the counter identity with a BLAKE2b digest of the text, so
+    one cache can serve every tokenizer in the process.
+    """
+
+    def __init__(self, max_entries: int = 16384) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached counts before LRU eviction.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(identity: str, text: str) -> tuple[str, bytes]:
+        """Build the cache key for ``text`` counted by ``identity``."""
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return identity, digest
+
+    def get(self, key: tuple[str, bytes]) -> int | None:
+        """Return the cached count for ``key`` (marking it recently used)."""
+        with self._lock:
+            count = self._entries.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def put(self, key: tuple[str, bytes], count: int) -> None:
+        """Store a count, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_token_count_cache = TokenCountCache()
+
+
+def get_token_count_cache() -> TokenCountCache:
+    """Return the process-wide token count cache shared by all agents."""
+    return _token_count_cache
+
+
+class CachedTokenCounter:
+    """Wrap a counter with the shared content-hash cache.
+
+    Texts shorter than ``min_chars`` bypass the cache: hashing them costs about
+    as much as encoding. Longer texts (system prompts, NEXUS.md layers, tool
+    schemas) are encoded once per process no matter how many agents use them.
+    """
+
+    def __init__(
+        self,
+        inner: TokenCounter,
+        cache: TokenCountCache | None = None,
+        min_chars: int = 512,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            inner: Counter that performs the actual encoding.
+            cache: Cache to use (defaults to the process-wide cache).
+            min_chars: Minimum text length to cache.
+        """
+        self._inner = inner
+        self._cache = cache if cache is not None else _token_count_cache
+        self._min_chars = min_chars
+        self.identity = describe_token_counter(inner)
+        self.OVERHEAD_PER_MESSAGE: int = getattr(inner, "OVERHEAD_PER_MESSAGE", 4)
+
+    @property
+    def inner(self) -> TokenCounter:
+        """The wrapped counter."""
+        return self._inner
+
+    def count(self, text: str) -> int:
+        """Count tokens, consulting the shared cache for long texts.
+
+        Args:
+            text: Text string to count tokens for.
+
+        Returns:
+            Token count from the wrapped counter.
+        """
+        if len(text) < self._min_chars:
+            return self._inner.count(text)
+        key = TokenCountCache.key(self.identity, text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        count = self._inner.count(text)
+        self._cache.put(key, count)
+        return count
+
+    def count_messages(self, messages: list["Message"]) -> int:
+        """Count tokens in messages, caching each content string.
+
+        Args:
+            messages: List of Message objects to count.
+
+        Returns:
+            Total token count for all messages.
+        """
+        total = 0
+        for msg in messages:
+            total += self.count(msg.content) + self.OVERHEAD_PER_MESSAGE
+
+            if msg.tool_calls:
+                for tc in msg.tool_calls:
+                    total += self.count(tc.name)
+                    args_str = json.dumps(tc.arguments)
+                    total += self.count(args_str)
+
+        return total
+
+
+def describe_token_counter(counter: TokenCounter) -> str:
+    """Return a stable identifier for a counter implementation.
+
+    Persisted token counts are only reused when they were produced by a counter
+    with the same identifier.
+    """
+    identity = getattr(counter, "identity", None)
+    if isinstance(identity, str) and identity:
+        return identity
+    return type(counter).__name__
+
+
+# Shared counters keyed by tokenizer settings, so agents on the same model
+# reuse one loaded tokenizer.
+_counter_registry: dict[tuple[str, str, str | None], TokenCounter] = {}
+_counter_registry_lock = threading.Lock()
+
+
+def _build_token_counter(tokenizer: TokenizerConfig, explicit: bool) -> TokenCounter:
+    """Create the counter for ``tokenizer``, falling back on load errors.
+
+    Only explicitly configured tokenizers warn on fallback; a missing tiktoken
+    for the default tokenizer is expected and silent.
+    """
+    if tokenizer.type == "simple":
+        return SimpleTokenCounter()
+    try:
+        if tokenizer.type == "huggingface":
+            return CachedTokenCounter(HuggingFaceTokenCounter(tokenizer.path or ""))
+        return CachedTokenCounter(TiktokenCounter(tokenizer.encoding))
+    except (ImportError, OSError, ValueError, KeyError) as e:
+        if explicit:
+            logger.warning(
+                "Tokenizer %s unavailable (%s); using character estimate", tokenizer.type, e
+            )
+        return SimpleTokenCounter()
+
+
+def get_token_counter(
+    use_tiktoken: bool = True,
+    tokenizer: TokenizerConfig | None = None,
+) -> TokenCounter:
     """Factory function to get appropriate token counter.
 
+    Counters built from a tokenizer config are shared process-wide and wrapped
+    in CachedTokenCounter, so identical texts are only encoded once across
+    agents.
+
     Args:
         use_tiktoken: If True (default), try to use tiktoken.
                       Falls back to SimpleTokenCounter if unavailable.
+                      Ignored when ``tokenizer`` is given.
+        tokenizer: Explicit tokenizer settings (e.g. from a resolved model).
 
     Returns:
         TokenCounter implementation (TiktokenCounter if available, else SimpleTokenCounter)
@@ -147,10 +410,29 @@ def get_token_counter(use_tiktoken: bool = True) -> TokenCounter:
         >>> tokens = counter.count("Hello, world!")
         >>> print(tokens)  # Accurate token count with tiktoken
     """
-    if use_tiktoken:
-        try:
-            return TiktokenCounter()
-        except ImportError:
-            pass  # Fall back to simple counter
+    explicit = tokenizer is not None
+    if tokenizer is None:
+        if not use_tiktoken:
+            return SimpleTokenCounter()
+        tokenizer = TokenizerConfig()
+
+    key = (tokenizer.type, tokenizer.encoding, tokenizer.path)
+    with _counter_registry_lock:
+        counter = _counter_registry.get(key)
+        if counter is None:
+            counter = _build_token_counter(tokenizer, explicit)
+            _counter_registry[key] = counter
+    return counter
 
-    return SimpleTokenCounter()
+
+def get_token_counter_for_model(model: "ResolvedModel | None") -> TokenCounter:
+    """Return the shared token counter for a resolved model.
+
+    Args:
+        model: Resolved model (its ``tokenizer`` setting is used), or None
+            for the default counter.
+
+    Returns:
+        TokenCounter for the model.
+    """
+    return get_token_counter(tokenizer=model.tokenizer if model is not None else None)
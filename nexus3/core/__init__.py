@@ -64,6 +64,7 @@ from nexus3.core.types import (
     Role,
     StreamComplete,
     StreamEvent,
+    TokenUsage,
     ToolCall,
     ToolCallStarted,
     ToolResult,
@@ -117,6 +118,7 @@ __all__ = [
     "ReasoningDelta",
     "ToolCallStarted",
     "StreamComplete",
+    "TokenUsage",
     # Path validation
     "validate_path",
     "validate_sandbox",
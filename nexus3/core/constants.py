@@ -8,6 +8,7 @@ from pathlib import Path
 
 NEXUS_DIR_NAME = ".nexus3"
 DEFAULT_SERVER_PORT = 8765
+DEFAULT_KEEP_ALIVE_TIMEOUT = 5.0  # Seconds the RPC server holds an idle connection
 
 # P2.5 SECURITY: File I/O limits to prevent memory DoS
 # These limits prevent reading huge files into memory
@@ -48,6 +49,19 @@ def get_default_server_port() -> int:
         return DEFAULT_SERVER_PORT
 
 
+def get_default_keep_alive_timeout() -> float | None:
+    """Get the server keep-alive timeout from config, with fallback to 5.0.
+
+    None means the server has keep-alive disabled.
+    """
+    try:
+        from nexus3.config.loader import load_config
+        config = load_config()
+        return config.server.keep_alive_timeout
+    except Exception:
+        return DEFAULT_KEEP_ALIVE_TIMEOUT
+
+
 def get_rpc_token_path(port: int = DEFAULT_SERVER_PORT) -> Path:
     """Get RPC token file path for a given port."""
     nexus_dir = get_nexus_dir()
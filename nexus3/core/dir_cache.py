@@ -0,0 +1,300 @@
+"""Process-wide cache of directory listings for the file-discovery skills.
+
+glob, search_text (Python fallback), concat_files, outline (directory mode)
+and list_directory each walk the tree from scratch on every call, paying a
+scandir plus a stat per entry. DirectoryCache keeps a snapshot of every
+directory it has listed, keyed by the directory's resolved path, so repeated
+walks over an unchanged tree only stat each directory once.
+
+- **Entries:** each DirEntry records the entry's type, size and mtime as of
+  the listing, plus whether the name matches EXCLUDED_DIRS, so callers do
+  not repeat the fnmatch work.
+- **Validation:** a snapshot is reused only while the directory's (dev,
+  inode, mtime, ctime) are unchanged. Snapshots of directories modified
+  within the last ``racy_window`` seconds are not kept at all: a change in
+  the same timestamp tick as the listing would otherwise go unnoticed.
+- **Invalidation:** skills that modify files call invalidate() with every
+  path they touched. This also refreshes the size/mtime of files edited in
+  place, which does not change the directory's mtime.
+- **Bounded:** least recently used snapshots are dropped once more than
+  ``max_entries`` entries are cached.
+
+The cache never makes access decisions: it lists whatever it is asked to,
+and callers still run every path through FilesystemAccessGateway.
+
+One cache is shared process-wide (get_directory_cache()); the agent pool
+registers it in each agent's ServiceContainer as ``directory_cache``.
+"""
+
+import fnmatch
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+# Directories skipped by recursive walks that prune exclusions
+# (search_text's Python fallback); ripgrep applies .gitignore instead.
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        ".nexus3",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "dist",
+        "build",
+        ".eggs",
+        "*.egg-info",
+    }
+)
+
+DEFAULT_MAX_ENTRIES = 500_000
+DEFAULT_RACY_WINDOW = 2.0
+
+
+def is_excluded_dir(name: str) -> bool:
+    """Return True if a directory name matches EXCLUDED_DIRS."""
+    if name in EXCLUDED_DIRS:
+        return True
+    return any("*" in pattern and fnmatch.fnmatch(name, pattern) for pattern in EXCLUDED_DIRS)
+
+
+@dataclass(frozen=True, slots=True)
+class DirEntry:
+    """One directory entry as of the listing.
+
+    Attributes:
+        name: Entry name.
+        is_dir: True for directories, following symlinks (like Path.is_dir()).
+        is_file: True for regular files, following symlinks.
+        is_symlink: True if the entry itself is a symlink.
+        size: Size in bytes (0 if the entry could not be stat'ed).
+        mtime_ns: Modification time in nanoseconds (0 if unknown).
+        excluded: True for directories whose name matches EXCLUDED_DIRS.
+    """
+
+    name: str
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+    size: int
+    mtime_ns: int
+    excluded: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    fingerprint: tuple[int, int, int, int]
+    entries: tuple[DirEntry, ...]
+
+
+def _fingerprint(st: os.stat_result) -> tuple[int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _scan(directory: Path) -> tuple[DirEntry, ...]:
+    entries: list[DirEntry] = []
+    with os.scandir(directory) as it:
+        for item in it:
+            try:
+                is_symlink = item.is_symlink()
+                st = item.stat()
+            except OSError:
+                # Broken symlink or entry removed mid-scan
+                entries.append(DirEntry(item.name, False, False, True, 0, 0, False))
+                continue
+            is_dir = stat.S_ISDIR(st.st_mode)
+            entries.append(
+                DirEntry(
+                    name=item.name,
+                    is_dir=is_dir,
+                    is_file=stat.S_ISREG(st.st_mode),
+                    is_symlink=is_symlink,
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    excluded=is_dir and is_excluded_dir(item.name),
+                )
+            )
+    entries.sort(key=lambda entry: entry.name)
+    return tuple(entries)
+
+
+class DirectoryCache:
+    """LRU cache of directory snapshots validated by directory stat."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        racy_window: float = DEFAULT_RACY_WINDOW,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Total directory entries to keep across snapshots.
+            racy_window: Seconds after a directory changes during which its
+                listing is not cached.
+        """
+        self._max_entries = max_entries
+        self._racy_window_ns = int(racy_window * 1_000_000_000)
+        self._snapshots: OrderedDict[Path, _Snapshot] = OrderedDict()
+        self._entry_count = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def listdir(self, directory: Path, *, resolved: bool = False) -> tuple[DirEntry, ...]:
+        """Return the entries of a directory, sorted by name.
+
+        Args:
+            directory: Directory to list. Symlinks are followed; the snapshot
+                is shared with every path resolving to the same directory.
+            resolved: directory is already resolved (skips resolving it again,
+                which costs a stat per path component).
+
+        Returns:
+            The directory's entries.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or listed.
+        """
+        key = directory if resolved else directory.resolve()
+        dir_stat = os.stat(key)
+        fingerprint = _fingerprint(dir_stat)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                self._snapshots.move_to_end(key)
+                self.hits += 1
+                return snapshot.entries
+            self.misses += 1
+            generation = self._generation
+
+        entries = _scan(key)
+
+        changed_ns = max(dir_stat.st_mtime_ns, dir_stat.st_ctime_ns)
+        if time.time_ns() - changed_ns < self._racy_window_ns:
+            return entries
+        with self._lock:
+            # Skip storing if something was invalidated while we scanned
+            if generation == self._generation:
+                self._store(key, _Snapshot(fingerprint, entries))
+        return entries
+
+    def walk_files(
+        self,
+        root: Path,
+        *,
+        prune_excluded: bool = False,
+        follow_symlinks: bool = False,
+    ) -> list[Path]:
+        """Recursively list regular files below root, depth-first by name.
+
+        Args:
+            root: Directory to walk. Returned paths are under root as given,
+                not its resolved form.
+            prune_excluded: Skip directories matching EXCLUDED_DIRS.
+            follow_symlinks: Descend into symlinked directories (each
+                resolved directory is visited at most once per branch).
+
+        Returns:
+            Paths of regular files (symlinks to files included). Directories
+            that cannot be listed are skipped.
+        """
+        results: list[Path] = []
+        ancestors: set[Path] = set()
+
+        def walk(directory: Path, resolved: Path) -> None:
+            if resolved in ancestors:
+                return
+            try:
+                entries = self.listdir(resolved, resolved=True)
+            except OSError:
+                return
+            ancestors.add(resolved)
+            for entry in entries:
+                if entry.is_dir:
+                    if prune_excluded and entry.excluded:
+                        continue
+                    child = directory / entry.name
+                    if not entry.is_symlink:
+                        walk(child, resolved / entry.name)
+                    elif follow_symlinks:
+                        try:
+                            walk(child, child.resolve())
+                        except OSError:
+                            continue
+                elif entry.is_file:
+                    results.append(directory / entry.name)
+            ancestors.discard(resolved)
+
+        try:
+            walk(root, root.resolve())
+        except OSError:
+            pass
+        return results
+
+    def invalidate(self, *paths: Path) -> None:
+        """Forget snapshots affected by changes to paths.
+
+        Drops each path's parent directory and, for directories, the path
+        itself and everything cached below it.
+
+        Args:
+            paths: Files or directories that were created, modified, moved
+                or deleted.
+        """
+        targets: list[Path] = []
+        for path in paths:
+            try:
+                targets.append(path.resolve())
+            except OSError:
+                targets.append(Path(os.path.abspath(path)))
+        with self._lock:
+            self._generation += 1
+            for target in targets:
+                self._drop(target.parent)
+                for key in [k for k in self._snapshots if k.is_relative_to(target)]:
+                    self._drop(key)
+
+    def clear(self) -> None:
+        """Forget every snapshot."""
+        with self._lock:
+            self._generation += 1
+            self._snapshots.clear()
+            self._entry_count = 0
+
+    def __len__(self) -> int:
+        """Return number of cached directory snapshots."""
+        return len(self._snapshots)
+
+    def _store(self, key: Path, snapshot: _Snapshot) -> None:
+        self._drop(key)
+        if len(snapshot.entries) > self._max_entries:
+            return
+        self._snapshots[key] = snapshot
+        self._entry_count += len(snapshot.entries)
+        while self._entry_count > self._max_entries:
+            _, evicted = self._snapshots.popitem(last=False)
+            self._entry_count -= len(evicted.entries)
+
+    def _drop(self, key: Path) -> None:
+        snapshot = self._snapshots.pop(key, None)
+        if snapshot is not None:
+            self._entry_count -= len(snapshot.entries)
+
+
+_DEFAULT_CACHE = DirectoryCache()
+
+
+def get_directory_cache() -> DirectoryCache:
+    """Return the process-wide directory cache."""
+    return _DEFAULT_CACHE
@@ -0,0 +1,382 @@
+"""Sparse line-offset index for large text files.
+
+tail and paged read_file need to know where line N starts, and how many
+lines a file has, without decoding the file from the top on every call.
+LineIndex records (line number, byte offset) checkpoints spaced roughly
+``checkpoint_bytes`` apart, so any line can be reached by seeking to the
+nearest checkpoint and skipping at most one checkpoint interval of lines.
+
+- **Building:** one pass over the raw bytes. Newlines are counted with
+  bytes.count() and checkpoints are placed at the first line start after
+  each stride, so the cost does not depend on the number of lines. The
+  same pass records whether the file is valid UTF-8 and whether it contains
+  bare ``\\r`` line breaks. Python's text mode treats those as line breaks
+  too, so byte-offset line numbers would drift from text-mode line numbers.
+- **Validation:** an index is reused while the file's (dev, inode, size,
+  mtime, ctime) are unchanged. Indexes of files modified within
+  ``racy_window`` seconds of being built are not trusted on a fingerprint
+  match alone, because a same-size rewrite in the same timestamp tick would
+  go unnoticed. Their last bytes are re-read and compared instead, so a
+  file that was just written is not rescanned on every call.
+- **Appends:** when a file grows in place, the index is extended from the
+  old end instead of rebuilt. This is only done if the bytes just before the
+  old end are unchanged. That is what keeps repeated tail calls on a
+  growing log cheap.
+- **Bounded:** least recently used indexes are dropped once more than
+  ``max_files`` are cached.
+
+Line numbering matches text-mode iteration: a trailing newline ends the
+last line rather than starting an empty one.
+
+One cache is shared process-wide (get_line_index_cache()).
+"""
+
+import bisect
+import codecs
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+DEFAULT_CHECKPOINT_BYTES = 64 * 1024
+DEFAULT_MAX_FILES = 128
+DEFAULT_RACY_WINDOW = 2.0
+
+_READ_BLOCK = 1024 * 1024
+# Bytes before the old end of file compared when extending an index
+_TAIL_SAMPLE = 64
+
+
+def _fingerprint(st: os.stat_result) -> tuple[int, int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+@dataclass(frozen=True, slots=True)
+class LineIndex:
+    """Sparse line → byte offset checkpoints for one version of a file.
+
+    Attributes:
+        size: File size in bytes covered by the index.
+        newline_count: Number of ``\\n`` bytes in the file.
+        checkpoint_lines: 1-indexed line numbers of the checkpoints, ascending.
+            The first checkpoint is always line 1 at offset 0.
+        checkpoint_offsets: Byte offset where each checkpoint line starts.
+    """
+
+    size: int
+    newline_count: int
+    checkpoint_lines: tuple[int, ...]
+    checkpoint_offsets: tuple[int, ...]
+    # Scan state, kept so the index can be extended when the file grows
+    fingerprint: tuple[int, int, int, int, int]
+    built_at_ns: int
+    tail_sample: bytes
+    utf8_pending: bytes
+    utf8_error: bool
+    bare_cr_seen: bool
+
+    @property
+    def utf8_valid(self) -> bool:
+        """True if the whole file decodes as UTF-8."""
+        return not self.utf8_error and not self.utf8_pending
+
+    @property
+    def has_bare_cr(self) -> bool:
+        """True if the file contains a ``\\r`` not followed by ``\\n``."""
+        return self.bare_cr_seen or self.tail_sample.endswith(b"\r")
+
+    @property
+    def total_lines(self) -> int:
+        """Number of lines, as text-mode iteration would count them."""
+        if self.size == 0:
+            return 0
+        ends_with_newline = self.tail_sample.endswith(b"\n")
+        return self.newline_count + (0 if ends_with_newline else 1)
+
+    @property
+    def ends_with_newline(self) -> bool:
+        """True if the last byte of the file is a newline."""
+        return self.tail_sample.endswith(b"\n")
+
+    def matches_stat(self, st: os.stat_result) -> bool:
+        """True if a stat result has the fingerprint this index was built from."""
+        return self.fingerprint == _fingerprint(st)
+
+    def checkpoint_for_line(self, line: int) -> tuple[int, int]:
+        """Return the nearest checkpoint at or before a 1-indexed line.
+
+        Returns:
+            Tuple of (checkpoint line number, byte offset of that line).
+        """
+        i = bisect.bisect_right(self.checkpoint_lines, max(line, 1)) - 1
+        return self.checkpoint_lines[i], self.checkpoint_offsets[i]
+
+    def checkpoint_for_offset(self, offset: int) -> tuple[int, int]:
+        """Return the nearest checkpoint at or before a byte offset.
+
+        Returns:
+            Tuple of (checkpoint line number, byte offset of that line).
+        """
+        i = bisect.bisect_right(self.checkpoint_offsets, max(offset, 0)) - 1
+        return self.checkpoint_lines[i], self.checkpoint_offsets[i]
+
+
+def _scan(
+    f: BinaryIO,
+    *,
+    start: int,
+    stop: int,
+    newline_count: int,
+    lines: list[int],
+    offsets: list[int],
+    checkpoint_bytes: int,
+    pending_cr: bool,
+    utf8_pending: bytes,
+    utf8_error: bool,
+    has_bare_cr: bool,
+) -> tuple[int, bool, bytes, bool, bool]:
+    """Scan bytes [start, stop) of an open binary file, appending checkpoints.
+
+    Returns:
+        Updated (newline_count, pending_cr, utf8_pending, utf8_error,
+        has_bare_cr).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    if not utf8_error and utf8_pending:
+        try:
+            decoder.decode(utf8_pending)
+        except UnicodeDecodeError:
+            utf8_error = True
+    next_checkpoint = offsets[-1] + checkpoint_bytes
+    pos = start
+    f.seek(start)
+    while pos < stop:
+        block = f.read(min(_READ_BLOCK, stop - pos))
+        if not block:
+            break
+
+        if not utf8_error:
+            try:
+                decoder.decode(block)
+            except UnicodeDecodeError:
+                utf8_error = True
+
+        if not has_bare_cr:
+            if pending_cr and not block.startswith(b"\n"):
+                has_bare_cr = True
+            cr = block.count(b"\r")
+            if cr:
+                trailing = 1 if block.endswith(b"\r") else 0
+                if cr - trailing != block.count(b"\r\n"):
+                    has_bare_cr = True
+            pending_cr = block.endswith(b"\r")
+
+        # Place checkpoints at the first line start after each stride
+        counted_to = 0
+        end = pos + len(block)
+        while next_checkpoint < end:
+            nl = block.find(b"\n", max(next_checkpoint - pos, 0))
+            if nl == -1:
+                break
+            newline_count += block.count(b"\n", counted_to, nl + 1)
+            counted_to = nl + 1
+            lines.append(newline_count + 1)
+            offsets.append(pos + nl + 1)
+            next_checkpoint = pos + nl + 1 + checkpoint_bytes
+        newline_count += block.count(b"\n", counted_to)
+        pos = end
+
+    if not utf8_error:
+        utf8_pending = decoder.getstate()[0]
+    return newline_count, pending_cr, utf8_pending, utf8_error, has_bare_cr
+
+
+def build_line_index(
+    path: Path,
+    *,
+    checkpoint_bytes: int = DEFAULT_CHECKPOINT_BYTES,
+    previous: LineIndex | None = None,
+) -> LineIndex:
+    """Index a file, extending previous instead of rescanning when possible.
+
+    Args:
+        path: File to index.
+        checkpoint_bytes: Approximate spacing of checkpoints in bytes.
+        previous: An older index of the same path. It is returned as is if
+            the file's fingerprint and last bytes are unchanged, and extended
+            from its old end if the file grew in place and the bytes before
+            the old end are unchanged.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+
+        start = 0
+        state: tuple[int, bool, bytes, bool, bool] = (0, False, b"", False, False)
+        lines, offsets = [1], [0]
+        if (
+            previous is not None
+            and previous.fingerprint[:2] == (st.st_dev, st.st_ino)
+            and previous.size <= size
+        ):
+            sample_start = previous.size - len(previous.tail_sample)
+            f.seek(sample_start)
+            same_tail = f.read(len(previous.tail_sample)) == previous.tail_sample
+            if same_tail and previous.fingerprint == _fingerprint(st):
+                return previous
+            if same_tail and previous.size < size:
+                start = previous.size
+                state = (
+                    previous.newline_count,
+                    previous.tail_sample.endswith(b"\r"),
+                    previous.utf8_pending,
+                    previous.utf8_error,
+                    previous.bare_cr_seen,
+                )
+                lines = list(previous.checkpoint_lines)
+                offsets = list(previous.checkpoint_offsets)
+
+        newline_count, _, utf8_pending, utf8_error, bare_cr_seen = _scan(
+            f,
+            start=start,
+            stop=size,
+            newline_count=state[0],
+            lines=lines,
+            offsets=offsets,
+            checkpoint_bytes=checkpoint_bytes,
+            pending_cr=state[1],
+            utf8_pending=state[2],
+            utf8_error=state[3],
+            has_bare_cr=state[4],
+        )
+
+        sample_len = min(_TAIL_SAMPLE, size)
+        f.seek(size - sample_len)
+        tail_sample = f.read(sample_len)
+
+    return LineIndex(
+        size=size,
+        newline_count=newline_count,
+        checkpoint_lines=tuple(lines),
+        checkpoint_offsets=tuple(offsets),
+        fingerprint=_fingerprint(st),
+        built_at_ns=time.time_ns(),
+        tail_sample=tail_sample,
+        utf8_pending=utf8_pending,
+        utf8_error=utf8_error,
+        bare_cr_seen=bare_cr_seen,
+    )
+
+
+def count_lines_before(path: Path, index: LineIndex, offset: int) -> int:
+    """Return how many line starts precede a byte offset (its 1-indexed line - 1).
+
+    Reads at most one checkpoint interval of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    offset = min(max(offset, 0), index.size)
+    line, start = index.checkpoint_for_offset(offset)
+    newlines = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = offset - start
+        while remaining > 0:
+            block = f.read(min(_READ_BLOCK, remaining))
+            if not block:
+                break
+            newlines += block.count(b"\n")
+            remaining -= len(block)
+    return line - 1 + newlines
+
+
+class LineIndexCache:
+    """LRU cache of LineIndex objects validated by file stat."""
+
+    def __init__(
+        self,
+        max_files: int = DEFAULT_MAX_FILES,
+        checkpoint_bytes: int = DEFAULT_CHECKPOINT_BYTES,
+        racy_window: float = DEFAULT_RACY_WINDOW,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_files: Number of file indexes to keep.
+            checkpoint_bytes: Approximate checkpoint spacing for new indexes.
+            racy_window: Seconds after a file changes during which a matching
+                fingerprint alone is not trusted.
+        """
+        self._max_files = max_files
+        self._checkpoint_bytes = checkpoint_bytes
+        self._racy_window_ns = int(racy_window * 1_000_000_000)
+        self._indexes: OrderedDict[Path, LineIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> LineIndex:
+        """Return an up-to-date index for a file, building or extending it.
+
+        Args:
+            path: File to index. Callers must already have authorized it.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
+        key = path.resolve()
+        st = os.stat(key)
+        with self._lock:
+            cached = self._indexes.get(key)
+            if (
+                cached is not None
+                and cached.fingerprint == _fingerprint(st)
+                and cached.built_at_ns - st.st_mtime_ns >= self._racy_window_ns
+            ):
+                self._indexes.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        index = build_line_index(
+            key, checkpoint_bytes=self._checkpoint_bytes, previous=cached
+        )
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self._max_files:
+                self._indexes.popitem(last=False)
+        return index
+
+    def invalidate(self, path: Path) -> None:
+        """Forget the index of a file."""
+        try:
+            key = path.resolve()
+        except OSError:
+            key = Path(os.path.abspath(path))
+        with self._lock:
+            self._indexes.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self) -> int:
+        """Return number of cached indexes."""
+        return len(self._indexes)
+
+
+_DEFAULT_CACHE = LineIndexCache()
+
+
+def get_line_index_cache() -> LineIndexCache:
+    """Return the process-wide line index cache."""
+    return _DEFAULT_CACHE
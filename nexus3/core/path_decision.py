@@ -31,13 +31,22 @@ checks should use this engine.
 
 from __future__ import annotations
 
+import os
+import stat
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from nexus3.core.errors import PathSecurityError
-from nexus3.core.paths import _decide_path, _DecisionReason
+from nexus3.core.paths import (
+    _absolute_input_path,
+    _decide_resolved_path,
+    _DecisionReason,
+    _resolution_failed,
+    _resolve_rules,
+)
 
 if TYPE_CHECKING:
     from nexus3.skill.services import ServiceContainer
@@ -103,6 +112,21 @@ class PathDecision:
         return self.resolved_path
 
 
+# Max resolved parent directories remembered per PathDecisionEngine
+_RESOLVED_DIR_CACHE_SIZE = 1024
+
+_FILE_ATTRIBUTE_REPARSE_POINT = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+
+# Windows maps 8.3 short names (SECRET~1.TXT) and names with a trailing dot
+# or space (secret.txt.) to the real file; only resolve() canonicalises them
+_WINDOWS_ALIASES = os.name == "nt"
+
+
+def _may_be_alias(name: str) -> bool:
+    """True if a file name may be an alias that resolve() would rename."""
+    return _WINDOWS_ALIASES or "~" in name or name.endswith((".", " "))
+
+
 class PathDecisionEngine:
     """Authoritative engine for path access decisions.
 
@@ -110,6 +134,13 @@ class PathDecisionEngine:
     results with reasoning. This is the single source of truth for
     determining whether a path can be accessed.
 
+    Allowed and blocked rules are resolved once, at construction. Resolved
+    parent directories are kept in a bounded per-engine cache, so checking
+    many entries of one directory costs an lstat() per entry rather than a
+    full resolve(). Entries that are themselves symlinks are always fully
+    resolved. Engines are built per operation, which bounds how long a
+    cached resolution can be relied on.
+
     The engine supports two modes:
     1. Standalone: Initialize with explicit allowed_paths/blocked_paths
     2. ServiceContainer: Initialize from a ServiceContainer for per-agent paths
@@ -149,6 +180,9 @@ class PathDecisionEngine:
         self._allowed_paths = allowed_paths
         self._blocked_paths = blocked_paths or []
         self._cwd = cwd or Path.cwd()
+        self._allowed_rules = _resolve_rules(allowed_paths)
+        self._blocked_rules = _resolve_rules(self._blocked_paths)
+        self._resolved_dirs: OrderedDict[Path, Path] = OrderedDict()
 
     @classmethod
     def from_services(
@@ -184,8 +218,8 @@ class PathDecisionEngine:
         """Check whether access to a path is allowed.
 
         This is the main method for making path access decisions. It
-        uses the shared _decide_path() kernel from paths.py and maps
-        the result to a PathDecision with existence checks.
+        applies the same rules as the shared _decide_path() kernel in
+        paths.py and maps the result to a PathDecision with existence checks.
 
         Args:
             path: Path to check (can be relative to cwd).
@@ -195,13 +229,20 @@ class PathDecisionEngine:
         Returns:
             PathDecision with allowed/denied status and reasoning.
         """
-        # Use the shared kernel for path decision
-        internal = _decide_path(
-            path=path,
-            allowed_paths=self._allowed_paths,
-            blocked_paths=self._blocked_paths,
-            cwd=self._cwd,
-        )
+        # Same decision as _decide_path(), against the pre-resolved rules
+        original = str(path)
+        try:
+            resolved = self._resolve(_absolute_input_path(path, self._cwd))
+        except (OSError, ValueError) as e:
+            internal = _resolution_failed(original, e)
+        else:
+            internal = _decide_resolved_path(
+                resolved,
+                original,
+                allowed_paths=self._allowed_paths,
+                allowed_rules=self._allowed_rules,
+                blocked_rules=self._blocked_rules,
+            )
 
         # Map internal reasons to public PathDecisionReason
         reason_map = {
@@ -234,6 +275,45 @@ class PathDecisionEngine:
             internal.matched_rule,
         )
 
+    def _resolve(self, path: Path) -> Path:
+        """Resolve path like Path.resolve(), reusing cached parent resolutions.
+
+        The parent directory is resolved through the cache. If the entry
+        itself is not a symlink (or does not exist), its resolved path is
+        the resolved parent plus its name. Otherwise, or if the name may be
+        a Windows alias, it is fully resolved.
+        """
+        name = path.name
+        if name in ("", ".", "..") or _may_be_alias(name):
+            return path.resolve()
+
+        parent = self._resolve_directory(path.parent)
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            # Path.resolve() appends missing components unchanged
+            return parent / name
+        except OSError:
+            return path.resolve()
+        # Windows junctions are reparse points but not S_ISLNK
+        reparse = getattr(st, "st_file_attributes", 0) & _FILE_ATTRIBUTE_REPARSE_POINT
+        if stat.S_ISLNK(st.st_mode) or reparse:
+            return path.resolve()
+        return parent / name
+
+    def _resolve_directory(self, directory: Path) -> Path:
+        """Resolve a directory path through the bounded per-engine cache."""
+        resolved = self._resolved_dirs.get(directory)
+        if resolved is not None:
+            self._resolved_dirs.move_to_end(directory)
+            return resolved
+
+        resolved = directory.resolve()
+        self._resolved_dirs[directory] = resolved
+        if len(self._resolved_dirs) > _RESOLVED_DIR_CACHE_SIZE:
+            self._resolved_dirs.popitem(last=False)
+        return resolved
+
     def _check_existence_constraints(
         self,
         resolved: Path,
@@ -84,6 +84,47 @@ def _normalize_input_path_string(path: str) -> str:
     return normalized
 
 
+# (rule, resolved rule) pairs, as produced by _resolve_rules()
+_ResolvedRules = tuple[tuple[Path, Path], ...]
+
+
+def _resolve_rules(paths: list[Path] | None) -> _ResolvedRules:
+    """Resolve allowed/blocked rule paths, skipping any that cannot be resolved.
+
+    Callers that check many paths against the same rules (PathDecisionEngine)
+    resolve them once with this instead of once per check.
+    """
+    rules: list[tuple[Path, Path]] = []
+    for rule in paths or ():
+        try:
+            rules.append((rule, rule.resolve()))
+        except (OSError, ValueError):
+            continue
+    return tuple(rules)
+
+
+def _absolute_input_path(path: str | Path, cwd: Path | None = None) -> Path:
+    """Normalize and expand a caller-supplied path, anchoring it at cwd.
+
+    The result is not resolved; symlinks and `..` components are left intact.
+    """
+    # Handle empty/None input
+    if not path:
+        path = "."
+
+    # Normalize and expand
+    if isinstance(path, str):
+        path = _normalize_input_path_string(path)
+        path = Path(path)
+
+    p = path.expanduser()
+
+    # Resolve relative paths against cwd
+    if cwd and not p.is_absolute():
+        p = cwd / p
+    return p
+
+
 def _decide_path(
     path: str | Path,
     allowed_paths: list[Path] | None = None,
@@ -107,50 +148,59 @@ def _decide_path(
         _PathDecisionInternal with decision, reason, and resolved path.
     """
     original = str(path)
-
-    # Handle empty/None input
-    if not path:
-        path = "."
-
-    # Normalize and expand
-    if isinstance(path, str):
-        path = _normalize_input_path_string(path)
-        path = Path(path)
-
-    p = path.expanduser()
-
-    # Resolve relative paths against cwd
-    if cwd and not p.is_absolute():
-        p = cwd / p
+    p = _absolute_input_path(path, cwd)
 
     # Try to resolve the path (follows symlinks)
     try:
         resolved = p.resolve()
     except (OSError, ValueError) as e:
-        return _PathDecisionInternal(
-            allowed=False,
-            resolved_path=None,
-            reason=_DecisionReason.DENIED_RESOLUTION_FAILED,
-            detail=f"Cannot resolve path: {e}",
-            original_path=original,
-        )
+        return _resolution_failed(original, e)
 
+    return _decide_resolved_path(
+        resolved,
+        original,
+        allowed_paths=allowed_paths,
+        allowed_rules=_resolve_rules(allowed_paths),
+        blocked_rules=_resolve_rules(blocked_paths),
+    )
+
+
+def _resolution_failed(original: str, error: Exception) -> _PathDecisionInternal:
+    """Decision for a path whose resolution raised."""
+    return _PathDecisionInternal(
+        allowed=False,
+        resolved_path=None,
+        reason=_DecisionReason.DENIED_RESOLUTION_FAILED,
+        detail=f"Cannot resolve path: {error}",
+        original_path=original,
+    )
+
+
+def _decide_resolved_path(
+    resolved: Path,
+    original: str,
+    *,
+    allowed_paths: list[Path] | None,
+    allowed_rules: _ResolvedRules,
+    blocked_rules: _ResolvedRules,
+) -> _PathDecisionInternal:
+    """Decide access for an already-resolved path against pre-resolved rules.
+
+    Performs no filesystem access. allowed_paths is the unresolved rule list;
+    it distinguishes unrestricted (None) from nothing-allowed ([]) and is
+    shown in denial details.
+    """
     # Check blocked first (always enforced)
-    if blocked_paths:
-        for blocked in blocked_paths:
-            try:
-                blocked_resolved = blocked.resolve()
-                if resolved.is_relative_to(blocked_resolved):
-                    return _PathDecisionInternal(
-                        allowed=False,
-                        resolved_path=None,
-                        reason=_DecisionReason.DENIED_BLOCKED,
-                        detail=f"Path is blocked: {blocked}",
-                        original_path=original,
-                        matched_rule=blocked,
-                    )
-            except (OSError, ValueError):
-                continue
+    for blocked, blocked_resolved in blocked_rules:
+        if resolved.is_relative_to(blocked_resolved):
+            return _PathDecisionInternal(
+                allowed=False,
+                resolved_path=None,
+                reason=_DecisionReason.DENIED_BLOCKED,
+                detail=f"Path is blocked: {blocked}",
+                original_path=original,
+                matched_rule=blocked,
+            )
 
     # Check allowed paths
     if allowed_paths is not None:
@@ -165,20 +215,16 @@ def _decide_path(
             )
 
         # Check if within any allowed path
-        for allowed in allowed_paths:
-            try:
-                allowed_resolved = allowed.resolve()
-                if resolved.is_relative_to(allowed_resolved):
-                    return _PathDecisionInternal(
-                        allowed=True,
-                        resolved_path=resolved,
-                        reason=_DecisionReason.ALLOWED_WITHIN_PATH,
-                        detail=f"Path within allowed directory: {allowed}",
-                        original_path=original,
-                        matched_rule=allowed,
-                    )
-            except (OSError, ValueError):
-                continue
+        for allowed, allowed_resolved in allowed_rules:
+            if resolved.is_relative_to(allowed_resolved):
+                return _PathDecisionInternal(
+                    allowed=True,
+                    resolved_path=resolved,
+                    reason=_DecisionReason.ALLOWED_WITHIN_PATH,
+                    detail=f"Path within allowed directory: {allowed}",
+                    original_path=original,
+                    matched_rule=allowed,
+                )
 
         # Not in any allowed path
         allowed_str = ", ".join(str(p) for p in allowed_paths)
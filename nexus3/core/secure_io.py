@@ -162,15 +162,19 @@ def ensure_secure_dir(path: Path) -> None:
     os.chmod(path, SECURE_DIR_MODE)
 
 
-def secure_append(path: Path, content: str | bytes, *, encoding: str = "utf-8") -> None:
-    """Append content to file, refusing to follow symlinks.
+def secure_open_append(path: Path) -> int:
+    """Open a file for appending, refusing to follow symlinks.
 
-    Creates file if it doesn't exist (with secure permissions 0o600).
+    Creates file if it doesn't exist (with secure permissions 0o600). The
+    caller owns the returned descriptor and must close it. Writes through the
+    descriptor keep going to the opened file even if the path is later
+    replaced, so a long-lived descriptor cannot be redirected by a symlink.
 
     Args:
         path: Target file path.
-        content: Content to append (str or bytes).
-        encoding: Encoding for str content (default: utf-8).
+
+    Returns:
+        File descriptor opened with O_WRONLY | O_APPEND.
 
     Raises:
         SymlinkError: If path is a symlink.
@@ -183,12 +187,28 @@ def secure_append(path: Path, content: str | bytes, *, encoding: str = "utf-8")
     flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_NOFOLLOW
 
     try:
-        fd = os.open(str(path), flags, SECURE_FILE_MODE)
+        return os.open(str(path), flags, SECURE_FILE_MODE)
     except OSError as e:
         if e.errno == errno.ELOOP:
             raise SymlinkError(f"Refusing to append through symlink: {path}") from e
         raise
 
+
+def secure_append(path: Path, content: str | bytes, *, encoding: str = "utf-8") -> None:
+    """Append content to file, refusing to follow symlinks.
+
+    Creates file if it doesn't exist (with secure permissions 0o600).
+
+    Args:
+        path: Target file path.
+        content: Content to append (str or bytes).
+        encoding: Encoding for str content (default: utf-8).
+
+    Raises:
+        SymlinkError: If path is a symlink.
+        OSError: On other I/O errors.
+    """
+    fd = secure_open_append(path)
     try:
         if isinstance(content, str):
             content = content.encode(encoding)
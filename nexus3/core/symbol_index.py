@@ -0,0 +1,454 @@
+"""Outline cache and project symbol index for the outline skill.
+
+outline re-reads and re-parses a file on every call, and agents call it on
+the same files over and over during refactors. A SymbolIndex keeps, per
+project root:
+
+- **Outlines:** the parsed entries of each file, keyed by (path, mtime,
+  size, parser) plus the parse options (depth, signatures, preview), since
+  several parsers shape their output by depth. A call with the same options
+  on an unchanged file skips the read and the parse.
+- **Symbols:** every definition (name, kind, line, signature) from a
+  full-depth parse, so "where is X defined" is one indexed SQL query instead
+  of parsing the whole tree.
+
+Entries are stale as soon as the file's mtime or size changes. At most
+``max_outlines`` outlines are kept; the oldest are dropped first. Files
+modified within the last ``racy_window`` seconds are treated as unverified
+(a second write in the same timestamp tick would be invisible): their
+outlines are not cached and their symbols are re-parsed on the next refresh.
+
+The index does not parse anything itself; the outline skill parses the
+files its FilesystemAccessGateway allowed and stores the results, and
+filters query results through the querying agent's gateway.
+
+By default an index lives in memory for the process; with
+``search.symbol_index`` it is stored in ``<cwd>/.nexus3/symbol_index.db``
+and survives restarts. Indexes are shared process-wide per project
+(get_symbol_index()); only the ``_MAX_INDEXES`` most recently used roots are
+kept open.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from nexus3.core.constants import NEXUS_DIR_NAME
+from nexus3.core.secure_io import SECURE_FILE_MODE, secure_mkdir
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "symbol_index.db"
+
+# Bump when stored outlines or symbols change shape; the index is then cleared.
+SCHEMA_VERSION = 1
+
+DEFAULT_RACY_WINDOW = 2.0
+DEFAULT_MAX_OUTLINES = 2000
+
+# Case-sensitive "path is below a directory" test (LIKE ignores ASCII case)
+_UNDER_SQL = "substr(path, 1, ?) = ?"
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    parser TEXT NOT NULL,
+    stable INTEGER NOT NULL,
+    has_symbols INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS outlines (
+    path TEXT NOT NULL,
+    options TEXT NOT NULL,
+    line_count INTEGER NOT NULL,
+    entries TEXT NOT NULL,
+    PRIMARY KEY (path, options)
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name_lower);
+CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path);
+"""
+
+Symbol = tuple[str, str, int, str]
+"""(name, kind, line, signature) of one definition."""
+
+
+def _under_params(prefix: str) -> tuple[int, str]:
+    """Parameters of _UNDER_SQL for files below the directory key prefix."""
+    return len(prefix) + 1, prefix + "/"
+
+
+@dataclass(frozen=True)
+class SymbolLocation:
+    """Where a symbol is defined.
+
+    Attributes:
+        path: Absolute path of the defining file.
+        line: 1-indexed line of the definition.
+        kind: Outline kind (class, function, method, ...).
+        name: Symbol name.
+        signature: Signature as the outline parser rendered it.
+    """
+
+    path: Path
+    line: int
+    kind: str
+    name: str
+    signature: str
+
+
+class SymbolIndex:
+    """Cached outlines and symbol definitions for one project root."""
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Path | None = None,
+        *,
+        persistent: bool = True,
+        racy_window: float = DEFAULT_RACY_WINDOW,
+        max_outlines: int = DEFAULT_MAX_OUTLINES,
+    ) -> None:
+        """Open (or create) the index.
+
+        Args:
+            root: Project root. Only files under it are cached.
+            db_path: Database file. Defaults to ``<root>/.nexus3/symbol_index.db``.
+            persistent: If False, keep the index in memory only.
+            racy_window: Seconds after a file changes during which its
+                entries are not trusted.
+            max_outlines: Number of cached outlines to keep.
+
+        Raises:
+            OSError: If the database directory cannot be created.
+            sqlite3.Error: If the database cannot be opened.
+        """
+        self._root = root
+        self._db_path = db_path or root / NEXUS_DIR_NAME / INDEX_FILE_NAME
+        self._persistent = persistent
+        self._racy_window_ns = int(racy_window * 1_000_000_000)
+        self._max_outlines = max_outlines
+        self._lock = threading.Lock()
+        self._conn = self._open()
+
+    @property
+    def root(self) -> Path:
+        """Project root this index covers."""
+        return self._root
+
+    def __len__(self) -> int:
+        """Number of files with cached entries."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()
+        return int(row[0])
+
+    def _open(self) -> sqlite3.Connection:
+        if not self._persistent:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.executescript(SCHEMA_SQL)
+            return conn
+        secure_mkdir(self._db_path.parent)
+        if not self._db_path.exists():
+            try:
+                fd = os.open(
+                    str(self._db_path),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                    SECURE_FILE_MODE,
+                )
+                os.close(fd)
+            except FileExistsError:
+                pass
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA_SQL)
+        row = conn.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+        if row is None or row[0] != str(SCHEMA_VERSION):
+            with conn:
+                conn.execute("DELETE FROM files")
+                conn.execute("DELETE FROM outlines")
+                conn.execute("DELETE FROM symbols")
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+        return conn
+
+    def _key(self, path: Path) -> str | None:
+        try:
+            return path.relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+
+    def _is_stable(self, st: os.stat_result) -> bool:
+        return time.time_ns() - st.st_mtime_ns >= self._racy_window_ns
+
+    def _current_version(
+        self,
+        key: str,
+        st: os.stat_result,
+        parser: str,
+    ) -> tuple[bool, bool] | None:
+        """Return (stable, has_symbols) if the stored version matches st."""
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, parser, stable, has_symbols FROM files WHERE path = ?",
+            (key,),
+        ).fetchone()
+        if row is None or (row[0], row[1], row[2]) != (st.st_mtime_ns, st.st_size, parser):
+            return None
+        return bool(row[3]), bool(row[4])
+
+    def _set_version(self, key: str, st: os.stat_result, parser: str) -> bool:
+        """Record the version of a file, dropping entries of older versions.
+
+        Must be called with the lock held, inside a transaction.
+        """
+        version = self._current_version(key, st, parser)
+        stable = self._is_stable(st)
+        if version is not None and version[0] == stable:
+            return stable
+        if version is None:
+            self._conn.execute("DELETE FROM outlines WHERE path = ?", (key,))
+            self._conn.execute("DELETE FROM symbols WHERE path = ?", (key,))
+        # Symbols parsed while the file was unverified are kept for queries
+        # but re-parsed on the next refresh
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, parser, stable, has_symbols) "
+            "VALUES (?, ?, ?, ?, ?, 0)",
+            (key, st.st_mtime_ns, st.st_size, parser, int(stable)),
+        )
+        return stable
+
+    def get_outline(
+        self,
+        path: Path,
+        st: os.stat_result,
+        parser: str,
+        options: str,
+    ) -> tuple[int, list[dict[str, Any]]] | None:
+        """Return cached (line_count, entries) for an unchanged file, or None.
+
+        Args:
+            path: File path.
+            st: Current stat of the file.
+            parser: Parser key used.
+            options: Caller's encoding of the parse options.
+        """
+        key = self._key(path)
+        if key is None:
+            return None
+        with self._lock:
+            version = self._current_version(key, st, parser)
+            if version is None or not version[0]:
+                return None
+            row = self._conn.execute(
+                "SELECT line_count, entries FROM outlines WHERE path = ? AND options = ?",
+                (key, options),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row[0]), json.loads(row[1])
+
+    def put_outline(
+        self,
+        path: Path,
+        st: os.stat_result,
+        parser: str,
+        options: str,
+        line_count: int,
+        entries: list[dict[str, Any]],
+    ) -> None:
+        """Cache the entries parsed from a file (ignored for unverified files)."""
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            try:
+                with self._conn:
+                    if not self._set_version(key, st, parser):
+                        return
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO outlines (path, options, line_count, entries) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, options, line_count, json.dumps(entries)),
+                    )
+                    # Replaced rows get a new rowid, so the lowest are the oldest
+                    (count,) = self._conn.execute("SELECT COUNT(*) FROM outlines").fetchone()
+                    if count > self._max_outlines:
+                        self._conn.execute(
+                            "DELETE FROM outlines WHERE rowid IN "
+                            "(SELECT rowid FROM outlines ORDER BY rowid LIMIT ?)",
+                            (count - self._max_outlines,),
+                        )
+            except sqlite3.Error as e:
+                logger.debug("Could not cache outline for %s: %s", path, e)
+
+    def needs_symbols(self, path: Path, st: os.stat_result, parser: str) -> bool:
+        """Return True if a file's symbols are missing, stale or unverified."""
+        key = self._key(path)
+        if key is None:
+            return False
+        with self._lock:
+            version = self._current_version(key, st, parser)
+        return version is None or not version[0] or not version[1]
+
+    def put_symbols(
+        self,
+        path: Path,
+        st: os.stat_result,
+        parser: str,
+        symbols: Sequence[Symbol],
+    ) -> None:
+        """Replace the definitions recorded for a file."""
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            try:
+                with self._conn:
+                    self._set_version(key, st, parser)
+                    self._conn.execute("DELETE FROM symbols WHERE path = ?", (key,))
+                    self._conn.executemany(
+                        "INSERT INTO symbols (path, name, name_lower, kind, line, signature) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (key, name, name.lower(), kind, line, signature)
+                            for name, kind, line, signature in symbols
+                        ],
+                    )
+                    self._conn.execute(
+                        "UPDATE files SET has_symbols = 1 WHERE path = ?", (key,)
+                    )
+            except sqlite3.Error as e:
+                logger.debug("Could not index symbols for %s: %s", path, e)
+
+    def prune(self, under: Path, existing: set[Path]) -> int:
+        """Drop entries for files under a directory that no longer exist.
+
+        Args:
+            under: Directory that was listed completely.
+            existing: Every file currently under it.
+
+        Returns:
+            Number of files dropped.
+        """
+        prefix = self._key(under)
+        if prefix is None:
+            return 0
+        existing_keys = {key for key in map(self._key, existing) if key is not None}
+        sql = "SELECT path FROM files"
+        params: list[Any] = []
+        if prefix != ".":
+            sql += f" WHERE {_UNDER_SQL}"
+            params.extend(_under_params(prefix))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            removed = [
+                (key,) for (key,) in rows
+                if key not in existing_keys and not (self._root / key).exists()
+            ]
+            if removed:
+                try:
+                    with self._conn:
+                        for table in ("files", "outlines", "symbols"):
+                            self._conn.executemany(
+                                f"DELETE FROM {table} WHERE path = ?", removed
+                            )
+                except sqlite3.Error as e:
+                    logger.debug("Could not prune symbol index: %s", e)
+        return len(removed)
+
+    def find(
+        self,
+        name: str,
+        *,
+        under: Path | None = None,
+        limit: int = 100,
+    ) -> list[SymbolLocation]:
+        """Find definitions of a symbol.
+
+        Exact-name matches are returned if there are any; otherwise
+        case-insensitive matches.
+
+        Args:
+            name: Symbol name.
+            under: Only return definitions in files below this directory.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching definitions ordered by path and line.
+        """
+        prefix = self._key(under) if under is not None else "."
+        if prefix is None:
+            return []
+        sql = (
+            "SELECT path, line, kind, name, signature FROM symbols "
+            "WHERE name_lower = ?"
+        )
+        params: list[Any] = [name.lower()]
+        if prefix != ".":
+            sql += f" AND {_UNDER_SQL}"
+            params.extend(_under_params(prefix))
+        sql += " ORDER BY path, line"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        exact = [row for row in rows if row[3] == name]
+        return [
+            SymbolLocation(self._root / path, line, kind, symbol_name, signature)
+            for path, line, kind, symbol_name, signature in (exact or rows)[:limit]
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_INDEXES: OrderedDict[tuple[Path, bool], SymbolIndex] = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+# Evicted indexes are not closed (a search may still hold one); the
+# connection is released when the last reference goes away.
+_MAX_INDEXES = 8
+
+
+def get_symbol_index(root: Path, *, persistent: bool = False) -> SymbolIndex:
+    """Return the process-wide index for a project root, opening it once.
+
+    Args:
+        root: Project root.
+        persistent: Store the index in ``<root>/.nexus3/symbol_index.db``
+            instead of memory.
+
+    Raises:
+        OSError: If the index directory cannot be created.
+        sqlite3.Error: If the database cannot be opened.
+    """
+    key = (root.resolve(), persistent)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = SymbolIndex(key[0], persistent=persistent)
+            _INDEXES[key] = index
+            while len(_INDEXES) > _MAX_INDEXES:
+                _INDEXES.popitem(last=False)
+        _INDEXES.move_to_end(key)
+        return index
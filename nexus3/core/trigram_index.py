@@ -0,0 +1,467 @@
+"""Persistent trigram index that narrows search_text's Python fallback.
+
+search_text uses ripgrep unless the agent is path-restricted (every sandboxed
+agent), in which case it walks the tree and regex-scans every file on every
+call. With ``search.content_index`` enabled, a TrigramIndex stored in
+``<cwd>/.nexus3/search_index.db`` keeps a small trigram signature per file,
+and the fallback only reads files whose signature holds every trigram the
+pattern requires.
+
+- **Signatures:** the trigrams inside each file's ASCII word runs
+  (``[A-Za-z0-9_]{3,}``, lowercased) are hashed into a Bloom filter of
+  1024-16384 bits, sized from the trigram count.
+- **Queries:** required_trigrams() collects the literal runs every match of
+  a pattern must contain. A file is a candidate when its filter has all of
+  their bits. False positives only cost a read; there are no false
+  negatives. Files that are not valid UTF-8, or could not be indexed, are
+  always candidates, so results are identical to an unindexed search.
+- **Freshness:** callers pass the (path, stat) pairs they already collected,
+  and entries whose mtime or size changed are re-read. The index never
+  walks or reads anything itself beyond those paths, so it only sees files
+  the caller's FilesystemAccessGateway already authorised.
+- **Bounded builds:** one refresh() indexes at most ``limit`` stale files,
+  stops reading once ``budget`` seconds have passed, and persists what it
+  read in batches of ``_PERSIST_BATCH``. Files it did not get to stay
+  candidates, so a large tree is indexed over several searches
+  instead of blocking the first one. Files another refresh is already
+  reading are skipped rather than read twice.
+
+Indexes are shared process-wide per project (get_trigram_index()).
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from re import _constants as sre_constants  # type: ignore[attr-defined]
+from re import _parser as sre_parser  # type: ignore[attr-defined]
+from typing import Any
+
+from nexus3.core.constants import NEXUS_DIR_NAME
+from nexus3.core.secure_io import SECURE_FILE_MODE, secure_mkdir
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "search_index.db"
+
+# Bump when the signature scheme changes; stored entries are then discarded.
+SIGNATURE_VERSION = 1
+
+# Filter sizes (bits), chosen per file so each trigram gets ~4 bits.
+_FILTER_BITS = (1024, 4096, 16384)
+_BITS_PER_TRIGRAM = 4
+
+# Stale files and seconds one refresh() spends indexing by default, and rows
+# written per commit
+DEFAULT_REFRESH_LIMIT = 5000
+DEFAULT_REFRESH_BUDGET = 5.0
+_PERSIST_BATCH = 500
+
+_WORD_RE = re.compile(rb"[a-z0-9_]{3,}")
+_HASH_MULT = 0x9E3779B1
+
+# Under IGNORECASE these ASCII letters also match non-ASCII characters
+# (İ/ı, K Kelvin sign, ſ long s), which the index does not see as word bytes.
+_CASEFOLD_UNSAFE = bytes.maketrans(b"iks", b"   ")
+
+# word -> filter bits, per filter size; shared across files (identifiers repeat)
+_WORD_MASKS: dict[tuple[int, bytes], int] = {}
+_MAX_WORD_MASKS = 500_000
+
+_REPEATS = frozenset(
+    op
+    for op in (
+        sre_constants.MAX_REPEAT,
+        sre_constants.MIN_REPEAT,
+        getattr(sre_constants, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    utf8 INTEGER NOT NULL,
+    bits INTEGER NOT NULL,
+    signature BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _word_mask(word: bytes, bits: int) -> int:
+    """Filter bits for every trigram of word."""
+    key = (bits, word)
+    mask = _WORD_MASKS.get(key)
+    if mask is None:
+        shift = 33 - bits.bit_length()  # top log2(bits) bits of a 32-bit hash
+        mask = 0
+        for i in range(len(word) - 2):
+            code = int.from_bytes(word[i : i + 3], "little")
+            mask |= 1 << (((code * _HASH_MULT) & 0xFFFFFFFF) >> shift)
+        if len(_WORD_MASKS) >= _MAX_WORD_MASKS:
+            _WORD_MASKS.clear()
+        _WORD_MASKS[key] = mask
+    return mask
+
+
+def trigram_signature(data: bytes) -> tuple[int, int]:
+    """Compute a file's trigram filter.
+
+    Returns:
+        (filter size in bits, filter as an int)
+    """
+    words = set(_WORD_RE.findall(data.lower()))
+    count = sum(len(word) - 2 for word in words)
+    bits = next(
+        (size for size in _FILTER_BITS if count * _BITS_PER_TRIGRAM <= size),
+        _FILTER_BITS[-1],
+    )
+    signature = 0
+    for word in words:
+        signature |= _word_mask(word, bits)
+    return bits, signature
+
+
+def required_trigrams(pattern: str, flags: int = 0) -> frozenset[bytes]:
+    """Trigrams that every line matching pattern must contain.
+
+    Conservative: returns an empty set (no narrowing) for patterns it cannot
+    analyse or that have no literal run of three word characters.
+    """
+    try:
+        parsed = sre_parser.parse(pattern, flags)
+    except Exception:
+        return frozenset()
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    runs: list[tuple[str, bool]] = []
+    _collect_literal_runs(parsed, ignore_case, runs)
+
+    trigrams: set[bytes] = set()
+    for run, run_ignore_case in runs:
+        # Fold ASCII only: str.lower() maps e.g. the Kelvin sign to "k", a
+        # byte the file does not contain
+        text = run.encode("ascii", "replace").lower()
+        if run_ignore_case:
+            text = text.translate(_CASEFOLD_UNSAFE)
+        for word in _WORD_RE.findall(text):
+            trigrams.update(word[i : i + 3] for i in range(len(word) - 2))
+    return frozenset(trigrams)
+
+
+def _collect_literal_runs(
+    items: Iterable[tuple[Any, Any]],
+    ignore_case: bool,
+    runs: list[tuple[str, bool]],
+) -> None:
+    """Append the literal runs that must appear in every match of items."""
+    current: list[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append(("".join(current), ignore_case))
+            current.clear()
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            current.append(chr(av))
+            continue
+        flush()
+        if op is sre_constants.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            sub_ignore_case = (ignore_case or bool(add_flags & re.IGNORECASE)) and not (
+                del_flags & re.IGNORECASE
+            )
+            _collect_literal_runs(sub, sub_ignore_case, runs)
+        elif op in _REPEATS:
+            minimum, _maximum, sub = av
+            if minimum >= 1:
+                _collect_literal_runs(sub, ignore_case, runs)
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            _collect_literal_runs(av, ignore_case, runs)
+    flush()
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    mtime_ns: int
+    size: int
+    utf8: bool
+    bits: int
+    signature: int
+
+
+class TrigramIndex:
+    """Per-project trigram signatures, persisted in SQLite.
+
+    Thread-safe; search_text calls it from worker threads.
+    """
+
+    def __init__(self, root: Path, db_path: Path | None = None) -> None:
+        """Open (or create) the index for root.
+
+        Args:
+            root: Project root. Only files under it are indexed.
+            db_path: Database file. Defaults to ``<root>/.nexus3/search_index.db``.
+
+        Raises:
+            OSError: If the database directory cannot be created.
+            sqlite3.Error: If the database cannot be opened.
+        """
+        self._root = root
+        self._db_path = db_path or root / NEXUS_DIR_NAME / INDEX_FILE_NAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        # Keys some refresh() is currently reading
+        self._claimed: set[str] = set()
+        self._conn = self._open()
+        self._load()
+
+    @property
+    def root(self) -> Path:
+        """Project root this index covers."""
+        return self._root
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self._entries)
+
+    def _open(self) -> sqlite3.Connection:
+        secure_mkdir(self._db_path.parent)
+        if not self._db_path.exists():
+            try:
+                fd = os.open(
+                    str(self._db_path),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                    SECURE_FILE_MODE,
+                )
+                os.close(fd)
+            except FileExistsError:
+                pass
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA_SQL)
+        row = conn.execute("SELECT value FROM metadata WHERE key = 'signature_version'").fetchone()
+        if row is None or row[0] != str(SIGNATURE_VERSION):
+            conn.execute("DELETE FROM files")
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('signature_version', ?)",
+                (str(SIGNATURE_VERSION),),
+            )
+            conn.commit()
+        return conn
+
+    def _load(self) -> None:
+        rows = self._conn.execute(
+            "SELECT path, mtime_ns, size, utf8, bits, signature FROM files"
+        ).fetchall()
+        self._entries = {
+            path: _Entry(mtime_ns, size, bool(utf8), bits, int.from_bytes(signature, "little"))
+            for path, mtime_ns, size, utf8, bits, signature in rows
+        }
+
+    def _key(self, path: Path) -> str | None:
+        try:
+            return path.relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+
+    def refresh(
+        self,
+        files: Sequence[tuple[Path, os.stat_result]],
+        *,
+        prune_under: Path | None = None,
+        limit: int | None = DEFAULT_REFRESH_LIMIT,
+        budget: float | None = DEFAULT_REFRESH_BUDGET,
+    ) -> int:
+        """Re-index files whose mtime or size changed.
+
+        Args:
+            files: (path, stat) for files the caller is allowed to read.
+            prune_under: If given, files was a complete listing of this
+                directory; entries under it that were not listed and no
+                longer exist are dropped.
+            limit: Most stale files to read in this call (None for all).
+                The rest stay stale, which candidates() treats as a match.
+            budget: Seconds after which no further stale files are read
+                (None for no limit). At least one batch is always read.
+
+        Returns:
+            Number of files (re)indexed.
+        """
+        stale: list[tuple[str, Path]] = []
+        seen: set[str] = set()
+        with self._lock:
+            for path, st in files:
+                key = self._key(path)
+                if key is None:
+                    continue
+                seen.add(key)
+                entry = self._entries.get(key)
+                if (
+                    (entry is None or entry.mtime_ns != st.st_mtime_ns or entry.size != st.st_size)
+                    and key not in self._claimed
+                    and (limit is None or len(stale) < limit)
+                ):
+                    stale.append((key, path))
+            self._claimed.update(key for key, _ in stale)
+
+        # Read outside the lock so concurrent searches are not serialised on I/O
+        indexed = 0
+        deadline = None if budget is None else time.monotonic() + budget
+        try:
+            for start in range(0, len(stale), _PERSIST_BATCH):
+                if start and deadline is not None and time.monotonic() >= deadline:
+                    break
+                updated: dict[str, _Entry] = {}
+                for key, path in stale[start:start + _PERSIST_BATCH]:
+                    entry = _index_file(path)
+                    if entry is not None:
+                        updated[key] = entry
+                if updated:
+                    with self._lock:
+                        self._entries.update(updated)
+                        self._persist(updated, [])
+                    indexed += len(updated)
+        finally:
+            with self._lock:
+                self._claimed.difference_update(key for key, _ in stale)
+
+        removed: list[str] = []
+        if prune_under is not None:
+            prefix = self._key(prune_under)
+            if prefix is not None:
+                prefix = "" if prefix == "." else prefix + "/"
+                with self._lock:
+                    candidates = [
+                        key for key in self._entries
+                        if key.startswith(prefix) and key not in seen
+                    ]
+                removed = [key for key in candidates if not (self._root / key).exists()]
+
+        if removed:
+            with self._lock:
+                for key in removed:
+                    self._entries.pop(key, None)
+                self._persist({}, removed)
+        return indexed
+
+    def _persist(self, updated: dict[str, _Entry], removed: list[str]) -> None:
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files "
+                    "(path, mtime_ns, size, utf8, bits, signature) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            key,
+                            e.mtime_ns,
+                            e.size,
+                            int(e.utf8),
+                            e.bits,
+                            e.signature.to_bytes(e.bits // 8, "little"),
+                        )
+                        for key, e in updated.items()
+                    ],
+                )
+                self._conn.executemany(
+                    "DELETE FROM files WHERE path = ?", [(key,) for key in removed]
+                )
+        except sqlite3.Error as e:
+            # The in-memory entries stay valid; they are re-checked by stat anyway
+            logger.debug("Could not persist search index %s: %s", self._db_path, e)
+
+    def candidates(
+        self,
+        files: Sequence[tuple[Path, os.stat_result]],
+        trigrams: frozenset[bytes],
+    ) -> list[Path]:
+        """Paths from files that may contain every trigram.
+
+        Files that are unindexed, stale, or not valid UTF-8 are always kept.
+        """
+        if not trigrams:
+            return [path for path, _ in files]
+        masks: dict[int, int] = {}
+        kept: list[Path] = []
+        with self._lock:
+            entries = self._entries
+            for path, st in files:
+                key = self._key(path)
+                entry = entries.get(key) if key is not None else None
+                if (
+                    entry is None
+                    or not entry.utf8
+                    or entry.mtime_ns != st.st_mtime_ns
+                    or entry.size != st.st_size
+                ):
+                    kept.append(path)
+                    continue
+                mask = masks.get(entry.bits)
+                if mask is None:
+                    mask = 0
+                    for trigram in trigrams:
+                        mask |= _word_mask(trigram, entry.bits)
+                    masks[entry.bits] = mask
+                if entry.signature & mask == mask:
+                    kept.append(path)
+        return kept
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _index_file(path: Path) -> _Entry | None:
+    """Read a file and compute its entry, or None if it cannot be read."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    try:
+        st = os.fstat(fd)
+        with os.fdopen(fd, "rb", closefd=False) as f:
+            data = f.read()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    try:
+        data.decode("utf-8")
+        utf8 = True
+    except UnicodeDecodeError:
+        utf8 = False
+    bits, signature = trigram_signature(data)
+    return _Entry(st.st_mtime_ns, st.st_size, utf8, bits, signature)
+
+
+_INDEXES: dict[Path, TrigramIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_trigram_index(root: Path) -> TrigramIndex:
+    """Return the process-wide index for a project root, opening it once.
+
+    Raises:
+        OSError: If the index directory cannot be created.
+        sqlite3.Error: If the database cannot be opened.
+    """
+    resolved = root.resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(resolved)
+        if index is None:
+            index = TrigramIndex(resolved)
+            _INDEXES[resolved] = index
+        return index
@@ -169,6 +169,19 @@ class ToolCallStarted(StreamEvent):
     name: str
 
 
+@dataclass(frozen=True)
+class TokenUsage:
+    """Token usage reported by the provider for one request.
+
+    Attributes:
+        prompt_tokens: Total input tokens, including cached prompt tokens.
+        completion_tokens: Output tokens, if reported.
+    """
+
+    prompt_tokens: int
+    completion_tokens: int | None = None
+
+
 @dataclass(frozen=True)
 class StreamComplete(StreamEvent):
     """Signals the stream has ended.
@@ -177,6 +190,8 @@ class StreamComplete(StreamEvent):
 
     Attributes:
         message: The complete Message with content and any tool_calls.
+        usage: Provider-reported token usage, if the stream included it.
     """
 
     message: "Message"
+    usage: TokenUsage | None = None
@@ -6,8 +6,13 @@ like agent IDs, session names, and tool arguments.
 
 from __future__ import annotations
 
+import copy
+import json
 import logging
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 from nexus3.core.errors import NexusError
@@ -31,6 +36,112 @@ class ValidationError(NexusError):
     pass
 
 
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A tool parameter schema checked and compiled once for reuse.
+
+    Attributes:
+        schema: The JSON schema the validator was built from.
+        validator: jsonschema validator instance bound to the schema.
+        properties: Top-level property names declared by the schema.
+        preserve_dynamic: Result of schema_preserves_dynamic_top_level_keys().
+    """
+
+    schema: dict[str, Any]
+    validator: Any
+    properties: frozenset[str]
+    preserve_dynamic: bool
+
+    def first_error(self, instance: Any) -> Any | None:
+        """Return the most relevant jsonschema error for instance, or None.
+
+        Picks the same error jsonschema.validate() would raise.
+        """
+        return _jsonschema().exceptions.best_match(self.validator.iter_errors(instance))
+
+
+def _jsonschema() -> Any:
+    """Import jsonschema on first use; it is slow to import."""
+    import jsonschema  # type: ignore[import-untyped]
+
+    return jsonschema
+
+
+# Compiled validators keyed by canonical schema JSON. Schemas are identical
+# across agents, so every SkillRegistry shares one validator per schema.
+# Bounded (MCP servers supply arbitrary schemas); least recently used
+# entries are evicted first.
+_COMPILED_SCHEMAS: OrderedDict[str, CompiledSchema] = OrderedDict()
+_COMPILED_SCHEMAS_SIZE = 512
+_COMPILED_SCHEMAS_LOCK = threading.Lock()
+
+
+def compile_schema(schema: dict[str, Any]) -> CompiledSchema:
+    """Return the process-wide compiled validator for a JSON schema.
+
+    The schema is checked against its metaschema only the first time it is
+    seen. Schemas are keyed by content, so a schema dict that is mutated after
+    compilation gets a fresh validator rather than a stale one.
+
+    Args:
+        schema: JSON schema for a tool's parameters.
+
+    Returns:
+        The cached CompiledSchema.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    key = json.dumps(schema, sort_keys=True, default=str)
+    with _COMPILED_SCHEMAS_LOCK:
+        compiled = _COMPILED_SCHEMAS.get(key)
+        if compiled is not None:
+            _COMPILED_SCHEMAS.move_to_end(key)
+            return compiled
+
+    cls = _jsonschema().validators.validator_for(schema)
+    cls.check_schema(schema)
+    compiled = CompiledSchema(
+        schema=schema,
+        validator=cls(schema),
+        properties=frozenset(schema.get("properties", {}).keys()),
+        preserve_dynamic=schema_preserves_dynamic_top_level_keys(schema),
+    )
+    with _COMPILED_SCHEMAS_LOCK:
+        compiled = _COMPILED_SCHEMAS.setdefault(key, compiled)
+        _COMPILED_SCHEMAS.move_to_end(key)
+        while len(_COMPILED_SCHEMAS) > _COMPILED_SCHEMAS_SIZE:
+            _COMPILED_SCHEMAS.popitem(last=False)
+        return compiled
+
+
+class SchemaCache:
+    """The compiled validator for one caller's (usually fixed) schema.
+
+    compile_schema() serializes the schema on every call to find its cache
+    entry. A SchemaCache keeps a copy of the last schema it compiled and
+    only goes back to compile_schema() when the schema no longer compares
+    equal, which is much cheaper for the per-call validation in skills.
+    """
+
+    def __init__(self) -> None:
+        # (copy of the schema, its validator), replaced as one for thread safety
+        self._entry: tuple[dict[str, Any], CompiledSchema] | None = None
+
+    def get(self, schema: dict[str, Any]) -> CompiledSchema:
+        """Return the compiled validator for schema.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        entry = self._entry
+        if entry is not None and entry[0] == schema:
+            return entry[1]
+        compiled = compile_schema(schema)
+        self._entry = (copy.deepcopy(schema), compiled)
+        return compiled
+
+
 def validate_agent_id(agent_id: str) -> str:
     """Validate agent ID format.
 
@@ -87,6 +198,7 @@ def is_valid_agent_id(agent_id: str) -> bool:
 def validate_tool_arguments(
     arguments: dict[str, Any],
     schema: dict[str, Any],
+    compiled: CompiledSchema | None = None,
 ) -> dict[str, Any]:
     """Validate tool arguments against JSON schema.
 
@@ -96,6 +208,8 @@ def validate_tool_arguments(
     Args:
         arguments: The arguments provided by the LLM.
         schema: The JSON schema for the tool's parameters.
+        compiled: Validator already compiled for schema (e.g. from
+            SkillRegistry.get_validator()); compiled from schema if None.
 
     Returns:
         Dict containing only valid, known parameters.
@@ -103,7 +217,8 @@ def validate_tool_arguments(
     Raises:
         ValidationError: If required params missing or types don't match.
     """
-    import jsonschema  # type: ignore[import-untyped]
+    if compiled is None:
+        compiled = compile_schema(schema)
 
     # Internal execution flags are allowed but should not interfere with schema validation.
     schema_arguments = {
@@ -111,14 +226,13 @@ def validate_tool_arguments(
     }
 
     # Validate against schema (checks required fields and types)
-    try:
-        jsonschema.validate(schema_arguments, schema)
-    except jsonschema.ValidationError as e:
-        raise ValidationError(f"Invalid argument: {e.message}") from e
+    error = compiled.first_error(schema_arguments)
+    if error is not None:
+        raise ValidationError(f"Invalid argument: {error.message}") from error
 
     # Get known properties from schema
-    schema_props = set(schema.get("properties", {}).keys())
-    preserve_dynamic = schema_preserves_dynamic_top_level_keys(schema)
+    schema_props = compiled.properties
+    preserve_dynamic = compiled.preserve_dynamic
 
     # Check for extra properties (warn but don't reject)
     provided = set(arguments.keys())
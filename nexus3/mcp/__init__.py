@@ -14,6 +14,7 @@ Usage:
 
 from nexus3.config.schema import MCPServerConfig
 from nexus3.mcp.client import MCPClient, MCPError
+from nexus3.mcp.pool import MCPServerPool
 from nexus3.mcp.protocol import (
     MCPPrompt,
     MCPPromptArgument,
@@ -42,6 +43,7 @@ __all__ = [
     "MCPResourceContent",
     "MCPServerConfig",
     "MCPServerInfo",
+    "MCPServerPool",
     "MCPServerRegistry",
     "MCPSkillAdapter",
     "MCPTool",
@@ -7,11 +7,21 @@ The MCPClient handles the MCP protocol lifecycle:
 4. Execute tool calls
 5. Clean shutdown
 
-P2.9 SECURITY: Response ID matching - verifies response IDs match request IDs
-to prevent response confusion attacks from malicious/buggy servers.
-
-P2.10 SECURITY: Notification discarding - discards server notifications while
-waiting for RPC responses to prevent response stream poisoning.
+Requests are multiplexed: each call registers a future under its request ID,
+and a reader task (started while calls are outstanding) routes responses to
+those futures, so several calls to one server can be in flight at once. The
+number in flight is capped per client (``max_concurrent_requests``).
+Transports whose request() pairs each response with its request (HTTP) are
+called directly instead.
+
+P2.9 SECURITY: Response ID matching - a response is only ever delivered to the
+request with the same ID. A response whose ID matches no outstanding request
+fails every outstanding request, since the stream can no longer be trusted.
+
+P2.10 SECURITY: Notifications never resolve a request. They are passed to the
+optional notification handler (or discarded), and a server that sends more
+than MAX_NOTIFICATIONS_TO_DISCARD in a row without answering fails the
+outstanding requests.
 
 Usage:
     transport = StdioTransport(["python", "-m", "some_server"])
@@ -22,6 +32,7 @@ Usage:
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from nexus3.core.errors import NexusError
@@ -44,6 +55,16 @@ logger = logging.getLogger(__name__)
 # Prevents infinite loop from servers that only send notifications.
 MAX_NOTIFICATIONS_TO_DISCARD: int = 100
 
+# Abandoned request IDs remembered for dropping late responses. Past this,
+# the oldest are forgotten; a response to one then counts as a mismatch.
+MAX_ABANDONED_REQUESTS: int = 1024
+
+# Default cap on requests in flight per client (see MCPServerConfig).
+DEFAULT_MAX_CONCURRENT_REQUESTS: int = 8
+
+NotificationHandler = Callable[[dict[str, Any]], None]
+"""Receives server notifications (JSON-RPC messages with a method and no id)."""
+
 
 class MCPError(NexusError):
     """Error from MCP protocol or server.
@@ -73,17 +94,31 @@ class MCPClient:
         self,
         transport: MCPTransport,
         client_info: MCPClientInfo | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        notification_handler: NotificationHandler | None = None,
     ):
         """Initialize MCP client.
 
         Args:
             transport: Transport layer for communication.
             client_info: Client identification (defaults to nexus3).
+            max_concurrent_requests: Maximum requests in flight at once.
+            notification_handler: Called with each server notification. When
+                set, the client keeps reading from the transport between
+                requests so notifications are delivered promptly.
         """
         self._transport = transport
         self._client_info = client_info or MCPClientInfo()
+        # Duck-typed transports (not MCPTransport subclasses) use send/receive.
+        self._paired_requests = isinstance(transport, MCPTransport) and transport.pairs_responses
         self._request_id = 0
-        self._rpc_lock = asyncio.Lock()
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        self._notification_handler = notification_handler
+        # Request ID -> future for its response (stream transports only)
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        # IDs of requests whose caller gave up; their late responses are dropped
+        self._abandoned: set[int] = set()
+        self._reader: asyncio.Task[None] | None = None
         self._server_info: MCPServerInfo | None = None
         self._tools: list[MCPTool] = []
         self._resources: list[MCPResource] = []
@@ -127,6 +162,7 @@ class MCPClient:
 
         Call this directly when not using the context manager pattern.
         """
+        await self._stop_reader()
         await self._transport.close()
         self._initialized = False
 
@@ -196,13 +232,11 @@ class MCPClient:
     async def _call(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make JSON-RPC call and wait for response.
 
-        P2.9 SECURITY: Verifies response ID matches request ID.
-        P2.10 SECURITY: Discards notifications while waiting for response.
+        P2.9 SECURITY: Only a response carrying this request's ID resolves it.
+        P2.10 SECURITY: Notifications never resolve a request.
 
-        Note: We use send()/receive() pattern instead of request() to support
-        notification discarding for stdio transport. HTTP transport's request()
-        returns responses directly and doesn't need this loop, but stdio servers
-        can interleave notifications. This pattern works for both transports.
+        Waits for a free slot if max_concurrent_requests calls are already in
+        flight.
 
         Args:
             method: RPC method name.
@@ -215,77 +249,180 @@ class MCPClient:
             MCPError: If the server returns an error, response ID mismatches,
                      or too many notifications are received.
         """
-        async with self._rpc_lock:
+        async with self._request_slots:
             self._request_id += 1
-            expected_id = self._request_id
+            request_id = self._request_id
             request: dict[str, Any] = {
                 "jsonrpc": "2.0",
-                "id": expected_id,
+                "id": request_id,
                 "method": method,
             }
             if params:
                 request["params"] = params
 
-            await self._transport.send(request)
+            if self._paired_requests:
+                response = await self._transport.request(request)
+                if "id" not in response or response.get("id") != request_id:
+                    raise MCPError(
+                        f"Response ID mismatch: expected {request_id}, "
+                        f"got {response.get('id')}. "
+                        "Server may be malfunctioning or malicious."
+                    )
+            else:
+                response = await self._exchange(request_id, request)
 
-            # P2.10 SECURITY: Loop to discard notifications and find our response
-            notifications_discarded = 0
-            while True:
-                response = await self._transport.receive()
+        # Handle error response
+        if "error" in response:
+            error = response["error"]
+            raise MCPError(
+                message=error.get("message", "Unknown error"),
+                code=error.get("code"),
+            )
 
-                # P2.10 SECURITY: Discard notifications (messages without "id")
-                # Notifications have "method" but no "id" field
-                if "id" not in response and "method" in response:
-                    notifications_discarded += 1
-                    logger.debug(
-                        "Discarded MCP notification while waiting for response: %s",
-                        response.get("method"),
-                    )
-                    if notifications_discarded > MAX_NOTIFICATIONS_TO_DISCARD:
-                        raise MCPError(
-                            f"Received too many notifications ({notifications_discarded}) "
-                            f"while waiting for response to request {expected_id}. "
-                            "Server may be malfunctioning."
-                        )
+        result: dict[str, Any] = response.get("result", {})
+        return result
+
+    async def _exchange(self, request_id: int, request: dict[str, Any]) -> dict[str, Any]:
+        """Send a request on a stream transport and wait for the routed response."""
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        # Register before sending: the response may arrive before send() returns.
+        self._pending[request_id] = future
+        try:
+            await self._transport.send(request)
+            self._ensure_reader()
+            return await future
+        except asyncio.CancelledError:
+            # Cancelling the caller also cancels the future; a future that
+            # already holds a response means nothing more will arrive.
+            if future.cancelled() or not future.done():
+                self._abandoned.add(request_id)
+                if len(self._abandoned) > MAX_ABANDONED_REQUESTS:
+                    self._abandoned.discard(min(self._abandoned))
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _ensure_reader(self) -> None:
+        """Start the response reader unless it is already running."""
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_responses())
+
+    async def _read_responses(self) -> None:
+        """Route incoming messages until no request is waiting.
+
+        Keeps running between requests when a notification handler is set.
+        A transport error fails every outstanding request with that error.
+        """
+        notifications_discarded = 0
+        try:
+            while self._pending or self._notification_handler is not None:
+                message = await self._transport.receive()
+
+                # P2.10 SECURITY: Notifications have "method" but no "id"
+                if "id" not in message and "method" in message:
+                    self._handle_notification(message)
+                    if self._pending:
+                        notifications_discarded += 1
+                        if notifications_discarded > MAX_NOTIFICATIONS_TO_DISCARD:
+                            self._fail_pending(
+                                MCPError(
+                                    f"Received too many notifications "
+                                    f"({notifications_discarded}) while waiting for "
+                                    f"response to request {self._pending_ids()}. "
+                                    "Server may be malfunctioning."
+                                )
+                            )
+                            notifications_discarded = 0
                     continue
 
                 # Discard error responses with null id (from non-compliant servers
                 # that respond to notifications instead of ignoring them)
-                if response.get("id") is None and "error" in response:
+                if message.get("id") is None and "error" in message:
                     notifications_discarded += 1
                     logger.debug(
                         "Discarded null-id error response (likely notification error): %s",
-                        response.get("error", {}).get("message", "unknown"),
+                        message.get("error", {}).get("message", "unknown"),
                     )
                     if notifications_discarded > MAX_NOTIFICATIONS_TO_DISCARD:
-                        raise MCPError(
-                            f"Received too many spurious responses ({notifications_discarded}) "
-                            f"while waiting for response to request {expected_id}. "
-                            "Server may be malfunctioning."
+                        self._fail_pending(
+                            MCPError(
+                                f"Received too many spurious responses "
+                                f"({notifications_discarded}) while waiting for "
+                                f"response to request {self._pending_ids()}. "
+                                "Server may be malfunctioning."
+                            )
                         )
+                        notifications_discarded = 0
                     continue
 
-                # P2.9 SECURITY: Verify response ID matches request ID
-                response_id = response.get("id")
-                if response_id != expected_id:
-                    raise MCPError(
-                        f"Response ID mismatch: expected {expected_id}, got {response_id}. "
+                notifications_discarded = 0
+                response_id = message.get("id")
+                future = (
+                    self._pending.pop(response_id, None)
+                    if isinstance(response_id, int)
+                    else None
+                )
+                if future is not None:
+                    if not future.done():
+                        future.set_result(message)
+                    continue
+                if isinstance(response_id, int) and response_id in self._abandoned:
+                    self._abandoned.discard(response_id)
+                    logger.debug("Dropped late MCP response for abandoned request %s", response_id)
+                    continue
+
+                # P2.9 SECURITY: A response for no outstanding request
+                self._fail_pending(
+                    MCPError(
+                        f"Response ID mismatch: expected {self._pending_ids()}, "
+                        f"got {response_id}. "
                         "Server may be malfunctioning or malicious."
                     )
-
-                # Found our response
-                break
-
-        # Handle error response
-        if "error" in response:
-            error = response["error"]
-            raise MCPError(
-                message=error.get("message", "Unknown error"),
-                code=error.get("code"),
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self._pending:
+                self._fail_pending(e)
+            else:
+                logger.debug("MCP reader stopped: %s", e)
+
+    def _handle_notification(self, message: dict[str, Any]) -> None:
+        """Pass a notification to the handler, or discard it."""
+        if self._notification_handler is None:
+            logger.debug(
+                "Discarded MCP notification while waiting for response: %s",
+                message.get("method"),
             )
-
-        result: dict[str, Any] = response.get("result", {})
-        return result
+            return
+        try:
+            self._notification_handler(message)
+        except Exception:
+            logger.exception("MCP notification handler failed for %s", message.get("method"))
+
+    def _pending_ids(self) -> str:
+        """Outstanding request IDs for error messages ("2", or "one of [2, 3]")."""
+        ids = sorted(self._pending)
+        return str(ids[0]) if len(ids) == 1 else f"one of {ids}"
+
+    def _fail_pending(self, error: BaseException) -> None:
+        """Fail every outstanding request with error."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _stop_reader(self) -> None:
+        """Cancel the reader and fail anything still waiting."""
+        reader, self._reader = self._reader, None
+        if reader is not None and not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+        self._fail_pending(MCPError("MCP connection closed"))
+        self._abandoned.clear()
 
     async def _notify(self, method: str, params: dict[str, Any] | None = None) -> None:
         """Send notification (no response expected).
@@ -301,8 +438,7 @@ class MCPClient:
         if params:  # Only include if non-empty
             notification["params"] = params
 
-        async with self._rpc_lock:
-            await self._transport.send(notification)
+        await self._transport.send(notification)
 
     async def list_tools(self) -> list[MCPTool]:
         """Discover available tools from server.
@@ -0,0 +1,225 @@
+"""Pool of shared stdio MCP server processes.
+
+Connecting the same stdio server for several agents (or reconnecting it after
+a disconnect) normally spawns a fresh process and lists its tools again. For
+servers configured with ``pooled: true``, MCPServerRegistry instead leases a
+process from an MCPServerPool:
+
+- One process per fingerprint of (command, env, env_passthrough, cwd), so
+  configs that differ only in name share a process.
+- Reference counted: each ConnectedServer holds one reference. When the last
+  is released the process stays up for ``pool_idle_timeout`` seconds, so a
+  quick reconnect reuses the warm process, then it is shut down.
+- The tool list is fetched once and cached on the pooled server. A
+  ``notifications/tools/list_changed`` notification refreshes it, and every
+  sharer is told through the listener it registered.
+
+Visibility and permissions stay per connection: the pool only shares the
+process, never the ConnectedServer.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from nexus3.config.schema import MCPServerConfig
+from nexus3.mcp.client import MCPClient, NotificationHandler
+from nexus3.mcp.protocol import MCPTool
+
+logger = logging.getLogger(__name__)
+
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+PoolKey = tuple[tuple[str, ...], tuple[tuple[str, str], ...], tuple[str, ...], str | None]
+ToolsChangedCallback = Callable[[list[MCPTool]], None]
+ClientFactory = Callable[[NotificationHandler], Awaitable[MCPClient]]
+
+
+def pool_key(config: MCPServerConfig) -> PoolKey:
+    """Fingerprint of the process a config would start.
+
+    The server name is deliberately excluded: two configs that launch the
+    same command with the same environment share one process.
+    """
+    return (
+        tuple(config.get_command_list()),
+        tuple(sorted((config.env or {}).items())),
+        tuple(sorted(config.env_passthrough or [])),
+        config.cwd,
+    )
+
+
+class PooledMCPServer:
+    """A shared server process with its cached tool list.
+
+    Attributes:
+        key: Pool fingerprint.
+        client: MCP client connected to the shared process.
+        refs: Number of connections currently holding this server.
+    """
+
+    def __init__(self, key: PoolKey, client: MCPClient, idle_timeout: float) -> None:
+        self.key = key
+        self.client = client
+        self.refs = 0
+        self._idle_timeout = idle_timeout
+        self._tools: list[MCPTool] | None = None
+        self._tools_lock = asyncio.Lock()
+        self._listeners: list[ToolsChangedCallback] = []
+        self._idle_task: asyncio.Task[None] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def tools(self) -> list[MCPTool] | None:
+        """Cached tool list, or None if not listed yet."""
+        return self._tools
+
+    async def list_tools(self) -> list[MCPTool]:
+        """Return the cached tool list, fetching it once if needed."""
+        async with self._tools_lock:
+            if self._tools is None:
+                self._tools = await self.client.list_tools()
+            return self._tools
+
+    async def refresh_tools(self) -> list[MCPTool]:
+        """Re-list tools from the server and notify every sharer."""
+        async with self._tools_lock:
+            self._tools = await self.client.list_tools()
+            tools = self._tools
+        self._notify_listeners(tools)
+        return tools
+
+    async def reconnect(self, timeout: float = 30.0) -> list[MCPTool]:
+        """Restart the shared process and refresh its tools.
+
+        Concurrent callers (several sharers noticing the same dead process)
+        restart it only once.
+        """
+        async with self._tools_lock:
+            if not self.client.is_connected:
+                await self.client.reconnect(timeout=timeout)
+                self._tools = None
+        if self._tools is not None:
+            return self._tools
+        return await self.refresh_tools()
+
+    def add_listener(self, callback: ToolsChangedCallback) -> None:
+        """Call callback with the new tool list whenever it is refreshed."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: ToolsChangedCallback) -> None:
+        """Stop calling a callback registered with add_listener()."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _tools_changed(self) -> None:
+        # Runs inside the client's reader task, which must keep reading to
+        # deliver the tools/list response, so the refresh runs separately.
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_after_change())
+
+    async def _refresh_after_change(self) -> None:
+        try:
+            tools = await self.refresh_tools()
+        except Exception as e:
+            logger.warning("Failed to refresh MCP tools after list_changed: %s", e)
+            return
+        logger.debug("Refreshed %d MCP tools after list_changed", len(tools))
+
+    def _notify_listeners(self, tools: list[MCPTool]) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(tools)
+            except Exception:
+                logger.exception("MCP tools-changed callback failed")
+
+    async def _close(self) -> None:
+        for task in (self._idle_task, self._refresh_task):
+            if task is not None and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+        await self.client.close()
+
+
+class MCPServerPool:
+    """Reference-counted pool of shared MCP server processes."""
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._servers: dict[PoolKey, PooledMCPServer] = {}
+        self._locks: dict[PoolKey, asyncio.Lock] = {}
+
+    async def acquire(
+        self,
+        config: MCPServerConfig,
+        start: ClientFactory,
+    ) -> PooledMCPServer:
+        """Take a reference to the process for config, starting it if needed.
+
+        Args:
+            config: Server configuration (must use a command).
+            start: Creates and connects a client with the given notification
+                handler. Only called when no process exists for config.
+
+        Returns:
+            The pooled server, with one more reference.
+
+        Raises:
+            Whatever start raises if the process cannot be started.
+        """
+        key = pool_key(config)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            server = self._servers.get(key)
+            if server is None:
+                client = await start(lambda message: self._on_notification(key, message))
+                server = PooledMCPServer(key, client, config.pool_idle_timeout)
+                self._servers[key] = server
+                logger.debug("Started pooled MCP server for %s", config.name)
+            if server._idle_task is not None:
+                server._idle_task.cancel()
+                server._idle_task = None
+            server.refs += 1
+            return server
+
+    def _on_notification(self, key: PoolKey, message: dict[str, Any]) -> None:
+        server = self._servers.get(key)
+        if server is not None and message.get("method") == TOOLS_LIST_CHANGED:
+            server._tools_changed()
+
+    async def release(self, server: PooledMCPServer) -> None:
+        """Drop a reference; the last one schedules idle shutdown.
+
+        Args:
+            server: Server returned by acquire().
+        """
+        server.refs = max(0, server.refs - 1)
+        if server.refs > 0 or self._servers.get(server.key) is not server:
+            return
+        if server._idle_timeout <= 0:
+            await self._shutdown(server)
+        else:
+            server._idle_task = asyncio.create_task(self._shutdown_when_idle(server))
+
+    async def _shutdown_when_idle(self, server: PooledMCPServer) -> None:
+        await asyncio.sleep(server._idle_timeout)
+        if server.refs == 0:
+            await self._shutdown(server)
+
+    async def _shutdown(self, server: PooledMCPServer) -> None:
+        if self._servers.get(server.key) is server:
+            del self._servers[server.key]
+            self._locks.pop(server.key, None)
+        logger.debug("Shutting down idle pooled MCP server %s", server.key[0])
+        await server._close()
+
+    async def close_all(self) -> None:
+        """Shut down every pooled process, referenced or not."""
+        servers = list(self._servers.values())
+        self._servers.clear()
+        self._locks.clear()
+        for server in servers:
+            await server._close()
+
+    def __len__(self) -> int:
+        """Return number of live pooled processes."""
+        return len(self._servers)
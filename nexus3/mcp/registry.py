@@ -5,6 +5,11 @@ and skill adapters for use in NEXUS3 agents.
 
 Connections can be private (visible only to the creating agent) or shared
 (visible to all agents). Permissions/allowances are always per-agent.
+Connections are keyed by (server name, owner agent), so several agents can
+hold their own connection to the same configured server at once.
+
+Servers configured with ``pooled: true`` lease their process from an
+MCPServerPool instead of starting their own (see nexus3.mcp.pool).
 
 Usage:
     registry = MCPServerRegistry()
@@ -27,9 +32,11 @@ from dataclasses import dataclass, field
 
 from nexus3.config.schema import MCPServerConfig
 from nexus3.core.errors import MCPConfigError
-from nexus3.mcp.client import MCPClient
+from nexus3.mcp.client import MCPClient, NotificationHandler
 from nexus3.mcp.error_formatter import format_command_not_found, format_server_crash
 from nexus3.mcp.errors import MCPErrorContext
+from nexus3.mcp.pool import MCPServerPool, PooledMCPServer
+from nexus3.mcp.protocol import MCPTool
 from nexus3.mcp.skill_adapter import MCPSkillAdapter
 from nexus3.mcp.transport import HTTPTransport, MCPTransportError, StdioTransport
 
@@ -46,6 +53,7 @@ class ConnectedServer:
         owner_agent_id: ID of the agent that created this connection.
         shared: If True, connection is visible to all agents.
             If False, only visible to owner_agent_id.
+        pooled: Shared process this connection leases, if the server is pooled.
     """
 
     config: MCPServerConfig
@@ -53,6 +61,7 @@ class ConnectedServer:
     skills: list[MCPSkillAdapter] = field(default_factory=list)
     owner_agent_id: str = "main"
     shared: bool = False
+    pooled: PooledMCPServer | None = None
 
     def is_visible_to(self, agent_id: str) -> bool:
         """Check if this connection is visible to a given agent.
@@ -88,9 +97,16 @@ class ConnectedServer:
         Raises:
             MCPError: If reconnection fails.
         """
+        if self.pooled is not None:
+            # Restarts the shared process once for every connection using it
+            self.set_tools(await self.pooled.reconnect(timeout=timeout))
+            return
         await self.client.reconnect(timeout=timeout)
         # Re-list tools after reconnection (tools may have changed)
-        tools = await self.client.list_tools()
+        self.set_tools(await self.client.list_tools())
+
+    def set_tools(self, tools: list[MCPTool]) -> None:
+        """Replace this connection's skill adapters with ones for tools."""
         self.skills = [MCPSkillAdapter(self.client, tool, self.config.name) for tool in tools]
 
 
@@ -101,9 +117,19 @@ class MCPServerRegistry:
     handles cleanup on shutdown. Supports per-agent and shared connections.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty registry."""
-        self._servers: dict[str, ConnectedServer] = {}
+    def __init__(self, pool: MCPServerPool | None = None) -> None:
+        """Initialize empty registry.
+
+        Args:
+            pool: Process pool for pooled servers. Defaults to a private pool.
+        """
+        self._servers: dict[tuple[str, str], ConnectedServer] = {}
+        self._pool = pool if pool is not None else MCPServerPool()
+
+    @property
+    def pool(self) -> MCPServerPool:
+        """Process pool used for servers configured with ``pooled: true``."""
+        return self._pool
 
     async def connect(
         self,
@@ -114,8 +140,8 @@ class MCPServerRegistry:
     ) -> ConnectedServer:
         """Connect to an MCP server and create skill adapters.
 
-        If a server with the same name is already connected, it will be
-        disconnected first.
+        If owner_agent_id already has a connection to a server with the same
+        name, it is disconnected first. Other agents' connections are kept.
 
         Args:
             config: Server configuration.
@@ -144,10 +170,48 @@ class MCPServerRegistry:
                 context=error_context,
             )
 
-        # Disconnect existing if present
-        if config.name in self._servers:
-            await self.disconnect(config.name)
+        # Disconnect this agent's existing connection if present
+        if (config.name, owner_agent_id) in self._servers:
+            await self.disconnect(config.name, owner_agent_id)
+
+        if config.pooled and command_list:
+            return await self._connect_pooled(
+                config, command_list, error_context, owner_agent_id, shared, timeout
+            )
+
+        client = await self._start_client(config, command_list, error_context, timeout)
 
+        # List tools and create adapters
+        # P2.1.6: Graceful failure - connect succeeds even if tool listing fails
+        try:
+            tools = await client.list_tools()
+            skills = [MCPSkillAdapter(client, tool, config.name) for tool in tools]
+        except Exception as e:
+            if config.fail_if_no_tools:
+                raise
+            logger.warning("Failed to list tools from '%s': %s", config.name, e)
+            skills = []
+
+        # Store connected server
+        connected = ConnectedServer(
+            config=config,
+            client=client,
+            skills=skills,
+            owner_agent_id=owner_agent_id,
+            shared=shared,
+        )
+        self._servers[config.name, owner_agent_id] = connected
+        return connected
+
+    async def _start_client(
+        self,
+        config: MCPServerConfig,
+        command_list: list[str],
+        error_context: MCPErrorContext,
+        timeout: float,
+        notification_handler: NotificationHandler | None = None,
+    ) -> MCPClient:
+        """Create a transport for config and connect a client over it."""
         # Create transport based on config
         transport: StdioTransport | HTTPTransport
         if command_list:
@@ -167,7 +231,11 @@ class MCPServerRegistry:
             )
 
         # Create and initialize client with error context
-        client = MCPClient(transport)
+        client = MCPClient(
+            transport,
+            max_concurrent_requests=config.max_concurrent_requests,
+            notification_handler=notification_handler,
+        )
         try:
             await client.connect(timeout=timeout)
         except MCPTransportError as e:
@@ -198,59 +266,102 @@ class MCPServerRegistry:
                     f"Failed to connect to MCP server '{config.name}': {e}"
                 ) from e
 
-        # List tools and create adapters
-        # P2.1.6: Graceful failure - connect succeeds even if tool listing fails
+        return client
+
+    async def _connect_pooled(
+        self,
+        config: MCPServerConfig,
+        command_list: list[str],
+        error_context: MCPErrorContext,
+        owner_agent_id: str,
+        shared: bool,
+        timeout: float,
+    ) -> ConnectedServer:
+        """Connect by leasing a shared process, listing tools only once."""
+
+        async def start(handler: NotificationHandler) -> MCPClient:
+            return await self._start_client(
+                config, command_list, error_context, timeout, handler
+            )
+
+        pooled = await self._pool.acquire(config, start)
         try:
-            tools = await client.list_tools()
-            skills = [MCPSkillAdapter(client, tool, config.name) for tool in tools]
+            tools = await pooled.list_tools()
         except Exception as e:
             if config.fail_if_no_tools:
+                await self._pool.release(pooled)
                 raise
             logger.warning("Failed to list tools from '%s': %s", config.name, e)
-            skills = []
+            tools = []
 
-        # Store connected server
         connected = ConnectedServer(
             config=config,
-            client=client,
-            skills=skills,
+            client=pooled.client,
             owner_agent_id=owner_agent_id,
             shared=shared,
+            pooled=pooled,
         )
-        self._servers[config.name] = connected
+        connected.set_tools(tools)
+        pooled.add_listener(connected.set_tools)
+        self._servers[config.name, owner_agent_id] = connected
         return connected
 
-    async def disconnect(self, name: str) -> bool:
+    async def disconnect(self, name: str, owner_agent_id: str | None = None) -> bool:
         """Disconnect and clean up a server.
 
         Args:
             name: Server name to disconnect.
+            owner_agent_id: Only disconnect this agent's connection. If None,
+                every connection to the named server is disconnected.
 
         Returns:
-            True if server was disconnected, False if not found.
+            True if a connection was disconnected, False if none was found.
+        """
+        keys = [
+            key for key in self._servers
+            if key[0] == name and owner_agent_id in (None, key[1])
+        ]
+        for key in keys:
+            server = self._servers.pop(key)
+            if server.pooled is not None:
+                server.pooled.remove_listener(server.set_tools)
+                await self._pool.release(server.pooled)
+            else:
+                await server.client.close()
+        return bool(keys)
+
+    def _visible_servers(self, agent_id: str | None) -> list[ConnectedServer]:
+        """One connection per server name, as seen by agent_id.
+
+        An agent's own connection wins over another agent's shared one. With
+        agent_id None, every name is included, first connection first.
         """
-        server = self._servers.pop(name, None)
-        if server is not None:
-            await server.client.close()
-            return True
-        return False
+        visible: dict[str, ConnectedServer] = {}
+        for (name, owner), server in self._servers.items():
+            if agent_id is not None:
+                if not server.is_visible_to(agent_id):
+                    continue
+                if owner == agent_id:
+                    visible[name] = server
+                    continue
+            visible.setdefault(name, server)
+        return list(visible.values())
 
     def get(self, name: str, agent_id: str | None = None) -> ConnectedServer | None:
         """Get a connected server by name.
 
         Args:
             name: Server name.
-            agent_id: If provided, only return if visible to this agent.
+            agent_id: If provided, only return a connection visible to this
+                agent, preferring the agent's own.
 
         Returns:
             ConnectedServer if found (and visible), None otherwise.
         """
-        server = self._servers.get(name)
-        if server is None:
-            return None
-        if agent_id is not None and not server.is_visible_to(agent_id):
-            return None
-        return server
+        for server in self._visible_servers(agent_id):
+            if server.config.name == name:
+                return server
+        return None
 
     def list_servers(self, agent_id: str | None = None) -> list[str]:
         """List names of connected servers.
@@ -261,12 +372,7 @@ class MCPServerRegistry:
         Returns:
             List of server names.
         """
-        if agent_id is None:
-            return list(self._servers.keys())
-        return [
-            name for name, server in self._servers.items()
-            if server.is_visible_to(agent_id)
-        ]
+        return [server.config.name for server in self._visible_servers(agent_id)]
 
     async def get_all_skills(self, agent_id: str | None = None) -> list[MCPSkillAdapter]:
         """Get all skill adapters from connected servers.
@@ -280,16 +386,15 @@ class MCPServerRegistry:
             Combined list of skills from (visible) servers.
         """
         skills: list[MCPSkillAdapter] = []
-        for server in self._servers.values():
-            if agent_id is None or server.is_visible_to(agent_id):
-                # Lazy reconnection: if connection is dead, try to reconnect
-                if not server.is_alive():
-                    try:
-                        await server.reconnect()
-                    except Exception:
-                        # Reconnection failed, skip this server's skills
-                        continue
-                skills.extend(server.skills)
+        for server in self._visible_servers(agent_id):
+            # Lazy reconnection: if connection is dead, try to reconnect
+            if not server.is_alive():
+                try:
+                    await server.reconnect()
+                except Exception:
+                    # Reconnection failed, skip this server's skills
+                    continue
+            skills.extend(server.skills)
         return skills
 
     def find_skill(
@@ -309,9 +414,7 @@ class MCPServerRegistry:
         Returns:
             Tuple of (skill, server_name) if found, None otherwise.
         """
-        for server in self._servers.values():
-            if agent_id is not None and not server.is_visible_to(agent_id):
-                continue
+        for server in self._visible_servers(agent_id):
             if not server.is_alive():
                 continue
             for skill in server.skills:
@@ -334,9 +437,7 @@ class MCPServerRegistry:
         Returns:
             ConnectedServer if found, None otherwise.
         """
-        for server in self._servers.values():
-            if agent_id is not None and not server.is_visible_to(agent_id):
-                continue
+        for server in self._visible_servers(agent_id):
             if not server.is_alive():
                 continue
             prefix = f"mcp_{server.config.name}_"
@@ -354,13 +455,14 @@ class MCPServerRegistry:
             List of server names that were removed due to dead connections.
         """
         dead: list[str] = []
-        for name, server in list(self._servers.items()):
+        for (name, owner), server in list(self._servers.items()):
             if not server.is_alive():
-                await self.disconnect(name)
-                dead.append(name)
+                await self.disconnect(name, owner)
+                if name not in dead:
+                    dead.append(name)
         return dead
 
-    async def retry_tools(self, name: str) -> int:
+    async def retry_tools(self, name: str, agent_id: str | None = None) -> int:
         """Retry listing tools from a server that previously failed.
 
         Useful when a server connected but tool listing failed. This attempts
@@ -368,6 +470,7 @@ class MCPServerRegistry:
 
         Args:
             name: Server name to retry.
+            agent_id: If provided, retry the connection visible to this agent.
 
         Returns:
             Number of tools discovered (0 if still failing or server not found).
@@ -375,17 +478,18 @@ class MCPServerRegistry:
         Raises:
             MCPError: If server is not connected.
         """
-        server = self._servers.get(name)
+        server = self.get(name, agent_id)
         if server is None:
             from nexus3.mcp.client import MCPError
             raise MCPError(f"Server '{name}' is not connected")
 
         try:
-            tools = await server.client.list_tools()
-            server.skills = [
-                MCPSkillAdapter(server.client, tool, server.config.name)
-                for tool in tools
-            ]
+            if server.pooled is not None:
+                # Refreshes every connection sharing the process
+                tools = await server.pooled.refresh_tools()
+            else:
+                tools = await server.client.list_tools()
+            server.set_tools(tools)
             return len(tools)
         except Exception as e:
             logger.warning("Retry tools failed for '%s': %s", name, e)
@@ -394,11 +498,13 @@ class MCPServerRegistry:
     async def close_all(self) -> None:
         """Disconnect all servers.
 
-        Call this during shutdown to clean up all connections.
+        Call this during shutdown to clean up all connections. Pooled
+        processes are shut down immediately rather than left to idle out.
         """
-        for name in list(self._servers.keys()):
-            await self.disconnect(name)
+        for name, owner in list(self._servers.keys()):
+            await self.disconnect(name, owner)
+        await self._pool.close_all()
 
     def __len__(self) -> int:
-        """Return number of connected servers."""
+        """Return number of connections (one per server and owning agent)."""
         return len(self._servers)
@@ -15,7 +15,7 @@ from typing import Any
 
 from nexus3.core.identifiers import build_mcp_skill_name
 from nexus3.core.types import ToolResult
-from nexus3.core.validation import ValidationError, validate_tool_arguments
+from nexus3.core.validation import SchemaCache, ValidationError, validate_tool_arguments
 from nexus3.display.safe_sink import SafeSink
 from nexus3.mcp.client import MCPClient, MCPError
 from nexus3.mcp.error_formatter import format_timeout_error
@@ -45,6 +45,7 @@ class MCPSkillAdapter(BaseSkill):
         self._client = client
         self._original_name = tool.name
         self._server_name = server_name
+        self._schemas = SchemaCache()
 
         prefixed_name = build_mcp_skill_name(server_name, tool.name)
         super().__init__(
@@ -75,7 +76,9 @@ class MCPSkillAdapter(BaseSkill):
         """
         # Validate parameters against input_schema before calling MCP server
         try:
-            validated_args = validate_tool_arguments(kwargs, self._parameters)
+            validated_args = validate_tool_arguments(
+                kwargs, self._parameters, self._schemas.get(self._parameters)
+            )
         except ValidationError as e:
             return ToolResult(error=f"Invalid parameters for {self.name}: {e.message}")
 
@@ -216,6 +216,16 @@ class MCPTransport(ABC):
         await self.send(message)
         return await self.receive()
 
+    @property
+    def pairs_responses(self) -> bool:
+        """Whether request() returns each request's own response.
+
+        True for request/response transports (HTTP), where request() can be
+        called concurrently. False for stream transports, where responses
+        arrive on receive() in any order and MCPClient routes them by ID.
+        """
+        return False
+
     @abstractmethod
     async def close(self) -> None:
         """Close the transport."""
@@ -282,8 +292,10 @@ class StdioTransport(MCPTransport):
         self._stderr_task: asyncio.Task[None] | None = None
         # P1.9.6: Buffer stderr lines for error context (last 20 lines)
         self._stderr_buffer: deque[str] = deque(maxlen=20)
-        # Lock for serializing I/O operations (clarity for concurrent callers)
-        self._io_lock = asyncio.Lock()
+        # Separate locks so a pending receive() never blocks send(): MCPClient
+        # keeps a reader waiting on stdout while other requests are written.
+        self._send_lock = asyncio.Lock()
+        self._receive_lock = asyncio.Lock()
         # Buffer for data read past newline (fixes multi-response buffering)
         self._read_buffer: bytes = b""
 
@@ -370,12 +382,12 @@ class StdioTransport(MCPTransport):
     async def send(self, message: dict[str, Any]) -> None:
         """Write JSON-RPC message to stdin.
 
-        Uses I/O lock to serialize concurrent sends.
+        Concurrent sends are serialized so messages are never interleaved.
         """
         if self._process is None or self._process.stdin is None:
             raise MCPTransportError("Transport not connected")
 
-        async with self._io_lock:
+        async with self._send_lock:
             try:
                 data = json.dumps(message, separators=(",", ":")) + "\n"
                 self._process.stdin.write(data.encode("utf-8"))
@@ -391,12 +403,12 @@ class StdioTransport(MCPTransport):
 
         P2.0.4: Handles both LF and CRLF line endings (Windows compatibility).
 
-        Uses I/O lock to serialize concurrent receives.
+        Concurrent receives are serialized; sends are not blocked.
         """
         if self._process is None or self._process.stdout is None:
             raise MCPTransportError("Transport not connected")
 
-        async with self._io_lock:
+        async with self._receive_lock:
             try:
                 line = await self._read_bounded_line()
                 if not line:
@@ -786,6 +798,11 @@ class HTTPTransport(MCPTransport):
             ) from last_error
         raise MCPTransportError(f"HTTP request failed after {self._max_retries + 1} attempts")
 
+    @property
+    def pairs_responses(self) -> bool:
+        """request() pairs each POST with its response and is concurrency-safe."""
+        return True
+
     async def close(self) -> None:
         """Close HTTP client."""
         if self._client is not None:
@@ -28,10 +28,11 @@ from nexus3.core.types import (
     Role,
     StreamComplete,
     StreamEvent,
+    TokenUsage,
     ToolCall,
     ToolCallStarted,
 )
-from nexus3.provider.base import BaseProvider
+from nexus3.provider.base import BaseProvider, iter_sse_events
 from nexus3.provider.tool_call_formats import (
     build_tool_call,
     parse_anthropic_content_blocks,
@@ -51,6 +52,19 @@ ANTHROPIC_VERSION = "2023-06-01"
 DEFAULT_MAX_TOKENS = 4096
 
 
+def _anthropic_prompt_tokens(usage: dict[str, Any]) -> int | None:
+    """Total prompt tokens from an Anthropic usage block.
+
+    ``input_tokens`` excludes cache writes and reads, so all three are summed.
+    """
+    input_tokens = usage.get("input_tokens")
+    if not isinstance(input_tokens, int):
+        return None
+    cache_creation = usage.get("cache_creation_input_tokens") or 0
+    cache_read = usage.get("cache_read_input_tokens") or 0
+    return input_tokens + int(cache_creation) + int(cache_read)
+
+
 class AnthropicProvider(BaseProvider):
     """Provider for native Anthropic Claude API.
 
@@ -401,6 +415,7 @@ class AnthropicProvider(BaseProvider):
         # Accumulators
         accumulated_content = ""
         current_tool: dict[str, Any] | None = None
+        tool_input_parts: list[str] = []
         tool_calls: list[ToolCall] = []
         seen_tool_ids: set[str] = set()
 
@@ -410,126 +425,120 @@ class AnthropicProvider(BaseProvider):
         finish_reason: str | None = None
         stream_start = time.monotonic()
 
-        buffer = ""
-
-        async for chunk in response.aiter_text():
-            buffer += chunk
+        # Usage: input side from message_start, output from message_delta
+        prompt_tokens: int | None = None
+        completion_tokens: int | None = None
 
-            # Process complete lines
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                line = line.strip()
-
-                # Skip empty lines
-                if not line:
-                    continue
-
-                # Handle event type lines (SSE spec: space after colon is optional)
-                if line.startswith("event:"):
-                    event_type = line[6:].removeprefix(" ")
+        async for sse in iter_sse_events(response):
+            for data_str in sse.payloads():
+                try:
+                    data = json.loads(data_str)
+                except json.JSONDecodeError:
                     continue
-
-                # Handle data lines (SSE spec: space after colon is optional)
-                if line.startswith("data:"):
-                    data_str = line[5:].removeprefix(" ")
-                    try:
-                        data = json.loads(data_str)
-                        event_count += 1
-
-                        # Log raw chunk if callback is set
-                        if self._raw_log:
-                            self._raw_log.on_chunk(data)
-
-                        event_type = data.get("type", "")
-
-                        if event_type == "message_start":
-                            # Log cache metrics from message_start event
-                            message_data = data.get("message", {})
-                            usage = message_data.get("usage", {})
-                            cache_creation = usage.get("cache_creation_input_tokens", 0)
-                            cache_read = usage.get("cache_read_input_tokens", 0)
-                            if cache_creation or cache_read:
-                                logger.debug(
-                                    "Cache: created=%d, read=%d tokens",
-                                    cache_creation,
-                                    cache_read,
-                                )
-
-                        elif event_type == "content_block_start":
-                            # New content block starting
-                            block = data.get("content_block", {})
-                            if block.get("type") == "tool_use":
-                                current_tool = {
-                                    "id": block.get("id", ""),
-                                    "name": block.get("name", ""),
-                                    "input": "",
-                                }
-                                # Yield ToolCallStarted
-                                if current_tool["id"] not in seen_tool_ids:
-                                    seen_tool_ids.add(current_tool["id"])
-                                    yield ToolCallStarted(
-                                        index=len(tool_calls),
-                                        id=current_tool["id"],
-                                        name=current_tool["name"],
-                                    )
-
-                        elif event_type == "content_block_delta":
-                            delta = data.get("delta", {})
-                            delta_type = delta.get("type")
-
-                            if delta_type == "text_delta":
-                                text = delta.get("text", "")
-                                if text:
-                                    accumulated_content += text
-                                    yield ContentDelta(text=text)
-
-                            elif delta_type == "input_json_delta":
-                                # Accumulate tool input JSON
-                                if current_tool is not None:
-                                    current_tool["input"] += delta.get(
-                                        "partial_json", ""
-                                    )
-
-                        elif event_type == "content_block_stop":
-                            # Content block finished
-                            if current_tool is not None:
-                                # Parse accumulated JSON input
-                                tool_calls.append(
-                                    build_tool_call(
-                                        call_id=current_tool["id"],
-                                        name=current_tool["name"],
-                                        payload=current_tool["input"],
-                                        source_format="anthropic_stream",
-                                    )
-                                )
-                                current_tool = None
-
-                        elif event_type == "message_delta":
-                            # Extract stop_reason
-                            delta = data.get("delta", {})
-                            sr = delta.get("stop_reason")
-                            if sr:
-                                finish_reason = sr
-
-                        elif event_type == "message_stop":
-                            # Message complete
-                            received_message_stop = True
-                            self._log_stream_summary(
-                                response, event_count, accumulated_content,
-                                tool_calls, received_message_stop, finish_reason,
-                                stream_start,
+                event_count += 1
+
+                # Log raw chunk if callback is set
+                if self._raw_log:
+                    self._raw_log.on_chunk(data)
+
+                event_type = data.get("type", "")
+
+                if event_type == "message_start":
+                    # Log cache metrics from message_start event
+                    message_data = data.get("message", {})
+                    usage = message_data.get("usage", {})
+                    cache_creation = usage.get("cache_creation_input_tokens", 0)
+                    cache_read = usage.get("cache_read_input_tokens", 0)
+                    if cache_creation or cache_read:
+                        logger.debug(
+                            "Cache: created=%d, read=%d tokens",
+                            cache_creation,
+                            cache_read,
+                        )
+                    prompt_tokens = _anthropic_prompt_tokens(usage)
+
+                elif event_type == "content_block_start":
+                    # New content block starting
+                    block = data.get("content_block", {})
+                    if block.get("type") == "tool_use":
+                        current_tool = {
+                            "id": block.get("id", ""),
+                            "name": block.get("name", ""),
+                        }
+                        tool_input_parts = []
+                        # Yield ToolCallStarted
+                        if current_tool["id"] not in seen_tool_ids:
+                            seen_tool_ids.add(current_tool["id"])
+                            yield ToolCallStarted(
+                                index=len(tool_calls),
+                                id=current_tool["id"],
+                                name=current_tool["name"],
                             )
-                            yield StreamComplete(
-                                message=Message(
-                                    role=Role.ASSISTANT,
-                                    content=accumulated_content,
-                                    tool_calls=tuple(tool_calls),
-                                )
+
+                elif event_type == "content_block_delta":
+                    delta = data.get("delta", {})
+                    delta_type = delta.get("type")
+
+                    if delta_type == "text_delta":
+                        text = delta.get("text", "")
+                        if text:
+                            accumulated_content += text
+                            yield ContentDelta(text=text)
+
+                    elif delta_type == "input_json_delta":
+                        # Accumulate tool input JSON; joined once at block stop
+                        if current_tool is not None:
+                            tool_input_parts.append(delta.get("partial_json", ""))
+
+                elif event_type == "content_block_stop":
+                    # Content block finished
+                    if current_tool is not None:
+                        # Parse accumulated JSON input
+                        tool_calls.append(
+                            build_tool_call(
+                                call_id=current_tool["id"],
+                                name=current_tool["name"],
+                                payload="".join(tool_input_parts),
+                                source_format="anthropic_stream",
                             )
-                            return
+                        )
+                        current_tool = None
+                        tool_input_parts = []
+
+                elif event_type == "message_delta":
+                    # Extract stop_reason
+                    delta = data.get("delta", {})
+                    sr = delta.get("stop_reason")
+                    if sr:
+                        finish_reason = sr
+                    delta_usage = data.get("usage") or {}
+                    if isinstance(delta_usage.get("output_tokens"), int):
+                        completion_tokens = delta_usage["output_tokens"]
+                    if prompt_tokens is None:
+                        prompt_tokens = _anthropic_prompt_tokens(delta_usage)
+
+                elif event_type == "message_stop":
+                    # Message complete
+                    received_message_stop = True
+                    self._log_stream_summary(
+                        response, event_count, accumulated_content,
+                        tool_calls, received_message_stop, finish_reason,
+                        stream_start,
+                    )
+                    yield StreamComplete(
+                        message=Message(
+                            role=Role.ASSISTANT,
+                            content=accumulated_content,
+                            tool_calls=tuple(tool_calls),
+                        ),
+                        usage=(
+                            TokenUsage(prompt_tokens, completion_tokens)
+                            if prompt_tokens is not None
+                            else None
+                        ),
+                    )
+                    return
 
-                    except json.JSONDecodeError:
-                        continue
 
         # If we exit without message_stop, yield what we have
         self._log_stream_summary(
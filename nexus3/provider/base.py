@@ -17,6 +17,7 @@ import random
 import ssl
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -26,6 +27,8 @@ from nexus3.config.schema import AuthMethod, ProviderConfig
 from nexus3.core.errors import ProviderError
 from nexus3.core.types import Message, StreamEvent
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
 # Hosts that are considered safe for HTTP (non-HTTPS) connections
 _LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "[::1]"})
 
@@ -56,6 +59,179 @@ _STALE_CONNECTION_ERROR_MARKERS = (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class SSEEvent:
+    """A single dispatched Server-Sent Events message.
+
+    Attributes:
+        data: Concatenated ``data:`` field values, joined with ``\\n``.
+        event: Value of the ``event:`` field, or None when the server sent none.
+        id: Last event ID seen on the stream (persists across events per spec).
+    """
+
+    data: str
+    event: str | None = None
+    id: str | None = None
+
+    def payloads(self) -> list[str]:
+        """Return the data payloads carried by this event.
+
+        Spec-compliant streams carry one payload per event. Some OpenAI-compatible
+        servers omit the blank line between events, which folds several ``data:``
+        lines into one event; those are split back out line by line when the
+        joined data is not a single JSON document.
+        """
+        if "\n" not in self.data:
+            return [self.data]
+        try:
+            json.loads(self.data)
+        except ValueError:
+            return self.data.split("\n")
+        return [self.data]
+
+
+class SSEDecoder:
+    """Incremental Server-Sent Events decoder over raw response bytes.
+
+    Bytes accumulate in a ``bytearray`` and are only searched from where the
+    previous scan stopped, so a frame spread over many network chunks is
+    scanned once rather than once per chunk. Each batch of completed lines is
+    decoded and split in a single pass; the unterminated tail stays in the
+    buffer. Lines may end in ``\\n``, ``\\r\\n`` or ``\\r``.
+
+    Field handling follows the WHATWG EventSource rules: ``data:`` lines are
+    accumulated until a blank line, ``event:`` sets the type of the pending
+    event, ``id:`` updates the last event ID, ``retry:`` is recorded, and lines
+    starting with ``:`` are comments. Unlike the spec, :meth:`flush` dispatches
+    a trailing event that was never terminated by a blank line, since several
+    providers end the stream without one.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._skip_lf = False
+        self._at_stream_start = True
+        self._data_lines: list[str] = []
+        self._event_type: str | None = None
+        self._last_event_id: str | None = None
+        self.retry_ms: int | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Consume a chunk of bytes and return any events it completed."""
+        if not chunk:
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        if self._skip_lf:
+            # Previous chunk ended in "\r"; a leading "\n" completes that CRLF.
+            self._skip_lf = False
+            if buffer[:1] == b"\n":
+                del buffer[:1]
+        if self._at_stream_start:
+            if len(buffer) < 3 and _UTF8_BOM.startswith(buffer):
+                return []
+            if buffer.startswith(_UTF8_BOM):
+                del buffer[:3]
+            self._at_stream_start = False
+
+        scan = self._scan_pos
+        cut = max(buffer.rfind(b"\n", scan), buffer.rfind(b"\r", scan))
+        if cut == -1:
+            self._scan_pos = len(buffer)
+            return []
+
+        block_end = cut
+        if buffer[cut] == 0x0A:
+            if cut and buffer[cut - 1] == 0x0D:
+                block_end -= 1
+        elif cut == len(buffer) - 1:
+            self._skip_lf = True
+        block = bytes(buffer[:block_end])
+        del buffer[: cut + 1]
+        self._scan_pos = 0
+
+        if b"\r" in block:
+            block = block.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        # A batch ends on a line boundary, so no UTF-8 sequence is split here.
+        events: list[SSEEvent] = []
+        for line in block.decode("utf-8", errors="replace").split("\n"):
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> list[SSEEvent]:
+        """Finish the stream, returning any event left in the buffer."""
+        events: list[SSEEvent] = []
+        if self._buffer:
+            line = self._buffer.decode("utf-8", errors="replace")
+            self._buffer.clear()
+            self._scan_pos = 0
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        event = self._process_line("")
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> SSEEvent | None:
+        """Apply one complete line to the pending event state."""
+        if not line:
+            return self._dispatch()
+        if line.startswith("data:"):
+            value = line[5:]
+            self._data_lines.append(value[1:] if value[:1] == " " else value)
+            return None
+        if line[0] == ":":
+            return None
+
+        field, sep, value = line.partition(":")
+        if sep and value[:1] == " ":
+            value = value[1:]
+
+        if field == "data":
+            self._data_lines.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self.retry_ms = int(value)
+        return None
+
+    def _dispatch(self) -> SSEEvent | None:
+        """Emit the pending event (if any) and reset per-event state."""
+        if not self._data_lines:
+            self._event_type = None
+            return None
+        data = self._data_lines[0] if len(self._data_lines) == 1 else "\n".join(self._data_lines)
+        event = SSEEvent(data=data, event=self._event_type, id=self._last_event_id)
+        self._data_lines = []
+        self._event_type = None
+        return event
+
+
+async def iter_sse_events(response: httpx.Response) -> AsyncIterator[SSEEvent]:
+    """Decode a streaming httpx response into :class:`SSEEvent` objects.
+
+    Args:
+        response: httpx Response whose body is an SSE stream.
+
+    Yields:
+        Each dispatched event, in stream order.
+    """
+    decoder = SSEDecoder()
+    async for chunk in response.aiter_bytes():
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
 def validate_base_url(url: str, allow_insecure: bool = False) -> None:
     """Validate provider base_url for SSRF protection.
 
@@ -30,10 +30,11 @@ from nexus3.core.types import (
     Role,
     StreamComplete,
     StreamEvent,
+    TokenUsage,
     ToolCall,
     ToolCallStarted,
 )
-from nexus3.provider.base import BaseProvider
+from nexus3.provider.base import BaseProvider, iter_sse_events
 from nexus3.provider.tool_call_formats import (
     StreamingToolCallAccumulator,
     parse_anthropic_content_blocks,
@@ -48,6 +49,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Provider types known to accept stream_options.include_usage. Azure is left
+# out because older api-versions reject the field.
+_STREAM_USAGE_PROVIDER_TYPES = frozenset({"openai", "openrouter", "vllm", "ollama"})
+
+
+def _parse_stream_usage(event_data: dict[str, Any]) -> TokenUsage | None:
+    """Extract usage from a chat-completions or Responses API stream event.
+
+    Chat completions send it on the final chunk (``usage.prompt_tokens``);
+    the Responses API nests it under ``response.usage.input_tokens``.
+    """
+    usage = event_data.get("usage")
+    if not isinstance(usage, dict):
+        response = event_data.get("response")
+        usage = response.get("usage") if isinstance(response, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+    if not isinstance(prompt, int) or isinstance(prompt, bool):
+        return None
+    completion = usage.get("completion_tokens", usage.get("output_tokens"))
+    return TokenUsage(
+        prompt_tokens=prompt,
+        completion_tokens=completion if isinstance(completion, int) else None,
+    )
+
 
 @dataclass
 class _ResponsesStreamState:
@@ -172,6 +199,10 @@ class OpenAICompatProvider(BaseProvider):
             "stream": stream,
         }
 
+        # Ask for the trailing usage chunk so token estimates can be calibrated
+        if stream and self._config.type in _STREAM_USAGE_PROVIDER_TYPES:
+            body["stream_options"] = {"include_usage": True}
+
         if tools:
             body["tools"] = _normalize_tools_for_openai(tools)
 
@@ -423,114 +454,58 @@ class OpenAICompatProvider(BaseProvider):
         received_done = False
         finish_reason: str | None = None
         stream_start = time.monotonic()
+        usage: TokenUsage | None = None
 
-        buffer = ""
-        current_event_type: str | None = None
         responses_state = self._new_responses_stream_state()
 
-        async for chunk in response.aiter_text():
-            buffer += chunk
-
-            # Process complete lines
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                line = line.strip()
-
-                if not line:
-                    current_event_type = None
-                    continue
-
-                if line.startswith(":"):
-                    continue
+        async for sse in iter_sse_events(response):
+            for data in sse.payloads():
+                # Check for stream end marker
+                if data == "[DONE]":
+                    received_done = True
+                    self._log_stream_summary(
+                        response, event_count, accumulated_content,
+                        tool_calls_by_index, received_done, finish_reason,
+                        stream_start,
+                    )
+                    yield self._build_stream_complete(
+                        accumulated_content, tool_calls_by_index, usage
+                    )
+                    return
 
-                if line.startswith("event:"):
-                    current_event_type = line[6:].removeprefix(" ")
+                # Parse JSON data
+                try:
+                    event_data = json.loads(data)
+                except json.JSONDecodeError:
+                    # Skip malformed JSON in stream
                     continue
-
-                # Handle data lines (SSE spec: space after colon is optional)
-                if line.startswith("data:"):
-                    data = line[5:].removeprefix(" ")
-
-                    # Check for stream end marker
-                    if data == "[DONE]":
-                        received_done = True
-                        self._log_stream_summary(
-                            response, event_count, accumulated_content,
-                            tool_calls_by_index, received_done, finish_reason,
-                            stream_start,
-                        )
-                        yield self._build_stream_complete(
-                            accumulated_content, tool_calls_by_index
-                        )
-                        return
-
-                    # Parse JSON data
-                    try:
-                        event_data = json.loads(data)
-                        event_count += 1
-
-                        # Extract finish_reason from final chunk
-                        choices = event_data.get("choices", [])
-                        if choices:
-                            fr = choices[0].get("finish_reason")
-                            if fr:
-                                finish_reason = fr
-
-                        # Log raw chunk if callback is set
-                        if self._raw_log:
-                            self._raw_log.on_chunk(event_data)
-
-                        # Process the event
-                        async for event in self._process_stream_event(
-                            event_data,
-                            current_event_type,
-                            tool_calls_by_index,
-                            seen_tool_indices,
-                            stream_key_to_index,
-                            responses_state,
-                        ):
-                            if isinstance(event, ContentDelta):
-                                accumulated_content += event.text
-                            yield event
-
-                    except json.JSONDecodeError:
-                        # Skip malformed JSON in stream
-                        continue
-
-        # Process any remaining data in buffer
-        if buffer.strip():
-            line = buffer.strip()
-            if line.startswith("data:"):
-                data = line[5:].removeprefix(" ")
-                if data != "[DONE]":
-                    try:
-                        event_data = json.loads(data)
-                        event_count += 1
-
-                        choices = event_data.get("choices", [])
-                        if choices:
-                            fr = choices[0].get("finish_reason")
-                            if fr:
-                                finish_reason = fr
-
-                        # Log raw chunk if callback is set
-                        if self._raw_log:
-                            self._raw_log.on_chunk(event_data)
-
-                        async for event in self._process_stream_event(
-                            event_data,
-                            current_event_type,
-                            tool_calls_by_index,
-                            seen_tool_indices,
-                            stream_key_to_index,
-                            responses_state,
-                        ):
-                            if isinstance(event, ContentDelta):
-                                accumulated_content += event.text
-                            yield event
-
-                    except json.JSONDecodeError:
-                        pass
+                event_count += 1
+
+                # Extract finish_reason from final chunk
+                choices = event_data.get("choices", [])
+                if choices:
+                    fr = choices[0].get("finish_reason")
+                    if fr:
+                        finish_reason = fr
+
+                usage = _parse_stream_usage(event_data) or usage
+
+                # Log raw chunk if callback is set
+                if self._raw_log:
+                    self._raw_log.on_chunk(event_data)
+
+                # Process the event
+                async for event in self._process_stream_event(
+                    event_data,
+                    sse.event,
+                    tool_calls_by_index,
+                    seen_tool_indices,
+                    stream_key_to_index,
+                    responses_state,
+                ):
+                    if isinstance(event, ContentDelta):
+                        accumulated_content += event.text
+                    yield event
 
         # If we get here without [DONE], still yield StreamComplete
         self._log_stream_summary(
@@ -538,7 +513,7 @@ class OpenAICompatProvider(BaseProvider):
             tool_calls_by_index, received_done, finish_reason,
             stream_start,
         )
-        yield self._build_stream_complete(accumulated_content, tool_calls_by_index)
+        yield self._build_stream_complete(accumulated_content, tool_calls_by_index, usage)
 
     def _log_stream_summary(
         self,
@@ -840,12 +815,14 @@ class OpenAICompatProvider(BaseProvider):
         self,
         content: str,
         tool_calls_by_index: dict[int, StreamingToolCallAccumulator],
+        usage: TokenUsage | None = None,
     ) -> StreamComplete:
         """Build the final StreamComplete event.
 
         Args:
             content: Accumulated content string.
             tool_calls_by_index: Accumulated tool calls.
+            usage: Provider-reported usage, if the stream carried it.
 
         Returns:
             StreamComplete with the final Message.
@@ -861,4 +838,4 @@ class OpenAICompatProvider(BaseProvider):
             tool_calls=tuple(tool_calls),
         )
 
-        return StreamComplete(message=message)
+        return StreamComplete(message=message, usage=usage)
@@ -25,6 +25,7 @@ from nexus3.rpc.dispatcher import Dispatcher
 from nexus3.rpc.http import (
     BIND_HOST,
     DEFAULT_PORT,
+    MAX_BATCH_SIZE,
     MAX_BODY_SIZE,
     HttpParseError,
     HttpRequest,
@@ -45,8 +46,11 @@ from nexus3.rpc.protocol import (
     ParseError,
     make_error_response,
     make_success_response,
+    parse_batch_request,
+    parse_batch_response,
     parse_request,
     parse_response,
+    serialize_batch_response,
     serialize_request,
     serialize_response,
 )
@@ -59,12 +63,15 @@ __all__ = [
     "HttpRequest",
     # Protocol functions (server-side)
     "parse_request",
+    "parse_batch_request",
     "serialize_response",
+    "serialize_batch_response",
     "make_error_response",
     "make_success_response",
     # Protocol functions (client-side)
     "serialize_request",
     "parse_response",
+    "parse_batch_response",
     # HTTP server
     "run_http_server",
     "handle_connection",
@@ -72,6 +79,7 @@ __all__ = [
     "send_http_response",
     "DEFAULT_PORT",
     "MAX_BODY_SIZE",
+    "MAX_BATCH_SIZE",
     "BIND_HOST",
     # Error codes
     "PARSE_ERROR",
@@ -195,9 +195,13 @@ class AgentScopedAPI:
         )
         return _extract_result(response)
 
-    async def get_tokens(self) -> dict[str, Any]:
+    async def get_tokens(self, per_tool: bool = False) -> dict[str, Any]:
         """Get current token usage.
 
+        Args:
+            per_tool: If True, include a 'tools_breakdown' map of tool name
+                to token count.
+
         Returns:
             Token usage breakdown dict.
         """
@@ -205,7 +209,7 @@ class AgentScopedAPI:
         request = Request(
             jsonrpc="2.0",
             method="get_tokens",
-            params=None,
+            params={"per_tool": True} if per_tool else None,
             id=1,
         )
         capability_token = _issue_direct_capability(
@@ -506,9 +510,9 @@ class ClientAdapter:
         """Cancel an in-progress request."""
         return await self._require_agent("cancel").cancel(request_id)
 
-    async def get_tokens(self) -> dict[str, Any]:
+    async def get_tokens(self, per_tool: bool = False) -> dict[str, Any]:
         """Get current token usage."""
-        return await self._require_agent("get_tokens").get_tokens()
+        return await self._require_agent("get_tokens").get_tokens(per_tool=per_tool)
 
     async def get_context(self) -> dict[str, Any]:
         """Get current context state."""
@@ -7,6 +7,7 @@ handles the common pattern of:
 - Success/error response generation
 - Exception handling with proper error codes
 - Notification handling (requests without id)
+- Concurrent batch dispatch (dispatch_batch)
 
 This eliminates code duplication and ensures consistent error handling across
 both dispatcher types.
@@ -14,8 +15,9 @@ both dispatcher types.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any, Protocol
 
 from pydantic import ValidationError as PydanticValidationError
@@ -234,3 +236,50 @@ async def dispatch_request(
             INTERNAL_ERROR,
             f"Internal error: {type(e).__name__}: {e}",
         )
+
+
+async def dispatch_batch(
+    items: list[Request | Response],
+    dispatch: Callable[[Request], Awaitable[Response | None]],
+    log_context: str,
+) -> list[Response]:
+    """Dispatch the requests of a JSON-RPC batch concurrently.
+
+    Each request goes through ``dispatch`` on its own, so envelope checks,
+    identity resolution and per-method authorization apply exactly as for a
+    single request. Items that are already error Responses (malformed batch
+    entries) are passed through.
+
+    Args:
+        items: Parsed batch entries, in request order.
+        dispatch: Single-request dispatch (e.g. a bound Dispatcher.dispatch).
+        log_context: Context string for log messages.
+
+    Returns:
+        Responses in request order, without entries for notifications. Empty
+        if the batch held only notifications.
+    """
+
+    async def run(item: Request | Response) -> Response | None:
+        if isinstance(item, Response):
+            return item
+        try:
+            return await dispatch(item)
+        except Exception as e:
+            logger.error(
+                "Unexpected error in batched %s '%s': %s",
+                log_context,
+                item.method,
+                e,
+                exc_info=True,
+            )
+            if item.id is None:
+                return None
+            return make_error_response(
+                item.id,
+                INTERNAL_ERROR,
+                f"Internal error: {type(e).__name__}: {e}",
+            )
+
+    results = await asyncio.gather(*(run(item) for item in items))
+    return [response for response in results if response is not None]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import secrets
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +24,7 @@ from nexus3.core.permissions import PermissionLevel
 from nexus3.core.request_context import RequestContext
 from nexus3.rpc.dispatch_core import (
     InvalidParamsError,
+    dispatch_batch,
     dispatch_request,
     resolve_dispatch_identity,
     validate_direct_request_envelope,
@@ -34,10 +35,12 @@ from nexus3.rpc.schemas import (
     CompactParamsSchema,
     EmptyParamsSchema,
     GetMessagesParamsSchema,
+    GetTokensParamsSchema,
     SendParamsSchema,
 )
 from nexus3.rpc.types import Request, Response
 from nexus3.session import Session
+from nexus3.session.events import SessionEvent, ToolCompleted, ToolStarted
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,24 @@ if TYPE_CHECKING:
 # Type alias for handler functions
 Handler = Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]
 
+# Async sink for streamed 'send' frames: (event name, JSON-serialisable data).
+# Awaiting it is what applies backpressure to the turn.
+StreamEmitter = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+def _stream_frame(event: SessionEvent) -> tuple[str, dict[str, Any]] | None:
+    """Map a tool-loop event to a streamed 'send' frame, if it has one."""
+    if isinstance(event, ToolStarted):
+        return "tool_started", {"name": event.name, "tool_id": event.tool_id}
+    if isinstance(event, ToolCompleted):
+        return "tool_completed", {
+            "name": event.name,
+            "tool_id": event.tool_id,
+            "success": event.success,
+            "error": event.error,
+        }
+    return None
+
 
 class _SendAuthorizationAdapter:
     """Kernel adapter mirroring legacy YOLO/REPL send authorization checks."""
@@ -196,6 +217,7 @@ class Dispatcher:
         requester_id: str | None = None,
         *,
         capability_token: str | None = None,
+        emit: StreamEmitter | None = None,
     ) -> Response | None:
         """Dispatch a request to the appropriate handler.
 
@@ -203,6 +225,8 @@ class Dispatcher:
             request: The parsed JSON-RPC request.
             requester_id: Requesting agent identity when available.
             capability_token: Optional direct in-process capability token.
+            emit: Optional frame sink for a streamed 'send' (``"stream": true``).
+                Other methods ignore it.
 
         Returns:
             A Response object, or None for notifications (requests without id).
@@ -234,7 +258,7 @@ class Dispatcher:
         handlers = dict(self._handlers)
 
         async def handle_send_with_context(params: dict[str, Any]) -> dict[str, Any]:
-            return await self._handle_send(params, request_context)
+            return await self._handle_send(params, request_context, emit=emit)
 
         async def handle_shutdown_with_context(params: dict[str, Any]) -> dict[str, Any]:
             return await self._handle_shutdown(params, request_context)
@@ -270,6 +294,34 @@ class Dispatcher:
 
         return await dispatch_request(request, handlers, "method")
 
+    async def dispatch_batch(
+        self,
+        items: list[Request | Response],
+        requester_id: str | None = None,
+        *,
+        capability_token: str | None = None,
+    ) -> list[Response]:
+        """Dispatch a JSON-RPC batch, running its requests concurrently.
+
+        Every request is authorized individually through dispatch().
+
+        Args:
+            items: Parsed batch entries (Requests, or error Responses for
+                malformed entries), in request order.
+            requester_id: Requesting agent identity when available.
+            capability_token: Optional direct in-process capability token.
+
+        Returns:
+            Responses in request order, omitting notifications.
+        """
+
+        async def dispatch_one(request: Request) -> Response | None:
+            return await self.dispatch(
+                request, requester_id, capability_token=capability_token
+            )
+
+        return await dispatch_batch(items, dispatch_one, "method")
+
     def _validate_direct_request_envelope(self, request: Request) -> None:
         validate_direct_request_envelope(request)
 
@@ -305,35 +357,43 @@ class Dispatcher:
         *,
         cancel_token: CancellationToken,
         user_meta: dict[str, str] | None,
+        on_event: Callable[[SessionEvent], Awaitable[None]] | None = None,
     ) -> Any:
         """Return the appropriate session send iterator for the reserved turn."""
+        kwargs: dict[str, Any] = {"cancel_token": cancel_token, "user_meta": user_meta}
+        if on_event is not None:
+            kwargs["on_event"] = on_event
         send_locked = getattr(self._session, "send_locked", None)
         if callable(send_locked):
-            return send_locked(
-                content,
-                cancel_token=cancel_token,
-                user_meta=user_meta,
-            )
-        return self._session.send(
-            content,
-            cancel_token=cancel_token,
-            user_meta=user_meta,
-        )
+            return send_locked(content, **kwargs)
+        return self._session.send(content, **kwargs)
 
     async def _handle_send(
         self,
         params: dict[str, Any],
         request_context: RequestContext | None = None,
+        *,
+        emit: StreamEmitter | None = None,
     ) -> dict[str, Any]:
         """Handle the 'send' method.
 
         Sends a message to the LLM and returns the full response.
         Uses Session.send() for streaming; accumulates chunks before returning.
 
+        With ``"stream": true`` and an ``emit`` sink (HTTP agent endpoint),
+        each content chunk is also emitted as a ``content`` frame and each
+        tool start/finish as ``tool_started``/``tool_completed`` while the turn
+        runs. Emitting is awaited, so a slow consumer slows the turn rather
+        than growing a buffer; if emitting fails (client gone or stalled) the
+        turn is cancelled.
+
         Args:
             params: Must contain 'content' key with message text.
                    Optional 'request_id' for cancellation support.
                    Optional 'source' and 'source_agent_id' for attribution.
+                   Optional 'stream' to request streamed frames.
+            request_context: Caller identity for authorization.
+            emit: Frame sink used when 'stream' is true.
 
         Returns:
             Dict with keys:
@@ -367,6 +427,10 @@ class Dispatcher:
                     raise InvalidParamsError(
                         f"source must be string, got: {type(raw_value).__name__}"
                     ) from exc
+                if field == "stream":
+                    raise InvalidParamsError(
+                        f"stream must be boolean, got: {type(raw_value).__name__}"
+                    ) from exc
                 if field == "source_agent_id":
                     raise InvalidParamsError(
                         "source_agent_id must be string or integer, "
@@ -443,6 +507,27 @@ class Dispatcher:
         token = CancellationToken()
         self._active_requests[request_id] = token
 
+        stream = emit if validated.stream else None
+        stream_failed = False
+
+        async def forward(event: str, data: dict[str, Any]) -> None:
+            nonlocal stream_failed
+            if stream is None or stream_failed:
+                return
+            try:
+                await stream(event, data)
+            except Exception as exc:
+                # Client disconnected or stopped reading: nobody will see the
+                # rest of this turn, so stop it like an explicit cancel.
+                stream_failed = True
+                logger.info("Streamed send %s aborted: %s", request_id, exc)
+                token.cancel()
+
+        async def forward_event(event: SessionEvent) -> None:
+            frame = _stream_frame(event)
+            if frame is not None:
+                await forward(*frame)
+
         try:
             async with self._reserve_session_turn():
                 # Check cancellation before starting
@@ -468,6 +553,7 @@ class Dispatcher:
                         content,
                         cancel_token=token,
                         user_meta=user_meta,
+                        on_event=forward_event if stream is not None else None,
                     )
                     # Wrap in agent context for correct raw log routing
                     if self._log_multiplexer and self._agent_id:
@@ -475,10 +561,12 @@ class Dispatcher:
                             async for chunk in send_iter:
                                 token.raise_if_cancelled()
                                 chunks.append(chunk)
+                                await forward("content", {"text": chunk})
                     else:
                         async for chunk in send_iter:
                             token.raise_if_cancelled()
                             chunks.append(chunk)
+                            await forward("content", {"text": chunk})
 
                     # Final check after loop ends (session may have stopped early)
                     token.raise_if_cancelled()
@@ -583,7 +671,9 @@ class Dispatcher:
         Returns token usage information from the context manager.
 
         Args:
-            params: Ignored.
+            params: Optional 'per_tool' flag (default False). When True, the
+                result also carries 'tools_breakdown', a name -> tokens map of
+                each tool definition, largest first.
 
         Returns:
             Dict with token usage breakdown.
@@ -593,13 +683,16 @@ class Dispatcher:
         """
         _ = request_context
         try:
-            EmptyParamsSchema.model_validate(params, strict=True)
+            validated = GetTokensParamsSchema.model_validate(params, strict=True)
         except PydanticValidationError as exc:
             raise InvalidParamsError("Invalid get_tokens parameters") from exc
 
         if not self._context:
             raise InvalidParamsError("No context manager configured")
-        return self._context.get_token_usage()
+        usage: dict[str, Any] = dict(self._context.get_token_usage())
+        if validated.per_tool:
+            usage["tools_breakdown"] = self._context.get_tool_token_breakdown()
+        return usage
 
     async def _handle_get_context(
         self,
@@ -36,6 +36,7 @@ from nexus3.core.policy import PermissionLevel
 from nexus3.core.request_context import RequestContext
 from nexus3.rpc.dispatch_core import (
     InvalidParamsError,
+    dispatch_batch,
     dispatch_request,
     resolve_dispatch_identity,
     validate_direct_request_envelope,
@@ -207,6 +208,34 @@ class GlobalDispatcher:
         handlers["shutdown_server"] = handle_shutdown_with_context
         return await dispatch_request(request, handlers, "global method")
 
+    async def dispatch_batch(
+        self,
+        items: list[Request | Response],
+        requester_id: str | None = None,
+        *,
+        capability_token: str | None = None,
+    ) -> list[Response]:
+        """Dispatch a JSON-RPC batch, running its requests concurrently.
+
+        Every request is authorized individually through dispatch().
+
+        Args:
+            items: Parsed batch entries (Requests, or error Responses for
+                malformed entries), in request order.
+            requester_id: Requesting agent identity when available.
+            capability_token: Optional direct in-process capability token.
+
+        Returns:
+            Responses in request order, omitting notifications.
+        """
+
+        async def dispatch_one(request: Request) -> Response | None:
+            return await self.dispatch(
+                request, requester_id, capability_token=capability_token
+            )
+
+        return await dispatch_batch(items, dispatch_one, "global method")
+
     def _validate_direct_request_envelope(self, request: Request) -> None:
         validate_direct_request_envelope(request)
 
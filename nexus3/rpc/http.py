@@ -7,6 +7,28 @@ Security:
     - The server binds only to localhost (127.0.0.1) and never to 0.0.0.0.
     - API key authentication via Authorization: Bearer <key> header.
 
+Persistent connections:
+    HTTP/1.1 keep-alive is supported (run_http_server enables it by default).
+    A connection serves requests in order - pipelined requests are read and
+    answered one at a time - until the client sends ``Connection: close``,
+    the connection sits idle past the keep-alive timeout, or it reaches the
+    per-connection request limit.
+
+Streaming:
+    A ``send`` to /agent/{agent_id} with ``"stream": true`` in its params is
+    answered as ``text/event-stream``: ``content``, ``tool_started`` and
+    ``tool_completed`` frames while the turn runs, then one ``result`` frame
+    holding the JSON-RPC response. Frames are drained to the socket before
+    the turn continues, so a slow reader throttles the agent instead of
+    growing server memory; a reader that stalls past STREAM_WRITE_TIMEOUT
+    has its turn cancelled.
+
+Batches:
+    A JSON array body is a JSON-RPC 2.0 batch (at most MAX_BATCH_SIZE
+    requests) on any route. Its requests are dispatched concurrently, each
+    authorized as if sent alone, and answered with an array of responses in
+    request order (notifications omitted).
+
 Path-based routing:
     - POST / or /rpc → GlobalDispatcher (agent management)
     - POST /agent/{agent_id} → Agent's Dispatcher
@@ -27,12 +49,14 @@ Example usage:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
 from collections.abc import Callable
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
 
+from nexus3.core.constants import DEFAULT_KEEP_ALIVE_TIMEOUT
 from nexus3.core.errors import NexusError
 from nexus3.core.validation import is_valid_agent_id
 from nexus3.rpc.auth import validate_api_key
@@ -43,7 +67,8 @@ from nexus3.rpc.protocol import (
     PARSE_ERROR,
     ParseError,
     make_error_response,
-    parse_request,
+    parse_batch_request,
+    serialize_batch_response,
     serialize_response,
 )
 
@@ -63,6 +88,26 @@ if TYPE_CHECKING:
             capability_token: str | None = None,
         ) -> Response | None: ...
 
+        async def dispatch_batch(
+            self,
+            items: list[Request | Response],
+            requester_id: str | None = None,
+            *,
+            capability_token: str | None = None,
+        ) -> list[Response]: ...
+
+    class StreamingDispatcher(Protocol):
+        """Agent dispatcher that can emit streamed 'send' frames."""
+
+        async def dispatch(
+            self,
+            request: Request,
+            requester_id: str | None = None,
+            *,
+            capability_token: str | None = None,
+            emit: StreamEmitter | None = None,
+        ) -> Response | None: ...
+
     class GlobalDispatcher(Protocol):
         """Protocol for the global dispatcher that manages agents."""
 
@@ -74,6 +119,14 @@ if TYPE_CHECKING:
             capability_token: str | None = None,
         ) -> Response | None: ...
 
+        async def dispatch_batch(
+            self,
+            items: list[Request | Response],
+            requester_id: str | None = None,
+            *,
+            capability_token: str | None = None,
+        ) -> list[Response]: ...
+
         @property
         def shutdown_requested(self) -> bool: ...
 
@@ -106,6 +159,7 @@ if TYPE_CHECKING:
 
         def load_session(self, name: str) -> SavedSession: ...
 
+    from nexus3.rpc.dispatcher import StreamEmitter
     from nexus3.rpc.types import Request, Response
 
 logger = logging.getLogger(__name__)
@@ -113,6 +167,7 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_PORT = 8765
 MAX_BODY_SIZE = 1_048_576  # 1MB
+MAX_BATCH_SIZE = 100  # Max requests in one JSON-RPC batch
 BIND_HOST = "127.0.0.1"  # Localhost only - NEVER bind to 0.0.0.0
 
 # HTTP header limits (DoS protection)
@@ -122,6 +177,13 @@ MAX_HEADER_VALUE_LEN = 8192  # Max header value length (bytes)
 MAX_TOTAL_HEADERS_SIZE = 32 * 1024  # 32KB total header size limit
 MAX_REQUEST_LINE_LEN = 8192  # Max request line length
 
+# Persistent connection limits
+KEEP_ALIVE_TIMEOUT = DEFAULT_KEEP_ALIVE_TIMEOUT  # Seconds an idle connection is held open
+MAX_KEEP_ALIVE_REQUESTS = 100  # Requests served per connection before closing
+
+# Streaming
+STREAM_WRITE_TIMEOUT = 30.0  # Seconds a streamed frame may wait for the client to read
+
 
 class ServerActivityTracker:
     """Track recent server activity for idle-timeout decisions."""
@@ -148,41 +210,111 @@ class HttpRequest:
         path: Request path (e.g., "/rpc")
         headers: Dict of lowercase header names to values
         body: Request body as string
+        version: HTTP version from the request line (e.g., "HTTP/1.1")
     """
 
     method: str
     path: str
     headers: dict[str, str]
     body: str
+    version: str = "HTTP/1.1"
+
+    @property
+    def wants_keep_alive(self) -> bool:
+        """Whether the client asked to keep the connection open.
+
+        HTTP/1.1 connections persist unless the client sends
+        ``Connection: close``; HTTP/1.0 ones only with ``Connection: keep-alive``.
+        """
+        tokens = {
+            token.strip().lower()
+            for token in self.headers.get("connection", "").split(",")
+        }
+        if "close" in tokens:
+            return False
+        if self.version.upper() == "HTTP/1.0":
+            return "keep-alive" in tokens
+        return True
 
 
 class HttpParseError(NexusError):
     """Raised when HTTP request parsing fails."""
 
 
-async def read_http_request(reader: asyncio.StreamReader) -> HttpRequest:
+class HttpConnectionClosed(HttpParseError):
+    """Raised when the peer closes or goes idle before sending a request line.
+
+    On a kept-alive connection this is the normal end of the connection
+    rather than a client error.
+    """
+
+
+@dataclass
+class KeepAlivePolicy:
+    """Persistent-connection limits shared by a server's connections.
+
+    Attributes:
+        idle_timeout: Seconds to wait for the next request on an open connection.
+        max_requests: Requests served on one connection before it is closed.
+    """
+
+    idle_timeout: float = KEEP_ALIVE_TIMEOUT
+    max_requests: int = MAX_KEEP_ALIVE_REQUESTS
+    _idle: set[asyncio.StreamWriter] = field(default_factory=set, repr=False)
+
+    def header_value(self, served: int) -> str:
+        """Keep-Alive response header after ``served`` requests."""
+        return f"timeout={int(self.idle_timeout)}, max={self.max_requests - served}"
+
+    def mark_idle(self, writer: asyncio.StreamWriter) -> None:
+        """Record that a connection is waiting for its next request."""
+        self._idle.add(writer)
+
+    def mark_busy(self, writer: asyncio.StreamWriter) -> None:
+        """Record that a connection is no longer idle."""
+        self._idle.discard(writer)
+
+    def close_idle(self) -> None:
+        """Close connections currently waiting for their next request.
+
+        Called on server shutdown so idle keep-alive connections do not hold
+        it open until their timeout.
+        """
+        for writer in list(self._idle):
+            writer.close()
+        self._idle.clear()
+
+
+async def read_http_request(
+    reader: asyncio.StreamReader,
+    request_line_timeout: float = 30.0,
+) -> HttpRequest:
     """Read and parse an HTTP request from the stream.
 
     Args:
         reader: The asyncio StreamReader to read from.
+        request_line_timeout: Seconds to wait for the request line. On a
+            kept-alive connection this is the idle timeout.
 
     Returns:
         Parsed HttpRequest object.
 
     Raises:
+        HttpConnectionClosed: If the stream ends or times out before a
+            request line arrives.
         HttpParseError: If the request is malformed or too large.
     """
     # Read request line
     try:
         request_line = await asyncio.wait_for(
             reader.readline(),
-            timeout=30.0,
+            timeout=request_line_timeout,
         )
     except TimeoutError:
-        raise HttpParseError("Request timeout") from None
+        raise HttpConnectionClosed("Request timeout") from None
 
     if not request_line:
-        raise HttpParseError("Empty request")
+        raise HttpConnectionClosed("Empty request")
 
     # Check request line length (DoS protection)
     if len(request_line) > MAX_REQUEST_LINE_LEN:
@@ -194,7 +326,7 @@ async def read_http_request(reader: asyncio.StreamReader) -> HttpRequest:
         parts = request_line_str.split(" ")
         if len(parts) != 3:
             raise HttpParseError(f"Invalid request line: {request_line_str}")
-        method, path, _version = parts
+        method, path, version = parts
     except UnicodeDecodeError as e:
         raise HttpParseError(f"Invalid request encoding: {e}") from e
 
@@ -253,6 +385,11 @@ async def read_http_request(reader: asyncio.StreamReader) -> HttpRequest:
 
         headers[name.lower()] = value
 
+    # Only Content-Length framing is supported; anything else would desync
+    # the next request on a persistent connection.
+    if "transfer-encoding" in headers:
+        raise HttpParseError("Transfer-Encoding is not supported; send Content-Length")
+
     # Read body based on Content-Length
     body = ""
     content_length_str = headers.get("content-length", "0")
@@ -287,6 +424,7 @@ async def read_http_request(reader: asyncio.StreamReader) -> HttpRequest:
         path=path,
         headers=headers,
         body=body,
+        version=version,
     )
 
 
@@ -295,6 +433,7 @@ async def send_http_response(
     status: int,
     body: str,
     content_type: str = "application/json",
+    keep_alive: str | None = None,
 ) -> None:
     """Send an HTTP response.
 
@@ -303,6 +442,8 @@ async def send_http_response(
         status: HTTP status code (e.g., 200, 400, 500).
         body: Response body as string.
         content_type: Content-Type header value.
+        keep_alive: Keep-Alive header value when the connection stays open;
+            None sends ``Connection: close``.
     """
     status_messages = {
         200: "OK",
@@ -320,16 +461,116 @@ async def send_http_response(
         f"HTTP/1.1 {status} {status_message}",
         f"Content-Type: {content_type}; charset=utf-8",
         f"Content-Length: {len(body_bytes)}",
-        "Connection: close",
-        "",
-        "",
     ]
+    if keep_alive is not None:
+        headers += ["Connection: keep-alive", f"Keep-Alive: {keep_alive}"]
+    else:
+        headers.append("Connection: close")
+    headers += ["", ""]
     response = "\r\n".join(headers).encode("utf-8") + body_bytes
 
     writer.write(response)
     await writer.drain()
 
 
+class SseResponse:
+    """A ``text/event-stream`` response written frame by frame.
+
+    HTTP/1.1 responses use chunked transfer encoding so the connection can
+    stay open afterwards; otherwise the body is unframed and the connection
+    must close after it. Every frame is drained before send() returns, which
+    is what propagates backpressure to the producer.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        *,
+        chunked: bool,
+        keep_alive: str | None,
+        write_timeout: float = STREAM_WRITE_TIMEOUT,
+    ) -> None:
+        """Prepare a streamed response.
+
+        Args:
+            writer: The connection's StreamWriter.
+            chunked: Use chunked transfer encoding (HTTP/1.1 clients).
+            keep_alive: Keep-Alive header value if the connection stays open;
+                ignored (``Connection: close``) when not chunked.
+            write_timeout: Seconds to wait for the client to accept a frame.
+        """
+        self._writer = writer
+        self._chunked = chunked
+        self._keep_alive = keep_alive if chunked else None
+        self._write_timeout = write_timeout
+        self.failed = False
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the connection may serve another request afterwards."""
+        return self._keep_alive is not None and not self.failed
+
+    async def start(self) -> None:
+        """Send the status line and headers."""
+        headers = [
+            "HTTP/1.1 200 OK",
+            "Content-Type: text/event-stream; charset=utf-8",
+            "Cache-Control: no-cache",
+        ]
+        if self._chunked:
+            headers.append("Transfer-Encoding: chunked")
+        if self._keep_alive is not None:
+            headers += ["Connection: keep-alive", f"Keep-Alive: {self._keep_alive}"]
+        else:
+            headers.append("Connection: close")
+        headers += ["", ""]
+        await self._write("\r\n".join(headers).encode("utf-8"))
+
+    async def send(self, event: str, data: dict[str, Any]) -> None:
+        """Write one ``event``/``data`` frame and wait until it is drained.
+
+        Raises:
+            ConnectionError: If the client has gone away.
+            TimeoutError: If the client did not read within the write timeout.
+        """
+        await self._send_frame(event, json.dumps(data, separators=(",", ":")))
+
+    async def finish(self, response: Response | None) -> None:
+        """Send the final ``result`` frame and end the body."""
+        body = serialize_response(response) if response is not None else ""
+        await self._send_frame("result", body)
+        if self._chunked:
+            await self._write(b"0\r\n\r\n")
+
+    async def _send_frame(self, event: str, data: str) -> None:
+        frame = f"event: {event}\ndata: {data}\n\n".encode()
+        if self._chunked:
+            frame = f"{len(frame):x}\r\n".encode() + frame + b"\r\n"
+        await self._write(frame)
+
+    async def _write(self, data: bytes) -> None:
+        if self.failed:
+            raise ConnectionResetError("stream already failed")
+        try:
+            if self._writer.is_closing():
+                raise ConnectionResetError("client disconnected")
+            self._writer.write(data)
+            await asyncio.wait_for(self._writer.drain(), self._write_timeout)
+        except BaseException:
+            self.failed = True
+            raise
+
+
+def _wants_stream(request: Request) -> bool:
+    """Whether a JSON-RPC request asks for a streamed 'send'."""
+    return (
+        request.method == "send"
+        and request.id is not None
+        and isinstance(request.params, dict)
+        and request.params.get("stream") is True
+    )
+
+
 def _extract_agent_id(path: str) -> str | None:
     """Extract agent_id from path like /agent/{agent_id}.
 
@@ -504,19 +745,27 @@ async def handle_connection(
     global_dispatcher: GlobalDispatcher,
     api_key: str | None = None,
     session_manager: SessionManager | None = None,
+    keep_alive: KeepAlivePolicy | None = None,
+    activity_tracker: ServerActivityTracker | None = None,
 ) -> None:
-    """Handle a single HTTP connection with path-based routing.
+    """Handle an HTTP connection with path-based routing.
 
-    This function orchestrates the HTTP pipeline through distinct layers:
+    Each request goes through distinct layers:
         1. Parse HTTP request
         2. Validate HTTP method (POST only)
         3. Authenticate request (if api_key configured)
         4. Route to dispatcher (global or agent)
         5. Restore agent if needed (auto-restore from saved session)
-        6. Parse JSON-RPC request
+        6. Parse JSON-RPC request (single or batch)
         7. Dispatch to handler
         8. Send response
 
+    Without a keep-alive policy the connection serves exactly one request.
+    With one, requests are served in order until the client asks to close,
+    the connection is idle past ``keep_alive.idle_timeout``, it has served
+    ``keep_alive.max_requests`` requests, or the server is shutting down.
+    HTTP-level parse errors always close the connection.
+
     Routing:
         - POST / or /rpc -> global_dispatcher
         - POST /agent/{agent_id} -> agent's dispatcher
@@ -534,101 +783,70 @@ async def handle_connection(
         api_key: Optional API key for authentication. If provided, requests
                  must include Authorization: Bearer <key> header.
         session_manager: Optional SessionManager for auto-restoring saved sessions.
+        keep_alive: Optional persistent-connection policy. None closes the
+                 connection after the first response.
+        activity_tracker: Optional tracker touched on every request, so
+                 persistent connections keep the server's idle timer fresh.
     """
+    served = 0
     try:
-        # Layer 1: Parse HTTP request
-        try:
-            http_request = await read_http_request(reader)
-        except HttpParseError as e:
-            error_response = make_error_response(None, PARSE_ERROR, str(e))
-            await send_http_response(writer, 400, serialize_response(error_response))
-            return
-
-        # Layer 2: Validate HTTP method (POST only)
-        if http_request.method != "POST":
-            error_response = make_error_response(
-                None, INVALID_REQUEST, "Method not allowed. Use POST."
+        while True:
+            # Layer 1: Parse HTTP request
+            if served and keep_alive is not None:
+                keep_alive.mark_idle(writer)
+            try:
+                http_request = await read_http_request(
+                    reader,
+                    request_line_timeout=(
+                        keep_alive.idle_timeout if served and keep_alive is not None else 30.0
+                    ),
+                )
+            except HttpConnectionClosed:
+                if served:
+                    return  # Client finished with the persistent connection
+                raise
+            finally:
+                if keep_alive is not None:
+                    keep_alive.mark_busy(writer)
+
+            served += 1
+            if activity_tracker is not None:
+                activity_tracker.touch()
+
+            persist = (
+                keep_alive is not None
+                and http_request.wants_keep_alive
+                and served < keep_alive.max_requests
+                and not pool.should_shutdown
+                and not global_dispatcher.shutdown_requested
             )
-            await send_http_response(writer, 405, serialize_response(error_response))
-            return
-
-        # Layer 3: Authenticate request
-        auth_error, auth_status = _authenticate_request(http_request, api_key)
-        if auth_error is not None:
-            await send_http_response(
-                writer, auth_status, serialize_response(auth_error)
+            keep_alive_header = (
+                keep_alive.header_value(served) if persist and keep_alive is not None else None
             )
-            return
-
-        # Layer 4: Route to dispatcher
-        dispatcher, agent_id, route_error, route_status = _route_to_dispatcher(
-            http_request.path, pool, global_dispatcher
-        )
-        if route_error is not None:
-            await send_http_response(
-                writer, route_status, serialize_response(route_error)
-            )
-            return
-
-        # Layer 5: Restore agent if needed (dispatcher is None but agent_id is set)
-        if dispatcher is None and agent_id is not None:
-            dispatcher, restore_error, restore_status = await _restore_agent_if_needed(
-                agent_id, pool, session_manager
+            reusable = await _serve_request(
+                http_request,
+                writer,
+                pool,
+                global_dispatcher,
+                api_key,
+                session_manager,
+                keep_alive_header,
             )
-            if restore_error is not None:
-                await send_http_response(
-                    writer, restore_status, serialize_response(restore_error)
-                )
+            if (
+                not reusable
+                or keep_alive_header is None
+                or global_dispatcher.shutdown_requested
+            ):
                 return
 
-        # Safety check: dispatcher must be set by now
-        assert dispatcher is not None, "dispatcher should be set after routing/restore"
-
-        # Layer 6: Parse JSON-RPC request
+    except HttpParseError as e:
+        error_response = make_error_response(None, PARSE_ERROR, str(e))
         try:
-            rpc_request = parse_request(http_request.body)
-        except ParseError as e:
-            error_response = make_error_response(None, PARSE_ERROR, str(e))
-            await send_http_response(writer, 400, serialize_response(error_response))
-            return
-
-        # Layer 7: Dispatch to handler
-        # Extract requester/capability identity headers for authorization.
-        requester_id = http_request.headers.get("x-nexus-agent")
-        has_capability_header = "x-nexus-capability" in http_request.headers
-        capability_token = http_request.headers.get("x-nexus-capability")
-        if requester_id is not None and not has_capability_header:
-            error_response = make_error_response(
-                rpc_request.id,
-                INVALID_PARAMS,
-                "X-Nexus-Agent requires X-Nexus-Capability; "
-                "requester-only HTTP identity is no longer supported.",
-            )
             await send_http_response(writer, 400, serialize_response(error_response))
-            return
-
-        try:
-            rpc_response = await dispatcher.dispatch(
-                rpc_request,
-                requester_id,
-                capability_token=capability_token,
-            )
-        except Exception as e:
-            # Unexpected error during dispatch
-            error_response = make_error_response(
-                rpc_request.id,
-                INTERNAL_ERROR,
-                f"Internal error: {type(e).__name__}: {e}",
+        except Exception as send_err:
+            logger.debug(
+                "Failed to send error response (client disconnected?): %s", send_err
             )
-            await send_http_response(writer, 500, serialize_response(error_response))
-            return
-
-        # Layer 8: Send response
-        if rpc_response is not None:
-            await send_http_response(writer, 200, serialize_response(rpc_response))
-        else:
-            # Notification - no response body, but still need HTTP response
-            await send_http_response(writer, 200, "")
 
     except Exception as e:
         # Catch-all for any unexpected errors
@@ -651,6 +869,178 @@ async def handle_connection(
             logger.debug("Connection close failed (already closed?): %s", close_err)
 
 
+async def _serve_request(
+    http_request: HttpRequest,
+    writer: asyncio.StreamWriter,
+    pool: AgentPool,
+    global_dispatcher: GlobalDispatcher,
+    api_key: str | None,
+    session_manager: SessionManager | None,
+    keep_alive: str | None,
+) -> bool:
+    """Run layers 2-8 for one parsed request and send exactly one response.
+
+    Args:
+        keep_alive: Keep-Alive header value if the connection stays open
+            after this response, else None.
+
+    Returns:
+        False if the response left the connection unusable for another
+        request (a streamed body that was unframed or cut short).
+    """
+
+    async def respond(status: int, body: str) -> None:
+        await send_http_response(writer, status, body, keep_alive=keep_alive)
+
+    # Layer 2: Validate HTTP method (POST only)
+    if http_request.method != "POST":
+        error_response = make_error_response(
+            None, INVALID_REQUEST, "Method not allowed. Use POST."
+        )
+        await respond(405, serialize_response(error_response))
+        return True
+
+    # Layer 3: Authenticate request
+    auth_error, auth_status = _authenticate_request(http_request, api_key)
+    if auth_error is not None:
+        await respond(auth_status, serialize_response(auth_error))
+        return True
+
+    # Layer 4: Route to dispatcher
+    dispatcher, agent_id, route_error, route_status = _route_to_dispatcher(
+        http_request.path, pool, global_dispatcher
+    )
+    if route_error is not None:
+        await respond(route_status, serialize_response(route_error))
+        return True
+
+    # Layer 5: Restore agent if needed (dispatcher is None but agent_id is set)
+    if dispatcher is None and agent_id is not None:
+        dispatcher, restore_error, restore_status = await _restore_agent_if_needed(
+            agent_id, pool, session_manager
+        )
+        if restore_error is not None:
+            await respond(restore_status, serialize_response(restore_error))
+            return True
+
+    # Safety check: dispatcher must be set by now
+    assert dispatcher is not None, "dispatcher should be set after routing/restore"
+
+    # Layer 6: Parse JSON-RPC request (single object or batch array)
+    try:
+        rpc_request = parse_batch_request(http_request.body, MAX_BATCH_SIZE)
+    except ParseError as e:
+        error_response = make_error_response(None, PARSE_ERROR, str(e))
+        await respond(400, serialize_response(error_response))
+        return True
+
+    # Layer 7: Dispatch to handler
+    # Extract requester/capability identity headers for authorization.
+    requester_id = http_request.headers.get("x-nexus-agent")
+    has_capability_header = "x-nexus-capability" in http_request.headers
+    capability_token = http_request.headers.get("x-nexus-capability")
+    if requester_id is not None and not has_capability_header:
+        error_response = make_error_response(
+            rpc_request.id if not isinstance(rpc_request, list) else None,
+            INVALID_PARAMS,
+            "X-Nexus-Agent requires X-Nexus-Capability; "
+            "requester-only HTTP identity is no longer supported.",
+        )
+        await respond(400, serialize_response(error_response))
+        return True
+
+    if isinstance(rpc_request, list):
+        responses = await dispatcher.dispatch_batch(
+            rpc_request,
+            requester_id,
+            capability_token=capability_token,
+        )
+        # A batch of only notifications gets an empty body
+        await respond(200, serialize_batch_response(responses) if responses else "")
+        return True
+
+    if agent_id is not None and _wants_stream(rpc_request):
+        return await _serve_streamed_send(
+            http_request,
+            writer,
+            cast("StreamingDispatcher", dispatcher),
+            rpc_request,
+            requester_id,
+            capability_token,
+            keep_alive,
+        )
+
+    try:
+        rpc_response = await dispatcher.dispatch(
+            rpc_request,
+            requester_id,
+            capability_token=capability_token,
+        )
+    except Exception as e:
+        # Unexpected error during dispatch
+        error_response = make_error_response(
+            rpc_request.id,
+            INTERNAL_ERROR,
+            f"Internal error: {type(e).__name__}: {e}",
+        )
+        await respond(500, serialize_response(error_response))
+        return True
+
+    # Layer 8: Send response
+    if rpc_response is not None:
+        await respond(200, serialize_response(rpc_response))
+    else:
+        # Notification - no response body, but still need HTTP response
+        await respond(200, "")
+    return True
+
+
+async def _serve_streamed_send(
+    http_request: HttpRequest,
+    writer: asyncio.StreamWriter,
+    dispatcher: StreamingDispatcher,
+    rpc_request: Request,
+    requester_id: str | None,
+    capability_token: str | None,
+    keep_alive: str | None,
+) -> bool:
+    """Layers 7-8 for a streamed 'send': dispatch while emitting SSE frames.
+
+    Headers go out before dispatch, so errors (including authorization
+    failures) arrive as the JSON-RPC response in the ``result`` frame.
+
+    Returns:
+        Whether the connection can serve another request.
+    """
+    stream = SseResponse(
+        writer,
+        chunked=http_request.version == "HTTP/1.1",
+        keep_alive=keep_alive,
+    )
+    await stream.start()
+    try:
+        rpc_response = await dispatcher.dispatch(
+            rpc_request,
+            requester_id,
+            capability_token=capability_token,
+            emit=stream.send,
+        )
+    except Exception as e:
+        rpc_response = make_error_response(
+            rpc_request.id,
+            INTERNAL_ERROR,
+            f"Internal error: {type(e).__name__}: {e}",
+        )
+    if stream.failed:
+        return False
+    try:
+        await stream.finish(rpc_response)
+    except (ConnectionError, TimeoutError) as e:
+        logger.debug("Streamed response not delivered: %s", e)
+        return False
+    return stream.reusable
+
+
 async def run_http_server(
     pool: AgentPool,
     global_dispatcher: GlobalDispatcher,
@@ -662,6 +1052,8 @@ async def run_http_server(
     idle_timeout: float | None = None,
     started_event: asyncio.Event | None = None,
     activity_tracker: ServerActivityTracker | None = None,
+    keep_alive_timeout: float | None = KEEP_ALIVE_TIMEOUT,
+    max_requests_per_connection: int = MAX_KEEP_ALIVE_REQUESTS,
 ) -> None:
     """Run the HTTP server for JSON-RPC requests with path-based routing.
 
@@ -699,6 +1091,10 @@ async def run_http_server(
         activity_tracker: Optional shared activity tracker. When provided, both
                       HTTP traffic and external callers (for example the direct
                       REPL path) can refresh the same idle timeout state.
+        keep_alive_timeout: Seconds an idle persistent connection is held open.
+                      None disables keep-alive (one request per connection).
+        max_requests_per_connection: Requests served on one persistent
+                      connection before the server closes it.
     """
     # Security: Force localhost binding
     if host not in ("127.0.0.1", "localhost", "::1"):
@@ -713,18 +1109,38 @@ async def run_http_server(
     # (immune to wall clock jumps from NTP sync, WSL time sync, suspend/resume)
     tracker = activity_tracker or ServerActivityTracker()
 
+    keep_alive = (
+        KeepAlivePolicy(
+            idle_timeout=keep_alive_timeout,
+            max_requests=max_requests_per_connection,
+        )
+        if keep_alive_timeout is not None
+        else None
+    )
+
     async def client_handler(
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
     ) -> None:
         tracker.touch()  # Reset idle timer on each connection
 
+        # All slots taken: reclaim the ones held by idle keep-alive connections
+        if keep_alive is not None and semaphore.locked():
+            keep_alive.close_idle()
+
         # Use try/finally to ensure writer is always closed (fixes connection leak)
         try:
             async with semaphore:
-                # Read and handle the full HTTP request under semaphore protection
+                # Read and handle the connection's requests under semaphore protection
                 await handle_connection(
-                    reader, writer, pool, global_dispatcher, api_key, session_manager
+                    reader,
+                    writer,
+                    pool,
+                    global_dispatcher,
+                    api_key,
+                    session_manager,
+                    keep_alive=keep_alive,
+                    activity_tracker=tracker,
                 )
                 return  # Writer already closed by handle_connection
         finally:
@@ -768,7 +1184,10 @@ async def run_http_server(
 
             await asyncio.sleep(0.1)
 
-        # Graceful shutdown
+        # Graceful shutdown: idle keep-alive connections would otherwise hold
+        # wait_closed() open until their idle timeout.
+        if keep_alive is not None:
+            keep_alive.close_idle()
         server.close()
         await server.wait_closed()
         logger.info("HTTP server stopped")
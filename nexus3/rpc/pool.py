@@ -46,7 +46,15 @@ from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
 from nexus3.clipboard import CLIPBOARD_PRESETS, ClipboardManager
-from nexus3.context import ContextConfig, ContextLoader, ContextManager, LoadedContext
+from nexus3.context import (
+    ContextConfig,
+    ContextLoader,
+    ContextManager,
+    LoadedContext,
+    describe_token_counter,
+    get_token_calibration,
+    get_token_counter_for_model,
+)
 from nexus3.core.authorization_kernel import (
     AdapterAuthorizationKernel,
     CreateAuthorizationStage,
@@ -57,6 +65,7 @@ from nexus3.core.capabilities import (
     InMemoryCapabilityRevocationStore,
     generate_capability_secret,
 )
+from nexus3.core.dir_cache import DirectoryCache, get_directory_cache
 from nexus3.core.permissions import (
     AgentPermissions,
     PermissionDelta,
@@ -276,6 +285,7 @@ class SharedComponents:
         log_streams: Log streams to enable (defaults to ALL for backwards compatibility).
         custom_presets: Custom permission presets loaded from config.
         mcp_registry: MCP server registry for external tool integration.
+        directory_cache: Directory listing cache shared by the file skills.
         is_repl: Whether running in REPL mode (affects context loading during compaction).
     """
 
@@ -287,6 +297,7 @@ class SharedComponents:
     log_streams: LogStream = LogStream.ALL
     custom_presets: dict[str, PermissionPreset] = field(default_factory=dict)
     mcp_registry: MCPServerRegistry = field(default_factory=MCPServerRegistry)
+    directory_cache: DirectoryCache = field(default_factory=get_directory_cache)
     is_repl: bool = False
 
 
@@ -580,6 +591,7 @@ class AgentPool:
             base_dir=agent_log_dir,
             streams=self._shared.log_streams,
             mode="agent",
+            storage=self._shared.config.session_storage,
         )
         logger = SessionLogger(log_config)
         logger.storage.set_metadata("agent_id", effective_id)
@@ -754,6 +766,7 @@ class AgentPool:
         services.set_permissions(permissions)
         services.set_model(resolved_model)  # ResolvedModel for model hotswapping
         services.register("mcp_registry", self._shared.mcp_registry)
+        services.register("directory_cache", self._shared.directory_cache)
         # Per-agent cwd for isolation (avoids global os.chdir)
         agent_cwd = effective_config.cwd or Path.cwd()
         services.set_cwd(agent_cwd)
@@ -778,12 +791,17 @@ class AgentPool:
         context_config = ContextConfig(
             max_tokens=resolved_model.context_window,
         )
+        token_counter = get_token_counter_for_model(resolved_model)
         context = ContextManager(
             config=context_config,
+            token_counter=token_counter,
             logger=logger,
             agent_id=effective_id,
             clipboard_manager=clipboard_manager,
             clipboard_config=self._shared.config.clipboard,
+            calibration=get_token_calibration(
+                resolved_model, describe_token_counter(token_counter)
+            ),
         )
         context.set_system_prompt(system_prompt)
 
@@ -800,7 +818,7 @@ class AgentPool:
         )
 
         # Initialize git repository context
-        context.refresh_git_context(agent_cwd)
+        await context.refresh_git_context_async(agent_cwd)
 
         # Register GitLab config for VCS skills
         gitlab_config = _convert_gitlab_config(self._shared.config)
@@ -1003,6 +1021,7 @@ class AgentPool:
             custom_presets=dict(self._shared.custom_presets),
             mcp_registry=self._shared.mcp_registry,
             is_repl=self._shared.is_repl,
+            directory_cache=self._shared.directory_cache,
         )
         runtime_deps = RestoreRuntimeDeps(
             agents=self._agents,
@@ -1049,6 +1068,7 @@ class AgentPool:
             custom_presets=dict(self._shared.custom_presets),
             mcp_registry=self._shared.mcp_registry,
             is_repl=self._shared.is_repl,
+            directory_cache=self._shared.directory_cache,
         )
         runtime_deps = RestoreRuntimeDeps(
             agents=self._agents,
@@ -121,6 +121,9 @@ class SessionLike(Protocol):
     halted_at_iteration_limit: bool
     last_action_at: datetime | None
 
+    async def close(self) -> None:
+        """Stop background work before teardown."""
+
 
 class AgentLike(Protocol):
     """Minimal Agent shape used by lifecycle helpers."""
@@ -317,6 +320,7 @@ async def destroy_unlocked(
                 parent.services.set_child_agent_ids(updated_child_ids)
 
     await agent.dispatcher.cancel_all_requests()
+    await agent.session.close()
     unregister_log_multiplexer_agent_fn(agent_id)
 
     clipboard_manager = agent.services.get("clipboard_manager")
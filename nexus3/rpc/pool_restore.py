@@ -10,13 +10,21 @@ from __future__ import annotations
 import asyncio
 import os
 from collections.abc import MutableMapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
 
 from nexus3.clipboard import CLIPBOARD_PRESETS, ClipboardManager
-from nexus3.context import ContextConfig, ContextLoader, ContextManager
+from nexus3.context import (
+    ContextConfig,
+    ContextLoader,
+    ContextManager,
+    describe_token_counter,
+    get_token_calibration,
+    get_token_counter_for_model,
+)
+from nexus3.core.dir_cache import DirectoryCache, get_directory_cache
 from nexus3.core.permissions import (
     AgentPermissions,
     PermissionDelta,
@@ -30,7 +38,10 @@ from nexus3.rpc.dispatcher import Dispatcher
 from nexus3.rpc.log_multiplexer import LogMultiplexer
 from nexus3.rpc.pool_visibility import _convert_gitlab_config
 from nexus3.session import LogConfig, LogStream, SavedSession, Session, SessionLogger
-from nexus3.session.persistence import deserialize_clipboard_entries, deserialize_messages
+from nexus3.session.persistence import (
+    deserialize_clipboard_entries,
+    deserialize_messages_with_tokens,
+)
 from nexus3.session.trace import write_active_agent_session
 from nexus3.skill import ServiceContainer, SkillRegistry
 from nexus3.skill.vcs import register_vcs_skills
@@ -39,7 +50,7 @@ AgentT = TypeVar("AgentT")
 AgentCo = TypeVar("AgentCo", covariant=True)
 
 if TYPE_CHECKING:
-    from nexus3.config.schema import Config
+    from nexus3.config.schema import Config, SessionStorageConfig
     from nexus3.provider.registry import ProviderRegistry
 
 
@@ -128,6 +139,7 @@ class LoggerFactory(Protocol):
         base_log_dir: Path,
         log_streams: LogStream,
         log_multiplexer: LogMultiplexer,
+        storage: SessionStorageConfig | None = None,
     ) -> SessionLogger:
         """Build a logger and register any raw callback routing."""
 
@@ -144,6 +156,7 @@ class RestoreSharedDeps:
     custom_presets: dict[str, PermissionPreset]
     mcp_registry: MCPServerRegistry
     is_repl: bool = False
+    directory_cache: DirectoryCache = field(default_factory=get_directory_cache)
 
 
 @dataclass
@@ -170,10 +183,13 @@ def default_logger_factory(
     base_log_dir: Path,
     log_streams: LogStream,
     log_multiplexer: LogMultiplexer,
+    storage: SessionStorageConfig | None = None,
 ) -> SessionLogger:
     """Default logger factory preserving AgentPool restore behavior."""
     agent_log_dir = base_log_dir / agent_id
-    log_config = LogConfig(base_dir=agent_log_dir, streams=log_streams, mode="agent")
+    log_config = LogConfig(
+        base_dir=agent_log_dir, streams=log_streams, mode="agent", storage=storage
+    )
     logger = SessionLogger(log_config)
 
     raw_callback = logger.get_raw_log_callback()
@@ -244,6 +260,7 @@ async def _restore_unlocked(
         base_log_dir=shared.base_log_dir,
         log_streams=shared.log_streams,
         log_multiplexer=runtime.log_multiplexer,
+        storage=shared.config.session_storage,
     )
     provenance = getattr(saved, "provenance", "user")
     parent_agent_id = provenance if provenance != "user" else None
@@ -278,6 +295,7 @@ async def _restore_unlocked(
     services.register("agent_id", agent_id)
     services.set_permissions(permissions)
     services.register("mcp_registry", shared.mcp_registry)
+    services.register("directory_cache", shared.directory_cache)
     services.set_model(resolved_model)
 
     agent_cwd = Path(saved.working_directory) if saved.working_directory else Path.cwd()
@@ -303,20 +321,26 @@ async def _restore_unlocked(
         clipboard_manager.restore_agent_entries(entries)
 
     context_config = ContextConfig(max_tokens=resolved_model.context_window)
+    token_counter = get_token_counter_for_model(resolved_model)
     context = ContextManager(
         config=context_config,
+        token_counter=token_counter,
         logger=logger,
         agent_id=agent_id,
         clipboard_manager=clipboard_manager,
         clipboard_config=shared.config.clipboard,
+        calibration=get_token_calibration(resolved_model, describe_token_counter(token_counter)),
     )
     context.set_system_prompt(system_prompt)
 
-    messages = deserialize_messages(saved.messages)
-    for msg in messages:
-        context._messages.append(msg)
+    messages, token_counts = deserialize_messages_with_tokens(saved.messages)
+    # Stored counts are only reused when produced by the same token counter.
+    if getattr(saved, "token_counter", None) == context.token_counter_id:
+        context.restore_messages(messages, token_counts)
+    else:
+        context.restore_messages(messages)
 
-    context.refresh_git_context(agent_cwd)
+    await context.refresh_git_context_async(agent_cwd)
 
     gitlab_config = _convert_gitlab_config(shared.config)
     if gitlab_config:
@@ -43,7 +43,51 @@ def parse_request(line: str) -> Request:
         data = json.loads(line)
     except json.JSONDecodeError as e:
         raise ParseError(f"Invalid JSON: {e}") from e
+    return _request_from_data(data)
 
+
+def parse_batch_request(text: str, max_size: int) -> Request | list[Request | Response]:
+    """Parse a JSON-RPC 2.0 payload that may be a single request or a batch.
+
+    A JSON object parses exactly like parse_request(). A JSON array is a
+    batch: each element becomes a Request, or an INVALID_REQUEST error
+    Response (id null) if that element is malformed, so one bad entry does
+    not reject the rest.
+
+    Args:
+        text: The request body.
+        max_size: Maximum number of requests accepted in one batch.
+
+    Returns:
+        A Request for a single object, or a list for a batch.
+
+    Raises:
+        ParseError: If the JSON is invalid, a single request is malformed,
+            or the batch is empty or larger than max_size.
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ParseError(f"Invalid JSON: {e}") from e
+
+    if not isinstance(data, list):
+        return _request_from_data(data)
+    if not data:
+        raise ParseError("Batch must contain at least one request")
+    if len(data) > max_size:
+        raise ParseError(f"Batch too large: {len(data)} requests (max {max_size})")
+
+    items: list[Request | Response] = []
+    for entry in data:
+        try:
+            items.append(_request_from_data(entry))
+        except ParseError as e:
+            items.append(make_error_response(None, INVALID_REQUEST, str(e)))
+    return items
+
+
+def _request_from_data(data: Any) -> Request:
+    """Validate decoded JSON as a single JSON-RPC 2.0 Request."""
     # Validate it's an object
     if not isinstance(data, dict):
         raise ParseError("Request must be a JSON object")
@@ -124,6 +168,11 @@ def serialize_response(response: Response) -> str:
     return json.dumps(data, separators=(",", ":"))
 
 
+def serialize_batch_response(responses: list[Response]) -> str:
+    """Serialize batch responses to a JSON array (no trailing newline)."""
+    return "[" + ",".join(serialize_response(r) for r in responses) + "]"
+
+
 def make_error_response(
     request_id: str | int | None,
     code: int,
@@ -215,7 +264,33 @@ def parse_response(line: str) -> Response:
         data = json.loads(line)
     except json.JSONDecodeError as e:
         raise ParseError(f"Invalid JSON: {e}") from e
+    return _response_from_data(data)
+
+
+def parse_batch_response(text: str) -> list[Response]:
+    """Parse a JSON-RPC 2.0 batch response (a JSON array of responses).
+
+    Args:
+        text: The response body.
+
+    Returns:
+        The parsed Responses, in server order.
+
+    Raises:
+        ParseError: If the body is not a JSON array of valid responses.
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ParseError(f"Invalid JSON: {e}") from e
+    if not isinstance(data, list):
+        # A batch rejected as a whole is answered with a single error object
+        raise ParseError(f"Batch rejected: {_response_from_data(data).error}")
+    return [_response_from_data(entry) for entry in data]
+
 
+def _response_from_data(data: Any) -> Response:
+    """Validate decoded JSON as a single JSON-RPC 2.0 Response."""
     # Validate it's an object
     if not isinstance(data, dict):
         raise ParseError("Response must be a JSON object")
@@ -97,6 +97,7 @@ class SendParamsSchema(StrictSchemaModel):
     request_id: JsonRpcId | None = None
     source: str | None = None
     source_agent_id: str | int | None = None
+    stream: bool = False
 
     @field_validator("request_id", mode="before")
     @classmethod
@@ -138,6 +139,12 @@ class CompactParamsSchema(StrictSchemaModel):
     force: bool = True
 
 
+class GetTokensParamsSchema(StrictSchemaModel):
+    """Params schema for dispatcher.get_tokens."""
+
+    per_tool: bool = False
+
+
 class GetMessagesParamsSchema(StrictSchemaModel):
     """Params schema for dispatcher.get_messages."""
 
@@ -216,7 +223,7 @@ RPC_AGENT_METHOD_PARAM_SCHEMAS: dict[str, type[StrictSchemaModel]] = {
     "shutdown": EmptyParamsSchema,
     "cancel": CancelParamsSchema,
     "compact": CompactParamsSchema,
-    "get_tokens": EmptyParamsSchema,
+    "get_tokens": GetTokensParamsSchema,
     "get_context": EmptyParamsSchema,
     "get_messages": GetMessagesParamsSchema,
 }
@@ -323,6 +330,7 @@ __all__ = [
     "DestroyAgentParamsSchema",
     "EmptyParamsSchema",
     "GetMessagesParamsSchema",
+    "GetTokensParamsSchema",
     "JsonRpcId",
     "MCPConfigEnvelopeSchema",
     "MCPServerEntryNoNameSchema",
@@ -30,6 +30,7 @@ from nexus3.session.persistence import (
     SessionSummary,
     deserialize_message,
     deserialize_messages,
+    deserialize_messages_with_tokens,
     serialize_message,
     serialize_messages,
     serialize_session,
@@ -68,6 +69,7 @@ __all__ = [
     "deserialize_message",
     "serialize_messages",
     "deserialize_messages",
+    "deserialize_messages_with_tokens",
     "serialize_session",
     # Session Manager
     "SessionManager",
@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
-from nexus3.context.compaction import build_summarize_prompt
+from nexus3.context.compaction import (
+    batch_summaries,
+    build_chunk_summarize_prompt,
+    build_condense_prompt,
+    build_incremental_summarize_prompt,
+    build_merge_prompt,
+    build_summarize_prompt,
+    create_summary_message,
+    get_summary_text,
+    is_summary_message,
+    split_for_summary,
+)
+from nexus3.context.graph import build_context_graph
+from nexus3.context.token_counter import TokenCounter, get_token_counter_for_model
 from nexus3.core.interfaces import AsyncProvider
 from nexus3.core.types import Message, Role
 from nexus3.session.http_logging import clear_current_logger, set_current_logger
 
 if TYPE_CHECKING:
     from nexus3.config.schema import CompactionConfig, Config
+    from nexus3.context.manager import ContextManager
     from nexus3.session.logging import SessionLogger
 
+logger = logging.getLogger(__name__)
+
 
 class _CompactionRuntimeSession(Protocol):
     """Session shape required by compaction runtime helpers."""
 
     provider: AsyncProvider
     logger: SessionLogger | None
+    context: ContextManager | None
     _config: Config | None
     _compaction_provider: AsyncProvider | None
 
@@ -44,14 +64,108 @@ def get_compaction_provider(session: _CompactionRuntimeSession) -> AsyncProvider
     return session._compaction_provider
 
 
+def get_compaction_limits(
+    session: _CompactionRuntimeSession,
+    compaction_config: CompactionConfig,
+) -> tuple[TokenCounter, int] | None:
+    """Return (token counter, request token budget) of the compaction model.
+
+    The budget is the request_budget_ratio of the compaction model's context
+    window, or of the session's own window when no separate model is
+    configured. Returns None when the window is unknown.
+    """
+    compaction_model = compaction_config.model
+    if session._config is not None and compaction_model is not None:
+        resolved = session._config.resolve_model(compaction_model)
+        counter = get_token_counter_for_model(resolved)
+        window = resolved.context_window
+    elif session.context is not None:
+        counter = session.context.token_counter
+        window = session.context.config.max_tokens
+    else:
+        return None
+    return counter, int(window * compaction_config.request_budget_ratio)
+
+
+async def _complete(provider: AsyncProvider, prompt: str) -> str:
+    """Send one summarization prompt and return the response text."""
+    response = await provider.complete([Message(role=Role.USER, content=prompt)], tools=None)
+    return response.content
+
+
+async def _summarize_chunked(
+    provider: AsyncProvider,
+    messages: list[Message],
+    token_counter: TokenCounter,
+    request_budget: int,
+    max_parallel: int,
+    previous_summary: str | None = None,
+) -> str:
+    """Summarize chunks concurrently, then merge the partial summaries.
+
+    A previous summary, if given, is merged in as the first part.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def complete(prompt: str) -> str:
+        async with semaphore:
+            return await _complete(provider, prompt)
+
+    # Leave room for the instructions around each chunk and merge batch
+    overhead = token_counter.count(build_chunk_summarize_prompt([], 1, 1))
+    chunks = split_for_summary(messages, token_counter, max(request_budget - overhead, 1))
+    summaries = list(
+        await asyncio.gather(
+            *(
+                complete(build_chunk_summarize_prompt(chunk, i, len(chunks)))
+                for i, chunk in enumerate(chunks, 1)
+            )
+        )
+    )
+    if previous_summary is not None:
+        summaries.insert(0, previous_summary)
+
+    overhead = token_counter.count(build_merge_prompt([]))
+    while len(summaries) > 1:
+        batches = batch_summaries(summaries, token_counter, max(request_budget - overhead, 1))
+        summaries = list(
+            await asyncio.gather(*(complete(build_merge_prompt(batch)) for batch in batches))
+        )
+    return summaries[0] if summaries else ""
+
+
 async def generate_summary(
     session: _CompactionRuntimeSession,
     messages: list[Message],
     compaction_config: CompactionConfig,
 ) -> str:
-    """Generate a compaction summary using the configured provider."""
-    prompt = build_summarize_prompt(messages)
-    summary_messages = [Message(role=Role.USER, content=prompt)]
+    """Generate a compaction summary using the configured provider.
+
+    Histories whose prompt exceeds the compaction model's request budget are
+    split along message group boundaries, summarized in parallel (at most
+    max_parallel_summaries requests at once) and merged hierarchically.
+
+    With the incremental strategy, a previous summary at the start of
+    messages is kept as a fixed prefix: only the messages after it are
+    summarized into it, and the result is condensed if it exceeds
+    summary_budget_ratio of the available context.
+    """
+    previous_summary = None
+    if compaction_config.strategy == "incremental" and messages:
+        if is_summary_message(messages[0]):
+            previous_summary = get_summary_text(messages[0])
+            messages = messages[1:]
+
+    summary_budget = None
+    if previous_summary is not None and session.context is not None:
+        available = session.context.get_token_usage()["available"]
+        summary_budget = int(available * compaction_config.summary_budget_ratio)
+
+    if previous_summary is None:
+        prompt = build_summarize_prompt(messages)
+    else:
+        prompt = build_incremental_summarize_prompt(previous_summary, messages, summary_budget)
+    limits = get_compaction_limits(session, compaction_config)
 
     # Keep logger lifecycle identical to Session-local implementation.
     if session.logger:
@@ -59,7 +173,120 @@ async def generate_summary(
 
     try:
         provider = get_compaction_provider(session)
-        response = await provider.complete(summary_messages, tools=None)
-        return response.content
+        if previous_summary is not None and not messages:
+            summary = previous_summary
+        elif limits is not None and limits[0].count(prompt) > limits[1]:
+            token_counter, request_budget = limits
+            summary = await _summarize_chunked(
+                provider,
+                messages,
+                token_counter,
+                request_budget,
+                compaction_config.max_parallel_summaries,
+                previous_summary,
+            )
+        else:
+            summary = await _complete(provider, prompt)
+
+        # Keep the rolling summary bounded
+        if (
+            summary_budget is not None
+            and session.context is not None
+            and session.context.token_counter.count(summary) > summary_budget
+        ):
+            summary = await _complete(provider, build_condense_prompt(summary, summary_budget))
+        return summary
     finally:
         clear_current_logger()
+
+
+@dataclass
+class Precompaction:
+    """A summary of older history being generated in the background.
+
+    Attributes:
+        summarized: The normalized message prefix being summarized.
+        task: Task producing the summary text.
+    """
+
+    summarized: tuple[Message, ...]
+    task: asyncio.Task[str]
+
+    def matches(self, messages: list[Message]) -> bool:
+        """True if context messages still start with the summarized prefix."""
+        return self._matches_normalized(list(build_context_graph(messages).messages))
+
+    def failed(self) -> bool:
+        """True if the background summary ended without a result."""
+        return self.task.done() and (
+            self.task.cancelled() or self.task.exception() is not None
+        )
+
+    def _matches_normalized(self, normalized: list[Message]) -> bool:
+        n = len(self.summarized)
+        return len(normalized) > n and tuple(normalized[:n]) == self.summarized
+
+    def cancel(self) -> None:
+        """Stop the background summary if it is still running."""
+        self.task.cancel()
+
+
+def _retrieve_exception(task: asyncio.Task[str]) -> None:
+    """Mark a background summary's failure as seen; it is reported on claim."""
+    if not task.cancelled():
+        task.exception()
+
+
+def start_precompaction(
+    session: _CompactionRuntimeSession,
+    to_summarize: list[Message],
+    compaction_config: CompactionConfig,
+) -> Precompaction:
+    """Start summarizing messages in the background on the compaction provider."""
+    task = asyncio.create_task(generate_summary(session, to_summarize, compaction_config))
+    task.add_done_callback(_retrieve_exception)
+    return Precompaction(summarized=tuple(to_summarize), task=task)
+
+
+async def claim_precompaction(
+    precompaction: Precompaction,
+    messages: list[Message],
+    token_counter: TokenCounter,
+    max_message_tokens: int,
+) -> tuple[str, list[Message]] | None:
+    """Use a background summary for compaction if it is still valid.
+
+    Waits for the summary if it is still being generated. It is only used
+    when the summarized prefix is unchanged and the summary plus the newer
+    messages fit in max_message_tokens.
+
+    Args:
+        precompaction: The background summary to claim.
+        messages: Current context messages.
+        token_counter: Token counter implementation.
+        max_message_tokens: Token budget for the compacted message list.
+
+    Returns:
+        Tuple of (summary text, messages to preserve), or None if the caller
+        should summarize synchronously instead.
+    """
+    normalized = list(build_context_graph(messages).messages)
+    if not precompaction._matches_normalized(normalized):
+        precompaction.cancel()
+        return None
+
+    try:
+        summary_text = await asyncio.shield(precompaction.task)
+    except asyncio.CancelledError:
+        if not precompaction.task.cancelled():
+            raise
+        return None
+    except Exception as e:
+        logger.debug("Background pre-compaction failed: %s", e)
+        return None
+
+    preserved = normalized[len(precompaction.summarized):]
+    summary_message = create_summary_message(summary_text)
+    if token_counter.count_messages([summary_message, *preserved]) > max_message_tokens:
+        return None
+    return summary_text, preserved
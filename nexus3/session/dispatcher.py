@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nexus3.core.types import ToolCall
+    from nexus3.core.validation import CompiledSchema
     from nexus3.mcp.registry import MCPServerRegistry
     from nexus3.mcp.skill_adapter import MCPSkillAdapter
     from nexus3.skill.base import Skill
@@ -54,6 +55,17 @@ class ToolDispatcher:
 
         return (None, None)
 
+    def get_validator(self, tool_call: ToolCall) -> CompiledSchema | None:
+        """Get the registry's precompiled argument validator for a tool call.
+
+        Returns:
+            The CompiledSchema of a built-in skill, or None for MCP tools and
+            skills whose schema is not compiled.
+        """
+        if self._registry:
+            return self._registry.get_validator(tool_call.name)
+        return None
+
     def _find_mcp_skill(self, tool_name: str) -> tuple[MCPSkillAdapter, str] | None:
         """Find MCP skill by name.
 
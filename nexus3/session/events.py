@@ -151,6 +151,8 @@ class ToolCompleted(SessionEvent):
         success: True if tool executed without error.
         error: Error message if success is False, empty string otherwise.
         output: Tool output if success is True, empty string otherwise.
+        validation_ms: Time spent validating arguments against the skill's
+            schema, 0.0 if the call never reached validation.
         timestamp: Unix timestamp when event was created.
     """
 
@@ -159,6 +161,7 @@ class ToolCompleted(SessionEvent):
     success: bool
     error: str = ""
     output: str = ""
+    validation_ms: float = 0.0
     timestamp: float = field(default_factory=time.time)
 
 
@@ -0,0 +1,241 @@
+"""Buffered, thread-backed sink for session log files.
+
+MarkdownWriter and RawWriter normally call ``secure_append`` per entry: an
+open/write/close triple on the event loop for every log line, and for raw
+logging for every streamed chunk. A BufferedLogSink instead keeps one
+``O_NOFOLLOW`` descriptor open per file and hands entries to a worker thread,
+which coalesces everything queued within the flush interval into a single
+``os.write`` per file.
+
+Symlink guarantees match ``secure_append``: each file is opened with
+``secure_open_append`` on the caller's thread at its first write, so a symlink
+at that point raises SymlinkError to the caller. Later writes go to the
+descriptor, which cannot be redirected by replacing the path.
+
+Memory is bounded: entries that would push the queued total past
+``max_buffered_bytes`` are dropped and counted, never blocked on.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+
+from nexus3.core.secure_io import secure_append, secure_open_append
+
+logger = logging.getLogger(__name__)
+
+# Default cap on bytes queued but not yet written (per sink).
+DEFAULT_MAX_BUFFERED_BYTES = 8 * 1024 * 1024
+
+_STOP = object()
+
+# How often a blocked flush() re-checks that the worker thread is still alive
+_FLUSH_POLL_SECONDS = 0.5
+
+# Open sinks, written out by one interpreter-exit hook. A WeakSet rather than
+# one atexit registration per sink, so pools that create many loggers do not
+# accumulate hooks (or keep closed sinks alive through them).
+_OPEN_SINKS: "weakref.WeakSet[BufferedLogSink]" = weakref.WeakSet()
+
+
+def _close_open_sinks() -> None:
+    for sink in list(_OPEN_SINKS):
+        sink.close()
+
+
+atexit.register(_close_open_sinks)
+
+
+@dataclass(frozen=True)
+class LogSinkStats:
+    """Counters for a BufferedLogSink."""
+
+    written_bytes: int
+    """Bytes written to disk."""
+
+    dropped_bytes: int
+    """Bytes discarded because the buffer was full."""
+
+    failed_bytes: int
+    """Bytes lost to write errors (e.g. disk full)."""
+
+    pending_bytes: int
+    """Bytes queued but not yet written."""
+
+
+class BufferedLogSink:
+    """Append-only log sink with per-file descriptors and a writer thread."""
+
+    def __init__(
+        self,
+        flush_interval: float = 0.1,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        name: str = "session",
+    ) -> None:
+        """Start the sink's worker thread.
+
+        Args:
+            flush_interval: Maximum seconds a queued entry waits before it is
+                written, unless flush() is called sooner.
+            max_buffered_bytes: Cap on queued bytes; further entries are dropped.
+            name: Label for the worker thread.
+        """
+        self._flush_interval = flush_interval
+        self._max_buffered_bytes = max_buffered_bytes
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._fds: dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._pending = 0
+        self._warned_overflow = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"nexus3-log-sink:{name}", daemon=True
+        )
+        self._thread.start()
+        # Daemon thread: write out whatever is queued on normal interpreter exit.
+        _OPEN_SINKS.add(self)
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def stats(self) -> LogSinkStats:
+        """Snapshot of the sink's counters."""
+        with self._lock:
+            return LogSinkStats(
+                written_bytes=self._written,
+                dropped_bytes=self._dropped,
+                failed_bytes=self._failed,
+                pending_bytes=self._pending,
+            )
+
+    def write(self, path: Path, content: str | bytes) -> None:
+        """Queue content to be appended to path.
+
+        After close(), falls back to a direct ``secure_append``.
+
+        Raises:
+            SymlinkError: If path is a symlink when first opened.
+            OSError: If the file cannot be opened.
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        if not data:
+            return
+        fd = self._fds.get(path)
+        if fd is None and not self._closed:
+            fd = secure_open_append(path)
+            with self._lock:
+                existing = self._fds.setdefault(path, fd) if not self._closed else None
+            if existing != fd:
+                os.close(fd)
+                fd = existing
+        warn = False
+        with self._lock:
+            if self._closed or fd is None:
+                queued = False
+            elif self._pending + len(data) > self._max_buffered_bytes:
+                queued = True
+                self._dropped += len(data)
+                warn = not self._warned_overflow
+                self._warned_overflow = True
+            else:
+                queued = True
+                self._pending += len(data)
+                self._queue.put((fd, data))
+        if not queued:
+            secure_append(path, data)
+        elif warn:
+            logger.warning(
+                "Log buffer full (%d bytes); dropping entries for %s",
+                self._max_buffered_bytes,
+                path,
+            )
+
+    def flush(self, wait: bool = True) -> None:
+        """Write everything queued so far.
+
+        Args:
+            wait: Block until written. With False the worker is only woken,
+                which is what the event loop should use at turn end.
+        """
+        if self._closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        if wait:
+            while not done.wait(_FLUSH_POLL_SECONDS):
+                if not self._thread.is_alive():
+                    return
+
+    def close(self) -> None:
+        """Write out queued entries, stop the worker and close descriptors."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        _OPEN_SINKS.discard(self)
+        try:
+            self._thread.join()
+        finally:
+            with self._lock:
+                fds = list(self._fds.values())
+                self._fds.clear()
+            for fd in fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            deadline = monotonic() + self._flush_interval
+            batch: dict[int, list[bytes]] = {}
+            waiters: list[threading.Event] = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                entry: tuple[int, bytes] = item  # type: ignore[assignment]
+                batch.setdefault(entry[0], []).append(entry[1])
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            for fd, chunks in batch.items():
+                self._write_all(fd, b"".join(chunks))
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write_all(self, fd: int, data: bytes) -> None:
+        view = memoryview(data)
+        written = 0
+        try:
+            while written < len(data):
+                written += os.write(fd, view[written:])
+        except OSError as e:
+            logger.warning("Log write failed (%d bytes lost): %s", len(data) - written, e)
+        with self._lock:
+            self._pending -= len(data)
+            self._written += written
+            self._failed += len(data) - written
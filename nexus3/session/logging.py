@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import asdict
 from pathlib import Path
 from time import time
@@ -10,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 from nexus3.core.secure_io import secure_mkdir
 from nexus3.core.types import Message, Role, ToolCall, ToolResult
 from nexus3.session.events import SessionEvent
+from nexus3.session.log_sink import BufferedLogSink, LogSinkStats
 from nexus3.session.markdown import MarkdownWriter, RawWriter
 from nexus3.session.storage import SessionStorage
 from nexus3.session.types import LogConfig, LogStream, SessionInfo
@@ -17,6 +19,8 @@ from nexus3.session.types import LogConfig, LogStream, SessionInfo
 if TYPE_CHECKING:
     from nexus3.core.interfaces import RawLogCallback
 
+_logger = logging.getLogger(__name__)
+
 
 def _json_safe_dict(obj: Any) -> Any:
     """Recursively convert to JSON-safe (str non-primitives)."""
@@ -56,7 +60,10 @@ class SessionLogger:
         secure_mkdir(self.info.session_dir)
 
         # Initialize storage (always on for context)
-        self.storage = SessionStorage(self.info.session_dir / "session.db")
+        self.storage = SessionStorage(
+            self.info.session_dir / "session.db",
+            storage_config=config.storage,
+        )
 
         # Store session metadata
         self.storage.set_metadata("session_id", self.info.session_id)
@@ -72,17 +79,29 @@ class SessionLogger:
             parent_agent_id=config.parent_session,
         )
 
+        # Buffered sink for the markdown/raw files. Used whenever a storage
+        # config is given (storage.buffered_logs defaults to True); without
+        # one, files are written synchronously.
+        self._log_sink: BufferedLogSink | None = None
+        if config.storage is not None and config.storage.buffered_logs:
+            self._log_sink = BufferedLogSink(
+                flush_interval=config.storage.log_flush_interval_ms / 1000,
+                max_buffered_bytes=config.storage.log_buffer_max_bytes,
+                name=self.info.session_id,
+            )
+
         # Initialize markdown writer
         verbose_enabled = LogStream.VERBOSE in config.streams
         self._md_writer = MarkdownWriter(
             self.info.session_dir,
             verbose_enabled=verbose_enabled,
+            sink=self._log_sink,
         )
 
         # Initialize raw writer if enabled
         self._raw_writer: RawWriter | None = None
         if LogStream.RAW in config.streams:
-            self._raw_writer = RawWriter(self.info.session_dir)
+            self._raw_writer = RawWriter(self.info.session_dir, sink=self._log_sink)
 
     @property
     def session_dir(self) -> Path:
@@ -110,22 +129,56 @@ class SessionLogger:
         self._md_writer.write_system(content)
         return msg_id
 
-    def log_user(self, content: str, meta: dict[str, Any] | None = None) -> int:
+    def log_user(
+        self,
+        content: str,
+        meta: dict[str, Any] | None = None,
+        tokens: int | None = None,
+    ) -> int:
         """Log user message. Returns message ID.
 
         Args:
             content: The user message content.
             meta: Optional metadata dict (e.g., source attribution).
+            tokens: Token count for the message, if known.
         """
         msg_id = self.storage.insert_message(
             role="user",
             content=content,
             meta=meta,
+            tokens=tokens,
             timestamp=time(),
         )
         self._md_writer.write_user(content, meta=meta)
         return msg_id
 
+    def log_summary(
+        self,
+        content: str,
+        meta: dict[str, Any] | None = None,
+        tokens: int | None = None,
+    ) -> int:
+        """Log a compaction summary. Returns message ID.
+
+        The summary is stored as a user message, since that is how it is
+        sent to the provider, but context.md shows it under its own heading
+        rather than as a user turn.
+
+        Args:
+            content: The summary message content.
+            meta: Optional metadata dict (the compaction summary marker).
+            tokens: Token count for the message, if known.
+        """
+        msg_id = self.storage.insert_message(
+            role="user",
+            content=content,
+            meta=meta,
+            tokens=tokens,
+            timestamp=time(),
+        )
+        self._md_writer.write_summary(content)
+        return msg_id
+
     def log_assistant(
         self,
         content: str,
@@ -173,6 +226,7 @@ class SessionLogger:
         tool_call_id: str,
         name: str,
         result: ToolResult,
+        tokens: int | None = None,
     ) -> int:
         """Log tool execution result. Returns message ID."""
         content = result.error if result.error else result.output
@@ -182,6 +236,7 @@ class SessionLogger:
             content=content,
             name=name,
             tool_call_id=tool_call_id,
+            tokens=tokens,
             timestamp=time(),
         )
 
@@ -361,6 +416,7 @@ class SessionLogger:
             base_dir=self.info.session_dir,
             streams=self.config.streams,
             parent_session=self.info.session_id,
+            storage=self.config.storage,
         )
         return SessionLogger(child_config)
 
@@ -396,9 +452,43 @@ class SessionLogger:
 
     # === Lifecycle ===
 
+    def flush_logs(self, wait: bool = False) -> None:
+        """Push buffered log file entries to disk (called at turn end).
+
+        Args:
+            wait: Block until written. The default only wakes the writer
+                thread so the event loop is not stalled.
+        """
+        if self._log_sink is not None:
+            self._log_sink.flush(wait=wait)
+
+    def log_sink_stats(self) -> LogSinkStats | None:
+        """Counters for the buffered log sink, or None when unbuffered."""
+        return self._log_sink.stats() if self._log_sink is not None else None
+
     def close(self) -> None:
-        """Close the logger and release resources."""
-        self.storage.close()
+        """Close the logger and release resources.
+
+        Buffered log entries are written out first; any bytes the sink had to
+        drop are reported in the log and recorded as session metadata.
+        """
+        try:
+            if self._log_sink is not None:
+                self._log_sink.close()
+                stats = self._log_sink.stats()
+                lost = stats.dropped_bytes + stats.failed_bytes
+                if lost:
+                    _logger.warning(
+                        "Session %s lost %d log bytes (%d dropped on overflow, %d write errors)",
+                        self.info.session_id,
+                        lost,
+                        stats.dropped_bytes,
+                        stats.failed_bytes,
+                    )
+                    self.storage.set_metadata("log_dropped_bytes", str(stats.dropped_bytes))
+                    self.storage.set_metadata("log_failed_bytes", str(stats.failed_bytes))
+        finally:
+            self.storage.close()
 
 
 class RawLogCallbackAdapter:
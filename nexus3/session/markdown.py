@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from nexus3.core.secure_io import (
     SECURE_FILE_MODE,
@@ -12,6 +12,9 @@ from nexus3.core.secure_io import (
     secure_write_new,
 )
 
+if TYPE_CHECKING:
+    from nexus3.session.log_sink import BufferedLogSink
+
 # Backwards compatibility alias
 _SECURE_FILE_MODE = SECURE_FILE_MODE
 
@@ -19,14 +22,21 @@ _SECURE_FILE_MODE = SECURE_FILE_MODE
 class MarkdownWriter:
     """Writes human-readable markdown logs for a session."""
 
-    def __init__(self, session_dir: Path, verbose_enabled: bool = False) -> None:
+    def __init__(
+        self,
+        session_dir: Path,
+        verbose_enabled: bool = False,
+        sink: "BufferedLogSink | None" = None,
+    ) -> None:
         """Initialize markdown writer.
 
         Args:
             session_dir: Directory to write markdown files to.
             verbose_enabled: Whether to write verbose.md.
+            sink: Optional buffered sink; appends go directly to disk without one.
         """
         self.session_dir = session_dir
+        self._sink = sink
         self.context_path = session_dir / "context.md"
         self.verbose_path = session_dir / "verbose.md"
         self.verbose_enabled = verbose_enabled
@@ -67,7 +77,10 @@ class MarkdownWriter:
 
     def _append(self, path: Path, content: str) -> None:
         """Append content to a file (symlink-safe)."""
-        secure_append(path, content)
+        if self._sink is not None:
+            self._sink.write(path, content)
+        else:
+            secure_append(path, content)
 
     def _format_timestamp(self, ts: float | None = None) -> str:
         """Format a timestamp for display."""
@@ -105,6 +118,12 @@ class MarkdownWriter:
         md = f"## {label} [{timestamp}]\n\n{content}\n\n"
         self._append(self.context_path, md)
 
+    def write_summary(self, content: str) -> None:
+        """Write a compaction summary to context.md."""
+        timestamp = self._format_timestamp()
+        md = f"## Context Summary [{timestamp}]\n\n{content}\n\n"
+        self._append(self.context_path, md)
+
     def write_assistant(
         self,
         content: str,
@@ -232,13 +251,15 @@ class MarkdownWriter:
 class RawWriter:
     """Writes raw API JSON to a JSONL file."""
 
-    def __init__(self, session_dir: Path) -> None:
+    def __init__(self, session_dir: Path, sink: "BufferedLogSink | None" = None) -> None:
         """Initialize raw writer.
 
         Args:
             session_dir: Directory to write raw.jsonl to.
+            sink: Optional buffered sink; appends go directly to disk without one.
         """
         self.raw_path = session_dir / "raw.jsonl"
+        self._sink = sink
         # Ensure directory exists with secure permissions (0o700)
         secure_mkdir(session_dir)
 
@@ -308,4 +329,8 @@ class RawWriter:
 
     def _append_jsonl(self, entry: dict[str, Any]) -> None:
         """Append a JSON line to file (symlink-safe)."""
-        secure_append(self.raw_path, json.dumps(entry) + "\n")
+        line = json.dumps(entry) + "\n"
+        if self._sink is not None:
+            self._sink.write(self.raw_path, line)
+        else:
+            secure_append(self.raw_path, line)
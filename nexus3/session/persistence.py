@@ -44,6 +44,8 @@ class SavedSession:
         permission_preset: Permission preset name (e.g., "yolo", "trusted", "sandboxed").
         disabled_tools: List of tool names that are disabled for this agent.
         session_allowances: Dynamic allowances (write paths, exec permissions) for TRUSTED mode.
+        token_counter: Identifier of the token counter that produced per-message
+            ``tokens`` values in ``messages`` (see describe_token_counter).
         schema_version: Schema version for migrations.
     """
 
@@ -63,6 +65,7 @@ class SavedSession:
     session_allowances: dict[str, Any] = field(default_factory=dict)
     model_alias: str | None = None  # Model alias used for this session (e.g., "haiku", "gpt")
     clipboard_agent_entries: list[dict[str, Any]] = field(default_factory=list)
+    token_counter: str | None = None
     schema_version: int = SESSION_SCHEMA_VERSION
 
     def to_json(self) -> str:
@@ -87,6 +90,7 @@ class SavedSession:
             "model_alias": self.model_alias,
             "clipboard_agent_entries": self.clipboard_agent_entries,
             "token_usage": self.token_usage,
+            "token_counter": self.token_counter,
             "provenance": self.provenance,
         }
 
@@ -121,6 +125,7 @@ class SavedSession:
             model_alias=data.get("model_alias"),
             clipboard_agent_entries=data.get("clipboard_agent_entries", []),
             token_usage=data.get("token_usage", {}),
+            token_counter=data.get("token_counter"),
             provenance=data.get("provenance", "user"),
             schema_version=data.get("schema_version", 1),
         )
@@ -179,11 +184,12 @@ def deserialize_tool_call(data: dict[str, Any]) -> ToolCall:
     )
 
 
-def serialize_message(msg: Message) -> dict[str, Any]:
+def serialize_message(msg: Message, tokens: int | None = None) -> dict[str, Any]:
     """Serialize a Message to a dictionary.
 
     Args:
         msg: Message to serialize.
+        tokens: Optional token count to store alongside the message.
 
     Returns:
         Dictionary representation suitable for JSON.
@@ -202,6 +208,9 @@ def serialize_message(msg: Message) -> dict[str, Any]:
     if msg.meta:
         data["meta"] = msg.meta
 
+    if tokens is not None:
+        data["tokens"] = tokens
+
     return data
 
 
@@ -239,16 +248,26 @@ def deserialize_message(data: dict[str, Any]) -> Message | None:
     )
 
 
-def serialize_messages(messages: list[Message]) -> list[dict[str, Any]]:
+def serialize_messages(
+    messages: list[Message],
+    token_counts: list[int] | None = None,
+) -> list[dict[str, Any]]:
     """Serialize a list of Messages.
 
     Args:
         messages: List of Message objects.
+        token_counts: Optional per-message token counts aligned with ``messages``.
+            Ignored if the lengths differ.
 
     Returns:
         List of dictionary representations.
     """
-    return [serialize_message(msg) for msg in messages]
+    if token_counts is None or len(token_counts) != len(messages):
+        return [serialize_message(msg) for msg in messages]
+    return [
+        serialize_message(msg, tokens)
+        for msg, tokens in zip(messages, token_counts, strict=True)
+    ]
 
 
 def deserialize_messages(data: list[dict[str, Any]]) -> list[Message]:
@@ -263,6 +282,31 @@ def deserialize_messages(data: list[dict[str, Any]]) -> list[Message]:
     return [m for m in (deserialize_message(d) for d in data) if m is not None]
 
 
+def deserialize_messages_with_tokens(
+    data: list[dict[str, Any]],
+) -> tuple[list[Message], list[int | None]]:
+    """Deserialize Messages along with any stored per-message token counts.
+
+    Args:
+        data: List of dictionary representations.
+
+    Returns:
+        Tuple of (messages, token_counts). ``token_counts`` is aligned with
+        ``messages``; entries are None where no valid count was stored.
+    """
+    messages: list[Message] = []
+    token_counts: list[int | None] = []
+    for item in data:
+        msg = deserialize_message(item)
+        if msg is None:
+            continue
+        tokens = item.get("tokens")
+        valid = isinstance(tokens, int) and not isinstance(tokens, bool) and tokens >= 0
+        messages.append(msg)
+        token_counts.append(tokens if valid else None)
+    return messages, token_counts
+
+
 def serialize_clipboard_entries(entries: dict[str, ClipboardEntry]) -> list[dict[str, Any]]:
     """Serialize clipboard entries to a list of dictionaries.
 
@@ -321,6 +365,8 @@ def serialize_session(
     session_allowances: dict[str, Any] | None = None,
     model_alias: str | None = None,
     clipboard_agent_entries: list[dict[str, Any]] | None = None,
+    message_token_counts: list[int] | None = None,
+    token_counter: str | None = None,
 ) -> SavedSession:
     """Create a SavedSession from runtime state.
 
@@ -339,6 +385,8 @@ def serialize_session(
         session_allowances: Dynamic allowances (write paths, exec permissions) for TRUSTED mode.
         model_alias: Model alias for this session (e.g., "haiku", "gpt").
         clipboard_agent_entries: Serialized agent-scope clipboard entries.
+        message_token_counts: Per-message token counts aligned with ``messages``.
+        token_counter: Identifier of the counter that produced the counts.
 
     Returns:
         SavedSession ready for disk storage.
@@ -348,7 +396,7 @@ def serialize_session(
         agent_id=agent_id,
         created_at=created_at or now,
         modified_at=now,
-        messages=serialize_messages(messages),
+        messages=serialize_messages(messages, message_token_counts),
         system_prompt=system_prompt,
         system_prompt_path=system_prompt_path,
         working_directory=str(working_directory),
@@ -360,4 +408,5 @@ def serialize_session(
         session_allowances=session_allowances or {},
         model_alias=model_alias,
         clipboard_agent_entries=clipboard_agent_entries or [],
+        token_counter=token_counter if message_token_counts is not None else None,
     )
@@ -26,6 +26,11 @@ from nexus3.core.types import (
     ToolCall,
     ToolResult,
 )
+from nexus3.session.compaction_runtime import (
+    Precompaction,
+    claim_precompaction,
+    start_precompaction,
+)
 from nexus3.session.compaction_runtime import (
     generate_summary as generate_compaction_summary,
 )
@@ -49,6 +54,7 @@ from nexus3.session.simple_turn_runtime import (
 from nexus3.session.single_tool_runtime import (
     execute_single_tool as execute_single_tool_runtime,
 )
+from nexus3.session.streaming_runtime import EventObserver
 from nexus3.session.streaming_runtime import (
     execute_tool_loop_streaming as execute_tool_loop_streaming_runtime,
 )
@@ -199,6 +205,9 @@ class Session:
             default_allow=False,
         )
 
+        # Argument validation time per tool call ID, drained into ToolCompleted
+        self._tool_validation_ms: dict[str, float] = {}
+
         # Track cancelled tool calls to report on next send()
         self._pending_cancelled_tools: list[tuple[str, str]] = []  # [(tool_id, tool_name), ...]
 
@@ -211,6 +220,8 @@ class Session:
 
         # Lazy-loaded compaction provider (uses different model if configured)
         self._compaction_provider: AsyncProvider | None = None
+        # Background summary started past compaction.precompact_threshold
+        self._precompaction: Precompaction | None = None
         self._turn_lock = asyncio.Lock()
 
     def _log_event(self, event: "SessionEvent") -> None:
@@ -383,6 +394,7 @@ class Session:
                 gitlab_authorization_kernel=self._gitlab_authorization_kernel,
                 skill_timeout=self.skill_timeout,
                 runtime_logger=logger,
+                validation_timings=self._tool_validation_ms,
             )
 
         async def execute_tools_parallel(
@@ -402,6 +414,7 @@ class Session:
         use_tools: bool = False,
         cancel_token: "CancellationToken | None" = None,
         user_meta: dict[str, Any] | None = None,
+        on_event: EventObserver | None = None,
     ) -> AsyncIterator[str]:
         """Send a message and stream the response.
 
@@ -414,6 +427,9 @@ class Session:
                       Automatically enabled if registry has tools.
             cancel_token: Optional cancellation token to cancel the operation.
             user_meta: Optional metadata for the user message (e.g., source attribution).
+            on_event: Optional async observer awaited with each non-content
+                tool-loop event (tool start/complete, reasoning, batches), in
+                addition to the session's callbacks.
 
         Yields:
             String chunks of the assistant's response.
@@ -451,6 +467,7 @@ class Session:
                         on_batch_progress=self.on_batch_progress,
                         on_batch_halt=self.on_batch_halt,
                         on_batch_complete=self.on_batch_complete,
+                        on_event=on_event,
                     ):
                         yield chunk
                     return
@@ -476,6 +493,9 @@ class Session:
             ):
                 yield chunk
         finally:
+            # Turn end: push buffered log file entries to disk
+            if self.logger:
+                self.logger.flush_logs()
             # Clear current logger after send completes
             clear_current_logger()
 
@@ -485,6 +505,7 @@ class Session:
         use_tools: bool = False,
         cancel_token: "CancellationToken | None" = None,
         user_meta: dict[str, Any] | None = None,
+        on_event: EventObserver | None = None,
     ) -> AsyncIterator[str]:
         """Send a message and stream the response."""
         async with self.reserve_turn():
@@ -493,6 +514,7 @@ class Session:
                 use_tools=use_tools,
                 cancel_token=cancel_token,
                 user_meta=user_meta,
+                on_event=on_event,
             ):
                 yield chunk
 
@@ -562,6 +584,9 @@ class Session:
             ):
                 yield event
         finally:
+            # Turn end: push buffered log file entries to disk
+            if self.logger:
+                self.logger.flush_logs()
             # Clear current logger after turn completes
             clear_current_logger()
 
@@ -603,7 +628,42 @@ class Session:
         usage = self.context.get_token_usage()
         threshold = int(usage["available"] * compaction_config.trigger_threshold)
 
-        return usage["total"] > threshold
+        # Compare the estimate corrected by provider-reported usage
+        return self.context.calibrated_total(usage) > threshold
+
+    def _maybe_start_precompaction(self) -> None:
+        """Start summarizing older history in the background past the soft threshold.
+
+        Opt-in via compaction.precompact_threshold. The result is reused by
+        compact_locked() if the summarized messages are still unchanged then.
+        """
+        if self._config is None or self.context is None:
+            return
+
+        compaction_config = self._config.compaction
+        if not compaction_config.enabled or compaction_config.precompact_threshold is None:
+            return
+
+        usage = self.context.get_token_usage()
+        threshold = int(usage["available"] * compaction_config.precompact_threshold)
+        if self.context.calibrated_total(usage) <= threshold:
+            return
+
+        messages = self.context.messages
+        if self._precompaction is not None:
+            if not self._precompaction.failed() and self._precompaction.matches(messages):
+                return
+            self._precompaction.cancel()
+            self._precompaction = None
+
+        to_summarize, _ = select_messages_for_compaction(
+            messages=messages,
+            token_counter=self.context.token_counter,
+            available_budget=usage["available"],
+            recent_preserve_ratio=compaction_config.recent_preserve_ratio,
+        )
+        if to_summarize:
+            self._precompaction = start_precompaction(self, to_summarize, compaction_config)
 
     async def compact_locked(self, force: bool = False) -> CompactionResult | None:
         """Compact context while already holding the session turn slot.
@@ -630,23 +690,40 @@ class Session:
         usage = self.context.get_token_usage()
         compaction_config = self._config.compaction
 
-        # Select messages to summarize vs preserve
-        to_summarize, to_preserve = select_messages_for_compaction(
-            messages=messages,
-            token_counter=self.context._counter,
-            available_budget=usage["available"],
-            recent_preserve_ratio=compaction_config.recent_preserve_ratio,
-        )
+        # Reuse a background summary if its messages are unchanged and the
+        # result lands below the soft threshold
+        claimed = None
+        precompaction, self._precompaction = self._precompaction, None
+        if precompaction is not None:
+            ratio = compaction_config.precompact_threshold or compaction_config.trigger_threshold
+            non_message_tokens = usage["total"] - usage["messages"]
+            claimed = await claim_precompaction(
+                precompaction,
+                messages,
+                self.context.token_counter,
+                int(usage["available"] * ratio) - non_message_tokens,
+            )
 
-        if not to_summarize:
-            return None
+        if claimed is not None:
+            summary_text, to_preserve = claimed
+        else:
+            # Select messages to summarize vs preserve
+            to_summarize, to_preserve = select_messages_for_compaction(
+                messages=messages,
+                token_counter=self.context.token_counter,
+                available_budget=usage["available"],
+                recent_preserve_ratio=compaction_config.recent_preserve_ratio,
+            )
 
-        # Generate summary via LLM
-        summary_text = await generate_compaction_summary(
-            self,
-            to_summarize,
-            compaction_config,
-        )
+            if not to_summarize:
+                return None
+
+            # Generate summary via LLM
+            summary_text = await generate_compaction_summary(
+                self,
+                to_summarize,
+                compaction_config,
+            )
         summary_message = create_summary_message(summary_text)
 
         # Reload system prompt fresh (picks up NEXUS.md changes)
@@ -663,7 +740,7 @@ class Session:
 
         # Refresh git context (picks up any changes since last refresh)
         cwd = self._services.get_cwd() if self._services else Path.cwd()
-        self.context.refresh_git_context(cwd)
+        await self.context.refresh_git_context_async(cwd)
 
         new_usage = self.context.get_token_usage()
 
@@ -682,3 +759,14 @@ class Session:
         """
         async with self.reserve_turn():
             return await self.compact_locked(force=force)
+
+    async def close(self) -> None:
+        """Stop background work started by this session.
+
+        Cancels a running background pre-compaction and waits for it to
+        finish, so no summary request outlives the agent.
+        """
+        precompaction, self._precompaction = self._precompaction, None
+        if precompaction is not None:
+            precompaction.cancel()
+            await asyncio.wait([precompaction.task])
@@ -78,6 +78,10 @@ async def execute_simple_send(
                 session.on_tool_call(event.name, event.id)
         elif isinstance(event, StreamComplete):
             final_message = event.message
+            if event.usage is not None and session.context:
+                session.context.record_provider_usage(
+                    event.usage.prompt_tokens, messages, tools, dynamic_context
+                )
 
     # If cancellation arrived mid-stream before StreamComplete,
     # exit quietly instead of treating as empty provider output.
@@ -146,6 +150,10 @@ async def execute_simple_run_turn(
             yield ToolDetected(name=stream_event.name, tool_id=stream_event.id)
         elif isinstance(stream_event, StreamComplete):
             final_message = stream_event.message
+            if stream_event.usage is not None:
+                context.record_provider_usage(
+                    stream_event.usage.prompt_tokens, messages, tools, dynamic_context
+                )
 
     if cancel_token and cancel_token.is_cancelled:
         yield SessionCancelled()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
@@ -10,7 +11,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 from nexus3.core.authorization_kernel import AdapterAuthorizationKernel
 from nexus3.core.permissions import AgentPermissions, ConfirmationResult
 from nexus3.core.types import ToolCall, ToolResult
-from nexus3.core.validation import ValidationError, validate_tool_arguments
+from nexus3.core.validation import CompiledSchema, ValidationError, validate_tool_arguments
 from nexus3.session.confirmation import ConfirmationController
 from nexus3.session.permission_runtime import (
     handle_gitlab_permissions as handle_gitlab_permissions_runtime,
@@ -62,6 +63,8 @@ class _PermissionEnforcer(Protocol):
 class _ToolDispatcher(Protocol):
     def find_skill(self, tool_call: ToolCall) -> tuple[Skill | None, str | None]: ...
 
+    def get_validator(self, tool_call: ToolCall) -> CompiledSchema | None: ...
+
 
 def _rewrite_tool_call(
     tool_call: ToolCall,
@@ -379,8 +382,13 @@ async def execute_single_tool(
     gitlab_authorization_kernel: AdapterAuthorizationKernel,
     skill_timeout: float,
     runtime_logger: logging.Logger,
+    validation_timings: dict[str, float] | None = None,
 ) -> ToolResult:
-    """Execute a single tool call with Session-equivalent behavior."""
+    """Execute a single tool call with Session-equivalent behavior.
+
+    When validation_timings is given, the time spent validating arguments is
+    recorded in it (milliseconds, keyed by tool call ID).
+    """
     tool_call = _normalize_tool_call_for_execution(tool_call)
     permissions = services.get_permissions() if services else None
 
@@ -488,13 +496,20 @@ async def execute_single_tool(
             return error
 
     # 7. Validate arguments
+    validation_start = time.perf_counter()
     try:
         args = validate_tool_arguments(
             tool_call.arguments,
             skill.parameters,
+            dispatcher.get_validator(tool_call) if mcp_server_name is None else None,
         )
     except ValidationError as e:
         return ToolResult(error=f"Invalid arguments for {tool_call.name}: {e.message}")
+    finally:
+        if validation_timings is not None:
+            validation_timings[tool_call.id] = (
+                time.perf_counter() - validation_start
+            ) * 1000
 
     # 7. Execute with timeout
     effective_timeout = enforcer.get_effective_timeout(tool_call.name, permissions, skill_timeout)
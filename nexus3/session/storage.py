@@ -1,16 +1,33 @@
-"""SQLite storage for session data."""
+"""SQLite storage for session data.
 
+Two durability modes are supported (see SessionStorageConfig):
+
+- full (default): every write is committed on the calling thread before it
+  returns, using SQLite's default rollback journal.
+- batched: the database runs in WAL mode with synchronous=NORMAL, and writes
+  are handed to a single background writer thread that groups them into one
+  transaction per flush interval. Row IDs are allocated up front so callers
+  still get an ID back immediately. Reads flush pending writes first, so the
+  storage always reads its own writes.
+"""
+
+import atexit
 import json
 import logging
 import os
+import queue
 import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from time import time
-from typing import Any
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any
 
 from nexus3.core.secure_io import SECURE_FILE_MODE, secure_mkdir
 
+if TYPE_CHECKING:
+    from nexus3.config.schema import SessionStorageConfig
+
 logger = logging.getLogger(__name__)
 
 # Maximum JSON field size to prevent memory exhaustion (10MB)
@@ -213,17 +230,220 @@ class EventRow:
         )
 
 
+# Queue items for the background writer: a statement, a flush request, or stop.
+_Statement = tuple[str, tuple[Any, ...] | list[Any]]
+_STOP = object()
+
+# How often a blocked flush() re-checks that the writer thread is still alive
+_FLUSH_POLL_SECONDS = 0.5
+
+
+class _BackgroundWriter:
+    """Single writer thread that commits queued statements in batches.
+
+    The thread owns its own connection. Each batch is one transaction: the
+    first queued statement waits at most ``flush_interval`` seconds before it
+    is committed, and a batch never exceeds ``max_batch`` statements.
+    """
+
+    def __init__(self, db_path: Path, flush_interval: float, max_batch: int) -> None:
+        self._db_path = db_path
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._closed = False
+        self.failed_writes = 0
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"nexus3-session-writer:{db_path.parent.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, sql: str, params: tuple[Any, ...] | list[Any]) -> None:
+        """Queue a statement for the next batch.
+
+        Raises:
+            sqlite3.ProgrammingError: If the storage was closed.
+            sqlite3.OperationalError: If the writer thread has died.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot write to a closed SessionStorage")
+        if not self._thread.is_alive():
+            raise sqlite3.OperationalError(
+                f"Session log writer thread is not running ({self._db_path})"
+            )
+        self._queue.put((sql, params))
+
+    def flush(self) -> None:
+        """Block until every statement queued so far is committed.
+
+        Returns early (with an error logged) if the writer thread dies while
+        waiting, instead of blocking forever.
+        """
+        if self._closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(_FLUSH_POLL_SECONDS):
+            if not self._thread.is_alive():
+                logger.error("Session log writer thread died (%s)", self._db_path)
+                return
+
+    def close(self) -> None:
+        """Commit pending statements and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self._db_path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        try:
+            while True:
+                batch: list[_Statement] = []
+                waiters: list[threading.Event] = []
+                stop = self._collect(batch, waiters)
+                try:
+                    if batch:
+                        self._commit(conn, batch)
+                finally:
+                    for waiter in waiters:
+                        waiter.set()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _collect(self, batch: list[_Statement], waiters: list[threading.Event]) -> bool:
+        """Gather one batch; returns True when the stop sentinel was seen."""
+        item = self._queue.get()
+        deadline = monotonic() + self._flush_interval
+        while True:
+            if item is _STOP:
+                return True
+            if isinstance(item, threading.Event):
+                # Flush request: commit what we have now rather than waiting.
+                waiters.append(item)
+                return False
+            batch.append(item)
+            if len(batch) >= self._max_batch:
+                return False
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+
+    def _commit(self, conn: sqlite3.Connection, batch: list[_Statement]) -> None:
+        try:
+            for sql, params in batch:
+                try:
+                    conn.execute(sql, params)
+                except Exception as e:
+                    # One bad row (SQL error, unbindable parameter such as an
+                    # out-of-range int) must not take the batch or thread down.
+                    self.failed_writes += 1
+                    logger.warning("Session log write failed (%s): %s", self._db_path, e)
+            conn.commit()
+        except Exception as e:
+            self.failed_writes += len(batch)
+            logger.error("Session log batch commit failed (%s): %s", self._db_path, e)
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+
+
 class SessionStorage:
     """SQLite operations for session data."""
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        storage_config: "SessionStorageConfig | None" = None,
+    ) -> None:
         """Initialize storage with database path.
 
         Creates the database and schema if they don't exist.
+
+        Args:
+            db_path: Path to the session database.
+            storage_config: Durability settings. None keeps the default
+                'full' mode (synchronous commit per write).
         """
         self.db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._batched = storage_config is not None and storage_config.durability == "batched"
+        self._writer: _BackgroundWriter | None = None
+        self._next_ids: dict[str, int] = {}
         self._ensure_schema()
+        if self._batched and storage_config is not None:
+            self._next_ids = {
+                table: self._max_allocated_id(table) + 1 for table in ("messages", "events")
+            }
+            self._writer = _BackgroundWriter(
+                db_path,
+                flush_interval=storage_config.flush_interval_ms / 1000,
+                max_batch=storage_config.max_batch,
+            )
+            # Daemon thread: make sure queued rows reach disk on normal exit.
+            atexit.register(self.flush)
+
+    @property
+    def durability(self) -> str:
+        """Active durability mode: 'full' or 'batched'."""
+        return "batched" if self._batched else "full"
+
+    @property
+    def failed_writes(self) -> int:
+        """Writes the background writer could not commit (batched mode only)."""
+        return self._writer.failed_writes if self._writer is not None else 0
+
+    def flush(self) -> None:
+        """Wait until all queued writes are committed. No-op in full mode."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _write(self, sql: str, params: tuple[Any, ...] | list[Any]) -> int | None:
+        """Run a write statement according to the durability mode.
+
+        Returns:
+            cursor.lastrowid in full mode; None in batched mode.
+        """
+        if self._writer is not None:
+            self._writer.submit(sql, params)
+            return None
+        conn = self._get_conn()
+        cursor = conn.execute(sql, params)
+        conn.commit()
+        return cursor.lastrowid
+
+    def _max_allocated_id(self, table: str) -> int:
+        """Highest AUTOINCREMENT id ever handed out for a table."""
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+        ).fetchone()
+        seq = row[0] if row else 0
+        row = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()
+        return int(max(seq, row[0]))
+
+    def _allocate_id(self, table: str) -> int:
+        """Allocate the next row id (batched mode; this storage is the only writer)."""
+        row_id = self._next_ids[table]
+        self._next_ids[table] = row_id + 1
+        return row_id
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """Connection for reads, after pending writes have been committed."""
+        self.flush()
+        return self._get_conn()
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get or create database connection with secure permissions."""
@@ -246,6 +466,11 @@ class SessionStorage:
             self._conn.row_factory = sqlite3.Row
             # Enable foreign keys
             self._conn.execute("PRAGMA foreign_keys = ON")
+            if self._batched:
+                # WAL lets the writer thread commit while this connection reads;
+                # the -wal/-shm files inherit the database file's permissions.
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
 
             # Ensure permissions are correct (handles existing DBs)
             os.chmod(self.db_path, SECURE_FILE_MODE)
@@ -326,7 +551,11 @@ class SessionStorage:
             conn.commit()
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush pending writes and close the database connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            atexit.unregister(self.flush)
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -346,30 +575,27 @@ class SessionStorage:
         timestamp: float | None = None,
     ) -> int:
         """Insert a message and return its ID."""
-        conn = self._get_conn()
-
         meta_json = json.dumps(meta) if meta else None
         tool_calls_json = json.dumps(tool_calls) if tool_calls else None
         ts = timestamp if timestamp is not None else time()
+        row_id = self._allocate_id("messages") if self._batched else None
 
-        cursor = conn.execute(
+        lastrowid = self._write(
             """
             INSERT INTO messages
-                (role, content, meta, name, tool_call_id, tool_calls, tokens, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (id, role, content, meta, name, tool_call_id, tool_calls, tokens, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
-                role, content, meta_json, name,
+                row_id, role, content, meta_json, name,
                 tool_call_id, tool_calls_json, tokens, ts,
             ),
         )
-        conn.commit()
-
-        return cursor.lastrowid  # type: ignore[return-value]
+        return row_id if row_id is not None else lastrowid  # type: ignore[return-value]
 
     def get_messages(self, in_context_only: bool = True) -> list[MessageRow]:
         """Get messages, optionally filtered to context window."""
-        conn = self._get_conn()
+        conn = self._read_conn()
 
         if in_context_only:
             cursor = conn.execute(
@@ -382,7 +608,7 @@ class SessionStorage:
 
     def get_message(self, message_id: int) -> MessageRow | None:
         """Get a single message by ID."""
-        conn = self._get_conn()
+        conn = self._read_conn()
         cursor = conn.execute("SELECT * FROM messages WHERE id = ?", (message_id,))
         row = cursor.fetchone()
         return MessageRow.from_row(row) if row else None
@@ -396,13 +622,11 @@ class SessionStorage:
         if not message_ids:
             return
 
-        conn = self._get_conn()
         placeholders = ",".join("?" for _ in message_ids)
-        conn.execute(
+        self._write(
             f"UPDATE messages SET in_context = ? WHERE id IN ({placeholders})",
             [int(in_context), *message_ids],
         )
-        conn.commit()
 
     def mark_as_summary(
         self,
@@ -413,11 +637,9 @@ class SessionStorage:
 
         Also marks the replaced messages as out of context.
         """
-        conn = self._get_conn()
-
         # Update the summary message
         summary_of = ",".join(str(x) for x in replaced_ids)
-        conn.execute(
+        self._write(
             "UPDATE messages SET summary_of = ? WHERE id = ?",
             (summary_of, summary_id),
         )
@@ -427,7 +649,7 @@ class SessionStorage:
 
     def get_token_count(self) -> int:
         """Get total tokens in current context."""
-        conn = self._get_conn()
+        conn = self._read_conn()
         cursor = conn.execute(
             "SELECT COALESCE(SUM(tokens), 0) FROM messages WHERE in_context = 1"
         )
@@ -438,23 +660,21 @@ class SessionStorage:
 
     def get_metadata(self, key: str) -> str | None:
         """Get a metadata value."""
-        conn = self._get_conn()
+        conn = self._read_conn()
         cursor = conn.execute("SELECT value FROM metadata WHERE key = ?", (key,))
         row = cursor.fetchone()
         return row[0] if row else None
 
     def set_metadata(self, key: str, value: str) -> None:
         """Set a metadata value."""
-        conn = self._get_conn()
-        conn.execute(
+        self._write(
             "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
             (key, value),
         )
-        conn.commit()
 
     def get_all_metadata(self) -> dict[str, str]:
         """Get all metadata as a dictionary."""
-        conn = self._get_conn()
+        conn = self._read_conn()
         cursor = conn.execute("SELECT key, value FROM metadata")
         return {row["key"]: row["value"] for row in cursor.fetchall()}
 
@@ -468,21 +688,18 @@ class SessionStorage:
         timestamp: float | None = None,
     ) -> int:
         """Insert an event and return its ID."""
-        conn = self._get_conn()
-
         data_json = json.dumps(data) if data else None
         ts = timestamp if timestamp is not None else time()
+        row_id = self._allocate_id("events") if self._batched else None
 
-        cursor = conn.execute(
+        lastrowid = self._write(
             """
-            INSERT INTO events (message_id, event_type, data, timestamp)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO events (id, message_id, event_type, data, timestamp)
+            VALUES (?, ?, ?, ?, ?)
             """,
-            (message_id, event_type, data_json, ts),
+            (row_id, message_id, event_type, data_json, ts),
         )
-        conn.commit()
-
-        return cursor.lastrowid  # type: ignore[return-value]
+        return row_id if row_id is not None else lastrowid  # type: ignore[return-value]
 
     def get_events(
         self,
@@ -490,7 +707,7 @@ class SessionStorage:
         message_id: int | None = None,
     ) -> list[EventRow]:
         """Get events, optionally filtered."""
-        conn = self._get_conn()
+        conn = self._read_conn()
 
         conditions = []
         params: list[Any] = []
@@ -524,10 +741,9 @@ class SessionStorage:
             session_type: 'saved' | 'temp' | 'subagent'
             parent_agent_id: ID of parent agent (for subagents)
         """
-        conn = self._get_conn()
         ts = time()
 
-        conn.execute(
+        self._write(
             """
             INSERT OR REPLACE INTO session_markers
             (id, session_type, session_status, parent_agent_id, created_at, updated_at)
@@ -535,7 +751,6 @@ class SessionStorage:
             """,
             (session_type, parent_agent_id, ts, ts),
         )
-        conn.commit()
 
     def get_session_markers(self) -> SessionMarkers | None:
         """Get current session markers.
@@ -543,7 +758,7 @@ class SessionStorage:
         Returns:
             SessionMarkers if set, None otherwise.
         """
-        conn = self._get_conn()
+        conn = self._read_conn()
         cursor = conn.execute("SELECT * FROM session_markers WHERE id = 1")
         row = cursor.fetchone()
         return SessionMarkers.from_row(row) if row else None
@@ -563,7 +778,6 @@ class SessionStorage:
             session_status: 'active' | 'destroyed' | 'orphaned'
             parent_agent_id: ID of parent agent
         """
-        conn = self._get_conn()
         ts = time()
 
         updates = ["updated_at = ?"]
@@ -582,11 +796,10 @@ class SessionStorage:
             params.append(parent_agent_id)
 
         set_clause = ", ".join(updates)
-        conn.execute(
+        self._write(
             f"UPDATE session_markers SET {set_clause} WHERE id = 1",
             params,
         )
-        conn.commit()
 
     def mark_session_destroyed(self) -> None:
         """Mark session as destroyed for cleanup tracking."""
@@ -604,7 +817,7 @@ class SessionStorage:
         Returns:
             List of orphaned session markers.
         """
-        conn = self._get_conn()
+        conn = self._read_conn()
         cutoff = time() - (older_than_days * 24 * 60 * 60)
 
         cursor = conn.execute(
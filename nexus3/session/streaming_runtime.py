@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TYPE_CHECKING
 
 from nexus3.core.types import ToolCall
@@ -31,6 +31,7 @@ ToolActiveCallback = Callable[[str, str], None]
 BatchProgressCallback = Callable[[str, str, bool, str, str], None]
 BatchHaltCallback = Callable[[], None]
 BatchCompleteCallback = Callable[[], None]
+EventObserver = Callable[[SessionEvent], Awaitable[None]]
 ExecuteToolLoopEvents = Callable[
     ["CancellationToken | None"],
     AsyncIterator[SessionEvent],
@@ -123,9 +124,17 @@ async def execute_tool_loop_streaming(
     on_batch_progress: BatchProgressCallback | None = None,
     on_batch_halt: BatchHaltCallback | None = None,
     on_batch_complete: BatchCompleteCallback | None = None,
+    on_event: EventObserver | None = None,
 ) -> AsyncIterator[str]:
-    """Execute tool-loop events and adapt them to legacy streaming callbacks."""
+    """Execute tool-loop events and adapt them to legacy streaming callbacks.
+
+    ``on_event`` is awaited with every non-content event before the callbacks
+    run; content reaches callers only as yielded chunks. Because it is awaited,
+    a slow observer pauses the tool loop instead of buffering events.
+    """
     async for event in execute_tool_loop_events(cancel_token):
+        if on_event is not None and not isinstance(event, ContentChunk):
+            await on_event(event)
         chunk = _dispatch_streaming_event(
             event,
             on_tool_call=on_tool_call,
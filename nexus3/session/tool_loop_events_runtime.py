@@ -66,9 +66,12 @@ class _ToolLoopEventsSession(Protocol):
     _last_iteration_count: int
     _last_action_at: datetime | None
     _halted_at_iteration_limit: bool
+    _tool_validation_ms: dict[str, float]
 
     def _should_compact(self) -> bool: ...
 
+    def _maybe_start_precompaction(self) -> None: ...
+
     def compact(self, force: bool = False) -> Awaitable[CompactionResult | None]: ...
 
     def compact_locked(self, force: bool = False) -> Awaitable[CompactionResult | None]: ...
@@ -106,6 +109,8 @@ async def execute_tool_loop_events(
                 yield ContentChunk(
                     text=f"\n[Context compacted: {saved:,} tokens reclaimed]\n\n"
                 )
+        else:
+            session._maybe_start_precompaction()
 
         # Type narrowing: run_turn() requires context, so it's guaranteed here
         assert session.context is not None
@@ -156,6 +161,10 @@ async def execute_tool_loop_events(
                     yield ReasoningEnded()
                 is_reasoning = False
                 final_message = event.message
+                if event.usage is not None:
+                    session.context.record_provider_usage(
+                        event.usage.prompt_tokens, messages, tools, dynamic_context
+                    )
 
         if cancel_token and cancel_token.is_cancelled:
             yield SessionCancelled()
@@ -221,6 +230,7 @@ async def execute_tool_loop_events(
                         success=tool_result.success,
                         error=tool_result.error,
                         output=tool_result.output if tool_result.success else "",
+                        validation_ms=session._tool_validation_ms.pop(tc.id, 0.0),
                     )
                     session._log_event(tool_complete)
                     yield tool_complete
@@ -254,6 +264,7 @@ async def execute_tool_loop_events(
                         success=tool_result.success,
                         error=tool_result.error,
                         output=tool_result.output if tool_result.success else "",
+                        validation_ms=session._tool_validation_ms.pop(tc.id, 0.0),
                     )
                     session._log_event(tool_complete)
                     yield tool_complete
@@ -304,7 +315,7 @@ async def execute_tool_loop_events(
                 for tc in final_message.tool_calls
             ):
                 cwd = session._services.get_cwd() if session._services else Path.cwd()
-                session.context.refresh_git_context(cwd)
+                await session.context.refresh_git_context_async(cwd)
 
             yield IterationCompleted(
                 iteration=iteration_num + 1,
@@ -341,6 +352,8 @@ async def execute_tool_loop_events(
                     yield ContentChunk(
                         text=f"\n\n[Context compacted: {saved:,} tokens reclaimed]"
                     )
+            else:
+                session._maybe_start_precompaction()
 
             yield SessionCompleted(halted_at_limit=False)
             return
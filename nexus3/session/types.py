@@ -5,6 +5,10 @@ from datetime import datetime
 from enum import Flag, auto
 from pathlib import Path
 from secrets import token_hex
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nexus3.config.schema import SessionStorageConfig
 
 
 class LogStream(Flag):
@@ -30,6 +34,7 @@ class LogConfig:
     parent_session: str | None = None
     mode: str = "repl"  # "repl" or "serve" - shown in log folder name
     session_type: str = "temp"  # 'saved' | 'temp' | 'subagent' - for cleanup
+    storage: "SessionStorageConfig | None" = None  # session.db durability (None = full)
 
     def __post_init__(self) -> None:
         """Ensure base_dir is a Path."""
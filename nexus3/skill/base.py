@@ -28,8 +28,8 @@ from nexus3.core.constants import get_default_server_port
 from nexus3.core.types import ToolResult
 from nexus3.core.validation import (
     ALLOWED_INTERNAL_PARAMS,
+    SchemaCache,
     ValidationError,
-    schema_preserves_dynamic_top_level_keys,
 )
 
 if TYPE_CHECKING:
@@ -99,28 +99,27 @@ def validate_skill_parameters(
         - This is defense-in-depth; session.py also validates before calling execute().
         - Useful for testing skills directly without going through session layer.
     """
-    import jsonschema  # type: ignore[import-untyped]
-
     def decorator(
         func: Callable[..., Coroutine[Any, Any, ToolResult]],
     ) -> Callable[..., Coroutine[Any, Any, ToolResult]]:
+        schemas = SchemaCache()
+
         @wraps(func)
         async def wrapper(self: "Skill", **kwargs: Any) -> ToolResult:
-            schema = self.parameters
+            compiled = schemas.get(self.parameters)
             schema_kwargs = {
                 k: v for k, v in kwargs.items() if k not in ALLOWED_INTERNAL_PARAMS
             }
 
             # Validate against JSON Schema
-            try:
-                jsonschema.validate(schema_kwargs, schema)
-            except jsonschema.ValidationError as e:
+            error = compiled.first_error(schema_kwargs)
+            if error is not None:
                 # Format a user-friendly error message
-                return ToolResult(error=_format_validation_error(e, self.name))
+                return ToolResult(error=_format_validation_error(error, self.name))
 
             # Get known properties from schema
-            schema_props = set(schema.get("properties", {}).keys())
-            preserve_dynamic = schema_preserves_dynamic_top_level_keys(schema)
+            schema_props = compiled.properties
+            preserve_dynamic = compiled.preserve_dynamic
 
             # Check for unexpected parameters
             provided = set(kwargs.keys())
@@ -206,27 +205,25 @@ def _wrap_with_validation(skill: "Skill") -> None:
     Args:
         skill: The skill instance to wrap. Modified in place.
     """
-    import jsonschema
-
     original_execute = skill.execute  # Already bound method
+    schemas = SchemaCache()
 
     @wraps(original_execute)
     async def validated_execute(**kwargs: Any) -> ToolResult:
-        schema = skill.parameters
+        compiled = schemas.get(skill.parameters)
         schema_kwargs = {
             k: v for k, v in kwargs.items() if k not in ALLOWED_INTERNAL_PARAMS
         }
 
         # Validate against JSON Schema
-        try:
-            jsonschema.validate(schema_kwargs, schema)
-        except jsonschema.ValidationError as e:
-            return ToolResult(error=_format_validation_error(e, skill.name))
+        error = compiled.first_error(schema_kwargs)
+        if error is not None:
+            return ToolResult(error=_format_validation_error(error, skill.name))
 
         # Get known properties from schema
-        schema_props = set(schema.get("properties", {}).keys())
+        schema_props = compiled.properties
 
-        if schema_preserves_dynamic_top_level_keys(schema):
+        if compiled.preserve_dynamic:
             validated = dict(kwargs)
         else:
             # Filter to known properties + allowed internal params
@@ -551,6 +548,14 @@ class FileSkill(ABC):
         resolver = PathResolver(self._services)
         return resolver.resolve(path, tool_name=self.name)
 
+    def _invalidate_directory_cache(self, *paths: Path) -> None:
+        """Tell the shared directory cache that paths were modified.
+
+        Skills that create, modify, move or delete files must call this
+        after the change so glob/search_text/list_directory see it.
+        """
+        self._services.get_directory_cache().invalidate(*paths)
+
     @property
     @abstractmethod
     def name(self) -> str:
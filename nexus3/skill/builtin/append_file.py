@@ -142,6 +142,7 @@ class AppendFileSkill(FileSkill):
                 return len(to_write)
 
             chars_written = await asyncio.to_thread(do_append)
+            self._invalidate_directory_cache(p)
             return ToolResult(output=f"Appended {chars_written} characters to {path}")
 
         except (PathSecurityError, ValueError) as e:
@@ -115,7 +115,7 @@ class ClipboardListSkill(ClipboardSkillBase):
                 return ToolResult(error=f"Invalid scope: {scope}")
 
         try:
-            entries = manager.list_entries(clip_scope)
+            entries = manager.list_entries(clip_scope, include_content=verbose)
         except PermissionError as e:
             return ToolResult(error=str(e))
 
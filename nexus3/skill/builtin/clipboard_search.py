@@ -25,7 +25,10 @@ class ClipboardSearchSkill:
 
     @property
     def description(self) -> str:
-        return "Search clipboard entries by content or description substring."
+        return (
+            "Search clipboard entries by key, description or content substring. "
+            "Results are ranked (key > description > content) with a snippet of each match."
+        )
 
     @property
     def parameters(self) -> dict[str, Any]:
@@ -75,10 +78,7 @@ class ClipboardSearchSkill:
                 return ToolResult(error=f"Invalid scope: {scope}")
 
         try:
-            results = manager.search(query, scope=clip_scope)
-            # Apply limit if specified
-            if max_results and len(results) > max_results:
-                results = results[:max_results]
+            results = manager.search_hits(query, scope=clip_scope, limit=max_results or None)
         except PermissionError as e:
             return ToolResult(error=str(e))
 
@@ -87,8 +87,10 @@ class ClipboardSearchSkill:
             return ToolResult(output=f"No matches found for '{query}'{scope_msg}")
 
         lines = [f"Found {len(results)} match(es) for '{query}':", ""]
-        for entry in results:
-            lines.append(format_entry_detail(entry, verbose=False))
+        for hit in results:
+            lines.append(format_entry_detail(hit.entry, verbose=False))
+            if hit.snippet:
+                lines.append(f"        Match: {hit.snippet}")
             lines.append("")
 
         return ToolResult(output="\n".join(lines))
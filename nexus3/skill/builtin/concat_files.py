@@ -642,7 +642,11 @@ class ConcatFilesSkill(FileSkill):
         extensions: list[str],
         exclude: list[str] | None,
     ) -> list[Path]:
-        """Find files matching extensions using glob.
+        """Find files matching extensions by walking the directory tree.
+
+        The walk goes through the shared directory cache, so repeated calls
+        over an unchanged tree do not re-list it. Like ``Path.glob("**")``,
+        it does not descend into symlinked directories.
 
         Args:
             base_path: Directory to search in.
@@ -653,28 +657,28 @@ class ConcatFilesSkill(FileSkill):
         Returns:
             List of matching file paths.
         """
+        dir_cache = self._services.get_directory_cache()
 
         def do_find() -> list[Path]:
             results: list[Path] = []
+            all_files = dir_cache.walk_files(base_path)
 
             for ext in extensions:
-                pattern = f"**/*.{ext}"
+                pattern = f"*.{ext}"
+                candidates = [path for path in all_files if fnmatch.fnmatch(path.name, pattern)]
                 try:
                     authorized_matches = fs_gateway.iter_authorized_paths(
-                        base_path.glob(pattern),
+                        candidates,
                         must_exist=True,
                     )
                     for path in authorized_matches:
-                        if not path.is_file():
-                            continue
-
                         # Check exclusions
                         if self._should_exclude(path, exclude):
                             continue
 
                         results.append(path)
                 except (OSError, PermissionError):
-                    # Skip directories we can't access
+                    # Skip files we can't access
                     continue
 
             return results
@@ -96,6 +96,7 @@ class CopyFileSkill(FileSkill):
 
             # Copy with metadata
             await asyncio.to_thread(shutil.copy2, src_path, dst_path)
+            self._invalidate_directory_cache(dst_path)
 
             return ToolResult(output=f"Copied {source} to {destination}")
 
@@ -52,6 +52,7 @@ class _ExactStringEditSkill(FileSkill):
         if original_line_ending != "\n":
             output_content = output_content.replace("\n", original_line_ending)
         await asyncio.to_thread(atomic_write_bytes, path, output_content.encode("utf-8"))
+        self._invalidate_directory_cache(path)
 
     def _string_replace(
         self,
@@ -102,6 +102,7 @@ class GlobSkill(FileSkill):
             # Validate path (resolves symlinks, checks allowed_paths if set)
             base_path = self._validate_path(path)
             fs_gateway = FilesystemAccessGateway(self._services, tool_name=self.name)
+            dir_cache = self._services.get_directory_cache()
 
             # Verify base path exists and is a directory
             is_dir = await asyncio.to_thread(base_path.is_dir)
@@ -119,39 +120,37 @@ class GlobSkill(FileSkill):
                 results: list[Path] = []
 
                 def walk(current_dir: Path, relative_dir: PurePosixPath | None = None) -> None:
+                    # base_path is resolved and symlinked dirs are not
+                    # descended, so every current_dir is already resolved
                     try:
-                        entries = sorted(current_dir.iterdir(), key=lambda entry: entry.name)
+                        entries = dir_cache.listdir(current_dir, resolved=True)
                     except OSError:
                         return
 
-                    for entry in entries:
+                    for dir_entry in entries:
+                        entry = current_dir / dir_entry.name
                         rel_path = (
-                            PurePosixPath(entry.name)
+                            PurePosixPath(dir_entry.name)
                             if relative_dir is None
-                            else relative_dir / entry.name
+                            else relative_dir / dir_entry.name
                         )
 
                         decision = fs_gateway.decide_path(entry, must_exist=True)
                         if not decision.allowed:
                             continue
 
-                        try:
-                            is_dir_entry = entry.is_dir()
-                        except OSError:
-                            continue
-
                         if _matches_exclude_patterns(rel_path, normalized_exclude):
                             continue
 
                         if _matches_glob_pattern(rel_path, pattern) and _matches_kind(
-                            is_dir=is_dir_entry,
+                            is_dir=dir_entry.is_dir,
                             kind=kind,
                         ):
                             results.append(entry)
                             if len(results) >= max_results:
                                 return
 
-                        if should_recurse and is_dir_entry and not entry.is_symlink():
+                        if should_recurse and dir_entry.is_dir and not dir_entry.is_symlink:
                             walk(entry, rel_path)
                             if len(results) >= max_results:
                                 return
@@ -3,44 +3,32 @@
 P2.5 SECURITY: Implements file size limits and streaming search.
 Issue 6: Optimized with parallel file search using asyncio.gather + semaphore.
 Performance: Uses ripgrep when available (10-100x faster for large directories).
+The Python fallback can narrow its candidate files with a persistent trigram
+index (``search.content_index``, see nexus3.core.trigram_index).
 """
 
 import asyncio
 import fnmatch
 import json
+import logging
+import os
 import re
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
 from nexus3.core.constants import MAX_GREP_FILE_SIZE
+from nexus3.core.dir_cache import EXCLUDED_DIRS, DirectoryCache, get_directory_cache
 from nexus3.core.errors import PathSecurityError
 from nexus3.core.external_tools import ExternalToolResolution, resolve_ripgrep
 from nexus3.core.filesystem_access import FilesystemAccessGateway
+from nexus3.core.trigram_index import TrigramIndex, get_trigram_index, required_trigrams
 from nexus3.core.types import ToolResult
 from nexus3.skill.base import FileSkill, file_skill_factory
 
-# Directories to exclude from Python fallback search
-# ripgrep respects .gitignore automatically, so these are only for the fallback
-EXCLUDED_DIRS = frozenset(
-    {
-        ".git",
-        "node_modules",
-        "__pycache__",
-        ".venv",
-        ".nexus3",
-        "venv",
-        ".tox",
-        ".mypy_cache",
-        ".pytest_cache",
-        ".ruff_cache",
-        "dist",
-        "build",
-        ".eggs",
-        "*.egg-info",
-    }
-)
+logger = logging.getLogger(__name__)
 
 # Bounded concurrency for parallel file search
 MAX_CONCURRENT_SEARCHES = 10
@@ -138,10 +126,7 @@ def _count_large_files_for_search(
     if recursive:
         files_to_check = _rglob_with_exclusions(search_path)
     else:
-        try:
-            files_to_check = [entry for entry in search_path.iterdir() if entry.is_file()]
-        except OSError:
-            return 0
+        files_to_check = _list_files(search_path)
 
     skipped = 0
     for file_path in files_to_check:
@@ -485,38 +470,85 @@ async def _search_with_ripgrep(
     )
 
 
-def _should_exclude_dir(dir_name: str) -> bool:
-    """Check if a directory should be excluded from Python fallback search."""
-    if dir_name in EXCLUDED_DIRS:
-        return True
-    # Handle patterns like *.egg-info
-    for pattern in EXCLUDED_DIRS:
-        if "*" in pattern and fnmatch.fnmatch(dir_name, pattern):
-            return True
-    return False
+def _rglob_with_exclusions(root: Path, dir_cache: DirectoryCache | None = None) -> list[Path]:
+    """Recursively list files, skipping EXCLUDED_DIRS.
+
+    This is significantly faster than rglob("*") for repos with node_modules, .git, etc.,
+    and repeated searches reuse the shared directory cache's listings.
+    """
+    cache = dir_cache or get_directory_cache()
+    return cache.walk_files(root, prune_excluded=True, follow_symlinks=True)
 
 
-def _rglob_with_exclusions(root: Path) -> list[Path]:
-    """Recursively glob files, skipping excluded directories.
+def _list_files(directory: Path, dir_cache: DirectoryCache | None = None) -> list[Path]:
+    """List the files directly inside directory (empty if it cannot be listed)."""
+    cache = dir_cache or get_directory_cache()
+    try:
+        return [directory / entry.name for entry in cache.listdir(directory) if entry.is_file]
+    except OSError:
+        return []
 
-    This is significantly faster than rglob("*") for repos with node_modules, .git, etc.
+
+def _prefilter_files(
+    fs_gateway: FilesystemAccessGateway,
+    files: list[Path],
+    search_path: Path,
+) -> tuple[list[tuple[Path, Path | str]], list[tuple[Path, os.stat_result]], int]:
+    """Authorize and stat candidate files, dropping oversized ones.
+
+    Returns:
+        Tuple of ((file_path, rel_path) pairs, (file_path, stat) pairs for the
+        same files, number of files skipped for size).
     """
-    results: list[Path] = []
+    valid_files: list[tuple[Path, Path | str]] = []
+    file_stats: list[tuple[Path, os.stat_result]] = []
+    files_skipped_size = 0
+    for file_path in fs_gateway.iter_authorized_paths(files, must_exist=True):
+        # P2.5 SECURITY: Skip files that are too large
+        try:
+            file_stat = file_path.stat()
+            if file_stat.st_size > MAX_GREP_FILE_SIZE:
+                files_skipped_size += 1
+                continue
+        except OSError:
+            continue
+        file_stats.append((file_path, file_stat))
 
-    def _walk(directory: Path) -> None:
+        # Format relative path
         try:
-            for entry in directory.iterdir():
-                if entry.is_dir():
-                    if not _should_exclude_dir(entry.name):
-                        _walk(entry)
-                else:
-                    results.append(entry)
-        except (PermissionError, OSError):
-            # Skip inaccessible directories
-            pass
+            rel_path: Path | str = file_path.relative_to(search_path)
+        except ValueError:
+            rel_path = file_path
 
-    _walk(root)
-    return results
+        valid_files.append((file_path, rel_path))
+    return valid_files, file_stats, files_skipped_size
+
+
+def _narrow_with_index(
+    index: TrigramIndex,
+    files: list[tuple[Path, Path | str]],
+    file_stats: list[tuple[Path, os.stat_result]],
+    regex: re.Pattern[str],
+    prune_under: Path | None,
+) -> list[tuple[Path, Path | str]]:
+    """Refresh the index for files and keep only those that may match regex.
+
+    Args:
+        index: Project trigram index.
+        files: (file_path, rel_path) pairs that passed access and size checks.
+        file_stats: (file_path, stat) for the same files.
+        regex: Compiled search pattern.
+        prune_under: Directory that files completely lists, if any.
+
+    Returns:
+        The subset of files that can contain a match.
+    """
+    trigrams = required_trigrams(regex.pattern, regex.flags)
+    if not trigrams:
+        return files
+    index.refresh(file_stats, prune_under=prune_under)
+    keep = set(index.candidates(file_stats, trigrams))
+    return [entry for entry in files if entry[0] in keep]
 
 
 class SearchTextSkill(FileSkill):
@@ -721,6 +753,17 @@ class SearchTextSkill(FileSkill):
         search_config = config.search if config is not None else None
         return resolve_ripgrep(search_config)
 
+    def _content_index(self) -> TrigramIndex | None:
+        """Return the project's trigram index if enabled and usable."""
+        config = self._services.get_config()
+        if config is None or not config.search.content_index:
+            return None
+        try:
+            return get_trigram_index(self._services.get_cwd())
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("search_text content index unavailable: %s", e)
+            return None
+
     def _require_ripgrep(self) -> bool:
         """Return True when config requires ripgrep for directory search_text."""
         config = self._services.get_config()
@@ -750,15 +793,14 @@ class SearchTextSkill(FileSkill):
         if is_file:
             files_to_search = [search_path]
         elif is_dir:
-            # Custom rglob that excludes common directories
+            # Cached walk that excludes common directories and lists files only
+            dir_cache = self._services.get_directory_cache()
             if recursive:
                 files_to_search = await asyncio.to_thread(
-                    lambda: list(_rglob_with_exclusions(search_path))
+                    _rglob_with_exclusions, search_path, dir_cache
                 )
             else:
-                files_to_search = await asyncio.to_thread(lambda: list(search_path.glob("*")))
-            # Filter to files only
-            files_to_search = [f for f in files_to_search if f.is_file()]
+                files_to_search = await asyncio.to_thread(_list_files, search_path, dir_cache)
         else:
             return ToolResult(error=f"Path not found: {search_path}")
 
@@ -768,34 +810,24 @@ class SearchTextSkill(FileSkill):
 
         # Issue 6: Pre-filter files before parallel search
         # This moves validation/size checks out of the hot loop
-        valid_files: list[tuple[Path, Path | str]] = []
-        files_skipped_size = 0
         fs_gateway = FilesystemAccessGateway(self._services, tool_name=self.name)
-        authorized_files = fs_gateway.iter_authorized_paths(
-            files_to_search,
-            must_exist=True,
+        valid_files, file_stats, files_skipped_size = await asyncio.to_thread(
+            _prefilter_files, fs_gateway, files_to_search, search_path
         )
 
-        for file_path in authorized_files:
-            # P2.5 SECURITY: Skip files that are too large
-            try:
-                file_size = file_path.stat().st_size
-                if file_size > MAX_GREP_FILE_SIZE:
-                    files_skipped_size += 1
-                    continue
-            except OSError:
-                continue
-
-            # Format relative path
-            try:
-                rel_path: Path | str = file_path.relative_to(search_path)
-            except ValueError:
-                rel_path = file_path
-
-            valid_files.append((file_path, rel_path))
+        files_searched = len(valid_files)
+        index = self._content_index() if is_dir else None
+        if index is not None:
+            valid_files = await asyncio.to_thread(
+                _narrow_with_index,
+                index,
+                valid_files,
+                file_stats,
+                regex,
+                search_path if recursive and include is None else None,
+            )
 
         # Issue 6: Parallel search with bounded concurrency
-        files_searched = len(valid_files)
         matches, files_with_matches, files_skipped_invalid_utf8 = await _search_files_parallel(
             valid_files,
             regex,
@@ -78,21 +78,23 @@ class ListDirectorySkill(FileSkill):
                     return ToolResult(error=f"Not a directory: {path}")
                 return ToolResult(error=f"Directory not found: {path}")
 
-            # Get directory entries
-            entries = await asyncio.to_thread(list, p.iterdir())
+            # Get directory entries from the shared listing cache
+            dir_cache = self._services.get_directory_cache()
+            entries = list(await asyncio.to_thread(dir_cache.listdir, p))
 
             # Filter hidden files unless 'all' is True
             if not all:
                 entries = [e for e in entries if not e.name.startswith(".")]
 
             # Sort entries: directories first, then files, alphabetically
-            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
+            entries.sort(key=lambda e: (not e.is_dir, e.name.lower()))
 
             if long:
                 lines = []
                 for entry in entries:
                     try:
-                        stat_info = await asyncio.to_thread(entry.stat)
+                        # Fresh stat: in-place edits don't change the listing
+                        stat_info = await asyncio.to_thread((p / entry.name).stat)
                         size = stat_info.st_size
                         mtime = datetime.fromtimestamp(stat_info.st_mtime)
                         mtime_str = mtime.strftime("%Y-%m-%d %H:%M")
@@ -116,7 +118,7 @@ class ListDirectorySkill(FileSkill):
                 output = "\n".join(lines)
             else:
                 # Simple listing
-                output = "\n".join(e.name + ("/" if e.is_dir() else "") for e in entries)
+                output = "\n".join(e.name + ("/" if e.is_dir else "") for e in entries)
 
             if not output:
                 output = "(empty directory)"
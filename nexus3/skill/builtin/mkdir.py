@@ -63,6 +63,7 @@ class MkdirSkill(FileSkill):
             # Create directory (and parents)
             already_exists = p.exists()
             await asyncio.to_thread(p.mkdir, parents=True, exist_ok=True)
+            self._invalidate_directory_cache(p)
 
             if already_exists:
                 return ToolResult(output=f"Directory already exists: {path}")
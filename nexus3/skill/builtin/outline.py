@@ -3,29 +3,45 @@
 Returns headings for markdown, class/function signatures for code,
 key hierarchies for data files. Acts as an "IDE outline view" for agents,
 enabling cheap structural awareness without reading full content.
+
+Parsed outlines are cached per file and (path, mtime, size, parser, options),
+and definitions feed a project symbol index that answers
+``outline(path=<directory>, symbol=...)`` (see nexus3.core.symbol_index).
 """
 
 import asyncio
+import logging
+import os
 import re
+import sqlite3
 import subprocess
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from nexus3.core.constants import MAX_FILE_SIZE_BYTES, MAX_OUTPUT_BYTES
+from nexus3.core.dir_cache import DirectoryCache
 from nexus3.core.errors import PathSecurityError
 from nexus3.core.filesystem_access import FilesystemAccessGateway
+from nexus3.core.symbol_index import SymbolIndex, get_symbol_index
 from nexus3.core.types import ToolResult
 from nexus3.skill.base import FileSkill, file_skill_factory
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Constants
 # =============================================================================
 
 _MAX_OUTLINE_LINES = 50000  # More generous than read_file; outline only stores entries
-_MAX_DIR_FILES = 100
 _MAX_DIR_OUTPUT_BYTES = 50000
+_MAX_SYMBOL_RESULTS = 100
+_UNLIMITED_DEPTH = 999
+
+# Minimum seconds between background symbol index refreshes of a project
+_BACKGROUND_REFRESH_INTERVAL = 60.0
 
 # Extension to parser language key
 EXT_TO_PARSER: dict[str, str] = {
@@ -1467,6 +1483,155 @@ PARSERS: dict[str, OutlineParser] = {
     "dockerfile": parse_dockerfile,
 }
 
+# Parsers whose entries are definitions; data-file keys and markup are not
+# put in the symbol index.
+SYMBOL_PARSERS: frozenset[str] = frozenset(
+    {"python", "javascript", "typescript", "rust", "go", "c", "cpp", "css", "sql",
+     "makefile", "dockerfile"}
+)
+
+
+# =============================================================================
+# Outline Cache and Symbol Index
+# =============================================================================
+
+def _cache_options(max_depth: int, signatures: bool, preview: int) -> str:
+    """Encode parse options for the outline cache key."""
+    return f"depth={max_depth};signatures={int(signatures)};preview={preview}"
+
+
+def _entry_to_cache(entry: OutlineEntry) -> dict[str, Any]:
+    """Serialise the parser-produced fields of an entry."""
+    return {
+        "line": entry.line,
+        "depth": entry.depth,
+        "kind": entry.kind,
+        "name": entry.name,
+        "signature": entry.signature,
+        "preview_lines": entry.preview_lines,
+    }
+
+
+def _load_outline(
+    p: Path,
+    st: os.stat_result,
+    parser_key: str,
+    max_depth: int,
+    signatures: bool,
+    preview: int,
+    index: SymbolIndex | None,
+    need_lines: bool = False,
+) -> tuple[list[OutlineEntry], int, list[str] | None]:
+    """Parse a file, or reuse its cached outline if it is unchanged.
+
+    Args:
+        p: File to outline.
+        st: Current stat of the file.
+        parser_key: Parser to use.
+        max_depth: Parser depth limit.
+        signatures: Include signatures.
+        preview: Preview lines per entry.
+        index: Cache to use, if any.
+        need_lines: Read the file even on a cache hit (tokens, symbol bodies).
+
+    Returns:
+        (entries, line count, file lines or None if not read).
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8.
+        OSError: If the file cannot be read.
+    """
+    options = _cache_options(max_depth, signatures, preview)
+    cached = index.get_outline(p, st, parser_key, options) if index is not None else None
+    if cached is not None:
+        line_count, raw_entries = cached
+        cached_lines = _read_file_lines(p) if need_lines else None
+        return [OutlineEntry(**raw) for raw in raw_entries], line_count, cached_lines
+
+    lines = _read_file_lines(p)
+    entries = PARSERS[parser_key](lines, max_depth, signatures, preview)
+    if index is not None:
+        index.put_outline(
+            p, st, parser_key, options, len(lines), [_entry_to_cache(e) for e in entries]
+        )
+    return entries, len(lines), lines
+
+
+def _refresh_symbol_index(
+    index: SymbolIndex,
+    directory: Path,
+    dir_cache: DirectoryCache,
+    fs_gateway: FilesystemAccessGateway,
+) -> int:
+    """Bring the symbol index up to date for every file under directory.
+
+    Only files the gateway authorises are parsed; unchanged files cost a
+    stat. Entries for deleted files are dropped.
+
+    Returns:
+        Number of files (re)parsed.
+    """
+    files = dir_cache.walk_files(directory, prune_excluded=True)
+    index.prune(directory, set(files))
+    candidates = [path for path in files if _detect_language(path) in SYMBOL_PARSERS]
+    parsed = 0
+    for path in fs_gateway.iter_authorized_paths(candidates, must_exist=True):
+        parser_key = _detect_language(path)
+        if parser_key is None:
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if st.st_size > MAX_FILE_SIZE_BYTES or not index.needs_symbols(path, st, parser_key):
+            continue
+        try:
+            lines = _read_file_lines(path)
+        except UnicodeDecodeError:
+            lines = []
+        except OSError:
+            continue
+        entries = PARSERS[parser_key](lines, _UNLIMITED_DEPTH, True, 0)
+        index.put_symbols(
+            path,
+            st,
+            parser_key,
+            [(e.name, e.kind, e.line, e.signature) for e in entries],
+        )
+        parsed += 1
+    return parsed
+
+
+# Background refresh per project root: (task, start time)
+_BACKGROUND_REFRESHES: dict[Path, tuple["asyncio.Task[int]", float]] = {}
+
+
+def _schedule_background_refresh(
+    index: SymbolIndex,
+    dir_cache: DirectoryCache,
+    fs_gateway: FilesystemAccessGateway,
+) -> None:
+    """Refresh a project's symbol index in a worker thread, at most once a minute."""
+    previous = _BACKGROUND_REFRESHES.get(index.root)
+    now = time.monotonic()
+    if previous is not None and (
+        not previous[0].done() or now - previous[1] < _BACKGROUND_REFRESH_INTERVAL
+    ):
+        return
+
+    async def refresh() -> int:
+        try:
+            parsed = await asyncio.to_thread(
+                _refresh_symbol_index, index, index.root, dir_cache, fs_gateway
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Background symbol index refresh failed: %s", e)
+            return 0
+        logger.debug("Symbol index refresh of %s parsed %d files", index.root, parsed)
+        return parsed
+
+    _BACKGROUND_REFRESHES[index.root] = (asyncio.create_task(refresh()), now)
+
 
 # =============================================================================
 # Skill Class
@@ -1494,7 +1659,8 @@ class OutlineSkill(FileSkill):
             "Markdown, HTML, CSS, SQL, Makefile, Dockerfile. "
             "Use line numbers in output to target read_file for details. "
             "Pass a directory to get a non-recursive per-file top-level map. "
-            "Use symbol='ClassName' to read a specific symbol's body. "
+            "Use symbol='ClassName' to read a specific symbol's body, or pass a "
+            "directory with symbol to find where it is defined anywhere below it. "
             "Use parser='python' when extension detection is unavailable. "
             "Use tokens=true for token estimates, diff=true for change markers."
         )
@@ -1562,7 +1728,9 @@ class OutlineSkill(FileSkill):
                     "type": "string",
                     "description": (
                         "Return the full body of this symbol (class, function, heading). "
-                        "Searches by name. Returns raw source lines, not an outline."
+                        "Searches by name. Returns raw source lines, not an outline. "
+                        "With a directory path, lists every definition of the symbol "
+                        "in code files below it (recursive)."
                     ),
                 },
                 "diff": {
@@ -1626,13 +1794,6 @@ class OutlineSkill(FileSkill):
                             "outline specific targets."
                         )
                     )
-                if symbol:
-                    return ToolResult(
-                        error=(
-                            "outline(symbol=...) is only supported for files. "
-                            "Pick a file first, then retry with symbol."
-                        )
-                    )
                 if file_type or language or parser:
                     return ToolResult(
                         error=(
@@ -1640,6 +1801,8 @@ class OutlineSkill(FileSkill):
                             "Directory mode auto-detects per-file parsers."
                         )
                     )
+                if symbol:
+                    return await self._find_symbol(p, symbol, line_numbers)
                 return await self._outline_directory(
                     p,
                     depth=depth,
@@ -1656,7 +1819,8 @@ class OutlineSkill(FileSkill):
                 return ToolResult(error=f"File not found: {path}")
 
             # Size check
-            file_size = await asyncio.to_thread(lambda: p.stat().st_size)
+            file_stat = await asyncio.to_thread(p.stat)
+            file_size = file_stat.st_size
             if file_size > MAX_FILE_SIZE_BYTES:
                 return ToolResult(
                     error=(
@@ -1686,26 +1850,33 @@ class OutlineSkill(FileSkill):
                     )
                 )
 
-            # Read file
-            lines = await asyncio.to_thread(_read_file_lines, p)
-
-            # Parse
-            max_depth = depth if depth is not None else 999
-            entries = parser_fn(lines, max_depth, signatures, preview)
+            # Read and parse, or reuse the cached outline of an unchanged file
+            max_depth = depth if depth is not None else _UNLIMITED_DEPTH
+            entries, line_count, lines = await asyncio.to_thread(
+                _load_outline,
+                p,
+                file_stat,
+                parser_key,
+                max_depth,
+                signatures,
+                preview,
+                self._symbol_index(p),
+                bool(symbol or tokens),
+            )
 
             if not entries:
                 return ToolResult(output=f"(No outline entries found in {p.name})")
 
             # Compute end_line for each entry
-            _compute_end_lines(entries, len(lines))
+            _compute_end_lines(entries, line_count)
 
             # Filtered read mode
             if symbol:
-                return _extract_symbol(entries, lines, symbol, p.name, line_numbers)
+                return _extract_symbol(entries, lines or [], symbol, p.name, line_numbers)
 
             # Token estimates
             if tokens:
-                _annotate_token_estimates(entries, lines)
+                _annotate_token_estimates(entries, lines or [])
 
             # Diff-aware markers
             diff_note = ""
@@ -1749,27 +1920,27 @@ class OutlineSkill(FileSkill):
     ) -> ToolResult:
         """Outline all supported files in a directory (non-recursive)."""
         fs_gateway = FilesystemAccessGateway(self._services, tool_name=self.name)
+        dir_cache = self._services.get_directory_cache()
         try:
-            entries_raw = sorted(dir_path.iterdir(), key=lambda p: p.name)
+            listing = await asyncio.to_thread(dir_cache.listdir, dir_path)
         except PermissionError:
             return ToolResult(error=f"Permission denied: {dir_path}")
+        file_names = {entry.name for entry in listing if entry.is_file}
 
         # Filter to supported files only
         file_paths: list[Path] = []
         authorized_entries = fs_gateway.iter_authorized_paths(
-            entries_raw,
+            [dir_path / entry.name for entry in listing],
             must_exist=True,
         )
         for entry in authorized_entries:
             if entry.name.startswith("."):
                 continue
-            if not entry.is_file():
+            if entry.name not in file_names:
                 continue
             if _detect_language(entry) is None:
                 continue
             file_paths.append(entry)
-            if len(file_paths) >= _MAX_DIR_FILES:
-                break
 
         if not file_paths:
             supported = _supported_parser_keys()
@@ -1800,29 +1971,30 @@ class OutlineSkill(FileSkill):
             parts.append(diff_note)
         parts.append("")
         total_bytes = 0
+        index = self._symbol_index(dir_path)
+
+        def load(fp: Path, parser_key: str) -> tuple[list[OutlineEntry], int, list[str] | None]:
+            return _load_outline(
+                fp, fp.stat(), parser_key, depth or 1, signatures, preview, index, tokens
+            )
 
         for fp in file_paths:
             section_start = len(parts)
             parser_key = _detect_language(fp)
-            if parser_key is None:
-                continue
-
-            parser = PARSERS.get(parser_key)
-            if parser is None:
+            if parser_key is None or parser_key not in PARSERS:
                 continue
 
             try:
-                lines = await asyncio.to_thread(_read_file_lines, fp)
-            except (UnicodeDecodeError, PermissionError):
+                file_entries, line_count, lines = await asyncio.to_thread(load, fp, parser_key)
+            except (UnicodeDecodeError, OSError):
                 continue
 
-            file_entries = parser(lines, depth or 1, signatures, preview)
             if not file_entries:
                 continue
 
             if tokens:
-                _compute_end_lines(file_entries, len(lines))
-                _annotate_token_estimates(file_entries, lines)
+                _compute_end_lines(file_entries, line_count)
+                _annotate_token_estimates(file_entries, lines or [])
 
             # File header
             diff_marker = ""
@@ -1860,6 +2032,81 @@ class OutlineSkill(FileSkill):
 
         return ToolResult(output="\n".join(parts))
 
+    def _symbol_index(self, path: Path) -> SymbolIndex | None:
+        """Return the project's outline cache / symbol index if path is inside it.
+
+        With ``search.symbol_index`` enabled the index is persistent and a
+        background refresh of the whole project is scheduled.
+        """
+        config = self._services.get_config()
+        persistent = config is not None and config.search.symbol_index
+        try:
+            root = self._services.get_cwd().resolve()
+            if not path.is_relative_to(root):
+                return None
+            index = get_symbol_index(root, persistent=persistent)
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("outline symbol index unavailable: %s", e)
+            return None
+        if persistent:
+            _schedule_background_refresh(
+                index,
+                self._services.get_directory_cache(),
+                FilesystemAccessGateway(self._services, tool_name=self.name),
+            )
+        return index
+
+    async def _find_symbol(
+        self,
+        dir_path: Path,
+        symbol: str,
+        line_numbers: bool = True,
+    ) -> ToolResult:
+        """List where symbol is defined in code files below dir_path."""
+        fs_gateway = FilesystemAccessGateway(self._services, tool_name=self.name)
+        index = self._symbol_index(dir_path)
+        temporary = index is None
+        try:
+            if index is None:
+                # Outside the project: parse the directory for this call only
+                index = SymbolIndex(dir_path, persistent=False)
+            await asyncio.to_thread(
+                _refresh_symbol_index,
+                index,
+                dir_path,
+                self._services.get_directory_cache(),
+                fs_gateway,
+            )
+            locations = await asyncio.to_thread(
+                index.find, symbol, under=dir_path, limit=_MAX_SYMBOL_RESULTS + 1
+            )
+        except (OSError, sqlite3.Error) as e:
+            return ToolResult(error=f"Symbol lookup failed: {e}")
+        finally:
+            if temporary and index is not None:
+                index.close()
+
+        allowed = set(
+            fs_gateway.iter_authorized_paths(
+                [location.path for location in locations], must_exist=True
+            )
+        )
+        locations = [
+            location for location in locations
+            if location.path in allowed and location.path.is_relative_to(dir_path)
+        ]
+        if not locations:
+            return ToolResult(output=f"No definitions of '{symbol}' found under {dir_path.name}/")
+
+        lines = [f"# Definitions of '{symbol}' under {dir_path.name}/", ""]
+        for location in locations[:_MAX_SYMBOL_RESULTS]:
+            relative = location.path.relative_to(dir_path).as_posix()
+            where = f"{relative}:{location.line}" if line_numbers else relative
+            lines.append(f"{where}  {location.kind}: {location.signature or location.name}")
+        if len(locations) > _MAX_SYMBOL_RESULTS:
+            lines.append(f"\n(Limited to {_MAX_SYMBOL_RESULTS} definitions)")
+        return ToolResult(output="\n".join(lines))
+
 
 # Factory
 outline_factory = file_skill_factory(OutlineSkill)
@@ -356,6 +356,7 @@ class PatchSkill(FileSkill):
             await asyncio.to_thread(target_path.parent.mkdir, parents=True, exist_ok=True)
             new_bytes = apply_result.new_content.encode("utf-8", errors="surrogateescape")
             await asyncio.to_thread(atomic_write_bytes, target_path, new_bytes)
+            self._invalidate_directory_cache(target_path)
         except OSError as e:
             return ToolResult(error=f"Error writing patched file: {e}")
 
@@ -1,9 +1,14 @@
 """Read file skill for reading file contents.
 
 P2.5 SECURITY: Implements streaming reads with size limits to prevent memory DoS.
+
+Paged reads (offset > 1) seek to the nearest checkpoint of the shared sparse
+line index (nexus3.core.line_index) instead of skipping lines from the top,
+so paging through a large file with next_offset is linear overall.
 """
 
 import asyncio
+import io
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,6 +16,7 @@ from typing import Any, Literal
 
 from nexus3.core.constants import MAX_FILE_SIZE_BYTES, MAX_OUTPUT_BYTES, MAX_READ_LINES
 from nexus3.core.errors import PathSecurityError
+from nexus3.core.line_index import LineIndex, get_line_index_cache
 from nexus3.core.types import ToolResult
 from nexus3.skill.base import FileSkill, file_skill_factory
 
@@ -32,6 +38,7 @@ def _stream_read_lines(
     limit: int | None = None,
     max_bytes: int = MAX_OUTPUT_BYTES,
     line_numbers: bool = True,
+    index: LineIndex | None = None,
 ) -> _ReadWindow:
     """Stream-read lines from a file with limits.
 
@@ -43,6 +50,10 @@ def _stream_read_lines(
         limit: Maximum lines to read (None = use MAX_READ_LINES)
         max_bytes: Maximum total bytes to read
         line_numbers: Whether to prefix each line with its original line number
+        index: Line index of the file. When given, reading starts at the
+            nearest checkpoint before offset. It is ignored for files with
+            bare CR line breaks or invalid UTF-8, which are read from the top
+            so that line numbers and decode errors stay unchanged.
 
     Returns:
         Read window details, including continuation metadata when truncated.
@@ -57,7 +68,13 @@ def _stream_read_lines(
     truncation_reason: Literal["line_limit", "byte_limit"] | None = None
     start_idx = offset - 1  # Convert to 0-indexed
 
-    with open(filepath, encoding="utf-8") as f:
+    start_byte = 0
+    if index is not None and index.utf8_valid and not index.has_bare_cr:
+        checkpoint_line, start_byte = index.checkpoint_for_line(offset)
+        line_num = checkpoint_line - 1
+
+    with open(filepath, "rb") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+        raw.seek(start_byte)
         for line in f:
             line_num += 1
 
@@ -234,6 +251,11 @@ class ReadFileSkill(FileSkill):
                     f"Use 'tail' for last lines or specify offset/limit."
                 )
 
+            # Paged reads seek via the line index instead of skipping from the top
+            index = None
+            if effective_offset > 1:
+                index = await asyncio.to_thread(get_line_index_cache().get, p)
+
             # P2.5 SECURITY: Stream-read with limits
             window = await asyncio.to_thread(
                 _stream_read_lines,
@@ -242,6 +264,7 @@ class ReadFileSkill(FileSkill):
                 effective_limit,
                 MAX_OUTPUT_BYTES,
                 line_numbers,
+                index,
             )
 
             if not window.lines:
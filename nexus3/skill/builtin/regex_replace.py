@@ -207,6 +207,7 @@ class RegexReplaceSkill(FileSkill):
             if original_line_ending != '\n':
                 new_content = new_content.replace('\n', original_line_ending)
             await asyncio.to_thread(atomic_write_bytes, p, new_content.encode('utf-8'))
+            self._invalidate_directory_cache(p)
 
             return ToolResult(
                 output=f"Replaced {actual_count} match(es) in {path}"
@@ -110,6 +110,7 @@ class RenameSkill(FileSkill):
 
             # Perform the rename/move
             await asyncio.to_thread(src_path.rename, dst_path)
+            self._invalidate_directory_cache(src_path, dst_path)
 
             item_type = "directory" if dst_path.is_dir() else "file"
             return ToolResult(output=f"Renamed {item_type}: {source} -> {destination}")
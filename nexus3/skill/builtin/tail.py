@@ -1,36 +1,61 @@
 """Tail skill for reading last N lines of a file.
 
 P2.5 SECURITY: Implements efficient tail reading with size limits.
+
+The last N lines are found by reading backwards from EOF in blocks, so the
+cost depends on N, not on the file size. Line numbers and UTF-8 validity
+come from the shared sparse line index (nexus3.core.line_index), which is
+built once per file version and extended cheaply as a log grows.
+
+With ``since_offset``, tail instead returns the complete lines appended since
+a byte offset returned by an earlier call, optionally waiting briefly for new
+data (``follow``).
 """
 
 import asyncio
+import os
+import time
 from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from nexus3.core.constants import MAX_OUTPUT_BYTES
+from nexus3.core.constants import MAX_OUTPUT_BYTES, MAX_READ_LINES
 from nexus3.core.errors import PathSecurityError
+from nexus3.core.line_index import LineIndex, count_lines_before, get_line_index_cache
 from nexus3.core.types import ToolResult
 from nexus3.skill.base import FileSkill, file_skill_factory
 
+# Block size for backward and since_offset reads
+_BLOCK_SIZE = 64 * 1024
+# follow waits at most this long for new data, polling at the interval below
+FOLLOW_TIMEOUT = 10.0
+_FOLLOW_POLL_INTERVAL = 0.25
+# Per-line overhead used when budgeting output bytes (line number prefix)
+_LINE_OVERHEAD = 10
+# Stands in for a line that can never fit in the output
+_SKIPPED_LINE = "[line longer than the output limit skipped]"
 
-def _tail_lines(
+
+@dataclass(frozen=True)
+class _SinceWindow:
+    """Complete lines appended after a byte offset."""
+
+    lines: list[tuple[int, str]]
+    next_offset: int
+    truncated: bool
+    reset: bool
+
+
+def _tail_lines_forward(
     filepath: Path,
     num_lines: int,
     max_bytes: int = MAX_OUTPUT_BYTES,
 ) -> tuple[list[tuple[int, str]], int, bool]:
-    """Read last N lines from a file efficiently.
+    """Read last N lines by iterating the whole file in text mode.
 
-    P2.5 SECURITY: Uses a deque to only keep last N lines in memory,
-    avoiding loading entire file.
-
-    Args:
-        filepath: Path to the file
-        num_lines: Number of lines from end
-        max_bytes: Maximum total bytes to return
-
-    Returns:
-        Tuple of (list of (line_num, line_content), total_lines, was_truncated)
+    Only used for files with bare ``\\r`` line breaks, which text mode splits
+    on but byte-offset indexing does not.
     """
     # Use deque to efficiently keep only last N lines
     line_buffer: deque[tuple[int, str]] = deque(maxlen=num_lines)
@@ -43,20 +68,173 @@ def _tail_lines(
 
     # Check if output would exceed max_bytes
     result = list(line_buffer)
-    # +10 for line number prefix
-    total_bytes = sum(len(line.encode("utf-8")) + 10 for _, line in result)
+    total_bytes = sum(len(line.encode("utf-8")) + _LINE_OVERHEAD for _, line in result)
 
     truncated = False
     if total_bytes > max_bytes:
         # Trim from start until under limit
         while result and total_bytes > max_bytes:
             removed = result.pop(0)
-            total_bytes -= len(removed[1].encode("utf-8")) + 10
+            total_bytes -= len(removed[1].encode("utf-8")) + _LINE_OVERHEAD
             truncated = True
 
     return result, total_lines, truncated
 
 
+def _tail_lines(
+    filepath: Path,
+    num_lines: int,
+    max_bytes: int = MAX_OUTPUT_BYTES,
+    index: LineIndex | None = None,
+) -> tuple[list[tuple[int, str]], int, bool]:
+    """Read last N lines from a file efficiently.
+
+    P2.5 SECURITY: Reads backwards from EOF and stops once N lines (or
+    max_bytes of output) are collected, so memory and I/O are bounded by the
+    output rather than the file.
+
+    Args:
+        filepath: Path to the file
+        num_lines: Number of lines from end
+        max_bytes: Maximum total bytes to return
+        index: Line index of the file (fetched from the shared cache if None)
+
+    Returns:
+        Tuple of (list of (line_num, line_content), total_lines, was_truncated)
+    """
+    if index is None:
+        index = get_line_index_cache().get(filepath)
+    if index.has_bare_cr:
+        return _tail_lines_forward(filepath, num_lines, max_bytes)
+
+    total_lines = index.total_lines
+    if total_lines == 0:
+        return [], 0, False
+
+    collected: list[str] = []  # Last line first
+    total_bytes = 0
+    truncated = False
+
+    def take(raw: bytes) -> bool:
+        """Add one line; return False once no more lines should be taken."""
+        nonlocal total_bytes, truncated
+        text = raw.decode("utf-8").rstrip()
+        line_bytes = len(text.encode("utf-8")) + _LINE_OVERHEAD
+        if total_bytes + line_bytes > max_bytes:
+            truncated = True
+            return False
+        collected.append(text)
+        total_bytes += line_bytes
+        return len(collected) < num_lines
+
+    with open(filepath, "rb") as f:
+        # Exclude the newline that terminates the last line
+        pos = index.size - 1 if index.ends_with_newline else index.size
+        partial = b""
+        more = True
+        while more and pos > 0:
+            start = max(0, pos - _BLOCK_SIZE)
+            f.seek(start)
+            block = f.read(pos - start)
+            pos = start
+            parts = (block + partial).split(b"\n")
+            partial = parts[0]
+            for raw in reversed(parts[1:]):
+                more = take(raw)
+                if not more:
+                    break
+            if more and len(partial) > max_bytes + _BLOCK_SIZE:
+                # A single line longer than the output budget
+                truncated = True
+                more = False
+        if more and pos == 0:
+            take(partial)
+
+    first_line = total_lines - len(collected) + 1
+    result = [(first_line + i, text) for i, text in enumerate(reversed(collected))]
+    return result, total_lines, truncated
+
+
+def _read_since(
+    filepath: Path,
+    index: LineIndex,
+    since_offset: int,
+    max_lines: int,
+    max_bytes: int = MAX_OUTPUT_BYTES,
+) -> _SinceWindow:
+    """Read complete lines that start at or after a byte offset.
+
+    A final line without a trailing newline is held back until it is
+    terminated, so a line being written is never returned in pieces. If the
+    file is now shorter than since_offset it was truncated or rotated, and
+    reading restarts from the beginning.
+    """
+    reset = since_offset > index.size
+    offset = 0 if reset else since_offset
+    line_num = count_lines_before(filepath, index, offset) + 1
+
+    lines: list[tuple[int, str]] = []
+    total_bytes = 0
+    truncated = False
+
+    def add(text: str, raw_len: int) -> bool:
+        """Append one line of raw_len bytes; False once the output is full."""
+        nonlocal total_bytes, line_num, offset, truncated
+        if len(lines) >= max_lines:
+            truncated = True
+            return False
+        line_bytes = len(text.encode("utf-8")) + _LINE_OVERHEAD
+        if line_bytes > max_bytes:
+            # Can never fit: skip it rather than stall the caller here
+            text = _SKIPPED_LINE
+            line_bytes = len(text) + _LINE_OVERHEAD
+        if total_bytes + line_bytes > max_bytes:
+            truncated = True
+            return False
+        lines.append((line_num, text))
+        total_bytes += line_bytes
+        line_num += 1
+        offset += raw_len + 1
+        return True
+
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        pending = b""
+        # Bytes of an overlong line dropped so far while looking for its end
+        skipped: int | None = None
+        pos = offset
+        while pos < index.size:
+            block = f.read(min(_BLOCK_SIZE, index.size - pos))
+            if not block:
+                break
+            pos += len(block)
+            if skipped is not None:
+                newline = block.find(b"\n")
+                if newline < 0:
+                    skipped += len(block)
+                    continue
+                if not add(_SKIPPED_LINE, skipped + newline):
+                    break
+                skipped = None
+                block = block[newline + 1 :]
+            parts = (pending + block).split(b"\n")
+            pending = parts.pop()
+            full = False
+            for raw in parts:
+                if not add(raw.decode("utf-8").rstrip(), len(raw)):
+                    full = True
+                    break
+            if full:
+                break
+            if len(pending) > max_bytes + _BLOCK_SIZE:
+                # Too long to ever return: stop buffering it and find its end.
+                # With no newline yet it is held back like any partial line.
+                skipped = len(pending)
+                pending = b""
+
+    return _SinceWindow(lines=lines, next_offset=offset, truncated=truncated, reset=reset)
+
+
 class TailSkill(FileSkill):
     """Skill that reads the last N lines of a file.
 
@@ -76,7 +254,11 @@ class TailSkill(FileSkill):
 
     @property
     def description(self) -> str:
-        return "Read the last N lines of a file"
+        return (
+            "Read the last N lines of a file. Output ends with a since_offset "
+            "marker; pass it back as since_offset to get only lines appended "
+            "since that call (add follow=true to wait briefly for new lines)"
+        )
 
     @property
     def parameters(self) -> dict[str, Any]:
@@ -86,20 +268,48 @@ class TailSkill(FileSkill):
                 "path": {"type": "string", "description": "The path to the file to read"},
                 "lines": {
                     "type": "integer",
-                    "description": "Number of lines from end (default: 10)",
+                    "description": (
+                        "Number of lines from end (default: 10). With since_offset, "
+                        "the maximum number of new lines to return (default: 10000)"
+                    ),
                     "default": 10,
                 },
+                "since_offset": {
+                    "type": "integer",
+                    "description": (
+                        "Byte offset from a previous tail call's since_offset marker. "
+                        "Returns only complete lines appended after it"
+                    ),
+                    "minimum": 0,
+                },
+                "follow": {
+                    "type": "boolean",
+                    "description": (
+                        "With since_offset, wait up to "
+                        f"{FOLLOW_TIMEOUT:.0f}s for new lines if there are none yet"
+                    ),
+                    "default": False,
+                },
             },
             "required": ["path"],
             "additionalProperties": False,
         }
 
-    async def execute(self, path: str = "", lines: int = 10, **kwargs: Any) -> ToolResult:
+    async def execute(
+        self,
+        path: str = "",
+        lines: int | None = None,
+        since_offset: int | None = None,
+        follow: bool = False,
+        **kwargs: Any,
+    ) -> ToolResult:
         """Read the last N lines of the file.
 
         Args:
             path: The path to the file to read
             lines: Number of lines from end (default: 10)
+            since_offset: Return only lines appended after this byte offset
+            follow: With since_offset, wait briefly for new lines
 
         Returns:
             ToolResult with file contents in output, or error message in error
@@ -107,15 +317,30 @@ class TailSkill(FileSkill):
         if not path:
             return ToolResult(error="No path provided")
 
-        if lines < 1:
+        if lines is not None and lines < 1:
             return ToolResult(error="Lines must be at least 1")
 
+        if follow and since_offset is None:
+            return ToolResult(error="follow requires since_offset")
+
         try:
             # Validate path (resolves symlinks, checks allowed_paths if set)
             p = self._validate_path(path)
 
-            # P2.5 SECURITY: Efficient tail read (deque keeps only last N lines)
-            result, total_lines, truncated = await asyncio.to_thread(_tail_lines, p, lines)
+            cache = get_line_index_cache()
+            index = await asyncio.to_thread(cache.get, p)
+            if not index.utf8_valid:
+                return ToolResult(error=f"File is not valid UTF-8 text: {path}")
+
+            if since_offset is not None:
+                return await self._execute_since(
+                    p, path, index, since_offset, lines or MAX_READ_LINES, follow
+                )
+
+            # P2.5 SECURITY: Efficient tail read (backwards from EOF)
+            result, total_lines, truncated = await asyncio.to_thread(
+                _tail_lines, p, lines or 10, MAX_OUTPUT_BYTES, index
+            )
 
             if not result:
                 return ToolResult(output="(File is empty)")
@@ -127,6 +352,8 @@ class TailSkill(FileSkill):
             if truncated:
                 output += "\n[... output truncated to fit size limit ...]"
 
+            next_offset = await asyncio.to_thread(_complete_lines_end, p, index)
+            output += f"\n[tail: since_offset={next_offset}]"
             return ToolResult(output=output)
 
         except UnicodeDecodeError:
@@ -142,6 +369,79 @@ class TailSkill(FileSkill):
         except Exception as e:
             return ToolResult(error=f"Error reading file: {e}")
 
+    async def _execute_since(
+        self,
+        p: Path,
+        path: str,
+        index: LineIndex,
+        since_offset: int,
+        max_lines: int,
+        follow: bool,
+    ) -> ToolResult:
+        """Return lines appended after since_offset, waiting if follow is set."""
+        cache = get_line_index_cache()
+        deadline = time.monotonic() + FOLLOW_TIMEOUT
+        while True:
+            window = await asyncio.to_thread(
+                _read_since, p, index, since_offset, max_lines, MAX_OUTPUT_BYTES
+            )
+            if window.lines or window.reset or not follow:
+                break
+            if not await _wait_for_change(p, index, deadline):
+                break
+            index = await asyncio.to_thread(cache.get, p)
+            if not index.utf8_valid:
+                return ToolResult(error=f"File is not valid UTF-8 text: {path}")
+
+        parts: list[str] = []
+        if window.reset:
+            parts.append(
+                f"[tail: file is shorter than since_offset={since_offset}; "
+                "it was truncated or rotated, reading from the start]\n"
+            )
+        if window.lines:
+            parts.extend(f"{line_num}: {content}\n" for line_num, content in window.lines)
+        else:
+            parts.append(f"(No new lines since offset {since_offset})\n")
+        if window.truncated:
+            parts.append("\n[... more lines available; call again with the offset below ...]")
+        parts.append(f"\n[tail: since_offset={window.next_offset}]")
+        return ToolResult(output="".join(parts))
+
+
+async def _wait_for_change(filepath: Path, index: LineIndex, deadline: float) -> bool:
+    """Poll the file's stat until it no longer matches index.
+
+    Returns:
+        True if the file changed, False if the deadline passed first.
+    """
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_FOLLOW_POLL_INTERVAL)
+        st = await asyncio.to_thread(os.stat, filepath)
+        if not index.matches_stat(st):
+            return True
+    return False
+
+
+def _complete_lines_end(filepath: Path, index: LineIndex) -> int:
+    """Byte offset just past the last newline-terminated line."""
+    if index.ends_with_newline or index.size == 0:
+        return index.size
+    nl = index.tail_sample.rfind(b"\n")
+    if nl != -1:
+        return index.size - len(index.tail_sample) + nl + 1
+    # Unterminated last line longer than the sample: search back for its start
+    with open(filepath, "rb") as f:
+        pos = index.size - len(index.tail_sample)
+        while pos > 0:
+            start = max(0, pos - _BLOCK_SIZE)
+            f.seek(start)
+            nl = f.read(pos - start).rfind(b"\n")
+            if nl != -1:
+                return start + nl + 1
+            pos = start
+    return 0
+
 
 # Factory for dependency injection
 tail_factory = file_skill_factory(TailSkill)
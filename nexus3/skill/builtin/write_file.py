@@ -68,6 +68,7 @@ class WriteFileSkill(FileSkill):
             await asyncio.to_thread(p.parent.mkdir, parents=True, exist_ok=True)
             # Atomic write: temp file + rename to prevent partial writes on crash
             await asyncio.to_thread(atomic_write_text, p, content)
+            self._invalidate_directory_cache(p)
             return ToolResult(output=f"Successfully wrote {bytes_written} bytes to {path}")
         except (PathSecurityError, ValueError) as e:
             return ToolResult(error=str(e))
@@ -24,17 +24,21 @@ Example:
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any
 
 from nexus3.core.identifiers import validate_tool_name
+from nexus3.core.validation import CompiledSchema, compile_schema
 from nexus3.skill.base import Skill
 from nexus3.skill.services import ServiceContainer
 
 if TYPE_CHECKING:
     from nexus3.core.permissions import AgentPermissions
 
+logger = logging.getLogger(__name__)
+
 # Factory type: takes ServiceContainer, returns Skill
 SkillFactory = Callable[[ServiceContainer], Skill]
 
@@ -51,12 +55,29 @@ class SkillSpec:
         description: Human-readable description of what the skill does.
         parameters: JSON Schema for the skill's parameters.
         factory: Factory function that creates the skill instance.
+        validator: Compiled validator for parameters, shared process-wide
+            with every registry that registers the same schema. None when
+            parameters were not provided or the schema failed to compile.
     """
 
     name: str
     description: str
     parameters: dict[str, Any]
     factory: SkillFactory
+    validator: CompiledSchema | None = None
+
+
+def _compile_validator(name: str, parameters: dict[str, Any]) -> CompiledSchema | None:
+    """Compile a skill's parameter schema via the process-wide validator cache.
+
+    Invalid schemas are not rejected at registration; they keep failing at
+    call time as they always have.
+    """
+    try:
+        return compile_schema(parameters)
+    except Exception as e:
+        logger.debug("Could not compile schema for skill %s: %s", name, e)
+        return None
 
 
 class SkillRegistry:
@@ -137,12 +158,15 @@ class SkillRegistry:
         # Clear cached instance if re-registering
         self._instances.pop(name, None)
 
-        # Store spec (metadata may be empty initially for lazy resolution)
+        # Store spec (metadata may be empty initially for lazy resolution).
+        # The argument validator is compiled here when the schema is known,
+        # otherwise on first instantiation in get().
         self._specs[name] = SkillSpec(
             name=name,
             description=description or "",
             parameters=parameters or {},
             factory=factory,
+            validator=_compile_validator(name, parameters) if parameters else None,
         )
 
     def get(self, name: str) -> Skill | None:
@@ -166,8 +190,26 @@ class SkillRegistry:
 
         skill = spec.factory(self._services)
         self._instances[name] = skill
+        if spec.validator is None:
+            self._specs[name] = replace(
+                spec, validator=_compile_validator(name, skill.parameters)
+            )
         return skill
 
+    def get_validator(self, name: str) -> CompiledSchema | None:
+        """Get the compiled argument validator for a skill.
+
+        Args:
+            name: The name of the skill.
+
+        Returns:
+            The CompiledSchema, or None if the skill is unknown, its schema
+            is not known yet (registered without parameters and not yet
+            instantiated), or its schema is invalid.
+        """
+        spec = self._specs.get(name)
+        return spec.validator if spec else None
+
     def get_definitions(self) -> list[dict[str, Any]]:
         """Get OpenAI-format tool definitions for all registered skills.
 
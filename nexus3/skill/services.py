@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if TYPE_CHECKING:
     from nexus3.config.schema import Config, ResolvedModel
+    from nexus3.core.dir_cache import DirectoryCache
     from nexus3.core.permissions import AgentPermissions, PermissionLevel
     from nexus3.rpc.agent_api import DirectAgentAPI
     from nexus3.skill.vcs.config import GitLabConfig
@@ -368,6 +369,20 @@ class ServiceContainer:
             return config
         return None
 
+    def get_directory_cache(self) -> "DirectoryCache":
+        """Get the shared directory listing cache.
+
+        Returns:
+            The registered ``directory_cache``, or the process-wide cache if
+            none is registered.
+        """
+        from nexus3.core.dir_cache import DirectoryCache, get_directory_cache
+
+        cache = self.get("directory_cache")
+        if isinstance(cache, DirectoryCache):
+            return cache
+        return get_directory_cache()
+
     def get_config(self) -> "Config | None":
         """Get the root Config if available."""
         from nexus3.config.schema import Config
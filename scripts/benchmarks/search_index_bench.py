@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark search_text with and without the trigram content index.
+
+Generates a synthetic tree (100k files by default, spread over directories
+of ``--files-per-dir``) with a rare identifier planted in a few files, then
+times search_text for it:
+
+- ``python_walk``: sandboxed Python fallback without the index (every file
+  is read and regex-scanned).
+- ``index_build``: searches with ``search.content_index`` enabled until the
+  index covers the tree. Each search indexes at most DEFAULT_REFRESH_LIMIT
+  files and stops after DEFAULT_REFRESH_BUDGET seconds, so ``max_s`` is the
+  cost a single call can hit while building.
+- ``index_warm``: the same search once the index is complete; only
+  candidate files are read.
+- ``ripgrep``: the unrestricted ripgrep fast path, if rg is installed.
+
+Usage:
+    python scripts/benchmarks/search_index_bench.py
+    python scripts/benchmarks/search_index_bench.py --files 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from nexus3.config.schema import Config, ModelConfig, ProviderConfig
+from nexus3.core.external_tools import resolve_ripgrep
+from nexus3.core.trigram_index import get_trigram_index
+from nexus3.skill.builtin.grep import search_text_factory
+from nexus3.skill.services import ServiceContainer
+
+NEEDLE = "frobnicate_widget_registry"
+
+
+def build_tree(root: Path, files: int, files_per_dir: int, hits: int, seed: int) -> None:
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+             for _ in range(5000)]
+    hit_indices = set(rng.sample(range(files), hits))
+    for i in range(files):
+        directory = root / f"pkg{i // files_per_dir:05d}"
+        if i % files_per_dir == 0:
+            directory.mkdir(parents=True)
+        lines = [
+            f"def {rng.choice(vocab)}_{rng.choice(vocab)}({rng.choice(vocab)}):"
+            f" return {rng.choice(vocab)}.{rng.choice(vocab)}()"
+            for _ in range(30)
+        ]
+        if i in hit_indices:
+            lines[15] = f"    {NEEDLE}.register(handler)"
+        (directory / f"mod{i:06d}.py").write_text("\n".join(lines) + "\n")
+
+
+def make_skill(root: Path, *, sandboxed: bool, content_index: bool):  # type: ignore[no-untyped-def]
+    services = ServiceContainer()
+    services.set_cwd(root)
+    services.register_runtime_compat("allowed_paths", [root] if sandboxed else None)
+    services.register(
+        "config",
+        Config(
+            default_model="bench/m",
+            providers={"bench": ProviderConfig(models={"m": ModelConfig(id="bench/model")})},
+            search={"content_index": content_index},
+        ),
+    )
+    return search_text_factory(services)
+
+
+async def time_search(skill, root: Path, repeat: int) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    timings: list[float] = []
+    output = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await skill.execute(pattern=NEEDLE, path=str(root), max_matches=1000)
+        timings.append(time.perf_counter() - start)
+        output = result.output or result.error or ""
+    return {
+        "best_s": round(min(timings), 3),
+        "mean_s": round(sum(timings) / len(timings), 3),
+        "matches": sum(1 for line in output.splitlines() if NEEDLE in line),
+    }
+
+
+async def run(args: argparse.Namespace, root: Path) -> dict[str, object]:
+    start = time.perf_counter()
+    build_tree(root, args.files, args.files_per_dir, args.hits, args.seed)
+    results: dict[str, object] = {
+        "files": args.files,
+        "tree_build_s": round(time.perf_counter() - start, 1),
+    }
+
+    plain = make_skill(root, sandboxed=True, content_index=False)
+    results["python_walk"] = await time_search(plain, root, args.repeat)
+
+    indexed = make_skill(root, sandboxed=True, content_index=True)
+    index = get_trigram_index(root)
+    build: list[float] = []
+    covered = -1
+    while covered < len(index) < args.files:
+        covered = len(index)
+        start = time.perf_counter()
+        await indexed.execute(pattern=NEEDLE, path=str(root), max_matches=1000)
+        build.append(time.perf_counter() - start)
+    results["index_build"] = {
+        "searches": len(build),
+        "max_s": round(max(build, default=0.0), 3),
+        "total_s": round(sum(build), 3),
+        "indexed_files": len(index),
+    }
+    results["index_warm"] = await time_search(indexed, root, args.repeat)
+    index_db = root / ".nexus3" / "search_index.db"
+    results["index_db_bytes"] = index_db.stat().st_size if index_db.exists() else 0
+
+    if resolve_ripgrep(None).available:
+        rg = make_skill(root, sandboxed=False, content_index=False)
+        results["ripgrep"] = await time_search(rg, root, args.repeat)
+    else:
+        results["ripgrep"] = "unavailable"
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=100_000, help="Files to generate")
+    parser.add_argument("--files-per-dir", type=int, default=200)
+    parser.add_argument("--hits", type=int, default=5, help="Files containing the needle")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", type=Path, help="Directory for the tree (default: tmp)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = asyncio.run(run(args, Path(tmp).resolve()))
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
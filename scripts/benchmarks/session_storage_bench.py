@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark SessionStorage write throughput per durability mode.
+
+Writes a burst of verbose-log events (plus one message every ``--events-per-message``
+events, mimicking a tool loop) into a fresh session.db and reports events/sec
+and the per-call latency seen by the caller. ``full`` is the commit-per-write
+behaviour; ``batched`` is WAL + the background writer thread. The batched run
+includes the final close(), so its throughput counts the time to get every row
+on disk.
+
+Usage:
+    python scripts/benchmarks/session_storage_bench.py
+    python scripts/benchmarks/session_storage_bench.py --events 20000 --flush-ms 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from nexus3.config.schema import SessionStorageConfig
+from nexus3.session.storage import SessionStorage
+
+
+def run(
+    durability: str,
+    events: int,
+    events_per_message: int,
+    flush_ms: int,
+    max_batch: int,
+    workdir: Path,
+) -> dict[str, object]:
+    config = SessionStorageConfig(
+        durability=durability,  # type: ignore[arg-type]
+        flush_interval_ms=flush_ms,
+        max_batch=max_batch,
+    )
+    storage = SessionStorage(workdir / durability / "session.db", storage_config=config)
+    payload = {"tool": "read_file", "duration_ms": 12.5, "detail": "x" * 200}
+    latencies: list[float] = []
+    message_id: int | None = None
+
+    start = time.perf_counter()
+    for i in range(events):
+        call_start = time.perf_counter()
+        if i % events_per_message == 0:
+            message_id = storage.insert_message(role="assistant", content=f"step {i}")
+        storage.insert_event("timing", payload, message_id=message_id)
+        latencies.append(time.perf_counter() - call_start)
+    storage.close()
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "durability": durability,
+        "events": events,
+        "elapsed_s": round(elapsed, 3),
+        "events_per_sec": round(events / elapsed, 1),
+        "mean_call_us": round(sum(latencies) / len(latencies) * 1e6, 2),
+        "p99_call_us": round(ordered[int(len(ordered) * 0.99)] * 1e6, 2),
+        "max_call_us": round(ordered[-1] * 1e6, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=5000, help="Events to write per mode")
+    parser.add_argument("--events-per-message", type=int, default=10)
+    parser.add_argument("--flush-ms", type=int, default=50, help="Batched flush interval")
+    parser.add_argument("--max-batch", type=int, default=512, help="Batched max statements")
+    parser.add_argument("--dir", type=Path, help="Directory for the databases (default: tmp)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = [
+            run(mode, args.events, args.events_per_message, args.flush_ms, args.max_batch,
+                Path(tmp))
+            for mode in ("full", "batched")
+        ]
+
+    print(json.dumps({"results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for provider SSE stream decoding.
+
+Replays a recorded SSE response body (raw bytes as received from the provider)
+through ``nexus3.provider.base.SSEDecoder`` in fixed-size chunks and reports
+per-chunk CPU cost. The pre-decoder ``buffer += chunk; buffer.split("\\n", 1)``
+loop is measured alongside for comparison.
+
+Without ``--replay`` a synthetic multi-MB Anthropic-style stream is generated:
+a large ``input_json_delta`` tool call plus a long text block.
+
+Usage:
+    python scripts/benchmarks/sse_decode_bench.py
+    python scripts/benchmarks/sse_decode_bench.py --replay capture.sse --chunk-size 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from nexus3.provider.base import SSEDecoder
+
+
+def synthesize_stream(target_bytes: int) -> bytes:
+    """Build an Anthropic-style SSE body of roughly ``target_bytes`` bytes."""
+    frames: list[bytes] = []
+
+    def frame(event: str, payload: dict[str, object]) -> None:
+        frames.append(f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode())
+
+    frame("message_start", {"type": "message_start", "message": {"usage": {}}})
+    frame(
+        "content_block_start",
+        {"type": "content_block_start", "content_block": {"type": "text", "text": ""}},
+    )
+    size = sum(len(f) for f in frames)
+    half = target_bytes // 2
+    while size < half:
+        frame(
+            "content_block_delta",
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "lorem " * 8}},
+        )
+        size += len(frames[-1])
+    frame("content_block_stop", {"type": "content_block_stop"})
+    frame(
+        "content_block_start",
+        {
+            "type": "content_block_start",
+            "content_block": {"type": "tool_use", "id": "toolu_1", "name": "write_file"},
+        },
+    )
+    # One oversized frame, as produced by a big tool-call argument delta.
+    big_json = json.dumps({"content": "x" * max(target_bytes - size, 0)})
+    frame(
+        "content_block_delta",
+        {
+            "type": "content_block_delta",
+            "delta": {"type": "input_json_delta", "partial_json": big_json},
+        },
+    )
+    frame("content_block_stop", {"type": "content_block_stop"})
+    frame("message_stop", {"type": "message_stop"})
+    return b"".join(frames)
+
+
+def run_decoder(chunks: list[bytes]) -> tuple[int, list[float]]:
+    decoder = SSEDecoder()
+    events = 0
+    timings: list[float] = []
+    for chunk in chunks:
+        start = time.process_time()
+        events += len(decoder.feed(chunk))
+        timings.append(time.process_time() - start)
+    events += len(decoder.flush())
+    return events, timings
+
+
+def run_legacy(chunks: list[bytes]) -> tuple[int, list[float]]:
+    buffer = ""
+    events = 0
+    timings: list[float] = []
+    for raw in chunks:
+        start = time.process_time()
+        buffer += raw.decode("utf-8", errors="replace")
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            if line.strip().startswith("data:"):
+                events += 1
+        timings.append(time.process_time() - start)
+    return events, timings
+
+
+def summarize(name: str, events: int, timings: list[float]) -> dict[str, object]:
+    ordered = sorted(timings)
+    total = sum(timings)
+    return {
+        "impl": name,
+        "events": events,
+        "chunks": len(timings),
+        "total_cpu_ms": round(total * 1000, 3),
+        "mean_chunk_us": round(total / max(len(timings), 1) * 1e6, 3),
+        "p99_chunk_us": round(ordered[int(len(ordered) * 0.99)] * 1e6, 3) if ordered else 0.0,
+        "max_chunk_us": round(ordered[-1] * 1e6, 3) if ordered else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--replay", type=Path, help="Recorded SSE response body to replay")
+    parser.add_argument("--size-mb", type=float, default=4.0, help="Synthetic stream size")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="Bytes per network chunk")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time SSEDecoder")
+    args = parser.parse_args()
+
+    body = (
+        args.replay.read_bytes()
+        if args.replay
+        else synthesize_stream(int(args.size_mb * 1024 * 1024))
+    )
+    chunks = [body[i : i + args.chunk_size] for i in range(0, len(body), args.chunk_size)]
+
+    results = [summarize("sse_decoder", *run_decoder(chunks))]
+    if not args.skip_legacy:
+        results.append(summarize("legacy_str_split", *run_legacy(chunks)))
+
+    print(json.dumps({"bytes": len(body), "chunk_size": args.chunk_size, "results": results},
+                     indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
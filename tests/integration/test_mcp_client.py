@@ -1,5 +1,6 @@
 """Integration tests for MCP client with test server."""
 
+import asyncio
 import sys
 
 import pytest
@@ -245,6 +246,87 @@ class TestMCPServerRegistry:
         assert len(registry) == 0
 
 
+class TestPooledRegistry:
+    """Pooled servers share one process across connections."""
+
+    @pytest.mark.asyncio
+    async def test_same_command_shares_process(self) -> None:
+        registry = MCPServerRegistry()
+        command = [sys.executable, "-m", "nexus3.mcp.test_server"]
+
+        first = await registry.connect(
+            MCPServerConfig(name="alpha", command=command, pooled=True),
+            owner_agent_id="a",
+        )
+        second = await registry.connect(
+            MCPServerConfig(name="beta", command=command, pooled=True),
+            owner_agent_id="b",
+        )
+
+        assert first.client is second.client
+        assert len(registry.pool) == 1
+        assert {s.name for s in await registry.get_all_skills(agent_id="b")} == {
+            "mcp_beta_echo",
+            "mcp_beta_get_time",
+            "mcp_beta_add",
+            "mcp_beta_slow_operation",
+        }
+        assert registry.get("alpha", agent_id="b") is None
+
+        echo = next(s for s in second.skills if s.original_name == "echo")
+        result = await echo.execute(message="hi")
+        assert "hi" in (result.output or "")
+
+        await registry.close_all()
+        assert len(registry.pool) == 0
+        assert not first.client.is_connected
+
+    @pytest.mark.asyncio
+    async def test_two_agents_share_one_process(self) -> None:
+        registry = MCPServerRegistry()
+        config = MCPServerConfig(
+            name="test",
+            command=[sys.executable, "-m", "nexus3.mcp.test_server"],
+            pooled=True,
+        )
+
+        first, second = await asyncio.gather(
+            registry.connect(config, owner_agent_id="a"),
+            registry.connect(config, owner_agent_id="b"),
+        )
+
+        assert first.client is second.client
+        assert len(registry.pool) == 1
+        assert registry.get("test", agent_id="a") is first
+        assert registry.get("test", agent_id="b") is second
+
+        await registry.disconnect("test", "a")
+        echo = next(s for s in second.skills if s.original_name == "echo")
+        result = await echo.execute(message="still here")
+        assert "still here" in (result.output or "")
+
+        await registry.close_all()
+        assert not second.client.is_connected
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_idle_process(self) -> None:
+        registry = MCPServerRegistry()
+        config = MCPServerConfig(
+            name="test",
+            command=[sys.executable, "-m", "nexus3.mcp.test_server"],
+            pooled=True,
+        )
+
+        first = await registry.connect(config)
+        await registry.disconnect("test")
+        assert first.client.is_connected
+
+        second = await registry.connect(config)
+        assert second.client is first.client
+
+        await registry.close_all()
+
+
 class TestMCPSkillAdapter:
     """Test MCP skill adapter."""
 
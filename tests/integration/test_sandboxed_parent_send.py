@@ -22,6 +22,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from nexus3.config.schema import SessionStorageConfig
 from nexus3.core.permissions import (
     ToolPermission,
     resolve_preset,
@@ -36,6 +37,7 @@ def create_mock_shared_components(tmp_path: Path) -> SharedComponents:
     mock_config = MagicMock()
     mock_config.skill_timeout = 30.0
     mock_config.max_concurrent_tools = 10
+    mock_config.session_storage = SessionStorageConfig()
     mock_config.permissions = MagicMock()
     mock_config.permissions.default_preset = "trusted"
     mock_config.default_provider = None  # Use "default" provider
@@ -416,6 +416,95 @@ class TestPathResolution:
         assert decision.allowed is True
 
 
+class TestResolutionCache:
+    """Pre-resolved rules and cached parent directories keep decisions exact."""
+
+    def test_children_of_cached_directory_match_full_resolve(self, tmp_path: Path) -> None:
+        """Entries decided through a cached parent resolve like Path.resolve()."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (real_dir / "a.txt").write_text("a")
+        (real_dir / "b.txt").write_text("b")
+        (tmp_path / "link").symlink_to(real_dir)
+
+        engine = PathDecisionEngine(allowed_paths=[tmp_path], cwd=tmp_path)
+
+        for name in ("a.txt", "b.txt", "missing.txt"):
+            candidate = tmp_path / "link" / name
+            decision = engine.check_access(candidate)
+            assert decision.allowed is True
+            assert decision.resolved_path == candidate.resolve()
+
+    def test_symlink_escape_detected_after_parent_cached(self, tmp_path: Path) -> None:
+        """A symlink entry in an already-cached directory is still fully resolved."""
+        allowed = tmp_path / "allowed"
+        outside = tmp_path / "outside"
+        allowed.mkdir()
+        outside.mkdir()
+        (allowed / "ok.txt").write_text("ok")
+        (outside / "target.txt").write_text("target")
+        (allowed / "escape").symlink_to(outside / "target.txt")
+
+        engine = PathDecisionEngine(allowed_paths=[allowed], cwd=tmp_path)
+
+        assert engine.check_access(allowed / "ok.txt").allowed is True
+        decision = engine.check_access(allowed / "escape")
+        assert decision.allowed is False
+        assert decision.reason == PathDecisionReason.OUTSIDE_ALLOWED
+
+    def test_blocked_entry_in_cached_directory_denied(self, tmp_path: Path) -> None:
+        """Blocked rules still apply to entries decided through the cache."""
+        (tmp_path / "public.txt").write_text("public")
+        secret = tmp_path / ".env"
+        secret.write_text("SECRET=1")
+
+        engine = PathDecisionEngine(
+            allowed_paths=[tmp_path], blocked_paths=[secret], cwd=tmp_path
+        )
+
+        assert engine.check_access("public.txt").allowed is True
+        decision = engine.check_access(".env")
+        assert decision.allowed is False
+        assert decision.reason == PathDecisionReason.BLOCKED
+
+    def test_parent_component_not_taken_from_cache(self, tmp_path: Path) -> None:
+        """Paths ending in '..' are resolved in full."""
+        allowed = tmp_path / "allowed"
+        (allowed / "sub").mkdir(parents=True)
+
+        engine = PathDecisionEngine(allowed_paths=[allowed], cwd=tmp_path)
+
+        assert engine.check_access(allowed / "sub").allowed is True
+        decision = engine.check_access(allowed / "sub" / ".." / "..")
+        assert decision.allowed is False
+        assert decision.reason == PathDecisionReason.OUTSIDE_ALLOWED
+
+    @pytest.mark.parametrize("alias", ["SECRET~1.TXT", "secret.txt.", "secret.txt "])
+    def test_windows_name_alias_resolved_in_full(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, alias: str
+    ) -> None:
+        """Short names and trailing dot/space aliases of a blocked file are denied."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("SECRET=1")
+        real_resolve = Path.resolve
+
+        def windows_resolve(self: Path, strict: bool = False) -> Path:
+            # Emulate Windows canonicalising the alias to the real name
+            if self.name == alias:
+                return real_resolve(self.parent, strict) / "secret.txt"
+            return real_resolve(self, strict)
+
+        monkeypatch.setattr(Path, "resolve", windows_resolve)
+        engine = PathDecisionEngine(
+            allowed_paths=[tmp_path], blocked_paths=[secret], cwd=tmp_path
+        )
+
+        assert engine.check_access(tmp_path / "public.txt").allowed is True
+        decision = engine.check_access(tmp_path / alias)
+        assert decision.allowed is False
+        assert decision.reason == PathDecisionReason.BLOCKED
+
+
 # =============================================================================
 # 4. Existence Constraints
 # =============================================================================
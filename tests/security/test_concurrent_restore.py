@@ -27,12 +27,14 @@ import pytest
 
 def create_mock_shared_components(tmp_path: Path) -> Any:
     """Create SharedComponents with mocks for testing."""
+    from nexus3.config.schema import SessionStorageConfig
     from nexus3.rpc.pool import SharedComponents
 
     mock_config = MagicMock()
     # Provide concrete values for skill timeout and concurrency limit
     mock_config.skill_timeout = 30.0
     mock_config.max_concurrent_tools = 10
+    mock_config.session_storage = SessionStorageConfig()
     mock_config.max_tool_iterations = 100
     mock_config.default_provider = None
 
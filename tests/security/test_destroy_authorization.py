@@ -49,6 +49,16 @@ class MockDispatcher:
         self._cancelled = True
 
 
+class MockSession:
+    """Minimal mock for Session."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
 class MockServices:
     """Minimal mock for ServiceContainer."""
 
@@ -101,6 +111,7 @@ class MockAgent:
         self.agent_id = agent_id
         self.logger = MockLogger()
         self.dispatcher = MockDispatcher()
+        self.session = MockSession()
 
         # Create permissions with parent_agent_id
         policy = PermissionPolicy.from_level(PermissionLevel.TRUSTED)
@@ -478,6 +478,21 @@ class TestClipboardManagerSearch:
         assert len(results) == 1
         assert results[0].key == "entry1"
 
+    def test_search_returns_content(self, yolo_manager: ClipboardManager) -> None:
+        """search() returns full entries from every scope unless asked not to."""
+        yolo_manager.copy("agent-note", "agent needle", ClipboardScope.AGENT)
+        yolo_manager.copy("project-note", "project needle", ClipboardScope.PROJECT)
+
+        results = yolo_manager.search("needle")
+        assert {e.key: e.content for e in results} == {
+            "agent-note": "agent needle",
+            "project-note": "project needle",
+        }
+
+        metadata = yolo_manager.search("needle", include_content=False)
+        assert sorted(e.key for e in metadata) == ["agent-note", "project-note"]
+        assert all(e.content == "" for e in metadata)
+
     def test_search_case_insensitive(self, yolo_manager: ClipboardManager) -> None:
         """search() is case-insensitive."""
         yolo_manager.copy("UPPERCASE", "content", ClipboardScope.AGENT)
@@ -528,6 +543,34 @@ class TestClipboardManagerSearch:
         assert len(results) == 0
 
 
+    def test_search_hits_ranked_across_scopes(
+        self, yolo_manager: ClipboardManager
+    ) -> None:
+        """search_hits() ranks key matches first and returns snippets."""
+        yolo_manager.copy("notes", "see the parser module", ClipboardScope.AGENT)
+        yolo_manager.copy("parser", "code", ClipboardScope.PROJECT)
+        yolo_manager.copy("misc", "parser internals", ClipboardScope.SYSTEM)
+
+        hits = yolo_manager.search_hits("parser")
+
+        assert hits[0].entry.key == "parser"
+        assert {h.entry.key for h in hits[1:]} == {"notes", "misc"}
+        assert all(h.entry.content == "" for h in hits)
+        assert all(h.snippet and "[parser]" in h.snippet for h in hits)
+        assert len(yolo_manager.search_hits("parser", limit=2)) == 2
+
+    def test_list_entries_without_content(self, yolo_manager: ClipboardManager) -> None:
+        """list_entries(include_content=False) returns metadata only."""
+        yolo_manager.copy("a", "agent content", ClipboardScope.AGENT)
+        yolo_manager.copy("p", "project content", ClipboardScope.PROJECT)
+
+        entries = yolo_manager.list_entries(include_content=False)
+
+        assert {e.key for e in entries} == {"a", "p"}
+        assert all(e.content == "" for e in entries)
+        assert yolo_manager.get("a", ClipboardScope.AGENT).content == "agent content"
+
+
 class TestClipboardManagerTags:
     """Tests for tag management operations."""
 
@@ -813,3 +856,37 @@ class TestClipboardManagerDefaults:
             manager.copy("key", "content", ClipboardScope.PROJECT)
 
         manager.close()
+
+
+class TestClipboardManagerVersion:
+    """Tests for the change version used by context injection caching."""
+
+    def test_stable_without_writes(self, yolo_manager: ClipboardManager) -> None:
+        yolo_manager.copy("entry", "content", ClipboardScope.PROJECT)
+        version = yolo_manager.version
+
+        yolo_manager.list_entries()
+        yolo_manager.get("entry")
+
+        assert yolo_manager.version == version
+
+    @pytest.mark.parametrize("scope", list(ClipboardScope))
+    def test_changes_on_writes(
+        self, yolo_manager: ClipboardManager, scope: ClipboardScope
+    ) -> None:
+        seen = {yolo_manager.version}
+
+        def changed() -> bool:
+            version = yolo_manager.version
+            is_new = version not in seen
+            seen.add(version)
+            return is_new
+
+        yolo_manager.copy("entry", "content", scope)
+        assert changed()
+        yolo_manager.update("entry", scope, content="new")
+        assert changed()
+        yolo_manager.add_tags("entry", scope, ["tag"])
+        assert changed()
+        yolo_manager.delete("entry", scope)
+        assert changed()
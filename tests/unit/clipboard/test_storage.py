@@ -529,6 +529,119 @@ class TestClipboardStorageTTL:
         assert expired == []
 
 
+def _add(
+    storage: ClipboardStorage,
+    key: str,
+    content: str,
+    description: str | None = None,
+    tags: list[str] | None = None,
+) -> None:
+    storage.create(
+        ClipboardEntry.from_content(
+            key=key,
+            scope=ClipboardScope.PROJECT,
+            content=content,
+            short_description=description,
+            tags=tags,
+        )
+    )
+
+
+class TestClipboardStorageMetadata:
+    """Tests for metadata-only listing."""
+
+    def test_list_metadata_omits_content(self, storage: ClipboardStorage) -> None:
+        _add(storage, "big", "x\n" * 1000, "large entry", tags=["b", "a"])
+        _add(storage, "small", "y")
+
+        entries = storage.list_metadata()
+
+        assert [e.key for e in entries] == ["small", "big"]
+        big = entries[1]
+        assert big.content == ""
+        assert big.line_count == 1000
+        assert big.short_description == "large entry"
+        assert big.tags == ["a", "b"]
+        assert entries[0].tags == []
+
+
+class TestClipboardStorageSearch:
+    """Tests for FTS5-backed search."""
+
+    def test_index_follows_create_update_delete(self, storage: ClipboardStorage) -> None:
+        assert storage.fts_enabled
+        _add(storage, "entry", "the quick brown fox")
+        assert [h.entry.key for h in storage.search("quick")] == ["entry"]
+
+        storage.update("entry", content="a lazy dog", new_key="renamed")
+        assert storage.search("quick") == []
+        assert [h.entry.key for h in storage.search("LAZY")] == ["renamed"]
+
+        storage.delete("renamed")
+        assert storage.search("lazy") == []
+
+    def test_ranked_key_before_description_before_content(
+        self, storage: ClipboardStorage
+    ) -> None:
+        _add(storage, "in-content", "mentions widget here")
+        _add(storage, "in-description", "nothing", "a widget helper")
+        _add(storage, "widget-key", "nothing")
+
+        keys = [h.entry.key for h in storage.search("widget")]
+
+        assert keys == ["widget-key", "in-description", "in-content"]
+
+    def test_snippet_and_metadata_only_hits(self, storage: ClipboardStorage) -> None:
+        _add(storage, "doc", "lorem ipsum " * 50 + "needle in haystack " + "dolor " * 50)
+
+        [hit] = storage.search("needle")
+
+        assert hit.entry.content == ""
+        assert hit.snippet is not None
+        assert "[" in hit.snippet and "needle" in hit.snippet
+        assert len(hit.snippet) < 200
+
+    def test_column_filters(self, storage: ClipboardStorage) -> None:
+        _add(storage, "treasure-key", "no match")
+        _add(storage, "other", "hidden treasure")
+
+        assert [h.entry.key for h in storage.search("treasure", search_keys=False)] == ["other"]
+        assert [
+            h.entry.key for h in storage.search("treasure", search_content=False)
+        ] == ["treasure-key"]
+
+    def test_special_characters_are_literal(self, storage: ClipboardStorage) -> None:
+        _add(storage, "quoted", 'call f("a" OR b*) now')
+
+        assert len(storage.search('"a" OR b*')) == 1
+        assert storage.search("a OR c") == []
+
+    def test_short_query_falls_back_to_scan(self, storage: ClipboardStorage) -> None:
+        _add(storage, "one", "x_y")
+        _add(storage, "two", "xzy")
+
+        assert [h.entry.key for h in storage.search("_y")] == ["one"]
+        assert storage.search("_y")[0].snippet is None
+
+    def test_existing_database_indexed_on_open(self, tmp_path) -> None:
+        db_path = tmp_path / "clipboard.db"
+        storage = ClipboardStorage(db_path, ClipboardScope.PROJECT)
+        _add(storage, "old", "legacy content")
+        storage._conn.executescript(
+            """DROP TRIGGER clipboard_fts_insert;
+               DROP TRIGGER clipboard_fts_delete;
+               DROP TRIGGER clipboard_fts_update;
+               DROP TABLE clipboard_fts;"""
+        )
+        storage.close()
+
+        reopened = ClipboardStorage(db_path, ClipboardScope.PROJECT)
+        try:
+            assert [h.entry.key for h in reopened.search("legacy")] == ["old"]
+        finally:
+            reopened.close()
+
+
 class TestClipboardStorageClose:
     """Tests for storage cleanup."""
 
@@ -0,0 +1,50 @@
+"""Tests for token estimate calibration."""
+
+import pytest
+
+from nexus3.config.schema import ResolvedModel
+from nexus3.context.calibration import TokenCalibration, get_token_calibration
+
+
+class TestTokenCalibration:
+    def test_uncalibrated_factor_is_one(self):
+        calibration = TokenCalibration()
+        assert calibration.factor == 1.0
+        assert calibration.apply(1000) == 1000
+
+    def test_first_sample_sets_factor(self):
+        calibration = TokenCalibration()
+        calibration.record(estimated=1000, reported=1200)
+        assert calibration.factor == pytest.approx(1.2)
+        assert calibration.apply(1000) == 1200
+        assert calibration.samples == 1
+
+    def test_moving_average(self):
+        calibration = TokenCalibration(smoothing=0.5)
+        calibration.record(1000, 1000)
+        calibration.record(1000, 1400)
+        assert calibration.factor == pytest.approx(1.2)
+
+    def test_factor_is_clamped(self):
+        calibration = TokenCalibration(min_factor=0.5, max_factor=2.0)
+        calibration.record(1000, 10_000)
+        assert calibration.factor == 2.0
+
+    def test_small_or_invalid_samples_ignored(self):
+        calibration = TokenCalibration(min_estimate=256)
+        calibration.record(100, 500)
+        calibration.record(1000, 0)
+        assert calibration.samples == 0
+        assert calibration.factor == 1.0
+
+
+class TestCalibrationRegistry:
+    def test_shared_per_model_and_counter(self):
+        model = ResolvedModel("vendor/model-x", 1000, False, "x", "local")
+        same = ResolvedModel("vendor/model-x", 1000, False, "other-alias", "local")
+
+        first = get_token_calibration(model, "tiktoken:cl100k_base")
+
+        assert get_token_calibration(same, "tiktoken:cl100k_base") is first
+        assert get_token_calibration(model, "SimpleTokenCounter") is not first
+        assert get_token_calibration("local/vendor/model-x", "tiktoken:cl100k_base") is first
@@ -0,0 +1,118 @@
+"""Tests for token counter registry and the shared encode cache."""
+
+import logging
+
+import pytest
+
+from nexus3.config.schema import ResolvedModel, TokenizerConfig
+from nexus3.context.token_counter import (
+    CachedTokenCounter,
+    SimpleTokenCounter,
+    TokenCountCache,
+    describe_token_counter,
+    get_token_counter,
+    get_token_counter_for_model,
+)
+from nexus3.core.types import Message, Role
+
+
+class _RecordingCounter(SimpleTokenCounter):
+    identity = "recording"
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def count(self, text: str) -> int:
+        self.encoded.append(text)
+        return super().count(text)
+
+
+class TestTokenCountCache:
+    def test_lru_eviction(self):
+        cache = TokenCountCache(max_entries=2)
+        a, b, c = (TokenCountCache.key("t", text) for text in ("a", "b", "c"))
+        cache.put(a, 1)
+        cache.put(b, 2)
+        assert cache.get(a) == 1  # a is now most recent
+        cache.put(c, 3)
+
+        assert cache.get(b) is None
+        assert cache.get(a) == 1
+        assert cache.get(c) == 3
+        assert len(cache) == 2
+
+    def test_keys_are_scoped_by_identity(self):
+        assert TokenCountCache.key("x", "same") != TokenCountCache.key("y", "same")
+
+
+class TestCachedTokenCounter:
+    def test_long_text_encoded_once_across_wrappers(self):
+        cache = TokenCountCache()
+        inner = _RecordingCounter()
+        first = CachedTokenCounter(inner, cache=cache, min_chars=10)
+        second = CachedTokenCounter(inner, cache=cache, min_chars=10)
+        prompt = "system prompt " * 20
+
+        assert first.count(prompt) == second.count(prompt) == inner.count(prompt)
+        assert inner.encoded.count(prompt) == 2  # one miss + the direct call above
+        assert cache.hits == 1
+
+    def test_short_text_bypasses_cache(self):
+        cache = TokenCountCache()
+        counter = CachedTokenCounter(_RecordingCounter(), cache=cache, min_chars=100)
+
+        counter.count("short")
+        counter.count("short")
+
+        assert len(cache) == 0
+
+    def test_identity_and_message_counts_match_inner(self):
+        inner = _RecordingCounter()
+        counter = CachedTokenCounter(inner, cache=TokenCountCache(), min_chars=1)
+        messages = [
+            Message(role=Role.USER, content="hello there"),
+            Message(role=Role.ASSISTANT, content="general kenobi"),
+        ]
+
+        assert describe_token_counter(counter) == "recording"
+        assert counter.count_messages(messages) == SimpleTokenCounter().count_messages(messages)
+
+
+class TestRegistry:
+    def test_counters_shared_per_tokenizer(self):
+        first = get_token_counter(tokenizer=TokenizerConfig(type="simple"))
+        second = get_token_counter(tokenizer=TokenizerConfig(type="simple"))
+        assert first is second
+        assert get_token_counter() is get_token_counter()
+
+    def test_model_without_tokenizer_uses_default(self):
+        model = ResolvedModel("m", 1000, False, "m", "p")
+        assert get_token_counter_for_model(model) is get_token_counter()
+        assert get_token_counter_for_model(None) is get_token_counter()
+
+    def test_missing_huggingface_file_falls_back(self, tmp_path, caplog):
+        config = TokenizerConfig(type="huggingface", path=str(tmp_path / "missing.json"))
+
+        with caplog.at_level(logging.WARNING, logger="nexus3.context.token_counter"):
+            counter = get_token_counter(tokenizer=config)
+
+        assert isinstance(counter, SimpleTokenCounter)
+        assert "huggingface" in caplog.text
+
+    def test_huggingface_tokenizer_loads_local_file(self, tmp_path):
+        tokenizers = pytest.importorskip("tokenizers")
+        from tokenizers.models import WordLevel
+        from tokenizers.pre_tokenizers import Whitespace
+
+        tok = tokenizers.Tokenizer(WordLevel({"hello": 0, "world": 1, "[UNK]": 2}, "[UNK]"))
+        tok.pre_tokenizer = Whitespace()
+        path = tmp_path / "tokenizer.json"
+        tok.save(str(path))
+
+        counter = get_token_counter(
+            tokenizer=TokenizerConfig(type="huggingface", path=str(path))
+        )
+
+        assert isinstance(counter, CachedTokenCounter)
+        assert describe_token_counter(counter).startswith("hf:")
+        assert counter.count("hello world hello") == 3
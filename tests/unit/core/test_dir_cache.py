@@ -0,0 +1,175 @@
+"""Tests for the shared directory listing cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from nexus3.core.dir_cache import DirectoryCache, get_directory_cache, is_excluded_dir
+from nexus3.skill.builtin.glob_search import glob_factory
+from nexus3.skill.builtin.write_file import write_file_factory
+from nexus3.skill.services import ServiceContainer
+
+
+def _touch_dir(path: Path, seconds: int) -> None:
+    """Give a directory a distinct mtime, as a change to it would."""
+    ns = seconds * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+class TestDirectoryCache:
+    """Snapshots, validation and invalidation."""
+
+    def test_entries_sorted_with_types_and_exclusions(self, tmp_path: Path) -> None:
+        (tmp_path / "b.txt").write_text("hello")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "pkg.egg-info").mkdir()
+
+        entries = DirectoryCache(racy_window=0).listdir(tmp_path)
+
+        assert [e.name for e in entries] == ["a", "b.txt", "node_modules", "pkg.egg-info"]
+        assert entries[0].is_dir and not entries[0].excluded
+        assert entries[1].is_file and entries[1].size == 5
+        assert entries[2].excluded and entries[3].excluded
+
+    def test_unchanged_directory_is_not_rescanned(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        cache = DirectoryCache(racy_window=0)
+
+        first = cache.listdir(tmp_path)
+        assert cache.listdir(tmp_path) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_directory_is_rescanned(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        cache = DirectoryCache(racy_window=0)
+        cache.listdir(tmp_path)
+
+        (tmp_path / "b.txt").write_text("b")
+        _touch_dir(tmp_path, 1_000_000)
+
+        assert [e.name for e in cache.listdir(tmp_path)] == ["a.txt", "b.txt"]
+
+    def test_recently_changed_directory_is_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        cache = DirectoryCache(racy_window=60)
+
+        cache.listdir(tmp_path)
+        cache.listdir(tmp_path)
+
+        assert len(cache) == 0
+        assert cache.misses == 2
+
+    def test_invalidate_refreshes_file_edited_in_place(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_text("a")
+        cache = DirectoryCache(racy_window=0)
+        cache.listdir(tmp_path)
+
+        path.write_text("longer content")
+        assert cache.listdir(tmp_path)[0].size == 1
+
+        cache.invalidate(path)
+        assert cache.listdir(tmp_path)[0].size == len("longer content")
+
+    def test_invalidate_directory_drops_descendants(self, tmp_path: Path) -> None:
+        nested = tmp_path / "pkg" / "sub"
+        nested.mkdir(parents=True)
+        cache = DirectoryCache(racy_window=0)
+        cache.walk_files(tmp_path)
+        assert len(cache) == 3
+
+        cache.invalidate(tmp_path / "pkg")
+
+        assert len(cache) == 0
+
+    def test_lru_bounded_by_entry_count(self, tmp_path: Path) -> None:
+        for name in ("one", "two", "three"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "f1").write_text("")
+            (tmp_path / name / "f2").write_text("")
+        cache = DirectoryCache(max_entries=4, racy_window=0)
+
+        for name in ("one", "two", "three"):
+            cache.listdir(tmp_path / name)
+
+        assert len(cache) == 2
+        cache.listdir(tmp_path / "one")
+        assert cache.hits == 0
+
+    def test_symlinked_directory_shares_snapshot(self, tmp_path: Path) -> None:
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "f.txt").write_text("")
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(real, target_is_directory=True)
+        except OSError as exc:
+            pytest.skip(f"symlink creation not supported: {exc}")
+        cache = DirectoryCache(racy_window=0)
+
+        cache.listdir(real)
+        cache.listdir(link)
+
+        assert cache.hits == 1
+
+
+class TestWalkFiles:
+    """Recursive file listing on top of cached snapshots."""
+
+    def test_prune_excluded(self, tmp_path: Path) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("")
+        cache = DirectoryCache(racy_window=0)
+
+        assert cache.walk_files(tmp_path, prune_excluded=True) == [tmp_path / "src" / "main.py"]
+        assert tmp_path / ".git" / "HEAD" in cache.walk_files(tmp_path)
+
+    def test_symlink_loops_terminate(self, tmp_path: Path) -> None:
+        (tmp_path / "f.txt").write_text("")
+        try:
+            (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        except OSError as exc:
+            pytest.skip(f"symlink creation not supported: {exc}")
+        cache = DirectoryCache(racy_window=0)
+
+        assert cache.walk_files(tmp_path, follow_symlinks=True) == [tmp_path / "f.txt"]
+        assert cache.walk_files(tmp_path) == [tmp_path / "f.txt"]
+
+    def test_unreadable_root_gives_empty_list(self, tmp_path: Path) -> None:
+        assert DirectoryCache().walk_files(tmp_path / "missing") == []
+
+
+class TestSkillIntegration:
+    """File skills share the registered cache and invalidate it on writes."""
+
+    def test_container_falls_back_to_process_cache(self) -> None:
+        assert ServiceContainer().get_directory_cache() is get_directory_cache()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_listing_used_by_glob(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        cache = DirectoryCache(racy_window=0)
+        services = ServiceContainer()
+        services.set_cwd(tmp_path)
+        services.register_runtime_compat("allowed_paths", [tmp_path])
+        services.register("directory_cache", cache)
+        glob = glob_factory(services)
+
+        assert (await glob.execute(pattern="*.py", path=str(tmp_path))).output == "a.py"
+        assert (await glob.execute(pattern="*.py", path=str(tmp_path))).output == "a.py"
+        assert cache.hits == 1
+
+        await write_file_factory(services).execute(path=str(tmp_path / "b.py"), content="")
+        assert len(cache) == 0
+        result = await glob.execute(pattern="*.py", path=str(tmp_path))
+        assert result.output == "a.py\nb.py"
+
+
+def test_is_excluded_dir() -> None:
+    assert is_excluded_dir("__pycache__")
+    assert is_excluded_dir("nexus3.egg-info")
+    assert not is_excluded_dir("src")
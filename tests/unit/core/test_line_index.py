@@ -0,0 +1,126 @@
+"""Tests for the sparse line-offset index."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from nexus3.core import line_index
+from nexus3.core.line_index import LineIndexCache, build_line_index, count_lines_before
+
+
+def _bump_mtime(path: Path, seconds: int) -> None:
+    """Give a file a distinct, old mtime so its index is not treated as racy."""
+    ns = seconds * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+class TestBuildLineIndex:
+    """Line counts, checkpoints and content flags."""
+
+    def test_counts_lines_like_text_mode(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        for content in (b"", b"a", b"a\n", b"a\nb", b"a\r\nb\r\n", b"\n\n"):
+            file.write_bytes(content)
+            with open(file, encoding="utf-8") as f:
+                expected = sum(1 for _ in f)
+            assert build_line_index(file).total_lines == expected
+
+    def test_checkpoints_point_at_line_starts(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        data = b"".join(b"line %d\n" % i for i in range(1, 1001))
+        file.write_bytes(data)
+
+        index = build_line_index(file, checkpoint_bytes=256)
+
+        assert len(index.checkpoint_lines) > 10
+        for line, offset in zip(index.checkpoint_lines, index.checkpoint_offsets, strict=True):
+            assert data[offset:].startswith(b"line %d\n" % line)
+
+    def test_flags_invalid_utf8_and_bare_cr(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        file.write_bytes(b"ok\r\nfine\n")
+        index = build_line_index(file)
+        assert index.utf8_valid and not index.has_bare_cr
+
+        file.write_bytes(b"old\rmac\n")
+        assert build_line_index(file).has_bare_cr
+
+        file.write_bytes(b"bad\xff\n")
+        assert not build_line_index(file).utf8_valid
+
+    def test_count_lines_before(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        data = b"".join(b"%d\n" % i for i in range(500))
+        file.write_bytes(data)
+        index = build_line_index(file, checkpoint_bytes=64)
+
+        for offset in (0, 1, 100, 777, len(data)):
+            assert count_lines_before(file, index, offset) == data[:offset].count(b"\n")
+
+
+class TestLineIndexCache:
+    """Reuse, append extension and invalidation."""
+
+    def test_unchanged_file_is_not_rescanned(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        file.write_text("a\nb\n")
+        _bump_mtime(file, 1_000_000)
+        cache = LineIndexCache(racy_window=0)
+
+        first = cache.get(file)
+        assert cache.get(file) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_racy_unchanged_file_is_not_rescanned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A just-written file is re-verified by its tail, not rescanned."""
+        file = tmp_path / "a.log"
+        file.write_text("a\nb\n")
+        cache = LineIndexCache()
+        scans = []
+        real_scan = line_index._scan
+
+        def counting_scan(*args, **kwargs):
+            scans.append(kwargs["start"])
+            return real_scan(*args, **kwargs)
+
+        monkeypatch.setattr(line_index, "_scan", counting_scan)
+        first = cache.get(file)
+        for _ in range(3):
+            assert cache.get(file) is first
+
+        assert scans == [0]
+
+    def test_append_extends_index(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.log"
+        file.write_bytes(b"".join(b"entry %d\n" % i for i in range(200)))
+        cache = LineIndexCache(racy_window=0, checkpoint_bytes=128)
+        cache.get(file)
+
+        with open(file, "ab") as f:
+            f.write(b"".join(b"entry %d\n" % i for i in range(200, 400)))
+        extended = cache.get(file)
+
+        rebuilt = build_line_index(file, checkpoint_bytes=128)
+        assert extended.total_lines == 400
+        assert extended.checkpoint_offsets == rebuilt.checkpoint_offsets
+
+    def test_rewritten_prefix_rebuilds(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.txt"
+        file.write_bytes(b"a\nb\n")
+        cache = LineIndexCache(racy_window=0)
+        cache.get(file)
+
+        file.write_bytes(b"abcdef")
+
+        assert cache.get(file).total_lines == 1
+
+    def test_lru_bound(self, tmp_path: Path) -> None:
+        cache = LineIndexCache(max_files=2)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).write_text("x\n")
+            cache.get(tmp_path / name)
+
+        assert len(cache) == 2
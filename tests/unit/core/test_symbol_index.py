@@ -0,0 +1,263 @@
+"""Tests for the outline cache and project symbol index."""
+
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nexus3.core import symbol_index
+from nexus3.core.symbol_index import INDEX_FILE_NAME, SymbolIndex, get_symbol_index
+from nexus3.skill.builtin import outline as outline_module
+from nexus3.skill.builtin.outline import outline_factory
+from nexus3.skill.services import ServiceContainer
+
+ENTRIES = [
+    {
+        "line": 1,
+        "depth": 0,
+        "kind": "class",
+        "name": "A",
+        "signature": "class A",
+        "preview_lines": [],
+    }
+]
+
+
+def _write_old(path: Path, content: str) -> os.stat_result:
+    """Write a file and backdate it out of the racy window."""
+    path.write_text(content)
+    os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    return path.stat()
+
+
+class TestOutlineCache:
+    """Outlines keyed by file version and parse options."""
+
+    def test_hit_for_unchanged_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path, persistent=False)
+
+        assert index.get_outline(path, st, "python", "opts") is None
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+
+        assert index.get_outline(path, st, "python", "opts") == (1, ENTRIES)
+        assert index.get_outline(path, st, "python", "other") is None
+        assert index.get_outline(path, st, "javascript", "opts") is None
+
+    def test_oldest_outlines_are_evicted(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path, persistent=False, max_outlines=2)
+
+        for options in ("one", "two", "three"):
+            index.put_outline(path, st, "python", options, 1, ENTRIES)
+
+        assert index.get_outline(path, st, "python", "one") is None
+        assert index.get_outline(path, st, "python", "two") == (1, ENTRIES)
+        assert index.get_outline(path, st, "python", "three") == (1, ENTRIES)
+
+    def test_changed_file_misses(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path, persistent=False)
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+
+        new_st = _write_old(path, "class A: pass\nclass B: pass\n")
+
+        assert index.get_outline(path, new_st, "python", "opts") is None
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        path.write_text("class A: pass\n")
+        st = path.stat()
+        index = SymbolIndex(tmp_path, persistent=False, racy_window=60)
+
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+
+        assert index.get_outline(path, st, "python", "opts") is None
+
+    def test_files_outside_root_are_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path / "project", persistent=False)
+
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+
+        assert len(index) == 0
+
+    def test_persistent_index_survives_reopen(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path)
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+        index.close()
+
+        db_path = tmp_path / ".nexus3" / INDEX_FILE_NAME
+        assert db_path.stat().st_mode & 0o777 == 0o600
+        assert SymbolIndex(tmp_path).get_outline(path, st, "python", "opts") == (1, ENTRIES)
+
+    def test_schema_version_change_clears_index(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        st = _write_old(path, "class A: pass\n")
+        index = SymbolIndex(tmp_path)
+        index.put_outline(path, st, "python", "opts", 1, ENTRIES)
+        index.close()
+        with sqlite3.connect(tmp_path / ".nexus3" / INDEX_FILE_NAME) as conn:
+            conn.execute("UPDATE metadata SET value = '0' WHERE key = 'schema_version'")
+
+        assert len(SymbolIndex(tmp_path)) == 0
+
+
+class TestSymbols:
+    """Definition lookup, staleness and pruning."""
+
+    def test_find_prefers_exact_matches(self, tmp_path: Path) -> None:
+        (tmp_path / "pkg").mkdir()
+        a, b = tmp_path / "a.py", tmp_path / "pkg" / "b.py"
+        index = SymbolIndex(tmp_path, persistent=False)
+        index.put_symbols(a, _write_old(a, ""), "python", [("Config", "class", 3, "")])
+        index.put_symbols(b, _write_old(b, ""), "python", [("config", "function", 7, "")])
+
+        assert [loc.path for loc in index.find("Config")] == [a]
+        assert [(loc.path, loc.line) for loc in index.find("CONFIG")] == [(a, 3), (b, 7)]
+        assert [loc.path for loc in index.find("config", under=tmp_path / "pkg")] == [b]
+        assert index.find("config", under=tmp_path / "elsewhere") == []
+
+    def test_needs_symbols_until_indexed_and_stable(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.py"
+        path.write_text("")
+        index = SymbolIndex(tmp_path, persistent=False, racy_window=60)
+
+        assert index.needs_symbols(path, path.stat(), "python")
+        index.put_symbols(path, path.stat(), "python", [("A", "class", 1, "")])
+        # Parsed while the file was still changing: kept, but re-parsed later
+        assert index.needs_symbols(path, path.stat(), "python")
+        assert len(index.find("A")) == 1
+
+        st = _write_old(path, "")
+        index.put_symbols(path, st, "python", [("A", "class", 1, "")])
+        assert not index.needs_symbols(path, st, "python")
+
+    def test_prune_drops_deleted_files(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        index = SymbolIndex(tmp_path, persistent=False)
+        index.put_symbols(a, _write_old(a, ""), "python", [("A", "class", 1, "")])
+        index.put_symbols(b, _write_old(b, ""), "python", [("B", "class", 1, "")])
+
+        b.unlink()
+
+        assert index.prune(tmp_path, {a}) == 1
+        assert index.find("B") == []
+        assert len(index) == 1
+
+    def test_under_is_case_sensitive_and_literal(self, tmp_path: Path) -> None:
+        for name in ("pkg", "PKG", "pkgx"):
+            (tmp_path / name).mkdir()
+        a, b, c = tmp_path / "pkg" / "a.py", tmp_path / "PKG" / "b.py", tmp_path / "pkgx" / "c.py"
+        index = SymbolIndex(tmp_path, persistent=False)
+        for path in (a, b, c):
+            index.put_symbols(path, _write_old(path, ""), "python", [("A", "class", 1, "")])
+
+        assert [loc.path for loc in index.find("A", under=tmp_path / "pkg")] == [a]
+        assert [loc.path for loc in index.find("A", under=tmp_path / "PKG")] == [b]
+
+        b.unlink()
+        assert index.prune(tmp_path / "pkg", {a}) == 0
+        assert index.prune(tmp_path / "PKG", set()) == 1
+        assert len(index) == 2
+
+    def test_get_symbol_index_is_shared_per_root(self, tmp_path: Path) -> None:
+        index = get_symbol_index(tmp_path)
+        assert get_symbol_index(tmp_path / ".") is index
+        assert get_symbol_index(tmp_path / "sub") is not index
+
+    def test_get_symbol_index_keeps_recent_roots(self, tmp_path: Path) -> None:
+        with patch.object(symbol_index, "_INDEXES", OrderedDict()):
+            first = get_symbol_index(tmp_path / "0")
+            for i in range(1, symbol_index._MAX_INDEXES + 1):
+                get_symbol_index(tmp_path / str(i))
+
+            assert len(symbol_index._INDEXES) == symbol_index._MAX_INDEXES
+            assert get_symbol_index(tmp_path / "0") is not first
+
+
+class TestOutlineSkillIntegration:
+    """The outline skill reads through the index."""
+
+    @pytest.fixture
+    def services(self, tmp_path: Path) -> ServiceContainer:
+        services = ServiceContainer()
+        services.set_cwd(tmp_path)
+        services.register_runtime_compat("allowed_paths", [tmp_path])
+        return services
+
+    @pytest.mark.asyncio
+    async def test_cached_outline_skips_reading_file(
+        self, tmp_path: Path, services: ServiceContainer
+    ) -> None:
+        path = tmp_path / "mod.py"
+        _write_old(path, "class Cached:\n    def run(self):\n        pass\n")
+        skill = outline_factory(services)
+
+        first = await skill.execute(path=str(path))
+        with patch.object(
+            outline_module, "_read_file_lines", side_effect=AssertionError("read")
+        ):
+            second = await skill.execute(path=str(path))
+
+        assert second.success
+        assert second.output == first.output
+
+    @pytest.mark.asyncio
+    async def test_symbol_lookup_excludes_blocked_files(
+        self, tmp_path: Path, services: ServiceContainer
+    ) -> None:
+        (tmp_path / "open").mkdir()
+        (tmp_path / "secret").mkdir()
+        _write_old(tmp_path / "open" / "a.py", "def target():\n    pass\n")
+        _write_old(tmp_path / "secret" / "b.py", "def target():\n    pass\n")
+        services.register("blocked_paths", [tmp_path / "secret"])
+
+        result = await outline_factory(services).execute(path=str(tmp_path), symbol="target")
+
+        assert result.success
+        assert "open/a.py:1" in result.output
+        assert "secret" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_symbol_lookup_outside_project_is_not_kept(
+        self, tmp_path: Path, services: ServiceContainer
+    ) -> None:
+        project = tmp_path / "project"
+        other = tmp_path / "other"
+        project.mkdir()
+        other.mkdir()
+        _write_old(other / "a.py", "def target():\n    pass\n")
+        services.set_cwd(project)
+
+        with patch.object(symbol_index, "_INDEXES", OrderedDict()):
+            result = await outline_factory(services).execute(path=str(other), symbol="target")
+
+            assert "a.py:1" in result.output
+            assert (other.resolve(), False) not in symbol_index._INDEXES
+
+    @pytest.mark.asyncio
+    async def test_symbol_lookup_only_lists_files_under_path(
+        self, tmp_path: Path, services: ServiceContainer
+    ) -> None:
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "PKG").mkdir()
+        _write_old(tmp_path / "pkg" / "a.py", "def target():\n    pass\n")
+        _write_old(tmp_path / "PKG" / "b.py", "def target():\n    pass\n")
+        skill = outline_factory(services)
+        await skill.execute(path=str(tmp_path), symbol="target")
+
+        result = await skill.execute(path=str(tmp_path / "pkg"), symbol="target")
+
+        assert result.success
+        assert "a.py:1" in result.output
+        assert "b.py" not in result.output
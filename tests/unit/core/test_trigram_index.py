@@ -0,0 +1,241 @@
+"""Tests for the persistent search_text trigram index."""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from nexus3.config.schema import Config, ModelConfig, ProviderConfig
+from nexus3.core import trigram_index
+from nexus3.core.trigram_index import (
+    TrigramIndex,
+    get_trigram_index,
+    required_trigrams,
+    trigram_signature,
+)
+from nexus3.skill.builtin.grep import search_text_factory
+from nexus3.skill.services import ServiceContainer
+
+
+def _stats(*paths: Path) -> list[tuple[Path, os.stat_result]]:
+    return [(p, p.stat()) for p in paths]
+
+
+class TestRequiredTrigrams:
+    """Literal analysis of regex patterns."""
+
+    def test_plain_literal(self) -> None:
+        assert required_trigrams("needle") == {b"nee", b"eed", b"edl", b"dle"}
+
+    def test_alternation_and_optional_parts_are_not_required(self) -> None:
+        assert required_trigrams("foo|bar") == frozenset()
+        assert required_trigrams("x(?:abcdef)?") == frozenset()
+
+    def test_literals_around_wildcards_are_required(self) -> None:
+        assert required_trigrams(r"def\s+load_config") >= {b"def", b"loa", b"fig"}
+
+    def test_repeat_with_minimum_one_is_required(self) -> None:
+        assert required_trigrams("(abc)+") == {b"abc"}
+
+    def test_case_is_folded(self) -> None:
+        assert required_trigrams("Needle") == required_trigrams("needle")
+
+    def test_ignore_case_drops_letters_with_unicode_folds(self) -> None:
+        # 'k' also matches KELVIN SIGN under IGNORECASE
+        assert b"ack" not in required_trigrams("backup", re.IGNORECASE)
+        assert b"ack" in required_trigrams("backup")
+
+    def test_non_ascii_literals_are_not_folded_to_ascii(self) -> None:
+        # KELVIN SIGN lowercases to 'k' in str.lower(); the file has no 'k' byte
+        assert required_trigrams("\u212aelvin") == {b"elv", b"lvi", b"vin"}
+
+    def test_invalid_pattern_gives_no_trigrams(self) -> None:
+        assert required_trigrams("(unclosed") == frozenset()
+
+
+class TestTrigramIndex:
+    """Signatures, incremental refresh and candidate filtering."""
+
+    def test_signature_contains_word_trigrams(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        hit = tmp_path / "hit.py"
+        miss = tmp_path / "miss.py"
+        hit.write_text("def load_config():\n    pass\n")
+        miss.write_text("def save_state():\n    pass\n")
+        files = _stats(hit, miss)
+
+        assert index.refresh(files) == 2
+        assert index.candidates(files, required_trigrams("load_config")) == [hit]
+
+    def test_unchanged_files_are_not_reread(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        path = tmp_path / "a.txt"
+        path.write_text("alpha\n")
+
+        assert index.refresh(_stats(path)) == 1
+        assert index.refresh(_stats(path)) == 0
+
+        path.write_text("bravo charlie\n")
+        files = _stats(path)
+        assert index.candidates(files, required_trigrams("charlie")) == [path]
+        assert index.refresh(files) == 1
+
+    def test_refresh_limit_leaves_rest_as_candidates(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        paths = []
+        for i in range(5):
+            paths.append(tmp_path / f"f{i}.txt")
+            paths[-1].write_text(f"unrelated {i}\n")
+        files = _stats(*paths)
+
+        assert index.refresh(files, limit=2) == 2
+        assert len(TrigramIndex(tmp_path)) == 2
+        assert index.candidates(files, required_trigrams("needle")) == paths[2:]
+        assert index.refresh(files, limit=2) == 2
+        assert index.refresh(files, limit=2) == 1
+
+    def test_refresh_budget_stops_after_a_batch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(trigram_index, "_PERSIST_BATCH", 2)
+        index = TrigramIndex(tmp_path)
+        paths = []
+        for i in range(5):
+            paths.append(tmp_path / f"f{i}.txt")
+            paths[-1].write_text(f"unrelated {i}\n")
+        files = _stats(*paths)
+
+        assert index.refresh(files, budget=0) == 2
+        assert index.candidates(files, required_trigrams("needle")) == paths[2:]
+        assert index.refresh(files, budget=None) == 3
+
+    def test_concurrent_refresh_skips_files_being_read(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        index = TrigramIndex(tmp_path)
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("alpha\n")
+        b.write_text("bravo\n")
+        real_index_file = trigram_index._index_file
+        nested: list[int] = []
+
+        def reentrant_index_file(path: Path):  # type: ignore[no-untyped-def]
+            if not nested:
+                # A second search starts while the first is reading
+                nested.append(index.refresh(_stats(a, b)))
+            return real_index_file(path)
+
+        monkeypatch.setattr(trigram_index, "_index_file", reentrant_index_file)
+
+        assert index.refresh(_stats(a, b)) == 2
+        assert nested == [0]
+
+    def test_persisted_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_text("persistent content\n")
+        first = TrigramIndex(tmp_path)
+        first.refresh(_stats(path))
+        first.close()
+
+        second = TrigramIndex(tmp_path)
+        assert len(second) == 1
+        assert second.refresh(_stats(path)) == 0
+        assert second.candidates(_stats(path), required_trigrams("nomatch")) == []
+
+    def test_kelvin_sign_pattern_keeps_matching_file(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        path = tmp_path / "units.txt"
+        path.write_text("temperature in \u212aelvin\n", encoding="utf-8")
+        files = _stats(path)
+        index.refresh(files)
+
+        pattern = "\u212aelvin"
+        assert re.search(pattern, path.read_text(encoding="utf-8"))
+        assert index.candidates(files, required_trigrams(pattern)) == [path]
+
+    def test_invalid_utf8_files_are_always_candidates(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        path = tmp_path / "bin.dat"
+        path.write_bytes(b"\xff\xfe nothing here")
+        index.refresh(_stats(path))
+
+        assert index.candidates(_stats(path), required_trigrams("needle")) == [path]
+
+    def test_prune_drops_deleted_files(self, tmp_path: Path) -> None:
+        index = TrigramIndex(tmp_path)
+        keep = tmp_path / "keep.txt"
+        gone = tmp_path / "gone.txt"
+        keep.write_text("keep")
+        gone.write_text("gone")
+        index.refresh(_stats(keep, gone))
+
+        gone.unlink()
+        index.refresh(_stats(keep), prune_under=tmp_path)
+
+        assert len(index) == 1
+
+    def test_files_outside_root_are_not_indexed(self, tmp_path: Path) -> None:
+        root = tmp_path / "project"
+        root.mkdir()
+        outside = tmp_path / "outside.txt"
+        outside.write_text("needle")
+        index = TrigramIndex(root)
+
+        assert index.refresh(_stats(outside)) == 0
+        assert index.candidates(_stats(outside), required_trigrams("zzzzzz")) == [outside]
+
+    def test_large_signature_saturates_safely(self) -> None:
+        data = " ".join(f"word{i:06d}" for i in range(20000)).encode()
+        bits, signature = trigram_signature(data)
+        assert bits == 16384
+        assert signature.bit_length() <= bits
+
+    def test_get_trigram_index_is_shared(self, tmp_path: Path) -> None:
+        assert get_trigram_index(tmp_path) is get_trigram_index(tmp_path)
+        assert (tmp_path / ".nexus3" / "search_index.db").exists()
+
+
+class TestSearchTextWithIndex:
+    """search_text's Python fallback narrows candidates through the index."""
+
+    @pytest.mark.asyncio
+    async def test_warm_search_reads_only_candidates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "hit.py").write_text("x = load_config()\n")
+        for i in range(20):
+            (tmp_path / "src" / f"other{i}.py").write_text(f"value_{i} = {i}\n")
+
+        services = ServiceContainer()
+        services.set_cwd(tmp_path)
+        services.register_runtime_compat("allowed_paths", [tmp_path])
+        services.register(
+            "config",
+            Config(
+                default_model="test/m",
+                providers={"test": ProviderConfig(models={"m": ModelConfig(id="test/model")})},
+                search={"content_index": True},
+            ),
+        )
+        skill = search_text_factory(services)
+
+        first = await skill.execute(pattern="load_config", path=str(tmp_path))
+        assert first.output is not None
+        assert "hit.py:1" in first.output
+        assert "21 searched" in first.output
+
+        opened: list[str] = []
+        real_open = open
+
+        def tracking_open(file, *args, **kwargs):  # type: ignore[no-untyped-def]
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+        second = await skill.execute(pattern="load_config", path=str(tmp_path))
+
+        assert second.output == first.output
+        assert [Path(p).name for p in opened] == ["hit.py"]
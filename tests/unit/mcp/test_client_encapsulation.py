@@ -642,10 +642,10 @@ class _ConcurrencyRaceTransport(MCPTransport):
 
 
 class TestMCPClientConcurrency:
-    """Focused regressions for client-level request/response serialization."""
+    """Focused regressions for client-level request/response multiplexing."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_call_tool_requests_are_serialized(self) -> None:
+    async def test_concurrent_call_tool_requests_are_multiplexed(self) -> None:
         transport = _ConcurrencyRaceTransport()
         client = MCPClient(transport)
         client._initialized = True
@@ -655,6 +655,22 @@ class TestMCPClientConcurrency:
             client.call_tool("second"),
         )
 
+        # Responses arrive out of order and are routed by ID.
+        assert first.to_text() == "response-1"
+        assert second.to_text() == "response-2"
+        assert transport.max_pending_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_requests_caps_in_flight(self) -> None:
+        transport = _ConcurrencyRaceTransport()
+        client = MCPClient(transport, max_concurrent_requests=1)
+        client._initialized = True
+
+        first, second = await asyncio.gather(
+            client.call_tool("first"),
+            client.call_tool("second"),
+        )
+
         assert first.to_text() == "response-1"
         assert second.to_text() == "response-2"
         assert transport.max_pending_requests == 1
@@ -0,0 +1,250 @@
+"""Tests for MCPClient request multiplexing and response routing."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from nexus3.mcp.client import MCPClient, MCPError
+from nexus3.mcp.transport import MCPTransport
+
+
+class _QueueTransport(MCPTransport):
+    """Stream transport whose incoming messages are pushed by the test."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self.incoming: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.sent_event = asyncio.Event()
+
+    async def connect(self) -> None:
+        return None
+
+    async def send(self, message: dict[str, Any]) -> None:
+        self.sent.append(message)
+        self.sent_event.set()
+
+    async def receive(self) -> dict[str, Any]:
+        return await self.incoming.get()
+
+    async def close(self) -> None:
+        return None
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    async def wait_for_sent(self, count: int) -> None:
+        while len(self.sent) < count:
+            self.sent_event.clear()
+            await self.sent_event.wait()
+
+    def respond(self, request_id: Any, text: str) -> None:
+        self.incoming.put_nowait({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {"content": [{"type": "text", "text": text}]},
+        })
+
+
+class _PairedTransport(_QueueTransport):
+    """Request/response transport (like HTTP) with a configurable reply ID."""
+
+    def __init__(self, reply_id: int | None = None) -> None:
+        super().__init__()
+        self._reply_id = reply_id
+
+    async def request(self, message: dict[str, Any]) -> dict[str, Any]:
+        self.sent.append(message)
+        reply_id = message["id"] if self._reply_id is None else self._reply_id
+        return {"jsonrpc": "2.0", "id": reply_id, "result": {"content": []}}
+
+    @property
+    def pairs_responses(self) -> bool:
+        return True
+
+
+def _client(transport: MCPTransport, **kwargs: Any) -> MCPClient:
+    client = MCPClient(transport, **kwargs)
+    client._initialized = True
+    return client
+
+
+class TestResponseRouting:
+    """Responses reach the caller whose request ID they carry."""
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_are_routed(self) -> None:
+        transport = _QueueTransport()
+        client = _client(transport)
+
+        calls = [asyncio.create_task(client.call_tool(f"t{i}")) for i in range(3)]
+        await transport.wait_for_sent(3)
+        for request_id in (3, 1, 2):
+            transport.respond(request_id, f"r{request_id}")
+
+        results = await asyncio.gather(*calls)
+        assert [r.to_text() for r in results] == ["r1", "r2", "r3"]
+        assert client._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_id_fails_all_outstanding(self) -> None:
+        transport = _QueueTransport()
+        client = _client(transport)
+
+        calls = [asyncio.create_task(client.call_tool(f"t{i}")) for i in range(2)]
+        await transport.wait_for_sent(2)
+        transport.respond(99, "forged")
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            assert isinstance(result, MCPError)
+            assert "Response ID mismatch" in str(result)
+            assert "got 99" in str(result)
+
+    @pytest.mark.asyncio
+    async def test_late_response_for_cancelled_request_is_dropped(self) -> None:
+        transport = _QueueTransport()
+        client = _client(transport)
+
+        abandoned = asyncio.create_task(client.call_tool("slow"))
+        kept = asyncio.create_task(client.call_tool("fast"))
+        await transport.wait_for_sent(2)
+        abandoned.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await abandoned
+
+        transport.respond(1, "late")
+        transport.respond(2, "ok")
+
+        assert (await kept).to_text() == "ok"
+        assert client._abandoned == set()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_ids_are_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("nexus3.mcp.client.MAX_ABANDONED_REQUESTS", 2)
+        transport = _QueueTransport()
+        client = _client(transport)
+
+        for count in range(1, 4):
+            call = asyncio.create_task(client.call_tool("never-answered"))
+            await transport.wait_for_sent(count)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+
+        assert client._abandoned == {2, 3}
+
+    @pytest.mark.asyncio
+    async def test_close_fails_outstanding_requests(self) -> None:
+        transport = _QueueTransport()
+        client = _client(transport)
+
+        call = asyncio.create_task(client.call_tool("t"))
+        await transport.wait_for_sent(1)
+        await client.close()
+
+        with pytest.raises(MCPError, match="closed"):
+            await call
+
+
+class TestConcurrencyCap:
+    """max_concurrent_requests bounds requests in flight."""
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_cap_wait_for_a_slot(self) -> None:
+        transport = _QueueTransport()
+        client = _client(transport, max_concurrent_requests=2)
+
+        calls = [asyncio.create_task(client.call_tool(f"t{i}")) for i in range(3)]
+        await transport.wait_for_sent(2)
+        await asyncio.sleep(0)
+        assert len(transport.sent) == 2
+
+        transport.respond(1, "r1")
+        await transport.wait_for_sent(3)
+        transport.respond(2, "r2")
+        transport.respond(3, "r3")
+
+        results = await asyncio.gather(*calls)
+        assert [r.to_text() for r in results] == ["r1", "r2", "r3"]
+
+
+class TestNotificationHandler:
+    """Server notifications are delivered to the handler, never to callers."""
+
+    @pytest.mark.asyncio
+    async def test_notifications_delivered_while_waiting(self) -> None:
+        transport = _QueueTransport()
+        received: list[dict[str, Any]] = []
+        client = _client(transport, notification_handler=received.append)
+
+        call = asyncio.create_task(client.call_tool("t"))
+        await transport.wait_for_sent(1)
+        transport.incoming.put_nowait(
+            {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+        )
+        transport.respond(1, "done")
+
+        assert (await call).to_text() == "done"
+        assert [m["method"] for m in received] == ["notifications/tools/list_changed"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_handler_keeps_reading_between_requests(self) -> None:
+        transport = _QueueTransport()
+        received: list[dict[str, Any]] = []
+        client = _client(transport, notification_handler=received.append)
+
+        call = asyncio.create_task(client.call_tool("t"))
+        await transport.wait_for_sent(1)
+        transport.respond(1, "done")
+        await call
+
+        transport.incoming.put_nowait(
+            {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+        )
+        for _ in range(10):
+            if received:
+                break
+            await asyncio.sleep(0)
+        assert len(received) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_fail_requests(self) -> None:
+        transport = _QueueTransport()
+
+        def broken(message: dict[str, Any]) -> None:
+            raise RuntimeError("boom")
+
+        client = _client(transport, notification_handler=broken)
+        call = asyncio.create_task(client.call_tool("t"))
+        await transport.wait_for_sent(1)
+        transport.incoming.put_nowait({"jsonrpc": "2.0", "method": "notifications/progress"})
+        transport.respond(1, "done")
+
+        assert (await call).to_text() == "done"
+        await client.close()
+
+
+class TestPairedTransport:
+    """Transports whose request() pairs responses are called directly."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_use_request(self) -> None:
+        transport = _PairedTransport()
+        client = _client(transport)
+
+        await asyncio.gather(*(client.call_tool(f"t{i}") for i in range(4)))
+
+        assert sorted(m["id"] for m in transport.sent) == [1, 2, 3, 4]
+        assert client._reader is None
+
+    @pytest.mark.asyncio
+    async def test_id_mismatch_raises(self) -> None:
+        transport = _PairedTransport(reply_id=42)
+        client = _client(transport)
+
+        with pytest.raises(MCPError, match="expected 1, got 42"):
+            await client.call_tool("t")
@@ -0,0 +1,260 @@
+"""Tests for the shared MCP server process pool."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nexus3.mcp.client import MCPClient, NotificationHandler
+from nexus3.mcp.pool import TOOLS_LIST_CHANGED, MCPServerPool, pool_key
+from nexus3.mcp.protocol import MCPTool
+from nexus3.mcp.registry import MCPServerConfig, MCPServerRegistry
+
+
+def _tool(name: str) -> MCPTool:
+    return MCPTool(name=name, description=name)
+
+
+class _Starter:
+    """Client factory that records starts and keeps the notification handler."""
+
+    def __init__(self, tools: list[MCPTool] | None = None) -> None:
+        self.starts = 0
+        self.handler: NotificationHandler | None = None
+        self.tools = tools or [_tool("echo")]
+        self.client = MagicMock(spec=MCPClient)
+        self.client.list_tools = AsyncMock(side_effect=lambda: list(self.tools))
+        self.client.close = AsyncMock()
+        self.client.is_connected = True
+
+    async def __call__(self, handler: NotificationHandler) -> Any:
+        self.starts += 1
+        self.handler = handler
+        return self.client
+
+
+def _config(name: str = "srv", **kwargs: Any) -> MCPServerConfig:
+    return MCPServerConfig(name=name, command=["node", "server.js"], pooled=True, **kwargs)
+
+
+class TestPoolKey:
+    """Fingerprint of (command, env, env_passthrough, cwd)."""
+
+    def test_name_is_ignored(self) -> None:
+        assert pool_key(_config("a")) == pool_key(_config("b"))
+
+    def test_env_and_cwd_distinguish(self) -> None:
+        base = pool_key(_config())
+        assert pool_key(_config(env={"TOKEN": "x"})) != base
+        assert pool_key(_config(env_passthrough=["HOME"])) != base
+        assert pool_key(_config(cwd="/tmp")) != base
+
+    def test_string_command_matches_list_form(self) -> None:
+        official = MCPServerConfig(name="o", command="node", args=["server.js"])
+        assert pool_key(official) == pool_key(_config())
+
+
+class TestMCPServerPool:
+    """Reference counting, idle shutdown and the shared tool list."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_shares_one_process(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+
+        first = await pool.acquire(_config("a"), start)
+        second = await pool.acquire(_config("b"), start)
+
+        assert first is second
+        assert first.refs == 2
+        assert start.starts == 1
+        assert len(pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_starts_once(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+
+        servers = await asyncio.gather(*(pool.acquire(_config(), start) for _ in range(5)))
+
+        assert start.starts == 1
+        assert servers[0].refs == 5
+
+    @pytest.mark.asyncio
+    async def test_tools_listed_once(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(), start)
+
+        await server.list_tools()
+        await server.list_tools()
+
+        assert start.client.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_last_release_without_idle_timeout_closes(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(pool_idle_timeout=0), start)
+        await pool.acquire(_config(pool_idle_timeout=0), start)
+
+        await pool.release(server)
+        start.client.close.assert_not_awaited()
+        await pool.release(server)
+
+        start.client.close.assert_awaited_once()
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_process_shut_down_after_timeout(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(pool_idle_timeout=0.01), start)
+
+        await pool.release(server)
+        assert len(pool) == 1
+        await asyncio.sleep(0.05)
+
+        start.client.close.assert_awaited_once()
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_reacquire_cancels_idle_shutdown(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(pool_idle_timeout=0.01), start)
+        await pool.release(server)
+
+        again = await pool.acquire(_config(pool_idle_timeout=0.01), start)
+        await asyncio.sleep(0.05)
+
+        assert again is server
+        assert start.starts == 1
+        start.client.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_list_changed_refreshes_and_notifies(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(), start)
+        await server.list_tools()
+        seen: list[list[str]] = []
+        server.add_listener(lambda tools: seen.append([t.name for t in tools]))
+
+        start.tools = [_tool("echo"), _tool("added")]
+        assert start.handler is not None
+        start.handler({"jsonrpc": "2.0", "method": TOOLS_LIST_CHANGED})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert seen == [["echo", "added"]]
+        assert [t.name for t in server.tools or []] == ["echo", "added"]
+
+    @pytest.mark.asyncio
+    async def test_other_notifications_ignored(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        server = await pool.acquire(_config(), start)
+        await server.list_tools()
+
+        assert start.handler is not None
+        start.handler({"jsonrpc": "2.0", "method": "notifications/progress"})
+        await asyncio.sleep(0)
+
+        assert start.client.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_referenced_processes(self) -> None:
+        pool = MCPServerPool()
+        start = _Starter()
+        await pool.acquire(_config(), start)
+
+        await pool.close_all()
+
+        start.client.close.assert_awaited_once()
+        assert len(pool) == 0
+
+
+def _pooled_start(start: _Starter) -> Any:
+    async def start_client(*args: Any) -> Any:
+        return await start(args[4])
+
+    return start_client
+
+
+class TestRegistryPooling:
+    """MCPServerRegistry leases pooled servers from its pool."""
+
+    @pytest.mark.asyncio
+    async def test_connections_share_tools_and_keep_visibility(self) -> None:
+        registry = MCPServerRegistry()
+        start = _Starter()
+        registry._start_client = _pooled_start(start)  # type: ignore[method-assign]
+
+        alpha = await registry.connect(_config("alpha"), owner_agent_id="a")
+        beta = await registry.connect(_config("beta"), owner_agent_id="b")
+
+        assert start.starts == 1
+        assert start.client.list_tools.await_count == 1
+        assert [s.name for s in alpha.skills] == ["mcp_alpha_echo"]
+        assert [s.name for s in beta.skills] == ["mcp_beta_echo"]
+        assert registry.get("alpha", agent_id="b") is None
+
+        start.tools = [_tool("echo"), _tool("added")]
+        assert await registry.retry_tools("alpha") == 2
+        assert len(beta.skills) == 2
+
+        await registry.disconnect("alpha")
+        start.client.close.assert_not_awaited()
+        await registry.close_all()
+        start.client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_two_agents_connect_same_config_at_once(self) -> None:
+        registry = MCPServerRegistry()
+        start = _Starter()
+        registry._start_client = _pooled_start(start)  # type: ignore[method-assign]
+        config = _config("srv")
+
+        first, second = await asyncio.gather(
+            registry.connect(config, owner_agent_id="a"),
+            registry.connect(config, owner_agent_id="b"),
+        )
+
+        assert start.starts == 1
+        assert first is not second and first.client is second.client
+        assert len(registry) == 2
+        assert registry.get("srv", agent_id="a") is first
+        assert registry.get("srv", agent_id="b") is second
+        assert [s.name for s in await registry.get_all_skills(agent_id="b")] == [
+            "mcp_srv_echo"
+        ]
+
+        # Reconnecting or disconnecting one agent leaves the other connected
+        await registry.connect(config, owner_agent_id="a")
+        assert registry.get("srv", agent_id="b") is second
+        assert await registry.disconnect("srv", "a")
+        assert registry.get("srv", agent_id="a") is None
+        assert registry.get("srv", agent_id="b") is second
+        start.client.close.assert_not_awaited()
+
+        await registry.close_all()
+        start.client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_server_stops_receiving_updates(self) -> None:
+        registry = MCPServerRegistry()
+        start = _Starter()
+        registry._start_client = _pooled_start(start)  # type: ignore[method-assign]
+        alpha = await registry.connect(_config("alpha"))
+        beta = await registry.connect(_config("beta"))
+        assert alpha.pooled is not None
+
+        await registry.disconnect("alpha")
+        start.tools = []
+        await beta.pooled.refresh_tools()  # type: ignore[union-attr]
+
+        assert beta.skills == []
+        assert len(alpha.skills) == 1
+        await registry.close_all()
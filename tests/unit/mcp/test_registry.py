@@ -294,7 +294,7 @@ class TestGracefulToolListingFailure:
 
         config = MCPServerConfig(name="test", command=["echo"])
         server = ConnectedServer(config=config, client=mock_client, skills=[])
-        registry._servers["test"] = server
+        registry._servers["test", "main"] = server
 
         # Retry should succeed and update skills
         count = await registry.retry_tools("test")
@@ -322,7 +322,7 @@ class TestGracefulToolListingFailure:
 
         config = MCPServerConfig(name="test", command=["echo"])
         server = ConnectedServer(config=config, client=mock_client, skills=[])
-        registry._servers["test"] = server
+        registry._servers["test", "main"] = server
 
         count = await registry.retry_tools("test")
         assert count == 0
@@ -337,7 +337,7 @@ class TestRegistrySkillVisibility:
         tool = MCPTool(name="echo", description="Echo")
         client = MagicMock()
         skill = MCPSkillAdapter(client, tool, "private")
-        registry._servers["private"] = ConnectedServer(
+        registry._servers["private", "owner-agent"] = ConnectedServer(
             config=MCPServerConfig(name="private", command=["echo", "private"]),
             client=client,
             skills=[skill],
@@ -353,7 +353,7 @@ class TestRegistrySkillVisibility:
         tool = MCPTool(name="echo", description="Echo")
         client = MagicMock()
         skill = MCPSkillAdapter(client, tool, "private")
-        registry._servers["private"] = ConnectedServer(
+        registry._servers["private", "owner-agent"] = ConnectedServer(
             config=MCPServerConfig(name="private", command=["echo", "private"]),
             client=client,
             skills=[skill],
@@ -374,7 +374,7 @@ class TestRegistrySkillVisibility:
         client = MagicMock()
         client.is_connected = False
         skill = MCPSkillAdapter(client, tool, "dead")
-        registry._servers["dead"] = ConnectedServer(
+        registry._servers["dead", "owner-agent"] = ConnectedServer(
             config=MCPServerConfig(name="dead", command=["echo", "dead"]),
             client=client,
             skills=[skill],
@@ -390,7 +390,7 @@ class TestRegistrySkillVisibility:
         client = MagicMock()
         client.is_connected = False
         skill = MCPSkillAdapter(client, tool, "dead")
-        registry._servers["dead"] = ConnectedServer(
+        registry._servers["dead", "owner-agent"] = ConnectedServer(
             config=MCPServerConfig(name="dead", command=["echo", "dead"]),
             client=client,
             skills=[skill],
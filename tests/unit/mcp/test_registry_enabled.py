@@ -76,7 +76,7 @@ class TestRegistryEnabledFlag:
             client=mock_client,
             skills=[],
         )
-        registry._servers["test-server"] = existing
+        registry._servers["test-server", "main"] = existing
 
         # Try to connect with disabled config
         disabled_config = MCPServerConfig(
@@ -89,7 +89,7 @@ class TestRegistryEnabledFlag:
             await registry.connect(disabled_config)
 
         # The existing server should NOT have been disconnected
-        assert "test-server" in registry._servers
+        assert ("test-server", "main") in registry._servers
         mock_client.close.assert_not_called()
 
     @pytest.mark.asyncio
@@ -116,7 +116,7 @@ class TestRegistryEnabledFlag:
 
         # Verify we got a connected server
         assert server.config.name == "enabled-server"
-        assert "enabled-server" in registry._servers
+        assert ("enabled-server", "main") in registry._servers
         mock_client.connect.assert_called_once()
 
     @pytest.mark.asyncio
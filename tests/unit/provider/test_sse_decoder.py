@@ -0,0 +1,144 @@
+"""Tests for the shared incremental SSE decoder in nexus3.provider.base."""
+
+import json
+
+import httpx
+import pytest
+
+from nexus3.provider.base import SSEDecoder, SSEEvent, iter_sse_events
+
+
+def _decode_all(chunks: list[bytes]) -> list[SSEEvent]:
+    decoder = SSEDecoder()
+    events: list[SSEEvent] = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
+
+
+class TestSSEDecoderFields:
+    """Field handling follows the EventSource rules."""
+
+    def test_single_data_line(self) -> None:
+        events = _decode_all([b"data: hello\n\n"])
+        assert events == [SSEEvent(data="hello")]
+
+    def test_optional_space_after_colon(self) -> None:
+        events = _decode_all([b"data:hello\n\n"])
+        assert events == [SSEEvent(data="hello")]
+
+    def test_only_one_leading_space_is_stripped(self) -> None:
+        events = _decode_all([b"data:  two\n\n"])
+        assert events[0].data == " two"
+
+    def test_multi_line_data_joined_with_newline(self) -> None:
+        events = _decode_all([b"data: first\ndata: second\n\n"])
+        assert events == [SSEEvent(data="first\nsecond")]
+
+    def test_event_type_applies_to_one_event(self) -> None:
+        events = _decode_all([b"event: ping\ndata: a\n\ndata: b\n\n"])
+        assert [(e.event, e.data) for e in events] == [("ping", "a"), (None, "b")]
+
+    def test_event_without_data_is_not_dispatched(self) -> None:
+        events = _decode_all([b"event: ping\n\ndata: a\n\n"])
+        assert events == [SSEEvent(data="a")]
+
+    def test_last_event_id_persists(self) -> None:
+        events = _decode_all([b"id: 7\ndata: a\n\ndata: b\n\n"])
+        assert [e.id for e in events] == ["7", "7"]
+
+    def test_id_with_nul_is_ignored(self) -> None:
+        events = _decode_all([b"id: 1\ndata: a\n\nid: bad\x00\ndata: b\n\n"])
+        assert [e.id for e in events] == ["1", "1"]
+
+    def test_comments_and_unknown_fields_ignored(self) -> None:
+        events = _decode_all([b": keep-alive\nfoo: bar\ndata: a\n\n"])
+        assert events == [SSEEvent(data="a")]
+
+    def test_retry_recorded(self) -> None:
+        decoder = SSEDecoder()
+        decoder.feed(b"retry: 2500\n\n")
+        assert decoder.retry_ms == 2500
+
+    def test_field_without_colon(self) -> None:
+        events = _decode_all([b"data\n\n"])
+        assert events == [SSEEvent(data="")]
+
+
+class TestSSEDecoderFraming:
+    """Line endings and chunk boundaries."""
+
+    @pytest.mark.parametrize("eol", [b"\n", b"\r\n", b"\r"])
+    def test_line_endings(self, eol: bytes) -> None:
+        body = b"event: x" + eol + b"data: a" + eol + eol + b"data: b" + eol + eol
+        events = _decode_all([body])
+        assert [(e.event, e.data) for e in events] == [("x", "a"), (None, "b")]
+
+    @pytest.mark.parametrize("eol", [b"\n", b"\r\n", b"\r"])
+    def test_byte_at_a_time_matches_whole_body(self, eol: bytes) -> None:
+        body = eol.join(
+            [b"id: 3", b"event: delta", b"data: {\"x\": 1}", b"data: more", b"", b"data: z", b""]
+        ) + eol
+        whole = _decode_all([body])
+        split = _decode_all([body[i : i + 1] for i in range(len(body))])
+        assert split == whole
+        assert [e.data for e in whole] == ['{"x": 1}\nmore', "z"]
+
+    def test_cr_inside_chunk_does_not_swallow_next_lf(self) -> None:
+        events = _decode_all([b"data: a\r\rdata: b", b"\n\ndata: c\n\n"])
+        assert [e.data for e in events] == ["a", "b", "c"]
+
+    def test_crlf_split_across_chunks(self) -> None:
+        events = _decode_all([b"data: a\r", b"\n\r", b"\ndata: b\r\n\r\n"])
+        assert [e.data for e in events] == ["a", "b"]
+
+    def test_utf8_split_across_chunks(self) -> None:
+        body = "data: héllo ☃\n\n".encode()
+        split_at = body.index(b"\xe2") + 1
+        events = _decode_all([body[:split_at], body[split_at:]])
+        assert events[0].data == "héllo ☃"
+
+    def test_bom_is_stripped(self) -> None:
+        events = _decode_all([b"\xef\xbb", b"\xbfdata: a\n\n"])
+        assert events == [SSEEvent(data="a")]
+
+    def test_flush_dispatches_unterminated_event(self) -> None:
+        events = _decode_all([b"data: tail"])
+        assert events == [SSEEvent(data="tail")]
+
+    def test_large_frame_over_many_chunks(self) -> None:
+        payload = "x" * 200_000
+        body = f"data: {payload}\n\n".encode()
+        chunks = [body[i : i + 97] for i in range(0, len(body), 97)]
+        events = _decode_all(chunks)
+        assert len(events) == 1
+        assert events[0].data == payload
+
+
+class TestSSEEventPayloads:
+    """Leniency for servers that omit blank-line separators."""
+
+    def test_single_payload(self) -> None:
+        assert SSEEvent(data="[DONE]").payloads() == ["[DONE]"]
+
+    def test_multi_line_json_kept_whole(self) -> None:
+        data = '{"a":\n1}'
+        assert SSEEvent(data=data).payloads() == [data]
+
+    def test_folded_events_split(self) -> None:
+        first = json.dumps({"a": 1})
+        event = SSEEvent(data=f"{first}\n[DONE]")
+        assert event.payloads() == [first, "[DONE]"]
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_events_reads_response_bytes() -> None:
+    response = httpx.Response(
+        status_code=200,
+        content=b"event: a\ndata: 1\n\ndata: 2\n",
+        headers={"content-type": "text/event-stream"},
+        request=httpx.Request("POST", "https://test.example.com/v1/messages"),
+    )
+    events = [event async for event in iter_sse_events(response)]
+    assert [(e.event, e.data) for e in events] == [("a", "1"), (None, "2")]
@@ -0,0 +1,144 @@
+"""Tests for provider-reported token usage and tool calls on StreamComplete."""
+
+import json
+import os
+
+import httpx
+import pytest
+
+from nexus3.config.schema import ProviderConfig
+from nexus3.core.types import Message, Role, StreamComplete, TokenUsage
+from nexus3.provider import OpenRouterProvider
+from nexus3.provider.anthropic import AnthropicProvider
+from nexus3.provider.openai_compat import OpenAICompatProvider
+
+
+def _make_sse_response(lines: list[str]) -> httpx.Response:
+    return httpx.Response(
+        status_code=200,
+        content=("\n\n".join(lines) + "\n\n").encode(),
+        headers={"content-type": "text/event-stream"},
+        request=httpx.Request("POST", "https://test.example.com/v1/chat/completions"),
+    )
+
+
+def _provider(cls: type, provider_type: str) -> OpenAICompatProvider | AnthropicProvider:
+    config = ProviderConfig(type=provider_type, api_key_env="TEST_STREAM_USAGE_KEY")
+    os.environ["TEST_STREAM_USAGE_KEY"] = "test-key"
+    try:
+        return cls(config, "test-model")
+    finally:
+        os.environ.pop("TEST_STREAM_USAGE_KEY", None)
+
+
+async def _complete(provider: OpenAICompatProvider | AnthropicProvider, lines: list[str]):
+    events = [event async for event in provider._parse_stream(_make_sse_response(lines))]
+    complete = events[-1]
+    assert isinstance(complete, StreamComplete)
+    return complete
+
+
+class TestOpenAIStreamUsage:
+    @pytest.mark.asyncio
+    async def test_trailing_usage_chunk(self) -> None:
+        provider = _provider(OpenRouterProvider, "openrouter")
+        lines = [
+            "data: " + json.dumps({"choices": [{"delta": {"content": "hi"}}], "usage": None}),
+            "data: " + json.dumps(
+                {"choices": [], "usage": {"prompt_tokens": 1234, "completion_tokens": 5}}
+            ),
+            "data: [DONE]",
+        ]
+
+        complete = await _complete(provider, lines)
+
+        assert complete.message.content == "hi"
+        assert complete.usage == TokenUsage(prompt_tokens=1234, completion_tokens=5)
+
+    @pytest.mark.asyncio
+    async def test_responses_api_usage(self) -> None:
+        provider = _provider(OpenRouterProvider, "openrouter")
+        completed = {
+            "type": "response.completed",
+            "response": {"usage": {"input_tokens": 900, "output_tokens": 12}},
+        }
+
+        complete = await _complete(provider, ["data: " + json.dumps(completed)])
+
+        assert complete.usage == TokenUsage(prompt_tokens=900, completion_tokens=12)
+
+    @pytest.mark.asyncio
+    async def test_no_usage(self) -> None:
+        provider = _provider(OpenRouterProvider, "openrouter")
+        complete = await _complete(provider, ["data: [DONE]"])
+        assert complete.usage is None
+
+    @pytest.mark.parametrize(
+        ("provider_type", "expected"),
+        [("openai", True), ("vllm", True), ("ollama", True), ("azure", False)],
+    )
+    def test_stream_options_requested(self, provider_type: str, expected: bool) -> None:
+        provider = _provider(OpenAICompatProvider, provider_type)
+        messages = [Message(role=Role.USER, content="hi")]
+
+        streaming = provider._build_request_body(messages, tools=None, stream=True)
+        blocking = provider._build_request_body(messages, tools=None, stream=False)
+
+        assert ("stream_options" in streaming) is expected
+        assert "stream_options" not in blocking
+
+
+class TestAnthropicStreamUsage:
+    @pytest.mark.asyncio
+    async def test_usage_includes_cached_input(self) -> None:
+        provider = _provider(AnthropicProvider, "anthropic")
+        events = [
+            {
+                "type": "message_start",
+                "message": {
+                    "usage": {
+                        "input_tokens": 10,
+                        "cache_creation_input_tokens": 200,
+                        "cache_read_input_tokens": 3000,
+                        "output_tokens": 1,
+                    }
+                },
+            },
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+             "usage": {"output_tokens": 42}},
+            {"type": "message_stop"},
+        ]
+
+        complete = await _complete(provider, [f"data: {json.dumps(e)}" for e in events])
+
+        assert complete.usage == TokenUsage(prompt_tokens=3210, completion_tokens=42)
+
+
+class TestAnthropicStreamToolInput:
+    @pytest.mark.asyncio
+    async def test_partial_json_pieces_joined(self) -> None:
+        provider = _provider(AnthropicProvider, "anthropic")
+        pieces = ['{"path": ', '"/tmp/', "x", '", "content": "', "a" * 5000, '"}']
+        events = [
+            {"type": "content_block_start",
+             "content_block": {"type": "tool_use", "id": "toolu_1", "name": "write_file"}},
+            *(
+                {"type": "content_block_delta",
+                 "delta": {"type": "input_json_delta", "partial_json": piece}}
+                for piece in pieces
+            ),
+            {"type": "content_block_stop"},
+            {"type": "content_block_start",
+             "content_block": {"type": "tool_use", "id": "toolu_2", "name": "read_file"}},
+            {"type": "content_block_delta",
+             "delta": {"type": "input_json_delta", "partial_json": '{"path": "/y"}'}},
+            {"type": "content_block_stop"},
+            {"type": "message_delta", "delta": {"stop_reason": "tool_use"}},
+            {"type": "message_stop"},
+        ]
+
+        complete = await _complete(provider, [f"data: {json.dumps(e)}" for e in events])
+
+        first, second = complete.message.tool_calls
+        assert first.arguments == {"path": "/tmp/x", "content": "a" * 5000}
+        assert second.arguments == {"path": "/y"}
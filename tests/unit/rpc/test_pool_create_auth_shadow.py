@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from nexus3.config.schema import SessionStorageConfig
 from nexus3.core.authorization_kernel import (
     AuthorizationAction,
     AuthorizationDecision,
@@ -33,6 +34,7 @@ def _create_mock_shared_components(tmp_path: Path) -> SharedComponents:
     config.skill_timeout = 30.0
     config.max_tool_iterations = 10
     config.max_concurrent_tools = 10
+    config.session_storage = SessionStorageConfig()
     config.default_provider = None
     config.resolve_model.return_value = MagicMock(
         provider_name="default",
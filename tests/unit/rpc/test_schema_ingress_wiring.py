@@ -10,7 +10,12 @@ import pytest
 from nexus3.core.cancel import CancellationToken
 from nexus3.rpc.dispatcher import Dispatcher
 from nexus3.rpc.global_dispatcher import GlobalDispatcher
-from nexus3.rpc.protocol import ParseError, parse_request, parse_response
+from nexus3.rpc.protocol import (
+    ParseError,
+    parse_batch_request,
+    parse_request,
+    parse_response,
+)
 from nexus3.rpc.types import Request
 
 
@@ -1108,3 +1113,30 @@ async def test_direct_dispatch_drops_malformed_notification_response() -> None:
     )
 
     assert response is None
+
+
+def test_parse_batch_request_accepts_single_object() -> None:
+    request = parse_batch_request('{"jsonrpc":"2.0","method":"get_tokens","id":1}', 10)
+    assert not isinstance(request, list)
+    assert request.method == "get_tokens"
+
+
+def test_parse_batch_request_keeps_valid_entries_next_to_malformed_ones() -> None:
+    items = parse_batch_request(
+        '[{"jsonrpc":"2.0","method":"get_tokens","id":1},'
+        '{"jsonrpc":"2.0","method":"","id":2},'
+        '"not an object"]',
+        10,
+    )
+    assert isinstance(items, list)
+    assert items[0].method == "get_tokens"  # type: ignore[union-attr]
+    assert items[1].error["message"] == "method must be a non-empty string"  # type: ignore[union-attr]
+    assert items[2].error["message"] == "Request must be a JSON object"  # type: ignore[union-attr]
+    assert items[2].id is None
+
+
+def test_parse_batch_request_rejects_empty_and_oversized_batches() -> None:
+    with pytest.raises(ParseError, match="at least one request"):
+        parse_batch_request("[]", 10)
+    with pytest.raises(ParseError, match="Batch too large: 3 requests \\(max 2\\)"):
+        parse_batch_request("[1,2,3]", 2)
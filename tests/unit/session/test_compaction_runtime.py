@@ -0,0 +1,263 @@
+"""Tests for compaction_runtime chunked summarization."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from nexus3.config.schema import CompactionConfig, Config, ModelConfig, ProviderConfig
+from nexus3.context.compaction import create_summary_message
+from nexus3.context.manager import ContextConfig, ContextManager
+from nexus3.context.token_counter import SimpleTokenCounter
+from nexus3.core.types import Message, Role
+from nexus3.session.compaction_runtime import (
+    claim_precompaction,
+    generate_summary,
+    start_precompaction,
+)
+from nexus3.session.session import Session
+
+
+class _RecordingProvider:
+    """Provider stub that records prompts and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def complete(self, messages, tools=None):
+        self.prompts.append(messages[0].content)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(content=f"summary {len(self.prompts)}")
+
+
+def _session(provider: _RecordingProvider, max_tokens: int) -> SimpleNamespace:
+    context = ContextManager(
+        ContextConfig(max_tokens=max_tokens), token_counter=SimpleTokenCounter()
+    )
+    return SimpleNamespace(
+        provider=provider,
+        logger=None,
+        context=context,
+        _config=None,
+        _compaction_provider=None,
+    )
+
+
+async def test_small_history_uses_single_request() -> None:
+    provider = _RecordingProvider()
+    messages = [Message(role=Role.USER, content="hello")]
+
+    summary = await generate_summary(_session(provider, 100_000), messages, CompactionConfig())
+
+    assert summary == "summary 1"
+    assert len(provider.prompts) == 1
+    assert "CONVERSATION:" in provider.prompts[0]
+
+
+async def test_oversized_history_is_mapped_then_reduced() -> None:
+    provider = _RecordingProvider()
+    messages = [
+        Message(role=Role.USER if i % 2 == 0 else Role.ASSISTANT, content=f"{i} " + "x" * 800)
+        for i in range(40)
+    ]
+    config = CompactionConfig(max_parallel_summaries=2)
+
+    summary = await generate_summary(_session(provider, 2000), messages, config)
+
+    chunk_prompts = [p for p in provider.prompts if "CONVERSATION PART:" in p]
+    merge_prompts = [p for p in provider.prompts if "SUMMARIES:" in p]
+    assert len(chunk_prompts) > 1
+    assert merge_prompts
+    assert summary == f"summary {len(provider.prompts)}"
+    assert provider.max_active <= 2
+    # Every prompt stays within the request budget (1 - summary_budget_ratio)
+    assert all(SimpleTokenCounter().count(p) <= 1500 for p in provider.prompts)
+
+
+async def test_default_compaction_of_most_of_the_window_is_one_request() -> None:
+    """A typical compaction (~65% of the window) is not split into chunks."""
+    provider = _RecordingProvider()
+    counter = SimpleTokenCounter()
+    messages = [Message(role=Role.USER, content="x" * 2600) for _ in range(10)]
+    assert 0.6 < counter.count_messages(messages) / 10_000 < 0.7
+
+    await generate_summary(_session(provider, 10_000), messages, CompactionConfig())
+
+    assert len(provider.prompts) == 1
+
+
+def test_request_budget_ratio_defaults_to_what_the_summary_leaves() -> None:
+    assert CompactionConfig().request_budget_ratio == 0.75
+    assert CompactionConfig(summary_budget_ratio=0.1).request_budget_ratio == 0.9
+    assert CompactionConfig(chunk_budget_ratio=0.5).request_budget_ratio == 0.5
+
+
+async def test_incremental_strategy_summarizes_only_new_messages() -> None:
+    provider = _RecordingProvider()
+    messages = [
+        create_summary_message("PREVIOUS SUMMARY"),
+        Message(role=Role.USER, content="new question"),
+    ]
+
+    summary = await generate_summary(
+        _session(provider, 100_000), messages, CompactionConfig(strategy="incremental")
+    )
+
+    assert summary == "summary 1"
+    assert len(provider.prompts) == 1
+    assert "EXISTING SUMMARY:\nPREVIOUS SUMMARY" in provider.prompts[0]
+    assert "CONTEXT SUMMARY" not in provider.prompts[0]
+    assert "USER: new question" in provider.prompts[0]
+
+
+async def test_full_strategy_resummarizes_previous_summary() -> None:
+    provider = _RecordingProvider()
+    messages = [
+        create_summary_message("PREVIOUS SUMMARY"),
+        Message(role=Role.USER, content="new question"),
+    ]
+
+    await generate_summary(_session(provider, 100_000), messages, CompactionConfig())
+
+    assert "CONVERSATION:" in provider.prompts[0]
+    assert "CONTEXT SUMMARY" in provider.prompts[0]
+
+
+async def test_incremental_summary_is_condensed_when_over_budget() -> None:
+    class _VerboseProvider(_RecordingProvider):
+        async def complete(self, messages, tools=None):
+            await super().complete(messages, tools)
+            if "CONDENSED SUMMARY:" in messages[0].content:
+                return SimpleNamespace(content="short")
+            return SimpleNamespace(content="word " * 2000)
+
+    provider = _VerboseProvider()
+    messages = [
+        create_summary_message("PREVIOUS SUMMARY"),
+        Message(role=Role.USER, content="new question"),
+    ]
+    config = CompactionConfig(strategy="incremental", summary_budget_ratio=0.1)
+
+    summary = await generate_summary(_session(provider, 10_000), messages, config)
+
+    assert summary == "short"
+    assert len(provider.prompts) == 2
+    assert "about 800 tokens" in provider.prompts[1]
+
+
+def _history(count: int) -> list[Message]:
+    return [
+        Message(role=Role.USER if i % 2 == 0 else Role.ASSISTANT, content=f"turn {i}")
+        for i in range(count)
+    ]
+
+
+async def test_claimed_precompaction_preserves_newer_messages() -> None:
+    provider = _RecordingProvider()
+    history = _history(6)
+    precompaction = start_precompaction(
+        _session(provider, 100_000), history[:4], CompactionConfig()
+    )
+
+    claimed = await claim_precompaction(
+        precompaction, history, SimpleTokenCounter(), max_message_tokens=10_000
+    )
+
+    assert claimed == ("summary 1", history[4:])
+
+
+async def test_precompaction_discarded_when_prefix_changed() -> None:
+    provider = _RecordingProvider()
+    history = _history(6)
+    precompaction = start_precompaction(
+        _session(provider, 100_000), history[:4], CompactionConfig()
+    )
+    rewritten = [Message(role=Role.USER, content="other"), *history[1:]]
+
+    claimed = await claim_precompaction(
+        precompaction, rewritten, SimpleTokenCounter(), max_message_tokens=10_000
+    )
+
+    assert claimed is None
+    with pytest.raises(asyncio.CancelledError):
+        await precompaction.task
+
+
+async def test_precompaction_discarded_when_result_does_not_fit() -> None:
+    provider = _RecordingProvider()
+    history = _history(6)
+    precompaction = start_precompaction(
+        _session(provider, 100_000), history[:4], CompactionConfig()
+    )
+
+    claimed = await claim_precompaction(
+        precompaction, history, SimpleTokenCounter(), max_message_tokens=5
+    )
+
+    assert claimed is None
+
+
+def test_precompact_threshold_must_be_below_trigger() -> None:
+    with pytest.raises(ValidationError, match="precompact_threshold"):
+        CompactionConfig(precompact_threshold=0.9, trigger_threshold=0.8)
+
+
+async def test_session_swaps_in_background_summary() -> None:
+    provider = _RecordingProvider()
+    context = ContextManager(
+        ContextConfig(max_tokens=1000, reserve_tokens=0), token_counter=SimpleTokenCounter()
+    )
+    config = Config(
+        default_model="test/m",
+        providers={"test": ProviderConfig(models={"m": ModelConfig(id="test/model")})},
+        compaction={"precompact_threshold": 0.5, "trigger_threshold": 0.9},
+    )
+    session = Session(provider=provider, context=context, config=config)
+    for i in range(12):
+        context.add_user_message(f"question {i} " + "q" * 150)
+
+    session._maybe_start_precompaction()
+    assert session._precompaction is not None
+    await session._precompaction.task
+    context.add_user_message("latest")
+
+    result = await session.compact_locked(force=True)
+
+    assert result is not None
+    assert len(provider.prompts) == 1
+    assert result.summary_message.content.endswith("summary 1")
+    assert context.messages[-1].content == "latest"
+    assert session._precompaction is None
+
+
+async def test_session_close_cancels_background_summary() -> None:
+    class _HangingProvider:
+        async def complete(self, messages, tools=None):
+            await asyncio.Event().wait()
+
+    context = ContextManager(
+        ContextConfig(max_tokens=1000, reserve_tokens=0), token_counter=SimpleTokenCounter()
+    )
+    config = Config(
+        default_model="test/m",
+        providers={"test": ProviderConfig(models={"m": ModelConfig(id="test/model")})},
+        compaction={"precompact_threshold": 0.5, "trigger_threshold": 0.9},
+    )
+    session = Session(provider=_HangingProvider(), context=context, config=config)
+    for i in range(12):
+        context.add_user_message(f"question {i} " + "q" * 150)
+    session._maybe_start_precompaction()
+    precompaction = session._precompaction
+    assert precompaction is not None
+    await asyncio.sleep(0)
+
+    await session.close()
+
+    assert precompaction.task.cancelled()
+    assert session._precompaction is None
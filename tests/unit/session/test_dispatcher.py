@@ -7,6 +7,7 @@ from nexus3.mcp.protocol import MCPTool
 from nexus3.mcp.registry import ConnectedServer, MCPServerConfig, MCPServerRegistry
 from nexus3.mcp.skill_adapter import MCPSkillAdapter
 from nexus3.session.dispatcher import ToolDispatcher
+from nexus3.skill.registry import SkillRegistry
 from nexus3.skill.services import ServiceContainer
 
 
@@ -25,7 +26,7 @@ def _register_mcp_server(
     )
     client = MagicMock()
     skill = MCPSkillAdapter(client, tool, server_name)
-    registry._servers[server_name] = ConnectedServer(
+    registry._servers[server_name, owner_agent_id] = ConnectedServer(
         config=MCPServerConfig(name=server_name, command=["echo", server_name]),
         client=client,
         skills=[skill],
@@ -96,3 +97,23 @@ class TestToolDispatcherMcpVisibility:
         assert skill is not None
         assert skill.name == "mcp_shared_echo"
         assert server_name == "shared"
+
+
+class TestToolDispatcherValidator:
+    """Precompiled argument validators come from the skill registry."""
+
+    def test_builtin_skill_uses_registry_validator(self) -> None:
+        schema = {"type": "object", "properties": {"message": {"type": "string"}}}
+        registry = SkillRegistry()
+        registry.register("echo", MagicMock(), description="Echo", parameters=schema)
+        dispatcher = ToolDispatcher(registry=registry)
+
+        validator = dispatcher.get_validator(ToolCall(id="tc-1", name="echo", arguments={}))
+
+        assert validator is not None
+        assert validator is registry.get_validator("echo")
+
+    def test_unknown_tool_has_no_validator(self) -> None:
+        dispatcher = ToolDispatcher(registry=SkillRegistry())
+        call = ToolCall(id="tc-1", name="mcp_x_echo", arguments={})
+        assert dispatcher.get_validator(call) is None
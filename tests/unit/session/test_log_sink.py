@@ -0,0 +1,177 @@
+"""Tests for the buffered session log sink."""
+
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from nexus3.config.schema import SessionStorageConfig
+from nexus3.core.secure_io import SECURE_FILE_MODE, SymlinkError
+from nexus3.session import log_sink
+from nexus3.session.log_sink import BufferedLogSink
+from nexus3.session.logging import SessionLogger
+from nexus3.session.markdown import MarkdownWriter, RawWriter
+from nexus3.session.storage import SessionStorage
+from nexus3.session.types import LogConfig, LogStream
+
+
+@pytest.fixture
+def sink():
+    sink = BufferedLogSink(flush_interval=5.0)
+    yield sink
+    sink.close()
+
+
+class TestBufferedLogSink:
+    """Queueing, flushing and accounting."""
+
+    def test_entries_written_in_order_on_flush(self, sink, tmp_path: Path) -> None:
+        target = tmp_path / "log.txt"
+        for i in range(100):
+            sink.write(target, f"line {i}\n")
+        sink.flush()
+
+        assert target.read_text().splitlines() == [f"line {i}" for i in range(100)]
+        assert sink.stats().written_bytes == target.stat().st_size
+        assert sink.stats().pending_bytes == 0
+
+    def test_new_file_has_secure_permissions(self, sink, tmp_path: Path) -> None:
+        target = tmp_path / "log.txt"
+        sink.write(target, "x")
+        sink.flush()
+
+        assert stat.S_IMODE(target.stat().st_mode) == SECURE_FILE_MODE
+
+    def test_one_descriptor_per_file(self, sink, tmp_path: Path) -> None:
+        for _ in range(10):
+            sink.write(tmp_path / "a.txt", "a")
+            sink.write(tmp_path / "b.txt", "b")
+
+        assert len(sink._fds) == 2
+
+    def test_close_writes_pending_entries(self, tmp_path: Path) -> None:
+        sink = BufferedLogSink(flush_interval=5.0)
+        target = tmp_path / "log.txt"
+        sink.write(target, "pending\n")
+        sink.close()
+
+        assert target.read_text() == "pending\n"
+        assert sink._fds == {}
+
+    def test_write_after_close_goes_direct(self, tmp_path: Path) -> None:
+        sink = BufferedLogSink()
+        sink.close()
+        target = tmp_path / "log.txt"
+        sink.write(target, "late\n")
+
+        assert target.read_text() == "late\n"
+
+    def test_overflow_drops_and_counts(self, tmp_path: Path) -> None:
+        sink = BufferedLogSink(flush_interval=5.0, max_buffered_bytes=10)
+        target = tmp_path / "log.txt"
+        sink.write(target, "12345678")
+        sink.write(target, "overflow")
+        sink.close()
+
+        assert target.read_text() == "12345678"
+        stats = sink.stats()
+        assert stats.dropped_bytes == len("overflow")
+        assert stats.written_bytes == 8
+
+    def test_refuses_symlink_on_first_write(self, sink, tmp_path: Path) -> None:
+        real = tmp_path / "real.txt"
+        real.write_text("")
+        link = tmp_path / "link.txt"
+        link.symlink_to(real)
+
+        with pytest.raises(SymlinkError):
+            sink.write(link, "malicious")
+        sink.flush()
+        assert real.read_text() == ""
+
+    def test_swapped_path_cannot_redirect_open_descriptor(
+        self, sink, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "log.txt"
+        sink.write(target, "first\n")
+        sink.flush()
+
+        stolen = tmp_path / "stolen.txt"
+        stolen.write_text("")
+        moved = tmp_path / "moved.txt"
+        target.rename(moved)
+        target.symlink_to(stolen)
+        sink.write(target, "second\n")
+        sink.flush()
+
+        assert stolen.read_text() == ""
+        assert moved.read_text() == "first\nsecond\n"
+
+
+class TestWritersWithSink:
+    """MarkdownWriter and RawWriter route appends through the sink."""
+
+    def test_markdown_writer(self, sink, tmp_path: Path) -> None:
+        writer = MarkdownWriter(tmp_path, verbose_enabled=True, sink=sink)
+        writer.write_user("hello")
+        writer.write_timing("op", 1.5)
+        sink.flush()
+
+        assert "hello" in writer.context_path.read_text()
+        assert "**op**" in writer.verbose_path.read_text()
+
+    def test_raw_writer(self, sink, tmp_path: Path) -> None:
+        writer = RawWriter(tmp_path, sink=sink)
+        for i in range(5):
+            writer.write_stream_chunk({"i": i})
+        sink.flush()
+
+        lines = writer.raw_path.read_text().splitlines()
+        assert [json.loads(line)["chunk"]["i"] for line in lines] == list(range(5))
+
+
+class TestSessionLoggerSink:
+    """SessionLogger wiring."""
+
+    def test_unbuffered_without_storage_config(self, tmp_path: Path) -> None:
+        logger = SessionLogger(LogConfig(base_dir=tmp_path))
+        assert logger.log_sink_stats() is None
+        logger.close()
+
+    def test_buffered_with_storage_config(self, tmp_path: Path) -> None:
+        config = SessionStorageConfig(log_flush_interval_ms=5000)
+        logger = SessionLogger(
+            LogConfig(base_dir=tmp_path, streams=LogStream.ALL, storage=config)
+        )
+        logger.log_user("buffered hello")
+        logger.log_raw_chunk({"delta": "x"})
+        logger.flush_logs(wait=True)
+
+        assert "buffered hello" in (logger.session_dir / "context.md").read_text()
+        assert (logger.session_dir / "raw.jsonl").read_text().count("\n") == 1
+        logger.close()
+
+    def test_close_records_dropped_bytes(self, tmp_path: Path) -> None:
+        config = SessionStorageConfig(
+            log_flush_interval_ms=5000, log_buffer_max_bytes=64 * 1024
+        )
+        logger = SessionLogger(LogConfig(base_dir=tmp_path, storage=config))
+        logger.log_user("x" * (70 * 1024))
+        session_dir = logger.session_dir
+        logger.close()
+
+        storage = SessionStorage(session_dir / "session.db")
+        assert int(storage.get_metadata("log_dropped_bytes") or 0) > 0
+        storage.close()
+
+    def test_close_stops_thread_and_releases_exit_hook(self, tmp_path: Path) -> None:
+        config = SessionStorageConfig(log_flush_interval_ms=5000)
+        logger = SessionLogger(LogConfig(base_dir=tmp_path, storage=config))
+        sink = logger._log_sink
+        assert sink is not None and sink in log_sink._OPEN_SINKS
+
+        logger.close()
+
+        assert not sink._thread.is_alive()
+        assert sink not in log_sink._OPEN_SINKS
@@ -771,6 +771,9 @@ class _ToolLoopCompactionSession:
         self._should_compact_calls += 1
         return self._should_compact_calls == 1
 
+    def _maybe_start_precompaction(self) -> None:
+        return None
+
     async def compact(self, force: bool = False) -> None:
         raise AssertionError("tool loop should use compact_locked() inside a turn")
 
@@ -0,0 +1,71 @@
+"""Tests that provider-reported usage feeds ContextManager calibration."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from nexus3.context import ContextConfig, ContextManager, SimpleTokenCounter
+from nexus3.core.types import (
+    ContentDelta,
+    Message,
+    Role,
+    StreamComplete,
+    StreamEvent,
+    TokenUsage,
+)
+from nexus3.session.session import Session
+
+
+class _UsageProvider:
+    """Provider that reports a fixed multiple of the local estimate."""
+
+    def __init__(self, context: ContextManager, ratio: float) -> None:
+        self._context = context
+        self._ratio = ratio
+
+    async def stream(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        dynamic_context: str | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        estimate = self._context.estimate_request_tokens(messages, tools, dynamic_context)
+        yield ContentDelta(text="ok")
+        yield StreamComplete(
+            message=Message(role=Role.ASSISTANT, content="ok"),
+            usage=TokenUsage(prompt_tokens=round(estimate * self._ratio)),
+        )
+
+
+def _context() -> ContextManager:
+    context = ContextManager(
+        config=ContextConfig(max_tokens=100_000),
+        token_counter=SimpleTokenCounter(),
+    )
+    context.set_system_prompt("system prompt " * 200)
+    return context
+
+
+@pytest.mark.asyncio
+async def test_send_records_usage() -> None:
+    context = _context()
+    session = Session(provider=_UsageProvider(context, 1.25), context=context)
+
+    async for _ in session.send("hello"):
+        pass
+
+    assert context.token_calibration.samples == 1
+    assert context.token_calibration.factor == pytest.approx(1.25, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_run_turn_records_usage() -> None:
+    context = _context()
+    session = Session(provider=_UsageProvider(context, 0.8), context=context)
+
+    async for _ in session.run_turn("hello"):
+        pass
+
+    assert context.token_calibration.samples == 1
+    assert context.token_calibration.factor == pytest.approx(0.8, rel=0.01)
@@ -88,6 +88,24 @@ class TestClipboardSearchSkill:
         assert "test" in result.output
         assert "1 match" in result.output
 
+    @pytest.mark.asyncio
+    async def test_search_shows_snippet(
+        self, search_skill, clipboard_manager: ClipboardManager
+    ) -> None:
+        """Project-scope hits come from the FTS index with a match snippet."""
+        clipboard_manager.copy(
+            key="notes",
+            content="first line\nthe retry budget is five\nlast line",
+            scope=ClipboardScope.PROJECT,
+        )
+
+        result = await search_skill.execute(query="retry budget")
+
+        assert result.success
+        assert "notes" in result.output
+        assert "Match:" in result.output
+        assert "[retry budget]" in result.output
+
     @pytest.mark.asyncio
     async def test_search_not_found(
         self, search_skill, clipboard_manager: ClipboardManager
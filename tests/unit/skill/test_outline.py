@@ -1550,10 +1550,32 @@ class TestOutlineSkill:
         assert "No supported files" in result.output
 
     @pytest.mark.asyncio
-    async def test_directory_rejects_symbol_mode(self, skill, tmp_path):
-        result = await skill.execute(path=str(tmp_path), symbol="Example")
-        assert not result.success
-        assert "only supported for files" in result.error
+    async def test_directory_symbol_lists_definitions_recursively(self, skill, tmp_path):
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "a.py").write_text("class Example:\n    pass\n")
+        (tmp_path / "pkg" / "sub" / "b.py").write_text("x = 1\n\ndef Example(y):\n    pass\n")
+        (tmp_path / "pkg" / "c.py").write_text("def other():\n    pass\n")
+        result = await skill.execute(path=str(tmp_path / "pkg"), symbol="Example")
+        assert result.success
+        assert "# Definitions of 'Example' under pkg/" in result.output
+        assert "a.py:1  class: class Example" in result.output
+        assert "sub/b.py:3  function: def Example(y)" in result.output
+        assert "c.py" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_directory_symbol_not_found(self, skill, tmp_path):
+        (tmp_path / "a.py").write_text("def f():\n    pass\n")
+        result = await skill.execute(path=str(tmp_path), symbol="Missing")
+        assert result.success
+        assert "No definitions of 'Missing'" in result.output
+
+    @pytest.mark.asyncio
+    async def test_directory_not_truncated_at_100_files(self, skill, tmp_path):
+        for i in range(120):
+            (tmp_path / f"m{i:03d}.py").write_text(f"def f{i}():\n    pass\n")
+        result = await skill.execute(path=str(tmp_path))
+        assert result.success
+        assert "m119.py" in result.output
 
     @pytest.mark.asyncio
     async def test_directory_rejects_file_type_override(self, skill, tmp_path):
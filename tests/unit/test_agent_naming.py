@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from nexus3.config.schema import SessionStorageConfig
 from nexus3.rpc.pool import (
     AgentPool,
     SharedComponents,
@@ -135,6 +136,7 @@ def create_mock_shared_components(tmp_path: Path) -> SharedComponents:
     # Provide concrete values for skill timeout and concurrency limit
     mock_config.skill_timeout = 30.0
     mock_config.max_concurrent_tools = 10
+    mock_config.session_storage = SessionStorageConfig()
     mock_config.default_provider = None  # Use "default" provider
 
     # Mock provider registry
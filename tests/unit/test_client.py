@@ -5,7 +5,7 @@ import json
 import httpx
 import pytest
 
-from nexus3.client import ClientError, NexusClient
+from nexus3.client import ClientError, NexusClient, keepalive_expiry_for
 from nexus3.rpc.protocol import ParseError, parse_response, serialize_request
 from nexus3.rpc.types import Request
 
@@ -161,6 +161,84 @@ class TestNexusClient:
         assert result["content"] == "Hello from server!"
         assert result["tokens"] == {"prompt": 10, "completion": 5}
 
+    @pytest.mark.asyncio
+    async def test_send_stream_parses_sse_framing(self):
+        """send_stream follows SSE rules: CRLF, comments, optional space, multi-line data."""
+        result = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"content": "done"}})
+        body = (
+            ": keep-alive\r\n"
+            "event:content\r\n"
+            'data:{"text":\r\n'
+            'data: "hi"}\r\n'
+            "\r\n"
+            "event: result\r\n"
+            f"data: {result}\r\n"
+            "\r\n"
+        ).encode()
+
+        def mock_handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=body
+            )
+
+        async with NexusClient() as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(mock_handler))
+            frames = [frame async for frame in client.send_stream("Hello!")]
+
+        assert [(f.event, f.data) for f in frames] == [
+            ("content", {"text": "hi"}),
+            ("result", {"content": "done"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shared_http_client_is_reused_and_not_closed(self):
+        """Instances given the same http_client share it and leave it open."""
+        calls = []
+
+        def mock_handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            calls.append(body["method"])
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": body["id"], "result": {"total": 1}}
+            )
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(mock_handler))
+        for agent in ("a", "b"):
+            async with NexusClient(f"http://127.0.0.1:8765/agent/{agent}",
+                                   http_client=shared) as client:
+                assert client._client is shared
+                await client.get_tokens()
+
+        assert calls == ["get_tokens", "get_tokens"]
+        assert not shared.is_closed
+        await shared.aclose()
+
+    @pytest.mark.parametrize("server_timeout", [0.5, 1.0, 5.0, 300.0])
+    def test_keepalive_expiry_below_server_timeout(self, server_timeout):
+        """Pooled connections expire before the server drops them."""
+        expiry = keepalive_expiry_for(server_timeout)
+        assert 0 < expiry < server_timeout
+
+    def test_keepalive_expiry_without_server_keep_alive(self):
+        """With server keep-alive disabled, connections are not reused."""
+        assert keepalive_expiry_for(None) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_create_http_client_uses_server_keep_alive(self):
+        """The pool expiry follows the given server keep-alive timeout."""
+        client = NexusClient.create_http_client(server_keep_alive_timeout=30.0)
+        try:
+            assert client._transport._pool._keepalive_expiry == 29.0
+        finally:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_owned_http_client_closed_on_exit(self):
+        """Without a shared client, the context owns and closes its pool."""
+        async with NexusClient() as client:
+            owned = client._client
+        assert owned is not None and owned.is_closed
+
     @pytest.mark.asyncio
     async def test_client_handles_connection_error(self):
         """Client raises ClientError on connection failure."""
@@ -485,6 +485,20 @@ class TestCmdStatus:
         assert output.data["agent_id"] == "target"
         assert "tokens" in output.data
 
+    @pytest.mark.asyncio
+    async def test_status_tokens_includes_tool_breakdown(
+        self, ctx: CommandContext, mock_pool: MockAgentPool
+    ):
+        """cmd_status --tokens lists per-tool definition costs."""
+        agent = mock_pool.add_agent("target")
+        agent.context.get_tool_token_breakdown.return_value = {"gitlab_mr": 900, "read_file": 40}
+
+        output = await cmd_status(ctx, agent_id="target", show_tokens=True)
+
+        assert output.result == CommandResult.SUCCESS
+        assert output.data["tool_tokens"] == {"gitlab_mr": 900, "read_file": 40}
+        assert "gitlab_mr: 900" in output.message
+
     @pytest.mark.asyncio
     async def test_status_current_agent(
         self, mock_pool: MockAgentPool, mock_session_manager: MockSessionManager
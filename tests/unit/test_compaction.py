@@ -1,10 +1,16 @@
 """Tests for nexus3.context.compaction module."""
 
 from nexus3.context.compaction import (
+    batch_summaries,
+    build_incremental_summarize_prompt,
+    build_merge_prompt,
     build_summarize_prompt,
     create_summary_message,
     format_messages_for_summary,
+    get_summary_text,
+    is_summary_message,
     select_messages_for_compaction,
+    split_for_summary,
 )
 from nexus3.core.types import Message, Role, ToolCall
 
@@ -564,3 +570,107 @@ class TestSelectMessagesForCompaction:
         # Implementation preserves at least one if preserved list is empty
         assert len(preserved) == 1
         assert preserved[0].content == "2"
+
+
+class TestSplitForSummary:
+    """Tests for split_for_summary function."""
+
+    def test_fitting_history_is_one_chunk(self):
+        messages = [
+            Message(role=Role.USER, content="Hello"),
+            Message(role=Role.ASSISTANT, content="Hi"),
+        ]
+        chunks = split_for_summary(messages, MockTokenCounter(), max_chunk_tokens=1000)
+        assert chunks == [messages]
+
+    def test_chunks_respect_budget_and_order(self):
+        messages = [Message(role=Role.USER, content=f"message {i:02d}") for i in range(10)]
+        chunks = split_for_summary(messages, MockTokenCounter(), max_chunk_tokens=60)
+
+        assert len(chunks) > 1
+        assert [m for chunk in chunks for m in chunk] == messages
+        for chunk in chunks:
+            assert len(format_messages_for_summary(chunk)) <= 60
+
+    def test_tool_batch_is_never_split(self):
+        messages = [
+            Message(role=Role.USER, content="Read both"),
+            Message(
+                role=Role.ASSISTANT,
+                content="",
+                tool_calls=(
+                    ToolCall(id="tc1", name="read_file", arguments={"path": "a"}),
+                    ToolCall(id="tc2", name="read_file", arguments={"path": "b"}),
+                ),
+            ),
+            Message(role=Role.TOOL, content="a" * 40, tool_call_id="tc1"),
+            Message(role=Role.TOOL, content="b" * 40, tool_call_id="tc2"),
+            Message(role=Role.ASSISTANT, content="Done"),
+        ]
+        chunks = split_for_summary(messages, MockTokenCounter(), max_chunk_tokens=200)
+
+        batch_chunk = next(c for c in chunks if any(m.tool_calls for m in c))
+        assert [m.tool_call_id for m in batch_chunk if m.role == Role.TOOL] == ["tc1", "tc2"]
+
+    def test_oversized_group_is_clipped_in_the_middle(self):
+        big = "HEAD" + "x" * 5000 + "TAIL"
+        messages = [
+            Message(role=Role.USER, content="before"),
+            Message(
+                role=Role.ASSISTANT,
+                content="",
+                tool_calls=(ToolCall(id="tc1", name="read_file", arguments={"path": "a"}),),
+            ),
+            Message(role=Role.TOOL, content=big, tool_call_id="tc1"),
+            Message(role=Role.USER, content="after"),
+        ]
+        chunks = split_for_summary(messages, MockTokenCounter(), max_chunk_tokens=500)
+
+        clipped = [m for chunk in chunks for m in chunk if "omitted" in m.content]
+        assert len(clipped) == 1
+        assert clipped[0].content.startswith("HEAD")
+        assert clipped[0].content.endswith("TAIL")
+        assert len(clipped[0].content) < len(big)
+        assert chunks[0][0].content == "before"
+        assert chunks[-1][-1].content == "after"
+
+
+class TestBatchSummaries:
+    """Tests for batch_summaries and build_merge_prompt."""
+
+    def test_batches_fit_budget(self):
+        summaries = ["s" * 10 for _ in range(6)]
+        batches = batch_summaries(summaries, MockTokenCounter(), max_batch_tokens=30)
+        assert batches == [summaries[0:3], summaries[3:6]]
+
+    def test_each_batch_pairs_at_least_two(self):
+        summaries = ["s" * 100 for _ in range(5)]
+        batches = batch_summaries(summaries, MockTokenCounter(), max_batch_tokens=10)
+        assert all(len(batch) >= 2 for batch in batches)
+        assert [s for batch in batches for s in batch] == summaries
+
+    def test_merge_prompt_keeps_part_order(self):
+        prompt = build_merge_prompt(["first", "second"])
+        assert prompt.index("PART 1:\nfirst") < prompt.index("PART 2:\nsecond")
+
+
+class TestIncrementalSummaries:
+    """Tests for summary detection and the incremental prompt."""
+
+    def test_summary_message_round_trips_text(self):
+        msg = create_summary_message("Decided X.\n---\nThen Y.")
+        assert is_summary_message(msg)
+        assert get_summary_text(msg) == "Decided X.\n---\nThen Y."
+
+    def test_prefix_detects_summaries_without_metadata(self):
+        restored = Message(role=Role.USER, content=create_summary_message("old").content)
+        assert is_summary_message(restored)
+        assert not is_summary_message(Message(role=Role.USER, content="hello"))
+
+    def test_incremental_prompt_holds_previous_summary_and_new_messages(self):
+        prompt = build_incremental_summarize_prompt(
+            "Earlier work", [Message(role=Role.USER, content="New request")], max_tokens=300
+        )
+        assert "EXISTING SUMMARY:\nEarlier work" in prompt
+        assert "USER: New request" in prompt
+        assert "about 300 tokens" in prompt
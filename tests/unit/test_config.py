@@ -14,6 +14,7 @@ from nexus3.config.schema import (
     ProviderConfig,
     SearchConfig,
     ServerConfig,
+    TokenizerConfig,
     ToolPermissionConfig,
 )
 from nexus3.core.errors import ConfigError
@@ -324,6 +325,39 @@ class TestConfig:
         assert resolved.model_id == "claude-haiku-4-5"
         assert resolved.provider_name == "anthropic"
 
+    def test_resolve_model_tokenizer_precedence(self, tmp_path):
+        """Model tokenizer wins over provider tokenizer; default is None."""
+        tokenizer_file = tmp_path / "tokenizer.json"
+        cfg = Config(
+            default_model="plain",
+            providers={
+                "local": ProviderConfig(
+                    tokenizer=TokenizerConfig(type="tiktoken", encoding="o200k_base"),
+                    models={
+                        "qwen": ModelConfig(
+                            id="qwen3",
+                            tokenizer=TokenizerConfig(
+                                type="huggingface", path=str(tokenizer_file)
+                            ),
+                        ),
+                        "inherit": ModelConfig(id="llama"),
+                    },
+                ),
+                "other": ProviderConfig(models={"plain": ModelConfig(id="x")}),
+            },
+        )
+
+        qwen = cfg.resolve_model("local/qwen").tokenizer
+        assert qwen is not None and qwen.type == "huggingface"
+        assert qwen.path == str(tokenizer_file)
+        inherit = cfg.resolve_model("inherit").tokenizer
+        assert inherit is not None and inherit.encoding == "o200k_base"
+        assert cfg.resolve_model().tokenizer is None
+
+    def test_huggingface_tokenizer_requires_path(self):
+        with pytest.raises(ValidationError, match="requires 'path'"):
+            TokenizerConfig(type="huggingface")
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -1,6 +1,9 @@
 """Tests for ContextManager."""
 
+import pytest
+
 from nexus3.context.manager import ContextConfig, ContextManager
+from nexus3.context.token_counter import SimpleTokenCounter
 from nexus3.core.types import Role, ToolCall
 
 
@@ -254,6 +257,376 @@ class TestContextManagerTokenTracking:
         assert ctx.is_over_budget()
 
 
+class _CountingCounter(SimpleTokenCounter):
+    """SimpleTokenCounter that records how many messages it tokenized."""
+
+    def __init__(self) -> None:
+        self.messages_counted = 0
+        self.texts: list[str] = []
+
+    def count(self, text):
+        self.texts.append(text)
+        return super().count(text)
+
+    def count_messages(self, messages):
+        self.messages_counted += len(messages)
+        return super().count_messages(messages)
+
+
+class TestMessageTokenCache:
+    """Per-message token caching and running totals."""
+
+    def test_each_message_counted_once(self):
+        """Repeated usage checks do not re-tokenize history."""
+        counter = _CountingCounter()
+        ctx = ContextManager(token_counter=counter)
+        for i in range(10):
+            ctx.add_user_message(f"message {i}")
+
+        counted = counter.messages_counted
+        for _ in range(5):
+            ctx.get_token_usage()
+            ctx.is_over_budget()
+
+        assert counter.messages_counted == counted == 10
+
+    def test_running_total_matches_full_count(self):
+        """Running total equals a fresh full count after mixed operations."""
+        from nexus3.core.types import ToolResult
+
+        counter = SimpleTokenCounter()
+        ctx = ContextManager(token_counter=counter)
+        ctx.add_user_message("hello " * 20)
+        ctx.add_assistant_message(
+            "", [ToolCall(id="c1", name="read_file", arguments={"path": "a.py"})]
+        )
+        ctx.add_tool_result("c1", "read_file", ToolResult(output="x" * 400))
+        ctx.add_assistant_message("done")
+        ctx.prune_unpaired_tool_results()
+
+        assert ctx.get_token_usage()["messages"] == counter.count_messages(ctx.messages)
+
+        ctx.replace_messages(ctx.messages[:2])
+        assert ctx.get_token_usage()["messages"] == counter.count_messages(ctx.messages)
+
+        ctx.clear_messages()
+        assert ctx.get_token_usage()["messages"] == 0
+
+    def test_compaction_only_counts_new_summary(self):
+        """apply_compaction reuses counts for preserved messages."""
+        from nexus3.core.types import Message
+
+        counter = _CountingCounter()
+        ctx = ContextManager(token_counter=counter)
+        for i in range(6):
+            ctx.add_user_message(f"turn {i}")
+        preserved = ctx.messages[-2:]
+        before = counter.messages_counted
+
+        summary = Message(role=Role.USER, content="summary of earlier turns")
+        ctx.apply_compaction(summary, preserved)
+
+        assert counter.messages_counted == before + 1
+        assert ctx.get_token_usage()["messages"] == SimpleTokenCounter().count_messages(
+            [summary, *preserved]
+        )
+
+    def test_truncation_updates_total(self):
+        """Truncation leaves the running total consistent with kept messages."""
+        counter = SimpleTokenCounter()
+        config = ContextConfig(max_tokens=300, reserve_tokens=50)
+        ctx = ContextManager(config=config, token_counter=counter)
+        for i in range(20):
+            ctx.add_user_message(f"Message {i}: " + "x" * 100)
+
+        ctx.build_messages()
+
+        assert ctx.get_token_usage()["messages"] == counter.count_messages(ctx.messages)
+
+    def test_direct_list_mutation_resyncs(self):
+        """Appending to _messages directly is picked up by the length guard."""
+        from nexus3.core.types import Message
+
+        counter = SimpleTokenCounter()
+        ctx = ContextManager(token_counter=counter)
+        ctx.add_user_message("one")
+        ctx._messages.append(Message(role=Role.USER, content="two " * 50))
+
+        assert ctx.get_token_usage()["messages"] == counter.count_messages(ctx.messages)
+
+    def test_restore_messages_seeds_counts(self):
+        """Known token counts are used instead of re-tokenizing."""
+        from nexus3.core.types import Message
+
+        counter = _CountingCounter()
+        ctx = ContextManager(token_counter=counter)
+        messages = [
+            Message(role=Role.USER, content="a"),
+            Message(role=Role.ASSISTANT, content="b"),
+            Message(role=Role.USER, content="c"),
+        ]
+
+        ctx.restore_messages(messages, [100, None, 300])
+
+        assert counter.messages_counted == 1
+        assert ctx.message_token_counts()[0] == 100
+        assert ctx.message_token_counts()[2] == 300
+        assert ctx.get_token_usage()["messages"] == 400 + ctx.message_token_counts()[1]
+
+
+class TestProviderCalibration:
+    """Calibration of estimates from provider-reported usage."""
+
+    def _context(self) -> ContextManager:
+        ctx = ContextManager(
+            config=ContextConfig(max_tokens=2000, reserve_tokens=0),
+            token_counter=SimpleTokenCounter(),
+        )
+        ctx.set_system_prompt("system " * 100)
+        ctx.set_tool_definitions([_tool_def("read_file", "x" * 200)])
+        for i in range(5):
+            ctx.add_user_message(f"message {i} " * 40)
+        return ctx
+
+    def test_request_estimate_matches_usage_total(self):
+        ctx = self._context()
+        messages = ctx.build_messages()
+        tools = ctx.get_tool_definitions()
+        dynamic = ctx.build_dynamic_context()
+
+        estimate = ctx.estimate_request_tokens(messages, tools, dynamic)
+
+        assert estimate == ctx.get_token_usage()["total"]
+
+    def test_reported_usage_moves_budget_check(self):
+        ctx = self._context()
+        total = ctx.get_token_usage()["total"]
+        ctx.config.max_tokens = int(total * 1.5)
+        assert not ctx.is_over_budget()
+
+        # Provider counts 2x what we estimate: the same history no longer fits
+        ctx.record_provider_usage(
+            total * 2,
+            ctx.build_messages(),
+            ctx.get_tool_definitions(),
+            ctx.build_dynamic_context(),
+        )
+
+        assert ctx.token_calibration.factor == pytest.approx(2.0, rel=0.01)
+        assert ctx.calibrated_total() == pytest.approx(total * 2, rel=0.01)
+        assert ctx.is_over_budget()
+
+    def test_truncation_uses_calibrated_budget(self):
+        ctx = self._context()
+        before = len(ctx.messages)
+        ctx.config.max_tokens = int(ctx.get_token_usage()["total"] * 1.5)
+        ctx.token_calibration.record(1000, 2000)
+
+        ctx.build_messages()
+
+        assert len(ctx.messages) < before
+        assert ctx.calibrated_total() <= ctx.get_token_usage()["available"]
+
+
+def _tool_def(name: str, description: str = "") -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": {"type": "object", "properties": {}},
+        },
+    }
+
+
+class TestStaticTokenCache:
+    """Memoised system prompt and tool definition counts."""
+
+    def test_system_and_tools_counted_once(self):
+        """Repeated usage checks reuse the static counts."""
+        counter = _CountingCounter()
+        ctx = ContextManager(token_counter=counter)
+        ctx.set_system_prompt("PROMPT " * 50)
+        ctx.set_tool_definitions([_tool_def("read_file"), _tool_def("write_file")])
+
+        first = ctx.get_token_usage()
+        for _ in range(5):
+            assert ctx.get_token_usage() == first
+
+        assert counter.texts.count(ctx.system_prompt) == 1
+        assert sum(1 for text in counter.texts if '"read_file"' in text) == 1
+
+    def test_set_system_prompt_invalidates(self):
+        ctx = ContextManager()
+        ctx.set_system_prompt("short")
+        before = ctx.get_token_usage()["system"]
+
+        ctx.set_system_prompt("a much longer system prompt " * 20)
+
+        assert ctx.get_token_usage()["system"] > before
+
+    def test_set_tool_definitions_invalidates(self):
+        ctx = ContextManager()
+        ctx.set_tool_definitions([_tool_def("one")])
+        before = ctx.get_token_usage()["tools"]
+        assert ctx.get_tool_token_breakdown().keys() == {"one"}
+
+        ctx.set_tool_definitions([_tool_def("one"), _tool_def("two", "x" * 400)])
+
+        assert ctx.get_token_usage()["tools"] > before
+        assert list(ctx.get_tool_token_breakdown()) == ["two", "one"]
+
+    def test_compaction_with_new_prompt_invalidates(self):
+        from nexus3.core.types import Message
+
+        ctx = ContextManager()
+        ctx.set_system_prompt("old")
+        before = ctx.get_token_usage()["system"]
+
+        ctx.apply_compaction(
+            Message(role=Role.USER, content="summary"),
+            [],
+            new_system_prompt="new prompt " * 30,
+        )
+
+        assert ctx.get_token_usage()["system"] > before
+
+    def test_tool_breakdown_sorted_and_copied(self):
+        ctx = ContextManager()
+        ctx.set_tool_definitions(
+            [_tool_def("small"), _tool_def("large", "y" * 800), _tool_def("medium", "z" * 200)]
+        )
+
+        breakdown = ctx.get_tool_token_breakdown()
+        assert list(breakdown) == ["large", "medium", "small"]
+
+        breakdown["large"] = 0
+        assert ctx.get_tool_token_breakdown()["large"] > 0
+
+    def test_tool_breakdown_empty_without_tools(self):
+        assert ContextManager().get_tool_token_breakdown() == {}
+
+    def test_set_token_counter_recounts_everything(self):
+        ctx = ContextManager(token_counter=SimpleTokenCounter())
+        ctx.set_system_prompt("prompt " * 40)
+        ctx.set_tool_definitions([_tool_def("one")])
+        ctx.add_user_message("hello " * 40)
+        before = ctx.get_token_usage()
+
+        class _Double(SimpleTokenCounter):
+            identity = "double"
+
+            def count(self, text):
+                return 2 * super().count(text)
+
+        ctx.set_token_counter(_Double())
+        after = ctx.get_token_usage()
+
+        assert ctx.token_counter_id == "double"
+        assert after["system"] == 2 * before["system"]
+        assert after["tools"] == 2 * before["tools"]
+        assert after["messages"] > before["messages"]
+
+
+class TestDynamicContextCache:
+    """Memoised build_dynamic_context() and its token count."""
+
+    @pytest.fixture
+    def clipboard(self, tmp_path):
+        from nexus3.clipboard.manager import ClipboardManager
+        from nexus3.clipboard.types import CLIPBOARD_PRESETS
+
+        manager = ClipboardManager(
+            agent_id="test-agent",
+            cwd=tmp_path,
+            permissions=CLIPBOARD_PRESETS["yolo"],
+            home_dir=tmp_path / "home",
+        )
+        yield manager
+        manager.close()
+
+    def test_repeated_builds_list_clipboard_once(self, clipboard, monkeypatch):
+        from nexus3.clipboard.types import ClipboardScope
+
+        clipboard.copy("note", "hello", ClipboardScope.PROJECT)
+        ctx = ContextManager(clipboard_manager=clipboard)
+        calls = []
+        original = clipboard.list_entries
+        monkeypatch.setattr(
+            clipboard, "list_entries", lambda *a, **k: calls.append(1) or original(*a, **k)
+        )
+
+        first = ctx.build_dynamic_context()
+        for _ in range(5):
+            assert ctx.build_dynamic_context() is first
+            ctx.get_token_usage()
+
+        assert first is not None and "| note |" in first
+        assert len(calls) == 1
+
+    def test_token_count_cached_with_block(self, clipboard):
+        counter = _CountingCounter()
+        ctx = ContextManager(token_counter=counter, clipboard_manager=clipboard)
+
+        for _ in range(3):
+            ctx.get_token_usage()
+        dynamic = ctx.build_dynamic_context()
+        ctx.estimate_request_tokens([], None, dynamic)
+
+        assert counter.texts.count(dynamic) == 1
+
+    def test_clipboard_write_invalidates(self, clipboard):
+        from nexus3.clipboard.types import ClipboardScope
+
+        ctx = ContextManager(clipboard_manager=clipboard)
+        assert "| note |" not in (ctx.build_dynamic_context() or "")
+
+        clipboard.copy("note", "hello", ClipboardScope.AGENT)
+
+        assert "| note |" in (ctx.build_dynamic_context() or "")
+
+    def test_write_from_other_connection_invalidates(self, clipboard, tmp_path):
+        from nexus3.clipboard.manager import ClipboardManager
+        from nexus3.clipboard.types import CLIPBOARD_PRESETS, ClipboardScope
+
+        ctx = ContextManager(clipboard_manager=clipboard)
+        ctx.build_dynamic_context()
+        other = ClipboardManager(
+            agent_id="other-agent",
+            cwd=tmp_path,
+            permissions=CLIPBOARD_PRESETS["yolo"],
+            home_dir=tmp_path / "home",
+        )
+        try:
+            other.copy("shared", "from another agent", ClipboardScope.PROJECT)
+        finally:
+            other.close()
+
+        assert "| shared |" in (ctx.build_dynamic_context() or "")
+
+    def test_git_refresh_invalidates(self, tmp_path):
+        ctx = ContextManager()
+        before = ctx.build_dynamic_context()
+
+        ctx.refresh_git_context(tmp_path)
+
+        after = ctx.build_dynamic_context()
+        assert after is not before
+        assert after is not None and "No git repository detected in CWD." in after
+
+    def test_minute_rollover_invalidates(self, monkeypatch):
+        import nexus3.context.manager as manager_module
+
+        now = ["Current date: 2026-01-13, Current time: 14:32 (local)"]
+        monkeypatch.setattr(manager_module, "get_current_datetime_str", lambda: now[0])
+        ctx = ContextManager()
+        assert "14:32" in (ctx.build_dynamic_context() or "")
+
+        now[0] = "Current date: 2026-01-13, Current time: 14:33 (local)"
+
+        assert "14:33" in (ctx.build_dynamic_context() or "")
+
+
 class TestFixOrphanedToolCalls:
     """Test fix_orphaned_tool_calls() synthesizes missing tool results."""
 
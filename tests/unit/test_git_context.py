@@ -1,15 +1,22 @@
 """Tests for git_context module."""
 
+import asyncio
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from nexus3.context import git_context
 from nexus3.context.git_context import (
+    _FACTS_CACHE,
+    GitContextRefresher,
     _parse_status_counts,
+    _run_git_async,
     _sanitize_remote_url,
+    _supports_stash_header,
     get_git_context,
+    get_git_context_async,
     should_refresh_git_context,
 )
 
@@ -81,49 +88,81 @@ class TestSanitizeRemoteUrl:
 
 
 class TestParseStatusCounts:
-    """Test git status --porcelain parsing."""
+    """Test git status --porcelain=v2 parsing."""
+
+    @staticmethod
+    def _entry(xy: str, path: str) -> str:
+        return f"1 {xy} N... 100644 100644 100644 aaaaaaa bbbbbbb {path}"
 
     def test_empty_output(self):
         counts = _parse_status_counts("")
         assert counts == {"staged": 0, "modified": 0, "untracked": 0}
 
+    def test_headers_ignored(self):
+        output = "# branch.oid abc\n# branch.head main\n# stash 2"
+        counts = _parse_status_counts(output)
+        assert counts == {"staged": 0, "modified": 0, "untracked": 0}
+
     def test_untracked_files(self):
-        output = "?? file1.txt\n?? file2.txt"
+        output = "? file1.txt\n? file2.txt"
         counts = _parse_status_counts(output)
         assert counts == {"staged": 0, "modified": 0, "untracked": 2}
 
     def test_staged_files(self):
-        output = "A  new_file.txt\nM  modified.txt"
+        output = "\n".join([self._entry("A.", "new_file.txt"), self._entry("M.", "modified.txt")])
         counts = _parse_status_counts(output)
         assert counts == {"staged": 2, "modified": 0, "untracked": 0}
 
     def test_modified_files(self):
-        output = " M file1.txt\n M file2.txt"
+        output = "\n".join([self._entry(".M", "file1.txt"), self._entry(".M", "file2.txt")])
         counts = _parse_status_counts(output)
         assert counts == {"staged": 0, "modified": 2, "untracked": 0}
 
     def test_mixed_status(self):
-        output = "A  staged.txt\n M modified.txt\n?? untracked.txt\nMM both.txt"
+        output = "\n".join([
+            self._entry("A.", "staged.txt"),
+            self._entry(".M", "modified.txt"),
+            "? untracked.txt",
+            self._entry("MM", "both.txt"),
+        ])
         counts = _parse_status_counts(output)
         # MM = staged (M in X) + modified (M in Y)
         assert counts == {"staged": 2, "modified": 2, "untracked": 1}
 
     def test_renamed_file(self):
-        output = "R  old.txt -> new.txt"
+        output = "2 R. N... 100644 100644 100644 aaaaaaa bbbbbbb R100 new.txt\told.txt"
         counts = _parse_status_counts(output)
         assert counts == {"staged": 1, "modified": 0, "untracked": 0}
 
     def test_deleted_staged(self):
-        output = "D  deleted.txt"
-        counts = _parse_status_counts(output)
+        counts = _parse_status_counts(self._entry("D.", "deleted.txt"))
         assert counts == {"staged": 1, "modified": 0, "untracked": 0}
 
     def test_deleted_unstaged(self):
-        output = " D deleted.txt"
-        counts = _parse_status_counts(output)
+        counts = _parse_status_counts(self._entry(".D", "deleted.txt"))
         assert counts == {"staged": 0, "modified": 1, "untracked": 0}
 
 
+def _status_v2(branch: str = "main", entries: str = "", stashes: int = 0) -> str:
+    """Build `git status --porcelain=v2 --branch --show-stash` output."""
+    head = "(detached)" if branch == "HEAD" else branch
+    lines = ["# branch.oid 0123456789abcdef", f"# branch.head {head}"]
+    if stashes:
+        lines.append(f"# stash {stashes}")
+    if entries:
+        lines.append(entries)
+    return "\n".join(lines)
+
+
+@pytest.fixture(autouse=True)
+def _clear_facts_cache(monkeypatch):
+    # Status output above includes "# stash" as git >= 2.35 prints it
+    monkeypatch.setattr(git_context, "_status_reports_stash", True)
+    _FACTS_CACHE.clear()
+    yield
+    _FACTS_CACHE.clear()
+
+
 class TestGetGitContext:
     """Test the main get_git_context() function."""
 
@@ -131,47 +170,31 @@ class TestGetGitContext:
         """Create a subprocess.run side effect based on git command args.
 
         Args:
-            responses: Maps git subcommand key to stdout value.
-                Keys: "rev-parse-work-tree", "rev-parse-branch", "status",
-                      "stash", "log", "remote", "worktree"
-                Values: stdout string or None (for returncode=1).
+            responses: Maps git subcommand ("status", "log", "remote",
+                "worktree") to stdout, or None for returncode=1.
         """
-        def side_effect(args, **kwargs):
-            cmd = args[1] if len(args) > 1 else ""
-
-            if cmd == "rev-parse":
-                if "--is-inside-work-tree" in args:
-                    key = "rev-parse-work-tree"
-                else:
-                    key = "rev-parse-branch"
-            elif cmd == "status":
-                key = "status"
-            elif cmd == "stash":
-                key = "stash"
-            elif cmd == "log":
-                key = "log"
-            elif cmd == "remote":
-                key = "remote"
-            elif cmd == "worktree":
-                key = "worktree"
-            else:
-                key = cmd
+        calls: list[str] = []
 
+        def side_effect(args, **kwargs):
+            key = args[1] if len(args) > 1 else ""
+            calls.append(key)
             value = responses.get(key)
             if value is None:
                 return subprocess.CompletedProcess(args, returncode=1, stdout="", stderr="")
             return subprocess.CompletedProcess(args, returncode=0, stdout=value, stderr="")
 
+        side_effect.calls = calls  # type: ignore[attr-defined]
         return side_effect
 
     @patch("nexus3.context.git_context.subprocess.run")
     def test_not_a_git_repo(self, mock_run):
         mock_run.return_value = subprocess.CompletedProcess(
-            ["git", "rev-parse", "--is-inside-work-tree"],
+            ["git", "status"],
             returncode=128, stdout="", stderr="not a git repo",
         )
         result = get_git_context("/tmp/not-a-repo")
         assert result == "No git repository detected in CWD."
+        assert mock_run.call_count == 1
 
     @patch("nexus3.context.git_context.subprocess.run")
     def test_git_not_installed(self, mock_run):
@@ -186,10 +209,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_basic_repo(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("main"),
             "log": "abc1234 fix login bug",
             "remote": "https://github.com/user/repo.git",
             "worktree": "worktree /home/user/repo\n",
@@ -205,16 +225,31 @@ class TestGetGitContext:
         # Only one worktree - should not show worktrees section
         assert "Worktrees:" not in result
 
+    @patch("nexus3.context.git_context.subprocess.run")
+    def test_status_is_a_single_call(self, mock_run):
+        side_effect = self._make_run_side_effect({
+            "status": _status_v2("main"),
+            "log": "abc1234 commit",
+            "remote": None,
+            "worktree": "worktree /home/user/repo\n",
+        })
+        mock_run.side_effect = side_effect
+
+        get_git_context("/home/user/repo")
+
+        assert side_effect.calls == ["status", "log", "remote", "worktree"]
+        status_args = mock_run.call_args_list[0].args[0]
+        assert status_args[1:] == ["status", "--porcelain=v2", "--branch", "--show-stash"]
+
     @patch("nexus3.context.git_context.subprocess.run")
     def test_dirty_repo_with_stashes(self, mock_run):
+        entries = "\n".join([
+            "1 M. N... 100644 100644 100644 aaaaaaa bbbbbbb file1.txt",
+            "? file2.txt",
+            "1 .M N... 100644 100644 100644 aaaaaaa bbbbbbb file3.txt",
+        ])
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "feature/test",
-            "status": "M  file1.txt\n?? file2.txt\n M file3.txt",
-            "stash": (
-                "stash@{0}: WIP on main: abc1234 first\n"
-                "stash@{1}: WIP on main: def5678 second"
-            ),
+            "status": _status_v2("feature/test", entries, stashes=2),
             "log": "def5678 add tests",
             "remote": "git@github.com:org/project.git",
             "worktree": "worktree /home/user/repo\n",
@@ -234,10 +269,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_single_stash_no_plural(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "stash@{0}: WIP on main: abc1234 first",
+            "status": _status_v2("main", stashes=1),
             "log": "abc1234 first",
             "remote": None,
             "worktree": "worktree /home/user/repo\n",
@@ -252,10 +284,7 @@ class TestGetGitContext:
     def test_long_commit_message_truncated(self, mock_run):
         long_msg = "abc1234 " + "x" * 100
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("main"),
             "log": long_msg,
             "remote": None,
             "worktree": "worktree /home/user/repo\n",
@@ -276,10 +305,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_no_remote(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("main"),
             "log": "abc1234 commit",
             "remote": None,
             "worktree": "worktree /home/user/repo\n",
@@ -292,10 +318,9 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_hard_cap_applied(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "a" * 200,
-            "status": "\n".join(f"?? file{i}.txt" for i in range(100)),
-            "stash": "\n".join(f"stash@{{{i}}}: WIP" for i in range(50)),
+            "status": _status_v2(
+                "a" * 200, "\n".join(f"? file{i}.txt" for i in range(100)), stashes=50
+            ),
             "log": "abc1234 " + "x" * 200,
             "remote": "https://github.com/" + "x" * 200 + ".git",
             "worktree": "worktree /a\nworktree /b\nworktree /c\n",
@@ -308,10 +333,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_multiple_worktrees_shown(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("main"),
             "log": "abc1234 commit",
             "remote": None,
             "worktree": "worktree /home/user/repo\nworktree /home/user/repo-hotfix\n",
@@ -325,10 +347,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_detached_head(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "HEAD",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("HEAD"),
             "log": "abc1234 commit",
             "remote": None,
             "worktree": "worktree /home/user/repo\n",
@@ -341,10 +360,7 @@ class TestGetGitContext:
     @patch("nexus3.context.git_context.subprocess.run")
     def test_result_starts_with_header(self, mock_run):
         mock_run.side_effect = self._make_run_side_effect({
-            "rev-parse-work-tree": "true",
-            "rev-parse-branch": "main",
-            "status": "",
-            "stash": "",
+            "status": _status_v2("main"),
             "log": "abc1234 commit",
             "remote": None,
             "worktree": "worktree /home/user/repo\n",
@@ -354,6 +370,133 @@ class TestGetGitContext:
         assert result is not None
         assert result.startswith("Git repository detected in CWD.")
 
+    @patch("nexus3.context.git_context.subprocess.run")
+    def test_old_git_counts_stash_list(self, mock_run, monkeypatch):
+        """Before git 2.35 status has no "# stash" header; use `git stash list`."""
+        monkeypatch.setattr(git_context, "_status_reports_stash", None)
+        side_effect = self._make_run_side_effect({
+            "status": _status_v2("main"),
+            "--version": "git version 2.34.1",
+            "stash": "stash@{0}: WIP on main\nstash@{1}: WIP on main",
+            "log": "abc1234 commit",
+            "remote": None,
+            "worktree": "worktree /home/user/repo\n",
+        })
+        mock_run.side_effect = side_effect
+
+        result = get_git_context("/home/user/repo")
+        assert result is not None
+        assert "2 stashes" in result
+        assert side_effect.calls[:3] == ["status", "--version", "stash"]
+
+        # The version probe runs once per process
+        side_effect.calls.clear()
+        get_git_context("/home/user/repo")
+        assert side_effect.calls[:2] == ["status", "stash"]
+
+    @patch("nexus3.context.git_context.subprocess.run")
+    def test_new_git_without_stash_header_has_no_stashes(self, mock_run, monkeypatch):
+        monkeypatch.setattr(git_context, "_status_reports_stash", None)
+        side_effect = self._make_run_side_effect({
+            "status": _status_v2("main"),
+            "--version": "git version 2.39.5",
+            "log": "abc1234 commit",
+            "remote": None,
+            "worktree": "worktree /home/user/repo\n",
+        })
+        mock_run.side_effect = side_effect
+
+        result = get_git_context("/home/user/repo")
+        assert result is not None and "Status: clean" in result
+        assert "stash" not in side_effect.calls
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            ("git version 2.35.0", True),
+            ("git version 2.43.0.windows.1", True),
+            ("git version 3.0.0", True),
+            ("git version 2.34.8", False),
+            ("git version 1.9.5", False),
+            (None, False),
+        ],
+    )
+    def test_supports_stash_header(self, output, expected):
+        assert _supports_stash_header(output) is expected
+
+
+class TestAsyncGitContext:
+    """get_git_context_async() and GitContextRefresher."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q", "-b", "main")
+        git("-c", "user.email=t@example.com", "-c", "user.name=T",
+            "commit", "-q", "--allow-empty", "-m", "initial commit")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_matches_blocking_version(self, repo: Path) -> None:
+        (repo / "new.txt").write_text("x")
+        assert await get_git_context_async(repo) == get_git_context(repo)
+
+    @pytest.mark.asyncio
+    async def test_not_a_repo(self, tmp_path: Path) -> None:
+        assert await get_git_context_async(tmp_path) == "No git repository detected in CWD."
+
+    @pytest.mark.asyncio
+    async def test_reuses_facts_while_head_unchanged(self, repo: Path) -> None:
+        await get_git_context_async(repo)
+        with patch(
+            "nexus3.context.git_context._run_git_async", wraps=_run_git_async
+        ) as run:
+            (repo / "new.txt").write_text("x")
+            result = await get_git_context_async(repo)
+
+        assert run.call_count == 1
+        assert result is not None and "1 untracked" in result
+        assert "initial commit" in result
+
+    @pytest.mark.asyncio
+    async def test_blocking_and_async_share_facts_cache(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A relative cwd and its absolute path hit the same cache entry."""
+        monkeypatch.chdir(repo.parent)
+        get_git_context(repo.name)
+        with patch(
+            "nexus3.context.git_context._run_git_async", wraps=_run_git_async
+        ) as run:
+            await get_git_context_async(repo)
+
+        assert run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_runs(self, repo: Path) -> None:
+        refresher = GitContextRefresher(debounce=0.01)
+        with patch(
+            "nexus3.context.git_context.get_git_context_async", wraps=get_git_context_async
+        ) as fetch:
+            results = await asyncio.gather(*(refresher.refresh(repo) for _ in range(20)))
+
+        assert fetch.call_count == 1
+        assert len(set(results)) == 1
+        assert refresher.cached(repo) == results[0]
+
+    @pytest.mark.asyncio
+    async def test_request_during_run_gets_fresh_result(self, repo: Path) -> None:
+        refresher = GitContextRefresher(debounce=0)
+        first = asyncio.create_task(refresher.refresh(repo))
+        await asyncio.sleep(0)  # first run has started
+        (repo / "late.txt").write_text("x")
+        second = await refresher.refresh(repo)
+        await first
+
+        assert second is not None and "1 untracked" in second
+
 
 class TestGetGitContextLive:
     """Integration tests that run against the actual NEXUS3 git repo.
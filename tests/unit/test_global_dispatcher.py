@@ -290,3 +290,35 @@ async def test_global_create_agent_sandboxed_without_allowed_write_paths_disable
     ):
         assert tool_name in tool_overrides
         assert tool_overrides[tool_name].enabled is False
+
+
+@pytest.mark.asyncio
+async def test_global_dispatch_batch_authorizes_each_request() -> None:
+    claims = CapabilityClaims(
+        token_id="tok-1",
+        issuer_id="issuer-1",
+        subject_id="subject-7",
+        scopes=("rpc:global:list_agents",),
+        issued_at=1,
+        expires_at=10,
+    )
+    pool = _CapabilityPool(claims=claims)
+    dispatcher = GlobalDispatcher(pool)
+    dispatcher._list_agents_authorization_kernel.authorize = (
+        lambda request: AuthorizationDecision.allow(request, reason="ok")
+    )
+    items = [
+        Request(jsonrpc="2.0", method="list_agents", params={}, id=1),
+        Request(jsonrpc="2.0", method="list_agents", params={}),  # notification
+        Request(jsonrpc="2.0", method="no_such_method", params={}, id=2),
+        Request(jsonrpc="2.0", method="list_agents", params={}, id=3),
+    ]
+
+    responses = await dispatcher.dispatch_batch(items, capability_token="cap-token")
+
+    assert [r.id for r in responses] == [1, 2, 3]
+    assert responses[0].result == {"agents": []}
+    assert responses[1].error is not None and responses[1].error["code"] == -32601
+    assert responses[2].result == {"agents": []}
+    # Capability verified once per request, notifications included
+    assert len(pool.verify_calls) == 3
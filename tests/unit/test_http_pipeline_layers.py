@@ -4,6 +4,7 @@ Sprint 5 D2: Tests for the extracted authentication, routing, and restore layers
 in the HTTP pipeline.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -518,3 +519,309 @@ class TestPipelineLayerIntegration:
             == "X-Nexus-Agent requires X-Nexus-Capability; "
             "requester-only HTTP identity is no longer supported."
         )
+
+
+class TestKeepAlive:
+    """Persistent connections in handle_connection."""
+
+    @staticmethod
+    def _rpc(method: str, request_id: int, extra_headers: str = "", version: str = "1.1") -> bytes:
+        body = json.dumps({"jsonrpc": "2.0", "method": method, "params": {}, "id": request_id})
+        return (
+            f"POST / HTTP/{version}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{extra_headers}"
+            f"\r\n{body}"
+        ).encode()
+
+    @staticmethod
+    async def _read_response(reader) -> tuple[str, dict[str, str], dict]:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        lines = head.decode().split("\r\n")
+        headers = {
+            name.lower(): value.strip()
+            for name, _, value in (line.partition(":") for line in lines[1:] if line)
+        }
+        body = await reader.readexactly(int(headers["content-length"]))
+        return lines[0], headers, json.loads(body)
+
+    @pytest.fixture
+    async def server(self):
+        from nexus3.rpc.dispatch_core import dispatch_batch
+        from nexus3.rpc.http import KeepAlivePolicy, handle_connection
+        from nexus3.rpc.protocol import make_success_response
+
+        global_dispatcher = MagicMock()
+        global_dispatcher.shutdown_requested = False
+        global_dispatcher.dispatch = AsyncMock(
+            side_effect=lambda request, *_args, **_kw: make_success_response(
+                request.id, {"method": request.method}
+            )
+        )
+
+        async def run_batch(items, *_args, **_kw):
+            return await dispatch_batch(items, global_dispatcher.dispatch, "test")
+
+        global_dispatcher.dispatch_batch = AsyncMock(side_effect=run_batch)
+        pool = MagicMock()
+        pool.should_shutdown = False
+        policy = KeepAlivePolicy(idle_timeout=0.5, max_requests=3)
+
+        async def handler(reader, writer):
+            await handle_connection(
+                reader, writer, pool, global_dispatcher, keep_alive=policy
+            )
+
+        srv = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        yield port, global_dispatcher, policy
+        srv.close()
+        await srv.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_serves_sequential_requests_on_one_connection(self, server) -> None:
+        port, dispatcher, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        writer.write(self._rpc("list_agents", 1))
+        status, headers, payload = await self._read_response(reader)
+        assert status == "HTTP/1.1 200 OK"
+        assert headers["connection"] == "keep-alive"
+        assert headers["keep-alive"] == "timeout=0, max=2"
+        assert payload["result"] == {"method": "list_agents"}
+
+        writer.write(self._rpc("get_tokens", 2))
+        _, _, payload = await self._read_response(reader)
+        assert payload["id"] == 2
+        assert dispatcher.dispatch.await_count == 2
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_answered_in_order(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._rpc("a", 1) + self._rpc("b", 2))
+
+        ids = [(await self._read_response(reader))[2]["id"] for _ in range(2)]
+        assert ids == [1, 2]
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_max_requests_closes_connection(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"".join(self._rpc("m", i) for i in range(1, 5)))
+
+        for _ in range(2):
+            await self._read_response(reader)
+        _, headers, _ = await self._read_response(reader)
+        assert headers["connection"] == "close"
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+
+    @pytest.mark.asyncio
+    async def test_connection_close_header_honoured(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._rpc("m", 1, "Connection: close\r\n"))
+
+        _, headers, _ = await self._read_response(reader)
+        assert headers["connection"] == "close"
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+
+    @pytest.mark.asyncio
+    async def test_http10_defaults_to_close(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._rpc("m", 1, version="1.0"))
+
+        _, headers, _ = await self._read_response(reader)
+        assert headers["connection"] == "close"
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_closed_after_timeout(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._rpc("m", 1))
+        await self._read_response(reader)
+
+        # Idle timeout is 0.5s; the server closes without sending anything.
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+
+    @pytest.mark.asyncio
+    async def test_close_idle_releases_waiting_connections(self, server) -> None:
+        port, _, policy = server
+        policy.idle_timeout = 30.0
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._rpc("m", 1))
+        await self._read_response(reader)
+        await asyncio.sleep(0.05)
+
+        policy.close_idle()
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+
+    @pytest.mark.asyncio
+    async def test_transfer_encoding_rejected(self, server) -> None:
+        port, _, _ = server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n")
+
+        status, headers, _ = await self._read_response(reader)
+        assert status == "HTTP/1.1 400 Bad Request"
+        assert headers["connection"] == "close"
+
+    @pytest.mark.asyncio
+    async def test_batch_round_trip_with_client(self, server) -> None:
+        from nexus3.client import NexusClient
+
+        port, dispatcher, _ = server
+        async with NexusClient(f"http://127.0.0.1:{port}", skip_url_validation=True) as client:
+            responses = await client.call_batch(
+                [("get_tokens", None), ("get_context", None), ("cancel", {"request_id": "x"})]
+            )
+
+        assert [r.result["method"] for r in responses] == ["get_tokens", "get_context", "cancel"]
+        assert dispatcher.dispatch_batch.await_count == 1
+        assert dispatcher.dispatch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_rejected(self, server) -> None:
+        from nexus3.rpc.http import MAX_BATCH_SIZE
+
+        port, dispatcher, _ = server
+        body = json.dumps(
+            [{"jsonrpc": "2.0", "method": "m", "id": i} for i in range(MAX_BATCH_SIZE + 1)]
+        )
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"POST / HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n{body}".encode())
+
+        status, _, payload = await self._read_response(reader)
+        assert status == "HTTP/1.1 400 Bad Request"
+        assert "Batch too large" in payload["error"]["message"]
+        dispatcher.dispatch.assert_not_awaited()
+        writer.close()
+
+    def test_wants_keep_alive(self) -> None:
+        from nexus3.rpc.http import HttpRequest
+
+        def req(version: str, connection: str | None) -> HttpRequest:
+            headers = {"connection": connection} if connection else {}
+            return HttpRequest("POST", "/", headers, "", version=version)
+
+        assert req("HTTP/1.1", None).wants_keep_alive
+        assert not req("HTTP/1.1", "close").wants_keep_alive
+        assert not req("HTTP/1.0", None).wants_keep_alive
+        assert req("HTTP/1.0", "Keep-Alive").wants_keep_alive
+
+
+class TestStreamedSend:
+    """Streamed 'send' over SSE, end to end with NexusClient."""
+
+    class _Session:
+        def __init__(self, chunks: list[str], delay: float = 0.0) -> None:
+            self.chunks = chunks
+            self.delay = delay
+            self.halted_at_iteration_limit = False
+            self.cancelled = False
+
+        async def send_locked(self, content, cancel_token=None, user_meta=None, on_event=None):
+            for chunk in self.chunks:
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    self.cancelled = True
+                    return
+                yield chunk
+
+    @pytest.fixture
+    async def agent_server(self):
+        from nexus3.rpc.dispatcher import Dispatcher
+        from nexus3.rpc.http import KeepAlivePolicy, handle_connection
+
+        session = self._Session(["Hello", ", ", "world"])
+        agent = MagicMock()
+        agent.dispatcher = Dispatcher(session)
+        pool = MagicMock()
+        pool.should_shutdown = False
+        pool.get = MagicMock(return_value=agent)
+        global_dispatcher = MagicMock()
+        global_dispatcher.shutdown_requested = False
+        policy = KeepAlivePolicy(idle_timeout=5.0, max_requests=10)
+
+        async def handler(reader, writer):
+            await handle_connection(reader, writer, pool, global_dispatcher, keep_alive=policy)
+
+        srv = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        yield port, session
+        srv.close()
+        await srv.wait_closed()
+
+    @staticmethod
+    def _send_bytes(params: dict, request_id: int = 1) -> bytes:
+        body = json.dumps(
+            {"jsonrpc": "2.0", "method": "send", "params": params, "id": request_id}
+        )
+        return (
+            f"POST /agent/worker HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n{body}"
+        ).encode()
+
+    @pytest.mark.asyncio
+    async def test_client_receives_frames_then_result(self, agent_server) -> None:
+        from nexus3.client import NexusClient
+
+        port, _ = agent_server
+        url = f"http://127.0.0.1:{port}/agent/worker"
+        async with NexusClient(url, skip_url_validation=True) as client:
+            frames = [frame async for frame in client.send_stream("hi", request_id="r1")]
+
+        assert [f.data["text"] for f in frames if f.event == "content"] == [
+            "Hello", ", ", "world"
+        ]
+        assert frames[-1].event == "result"
+        assert frames[-1].data["content"] == "Hello, world"
+        assert frames[-1].data["request_id"] == "r1"
+
+    @pytest.mark.asyncio
+    async def test_chunked_stream_keeps_connection_alive(self, agent_server) -> None:
+        port, _ = agent_server
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._send_bytes({"content": "hi", "stream": True}))
+
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        assert b"Content-Type: text/event-stream" in head
+        assert b"Transfer-Encoding: chunked" in head
+        assert b"Connection: keep-alive" in head
+        body = await asyncio.wait_for(reader.readuntil(b"0\r\n\r\n"), timeout=5)
+        assert b"event: result" in body
+
+        writer.write(self._send_bytes({"content": "again"}, request_id=2))
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        assert b"application/json" in head
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_client_cancels_turn(self, agent_server) -> None:
+        port, session = agent_server
+        session.chunks = ["x"] * 200
+        session.delay = 0.01
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(self._send_bytes({"content": "hi", "stream": True}))
+        await asyncio.wait_for(reader.readuntil(b"event: content"), timeout=5)
+        writer.close()
+        await writer.wait_closed()
+
+        for _ in range(200):
+            if session.cancelled:
+                break
+            await asyncio.sleep(0.01)
+        assert session.cancelled
+
+    @pytest.mark.asyncio
+    async def test_wants_stream_requires_send_with_id(self) -> None:
+        from nexus3.rpc.http import _wants_stream
+        from nexus3.rpc.types import Request
+
+        assert _wants_stream(Request("2.0", "send", {"content": "x", "stream": True}, 1))
+        assert not _wants_stream(Request("2.0", "send", {"content": "x", "stream": True}))
+        assert not _wants_stream(Request("2.0", "send", {"content": "x"}, 1))
+        assert not _wants_stream(Request("2.0", "list_agents", {"stream": True}, 1))
@@ -1,11 +1,13 @@
 """Tests for new skills: tail, file_info, append_file."""
 
+import asyncio
 import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from nexus3.core.line_index import get_line_index_cache
 from nexus3.skill.builtin.append_file import AppendFileSkill, append_file_factory
 from nexus3.skill.builtin.file_info import FileInfoSkill, file_info_factory
 from nexus3.skill.builtin.tail import TailSkill, tail_factory
@@ -109,6 +111,110 @@ class TestTailSkill:
         assert result.error is not None
         assert "not valid utf-8" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_trailing_newline_and_crlf(self, skill: TailSkill, tmp_path: Path) -> None:
+        """Line numbers match text-mode iteration for CRLF files."""
+        file = tmp_path / "crlf.txt"
+        file.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+        result = await skill.execute(path=str(file), lines=2)
+
+        assert result.output.startswith("2: two\n3: three\n")
+        assert "[tail: since_offset=17]" in result.output
+
+    @pytest.mark.asyncio
+    async def test_since_offset_returns_only_appended_lines(
+        self, skill: TailSkill, test_file: Path
+    ) -> None:
+        """since_offset returns complete lines written after the previous call."""
+        first = await skill.execute(path=str(test_file), lines=1)
+        # Last line has no trailing newline, so the marker points at its start
+        offset = int(first.output.rsplit("since_offset=", 1)[1].rstrip("]"))
+
+        with open(test_file, "a") as f:
+            f.write("\nLine 21\nLine 22\npartial")
+
+        result = await skill.execute(path=str(test_file), since_offset=offset)
+
+        assert result.output.startswith("20: Line 20\n21: Line 21\n22: Line 22\n")
+        assert "partial" not in result.output
+        assert f"since_offset={test_file.stat().st_size - len('partial')}" in result.output
+
+    @pytest.mark.asyncio
+    async def test_since_offset_past_end_restarts(
+        self, skill: TailSkill, test_file: Path
+    ) -> None:
+        """A since_offset beyond EOF (truncated/rotated file) reads from the start."""
+        result = await skill.execute(path=str(test_file), since_offset=10**9, lines=2)
+
+        assert "truncated or rotated" in result.output
+        assert "1: Line 1\n2: Line 2\n" in result.output
+
+    @pytest.mark.asyncio
+    async def test_since_offset_skips_line_longer_than_buffer(
+        self, skill: TailSkill, tmp_path: Path
+    ) -> None:
+        """A line too long to buffer is skipped and the offset moves past it."""
+        file = tmp_path / "long.log"
+        file.write_bytes(b"first\n" + b"x" * 1_300_000 + b"\nafter\n")
+
+        result = await skill.execute(path=str(file), since_offset=6)
+
+        assert result.output.startswith(
+            "2: [line longer than the output limit skipped]\n3: after\n"
+        )
+        assert f"since_offset={file.stat().st_size}" in result.output
+
+    @pytest.mark.asyncio
+    async def test_since_offset_holds_back_unterminated_long_line(
+        self, skill: TailSkill, tmp_path: Path
+    ) -> None:
+        """Without a newline yet, an overlong line is held back, not skipped."""
+        file = tmp_path / "long.log"
+        file.write_bytes(b"first\n" + b"x" * 1_300_000)
+
+        result = await skill.execute(path=str(file), since_offset=6)
+
+        assert "skipped" not in result.output
+        assert "since_offset=6]" in result.output
+
+    @pytest.mark.asyncio
+    async def test_follow_waits_for_appended_lines(
+        self, skill: TailSkill, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """follow only re-indexes the file once its stat changes."""
+        monkeypatch.setattr("nexus3.skill.builtin.tail._FOLLOW_POLL_INTERVAL", 0.01)
+        file = tmp_path / "live.log"
+        file.write_text("a\nb\n")
+        cache = get_line_index_cache()
+        lookups = []
+        real_get = cache.get
+
+        def counting_get(path: Path):
+            lookups.append(path)
+            return real_get(path)
+
+        monkeypatch.setattr(cache, "get", counting_get)
+
+        async def append_later() -> None:
+            await asyncio.sleep(0.1)
+            with open(file, "a") as f:
+                f.write("c\n")
+
+        writer = asyncio.create_task(append_later())
+        result = await skill.execute(path=str(file), since_offset=4, follow=True)
+        await writer
+
+        assert result.output.startswith("3: c\n")
+        assert len(lookups) == 2
+
+    @pytest.mark.asyncio
+    async def test_follow_requires_since_offset(
+        self, skill: TailSkill, test_file: Path
+    ) -> None:
+        result = await skill.execute(path=str(test_file), follow=True)
+        assert "follow requires since_offset" in result.error
+
     @pytest.mark.asyncio
     async def test_sandbox_enforcement(self, tmp_path: Path) -> None:
         """Sandbox is enforced when allowed_paths configured."""
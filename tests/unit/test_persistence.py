@@ -13,6 +13,7 @@ from nexus3.session.persistence import (
     SessionSummary,
     deserialize_message,
     deserialize_messages,
+    deserialize_messages_with_tokens,
     deserialize_tool_call,
     serialize_message,
     serialize_messages,
@@ -252,6 +253,26 @@ class TestSerializeMessages:
         assert serialize_messages([]) == []
         assert deserialize_messages([]) == []
 
+    def test_token_counts_round_trip(self):
+        """Per-message token counts survive serialization and skip filtered messages."""
+        messages = [
+            Message(role=Role.USER, content="Hello"),
+            Message(role=Role.ASSISTANT, content="Hi"),
+        ]
+        data = serialize_messages(messages, [7, 5])
+        data.insert(1, {"role": "assistant", "content": "", "tokens": 99})
+        data.append({"role": "user", "content": "no count"})
+
+        restored, counts = deserialize_messages_with_tokens(data)
+
+        assert [m.content for m in restored] == ["Hello", "Hi", "no count"]
+        assert counts == [7, 5, None]
+
+    def test_mismatched_token_counts_ignored(self):
+        """Token counts of the wrong length are not written."""
+        data = serialize_messages([Message(role=Role.USER, content="x")], [1, 2])
+        assert "tokens" not in data[0]
+
 
 class TestSavedSession:
     """Tests for SavedSession dataclass."""
@@ -18,6 +18,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from nexus3.config.schema import SessionStorageConfig
+from nexus3.context.manager import ContextManager
 from nexus3.core.authorization_kernel import (
     AuthorizationAction,
     AuthorizationDecision,
@@ -61,7 +63,7 @@ class TestSharedComponents:
         expected = {
             "config", "provider_registry", "base_log_dir", "base_context",
             "context_loader", "log_streams", "custom_presets", "mcp_registry",
-            "is_repl",
+            "directory_cache", "is_repl",
         }
         assert field_names == expected
 
@@ -159,6 +161,7 @@ def create_mock_shared_components(tmp_path: Path) -> SharedComponents:
     # Provide concrete values for skill timeout and concurrency limit
     mock_config.skill_timeout = 30.0
     mock_config.max_concurrent_tools = 10
+    mock_config.session_storage = SessionStorageConfig()
     mock_config.default_provider = None  # Use "default" provider
 
     # Mock provider registry
@@ -202,6 +205,40 @@ class TestAgentPool:
             assert "my-custom-id" in pool
             assert len(pool) == 1
 
+    @pytest.mark.asyncio
+    async def test_create_and_restore_refresh_git_context_off_the_event_loop(self, tmp_path):
+        """create() and restore use the async git context refresh."""
+        shared = create_mock_shared_components(tmp_path)
+        saved = SavedSession(
+            agent_id="restored",
+            created_at=datetime.now(),
+            modified_at=datetime.now(),
+            messages=[],
+            system_prompt="You are a test assistant.",
+            system_prompt_path=None,
+            working_directory=str(tmp_path),
+            permission_level="sandboxed",
+            token_usage={},
+            provenance="user",
+            permission_preset="sandboxed",
+        )
+        session_manager = MagicMock()
+        session_manager.session_exists.return_value = True
+        session_manager.load_session.return_value = saved
+
+        with (
+            patch("nexus3.skill.builtin.register_builtin_skills"),
+            patch.object(
+                ContextManager, "refresh_git_context", side_effect=AssertionError("blocking")
+            ),
+            patch.object(ContextManager, "refresh_git_context_async") as refresh_async,
+        ):
+            pool = AgentPool(shared)
+            await pool.create(agent_id="created")
+            await pool.get_or_restore("restored", session_manager=session_manager)
+
+        assert refresh_async.await_count == 2
+
     @pytest.mark.asyncio
     async def test_create_with_auto_generated_agent_id(self, tmp_path):
         """create() without agent_id generates a random ID."""
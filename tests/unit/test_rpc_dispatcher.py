@@ -13,7 +13,13 @@ from nexus3.core.capabilities import CapabilityClaims, CapabilitySignatureError
 from nexus3.core.permissions import PermissionLevel
 from nexus3.rpc.dispatcher import Dispatcher
 from nexus3.rpc.types import Request
-from nexus3.session.events import ContentChunk, SessionCompleted, SessionEvent
+from nexus3.session.events import (
+    ContentChunk,
+    SessionCompleted,
+    SessionEvent,
+    ToolCompleted,
+    ToolStarted,
+)
 
 
 class MockSession:
@@ -785,6 +791,40 @@ class TestNoContextManagerErrors:
         assert response.result is None
 
 
+class TestGetTokens:
+    """Tests for get_tokens with a real context manager."""
+
+    @pytest.mark.asyncio
+    async def test_per_tool_breakdown(self):
+        """per_tool=True adds a name -> tokens map of tool definitions."""
+        from nexus3.context.manager import ContextManager
+
+        context = ContextManager()
+        context.set_tool_definitions(
+            [
+                {"type": "function", "function": {"name": "small", "parameters": {}}},
+                {
+                    "type": "function",
+                    "function": {"name": "big", "description": "x" * 400, "parameters": {}},
+                },
+            ]
+        )
+        dispatcher = Dispatcher(MockSession(), context=context)
+
+        plain = await dispatcher.dispatch(
+            Request(jsonrpc="2.0", method="get_tokens", params=None, id=1)
+        )
+        detailed = await dispatcher.dispatch(
+            Request(jsonrpc="2.0", method="get_tokens", params={"per_tool": True}, id=2)
+        )
+
+        assert plain is not None and plain.result is not None
+        assert "tools_breakdown" not in plain.result
+        assert detailed is not None and detailed.result is not None
+        assert list(detailed.result["tools_breakdown"]) == ["big", "small"]
+        assert detailed.result["tools"] == plain.result["tools"]
+
+
 class TestInvalidParamsError:
     """Tests for InvalidParamsError handling."""
 
@@ -892,3 +932,111 @@ class TestDirectIngressStrictness:
         assert response.error is not None
         assert response.error["code"] == -32602
         assert response.error["message"] == "jsonrpc must be '2.0', got: '1.0'"
+
+
+class _ToolLoopSession(MockSession):
+    """MockSession whose send_locked reports tool events to on_event."""
+
+    async def send_locked(
+        self,
+        user_input: str,
+        cancel_token: Any = None,
+        user_meta: dict[str, Any] | None = None,
+        on_event: Any = None,
+    ) -> AsyncIterator[str]:
+        yield "Reading"
+        if on_event is not None:
+            await on_event(ToolStarted(name="read_file", tool_id="t1"))
+            await on_event(ToolCompleted(name="read_file", tool_id="t1", success=True))
+        for chunk in self._chunks:
+            if cancel_token and cancel_token.is_cancelled:
+                return
+            yield chunk
+
+
+class TestStreamedSend:
+    """'send' with stream=true and an emit sink."""
+
+    @staticmethod
+    def _request(**params: Any) -> Request:
+        return Request(
+            jsonrpc="2.0", method="send", params={"content": "hi", **params}, id=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_emits_content_and_tool_frames(self) -> None:
+        dispatcher = Dispatcher(_ToolLoopSession(chunks=[" done"]))
+        frames: list[tuple[str, dict[str, Any]]] = []
+
+        async def emit(event: str, data: dict[str, Any]) -> None:
+            frames.append((event, data))
+
+        response = await dispatcher.dispatch(self._request(stream=True), emit=emit)
+
+        assert response is not None
+        assert response.result["content"] == "Reading done"
+        assert frames == [
+            ("content", {"text": "Reading"}),
+            ("tool_started", {"name": "read_file", "tool_id": "t1"}),
+            (
+                "tool_completed",
+                {"name": "read_file", "tool_id": "t1", "success": True, "error": ""},
+            ),
+            ("content", {"text": " done"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_emit_ignored_without_stream_flag(self) -> None:
+        dispatcher = Dispatcher(_ToolLoopSession())
+        emit = AsyncMock()
+
+        response = await dispatcher.dispatch(self._request(), emit=emit)
+
+        assert response is not None
+        assert response.error is None
+        emit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_emit_cancels_turn(self) -> None:
+        dispatcher = Dispatcher(_ToolLoopSession(chunks=["a", "b", "c"]))
+        emit = AsyncMock(side_effect=ConnectionResetError("gone"))
+
+        response = await dispatcher.dispatch(self._request(stream=True), emit=emit)
+
+        assert response is not None
+        assert response.result["cancelled"] is True
+        assert emit.await_count == 1
+        assert dispatcher._active_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_boolean_stream(self) -> None:
+        dispatcher = Dispatcher(MockSession())
+
+        response = await dispatcher.dispatch(self._request(stream="yes"))
+
+        assert response is not None
+        assert response.error is not None
+        assert response.error["message"] == "stream must be boolean, got: str"
+
+
+class TestDispatchBatch:
+    """Dispatcher.dispatch_batch runs requests concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_in_same_batch_reaches_running_send(self) -> None:
+        dispatcher = Dispatcher(MockSession(chunks=["a"] * 50, delay=0.01))
+        items: list[Any] = [
+            Request(
+                jsonrpc="2.0",
+                method="send",
+                params={"content": "hi", "request_id": "r1"},
+                id=1,
+            ),
+            Request(jsonrpc="2.0", method="cancel", params={"request_id": "r1"}, id=2),
+        ]
+
+        responses = await dispatcher.dispatch_batch(items)
+
+        assert [r.id for r in responses] == [1, 2]
+        assert responses[0].result == {"cancelled": True, "request_id": "r1"}
+        assert responses[1].result["cancelled"] is True
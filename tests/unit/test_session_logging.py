@@ -9,17 +9,22 @@ Tests cover:
 
 import json
 import re
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from time import time
+from time import monotonic, sleep, time
 
 import pytest
 
+from nexus3.config.schema import SessionStorageConfig
+from nexus3.context.compaction import create_summary_message
+from nexus3.context.manager import ContextConfig, ContextManager
 from nexus3.core.types import Role, ToolCall, ToolResult
 from nexus3.session.events import ToolBatchStarted
 from nexus3.session.logging import SessionLogger
 from nexus3.session.markdown import MarkdownWriter, RawWriter
 from nexus3.session.storage import (
+    _STOP,
     EventRow,
     MessageRow,
     SessionStorage,
@@ -444,6 +449,143 @@ class TestSessionStorage:
         storage2.close()
 
 
+class TestBatchedSessionStorage:
+    """Tests for the WAL + background writer durability mode."""
+
+    @pytest.fixture
+    def config(self) -> SessionStorageConfig:
+        return SessionStorageConfig(durability="batched", flush_interval_ms=20)
+
+    @pytest.fixture
+    def storage(self, tmp_path, config) -> SessionStorage:
+        storage = SessionStorage(tmp_path / "test.db", storage_config=config)
+        yield storage
+        storage.close()
+
+    def test_default_is_full_mode(self, tmp_path):
+        """Without config the storage commits synchronously with no writer thread."""
+        storage = SessionStorage(tmp_path / "test.db")
+        assert storage.durability == "full"
+        assert storage._writer is None
+        storage.close()
+
+    def test_uses_wal_journal(self, storage):
+        """Batched mode switches the database to WAL."""
+        assert storage.durability == "batched"
+        mode = storage._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_ids_are_returned_immediately_and_sequential(self, storage):
+        """Row IDs are allocated up front and match what is committed."""
+        first = storage.insert_message(role="user", content="a")
+        second = storage.insert_message(role="assistant", content="b")
+        event_id = storage.insert_event("thinking", {"x": 1}, message_id=second)
+
+        assert (first, second) == (1, 2)
+        assert [m.id for m in storage.get_messages()] == [1, 2]
+        assert storage.get_events()[0].id == event_id
+        assert storage.get_events()[0].message_id == second
+
+    def test_reads_see_pending_writes(self, tmp_path):
+        """Reads flush the queue even when the flush interval is long."""
+        config = SessionStorageConfig(durability="batched", flush_interval_ms=5000)
+        storage = SessionStorage(tmp_path / "test.db", storage_config=config)
+        storage.insert_message(role="user", content="hi")
+        storage.set_metadata("k", "v")
+
+        assert storage.get_metadata("k") == "v"
+        assert storage.get_token_count() == 0
+        assert [m.content for m in storage.get_messages()] == ["hi"]
+        storage.close()
+
+    def test_writes_commit_without_explicit_flush(self, storage, tmp_path):
+        """A queued write reaches disk within the flush interval."""
+        storage.insert_message(role="user", content="later")
+        deadline = monotonic() + 5
+        count = 0
+        while monotonic() < deadline:
+            other = sqlite3.connect(tmp_path / "test.db")
+            count = other.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+            other.close()
+            if count:
+                break
+            sleep(0.01)
+        assert count == 1
+
+    def test_mark_as_summary(self, storage):
+        """Summary bookkeeping goes through the writer in order."""
+        ids = [storage.insert_message(role="user", content=f"m{i}") for i in range(3)]
+        summary_id = storage.insert_message(role="user", content="summary")
+        storage.mark_as_summary(summary_id, ids)
+
+        in_context = storage.get_messages()
+        assert [m.id for m in in_context] == [summary_id]
+        assert in_context[0].summary_of == ids
+
+    def test_close_flushes_and_reopen_continues_ids(self, tmp_path, config):
+        """Close commits queued rows; a reopened storage continues the sequence."""
+        db_path = tmp_path / "test.db"
+        storage = SessionStorage(db_path, storage_config=config)
+        for i in range(50):
+            storage.insert_event("tick", {"i": i})
+        storage.insert_message(role="user", content="x")
+        storage.close()
+
+        reopened = SessionStorage(db_path, storage_config=config)
+        assert len(reopened.get_events()) == 50
+        assert reopened.insert_message(role="user", content="y") == 2
+        assert reopened.insert_event("tick") == 51
+        reopened.close()
+
+    def test_failed_statement_does_not_drop_batch(self, storage):
+        """A failing row is counted and logged; the rest of the batch commits."""
+        storage.insert_event("ok", message_id=999)  # violates the FK
+        storage.insert_event("ok")
+        events = storage.get_events()
+
+        assert storage.failed_writes == 1
+        assert [e.event_type for e in events] == ["ok"]
+
+    def test_unbindable_parameter_does_not_kill_writer(self, storage):
+        """Non-sqlite3 errors from one statement are counted like SQL errors."""
+        storage._writer.submit("INSERT INTO metadata (key, value) VALUES (?, ?)", ("k", 2**70))
+        storage.set_metadata("after", "ok")
+
+        assert storage.get_metadata("after") == "ok"
+        assert storage.failed_writes == 1
+        assert storage._writer._thread.is_alive()
+
+    def test_flush_and_submit_after_writer_death(self, storage, monkeypatch):
+        """A dead writer makes flush() return and submit() raise."""
+        writer = storage._writer
+        monkeypatch.setattr("nexus3.session.storage._FLUSH_POLL_SECONDS", 0.01)
+        writer._queue.put(_STOP)
+        writer._thread.join(timeout=5)
+
+        writer.flush()
+        with pytest.raises(sqlite3.OperationalError):
+            writer.submit("SELECT 1", ())
+        writer._closed = True
+
+    def test_write_after_close_raises(self, tmp_path, config):
+        """Writes after close fail loudly instead of being silently queued."""
+        storage = SessionStorage(tmp_path / "test.db", storage_config=config)
+        writer = storage._writer
+        storage.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            writer.submit("SELECT 1", ())
+
+    def test_logger_passes_config_to_storage_and_children(self, tmp_path, config):
+        """SessionLogger and its child loggers use the configured durability."""
+        logger = SessionLogger(LogConfig(base_dir=tmp_path, storage=config))
+        child = logger.create_child_logger()
+
+        assert logger.storage.durability == "batched"
+        assert child.storage.durability == "batched"
+        child.close()
+        logger.close()
+
+
 # ============================================================================
 # MessageRow and EventRow Tests
 # ============================================================================
@@ -998,6 +1140,42 @@ class TestSessionLogger:
         old1 = logger.storage.get_message(id1)
         assert old1 is not None and old1.in_context is False
 
+    def test_context_compaction_records_summary_coverage(self, logger):
+        """Each compaction summary records the logged messages it replaced."""
+        context = ContextManager(ContextConfig(), logger=logger)
+        context.add_user_message("first")
+        context.add_assistant_message("reply")
+        context.add_user_message("kept")
+        first_ids = [row.id for row in logger.storage.get_messages()]
+        kept = context.messages[-1:]
+
+        context.apply_compaction(create_summary_message("one"), kept)
+        summary_id = logger.storage.get_messages()[-1].id
+        assert logger.storage.get_message(summary_id).summary_of == first_ids[:2]
+
+        context.add_assistant_message("later")
+        context.apply_compaction(create_summary_message("two"), context.messages[-1:])
+        rolling = logger.storage.get_messages()[-1]
+
+        # The rolling summary covers the previous summary plus newer messages
+        assert rolling.summary_of == [summary_id, first_ids[2]]
+        assert rolling.meta == {"compaction_summary": True}
+        assert logger.storage.get_message(summary_id).in_context is False
+
+    def test_context_compaction_logs_summary_under_own_heading(self, logger):
+        """Compaction summaries are not written to context.md as user turns."""
+        context = ContextManager(ContextConfig(), logger=logger)
+        context.add_user_message("first")
+        context.apply_compaction(create_summary_message("recap"), [])
+
+        summary = logger.storage.get_messages()[-1]
+        assert summary.role == "user"
+        assert summary.meta == {"compaction_summary": True}
+        content = (logger.session_dir / "context.md").read_text()
+        assert content.count("## User") == 1
+        assert "## Context Summary" in content
+        assert "recap" in content
+
     # --- Subagent Support ---
 
     def test_create_child_logger(self, logger):
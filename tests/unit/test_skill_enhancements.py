@@ -232,6 +232,40 @@ class TestReadFileOffsetLimit:
         assert result.error is not None
         assert "UTF-8" in result.error
 
+    @pytest.mark.asyncio
+    async def test_paged_read_past_checkpoints_keeps_line_numbers(
+        self,
+        skill: ReadFileSkill,
+        tmp_path: Path,
+    ) -> None:
+        """Offsets beyond several index checkpoints return the right lines."""
+        test_file = tmp_path / "large.txt"
+        test_file.write_text("".join(f"row {i} {'x' * 60}\n" for i in range(1, 5001)))
+
+        result = await skill.execute(path=str(test_file), offset=4321, limit=2)
+
+        assert not result.error
+        assert f"4321: row 4321 {'x' * 60}" in result.output
+        assert f"4322: row 4322 {'x' * 60}" in result.output
+        assert "4320:" not in result.output
+        assert "continue with offset=4323" in result.output
+
+    @pytest.mark.asyncio
+    async def test_paged_read_with_bare_cr_matches_text_mode(
+        self,
+        skill: ReadFileSkill,
+        tmp_path: Path,
+    ) -> None:
+        """Bare CR line breaks count as lines, as in text mode."""
+        test_file = tmp_path / "cr.txt"
+        test_file.write_bytes(b"a\rb\nc\n" + b"".join(b"r%d\n" % i for i in range(20000)))
+
+        result = await skill.execute(path=str(test_file), offset=2, limit=2)
+
+        assert not result.error
+        assert "2: b" in result.output
+        assert "3: c" in result.output
+
 
 class TestGlobBehavior:
     """Tests for glob exclusion and traversal behavior."""
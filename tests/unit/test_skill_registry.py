@@ -228,6 +228,30 @@ class TestSkillRegistry:
         assert skill is not None
         assert skill.name == "echo"
 
+    def test_validator_compiled_at_registration_and_shared(self):
+        """Registries registering the same schema share one compiled validator."""
+        schema = {"type": "object", "properties": {"message": {"type": "string"}}}
+        first = SkillRegistry()
+        second = SkillRegistry()
+        first.register("echo", echo_skill_factory, description="Echo", parameters=schema)
+        second.register("echo", echo_skill_factory, description="Echo", parameters=dict(schema))
+
+        validator = first.get_validator("echo")
+        assert validator is not None
+        assert second.get_validator("echo") is validator
+
+    def test_validator_compiled_on_first_get_without_parameters(self):
+        """Skills registered without a schema get a validator on instantiation."""
+        registry = SkillRegistry()
+        registry.register("echo", echo_skill_factory)
+        assert registry.get_validator("echo") is None
+
+        skill = registry.get("echo")
+
+        validator = registry.get_validator("echo")
+        assert skill is not None and validator is not None
+        assert validator.schema == skill.parameters
+
     def test_get_unknown_skill_returns_none(self):
         """get() returns None for unregistered skills."""
         registry = SkillRegistry()
@@ -1,11 +1,18 @@
 """Tests for skill parameter validation decorator."""
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from nexus3.core import validation
 from nexus3.core.types import ToolResult
-from nexus3.core.validation import ValidationError, validate_tool_arguments
+from nexus3.core.validation import (
+    SchemaCache,
+    ValidationError,
+    compile_schema,
+    validate_tool_arguments,
+)
 from nexus3.skill.base import validate_skill_parameters
 
 
@@ -362,3 +369,71 @@ class TestValidateToolArguments:
 
         assert result.success
         assert received_kwargs == {"dynamic_key": "value"}
+
+
+class TestCompileSchema:
+    def test_equal_schemas_share_one_validator(self) -> None:
+        schema = {"type": "object", "properties": {"path": {"type": "string"}}}
+        same = {"properties": {"path": {"type": "string"}}, "type": "object"}
+
+        compiled = compile_schema(schema)
+
+        assert compile_schema(same) is compiled
+        assert compiled.properties == frozenset({"path"})
+        assert compiled.preserve_dynamic is False
+
+    def test_mutated_schema_gets_fresh_validator(self) -> None:
+        schema: dict[str, Any] = {
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+        }
+        first = compile_schema(schema)
+
+        schema["required"] = ["path"]
+
+        assert compile_schema(schema) is not first
+        with pytest.raises(ValidationError, match="required"):
+            validate_tool_arguments({}, schema)
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(validation, "_COMPILED_SCHEMAS_SIZE", 2)
+        validation._COMPILED_SCHEMAS.clear()
+        schemas = [
+            {"type": "object", "properties": {f"p{i}": {"type": "string"}}} for i in range(3)
+        ]
+        first = compile_schema(schemas[0])
+        compile_schema(schemas[1])
+        assert compile_schema(schemas[0]) is first  # Now most recently used
+
+        compile_schema(schemas[2])
+
+        assert len(validation._COMPILED_SCHEMAS) == 2
+        assert compile_schema(schemas[0]) is first
+        validation._COMPILED_SCHEMAS.clear()
+
+    def test_precompiled_validator_skips_compilation(self) -> None:
+        schema = {"type": "object", "properties": {"path": {"type": "string"}}}
+        compiled = compile_schema(schema)
+
+        with patch.object(validation, "compile_schema", side_effect=AssertionError):
+            assert validate_tool_arguments({"path": "a"}, schema, compiled) == {"path": "a"}
+
+    def test_schema_cache_recompiles_only_on_change(self) -> None:
+        schema: dict[str, Any] = {"type": "object", "properties": {"n": {"type": "integer"}}}
+        cache = SchemaCache()
+        compiled = cache.get(schema)
+
+        with patch.object(validation, "compile_schema", side_effect=AssertionError):
+            assert cache.get(dict(schema)) is compiled
+
+        schema["required"] = ["n"]
+        assert cache.get(schema) is not compiled
+        with pytest.raises(ValidationError, match="required"):
+            validate_tool_arguments({}, schema, cache.get(schema))
+
+    def test_invalid_schema_raises(self) -> None:
+        import jsonschema  # type: ignore[import-untyped]
+
+        with pytest.raises(jsonschema.SchemaError):
+            compile_schema({"type": "not-a-type"})
+